@@ -2,21 +2,75 @@
 # CipherCore - Datei Vergleichs Tool - Pro Version
 
 import argparse
+import sys
 import json
 import logging
 import os
 import datetime
 import base64
-from io import BytesIO
+import time
+import platform
+import contextlib
+import cProfile
+import pstats
+import tracemalloc
+from io import BytesIO, StringIO, BufferedReader, RawIOBase
+import re
+import csv
+import codecs
+import filecmp
+import itertools
+import gzip
+import zipfile
+import hashlib
+import pickle
+import importlib.util
+import tempfile
+import shutil
+import queue
 import tkinter as tk
-from tkinter import filedialog, messagebox, scrolledtext, Checkbutton, Button, Entry, Label
+from tkinter import filedialog, messagebox, scrolledtext, ttk, Checkbutton, Button, Entry, Label
 import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import sqlite3
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from fpdf import FPDF
 from abc import ABC, abstractmethod
-from typing import Dict, Tuple, List, Optional, Callable
+from collections import OrderedDict
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, Tuple, List, Optional, Callable, Iterator, Union
+
+try: # Optionale Abhängigkeit: schneller, mehrthreadiger CSV-Parser mit Arrow-Spalten
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.compute as pa_compute
+    import pyarrow.dataset as pa_dataset
+    import pyarrow.feather as pa_feather
+    import pyarrow.parquet as pa_parquet
+except ImportError:
+    pa = None # Ohne pyarrow wird der pandas-Standardparser verwendet
+
+try: # Optionale Abhängigkeit: Zstandard-Dekompression für .zst-Eingaben
+    import zstandard
+except ImportError:
+    zstandard = None # .zst-Dateien werden dann über pyarrow gelesen (falls installiert)
+
+try: # Nur unter Unix: Grenze der offenen Dateien für den partitionierten Vergleich
+    import resource
+except ImportError:
+    resource = None # Windows: Standardgrenze der C-Laufzeit (SHARD_DATEI_GRENZE_OHNE_RLIMIT)
+
+try: # Nur unter Unix: Dateisperren für den Anhänge-Puffer des Parquet-Verlaufs
+    import fcntl
+except ImportError:
+    fcntl = None # Windows: eine geöffnete Datei kann nicht umbenannt werden, das ersetzt dort die Sperre
+
+try: # Optionale Abhängigkeit: eingebettete analytische Datenbank für den SQL-Vergleich
+    import duckdb
+except ImportError:
+    duckdb = None # Der SQL-Vergleich verwendet dann SQLite aus der Standardbibliothek
 
 from PIL import Image  # Importiere PIL Image für die Bildverarbeitung
 import secrets # Importiere secrets für die Schlüsselerstellung
@@ -31,6 +85,7 @@ __copyright__ = "Copyright (c) 2024 CipherCore GmbH"
 __license__ = "Proprietär - Alle Rechte vorbehalten"
 
 # --- Konstanten Definitionen (Erhöhte Sicherheit und Klarheit) ---
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {} # Speichersparende Ergebnisobjekte ab Python 3.10, darunter ohne __slots__
 CONFIG_DATEI = 'config.json'
 LOGO_DATEIPFAD_STANDARD = 'assets/ciphercore_logo_standard.png' # Standardpfad für Logo
 AUSGABE_DATEIPFAD_STANDARD = 'berichte/datei_vergleichsbericht.pdf' # Standardpfad für Berichte
@@ -39,6 +94,7 @@ CONFIG_SCHLUESSEL_LIZENZ_AKZEPTIERT = "lizenz_akzeptiert"
 CONFIG_SCHLUESSEL_DATENBANK_PFAD = "datenbank_pfad"
 DATENBANK_DATEINAME_STANDARD = 'ciphercore_datei_vergleich.db' # Standard Datenbankname
 DATEN_VERZEICHNIS_STANDARD = 'ciphercore_vergleichsdaten' # Standard Datenverzeichnis
+PARQUET_VERZEICHNIS_STANDARD = 'ciphercore_verlauf_parquet' # Standardverzeichnis des spaltenorientierten Verlaufs
 CONFIG_SCHLUESSEL_LIZENZSCHLUESSEL = "lizenzschluessel" # Schlüssel für den Lizenzschlüssel in der Konfiguration
 OEFFENTLICHER_SCHLUESSEL_PFAD = "public_key.pem" # Pfad zum öffentlichen Schlüssel für Lizenzvalidierung
 
@@ -46,11 +102,115 @@ DATEIFORMAT_CSV = '.csv'
 DATEIFORMAT_TEXT = '.txt'
 DATEIFORMAT_EXCEL_XLS = '.xls'
 DATEIFORMAT_EXCEL_XLSX = '.xlsx'
-UNTERSTUETZTE_DATEIFORMATE = (DATEIFORMAT_CSV, DATEIFORMAT_TEXT, DATEIFORMAT_EXCEL_XLS, DATEIFORMAT_EXCEL_XLSX)
+DATEIFORMAT_PARQUET = '.parquet'
+DATEIFORMAT_FEATHER = '.feather'
+DATEIFORMAT_ARROW = '.arrow' # Arrow IPC (Datei- oder Stream-Format)
+SPALTEN_DATEIFORMATE = (DATEIFORMAT_PARQUET, DATEIFORMAT_FEATHER, DATEIFORMAT_ARROW) # Spaltenorientierte Formate (benötigen pyarrow)
+UNTERSTUETZTE_DATEIFORMATE = (DATEIFORMAT_CSV, DATEIFORMAT_TEXT, DATEIFORMAT_EXCEL_XLS, DATEIFORMAT_EXCEL_XLSX) + SPALTEN_DATEIFORMATE
+KOMPRESSION_GZIP = '.gz'
+KOMPRESSION_ZSTD = '.zst'
+KOMPRESSION_ZIP = '.zip'
+UNTERSTUETZTE_KOMPRESSIONEN = (KOMPRESSION_GZIP, KOMPRESSION_ZSTD, KOMPRESSION_ZIP) # Für CSV/TXT, z.B. 'liste.csv.gz' oder ZIP mit einer CSV-Datei
 
 DIAGRAMM_TYP_BALKEN = 'balken'
 DIAGRAMM_TYP_KREIS = 'kreis'
 UNTERSTUETZTE_DIAGRAMM_TYPEN = (DIAGRAMM_TYP_BALKEN, DIAGRAMM_TYP_KREIS)
+DIAGRAMM_TYP_UPSET = 'upset' # Schnittmengen-Diagramm des N-Wege-Vergleichs (nicht für den Vergleich zweier Dateien)
+
+BENCHMARK_MIN_ZEILEN = 10_000 # Kleinste unterstützte Benchmark-Datensatzgröße
+BENCHMARK_MAX_ZEILEN = 50_000_000 # Größte unterstützte Benchmark-Datensatzgröße
+BENCHMARK_STANDARD_GROESSEN = (10_000, 100_000, 1_000_000) # Standardgrößen für --benchmark
+BENCHMARK_VERZEICHNIS_STANDARD = 'benchmark_daten' # Arbeitsverzeichnis für synthetische Datensätze (innerhalb des Basisverzeichnisses)
+BENCHMARK_AUSGABE_STANDARD = 'benchmark_ergebnisse.json' # Maschinenlesbare Benchmark-Ergebnisse
+EXCEL_MAX_ZEILEN = 1_048_575 # Maximale Datenzeilen eines Excel-Arbeitsblatts (ohne Kopfzeile)
+
+CSV_BLOCK_GROESSE = 100_000 # Zeilen pro Block beim abbrechbaren Laden von CSV/TXT-Dateien
+ARROW_CSV_BLOCK_BYTES = 16 * 1024 * 1024 # Bytes pro Block beim Streamen von CSV/TXT-Dateien mit pyarrow
+CSV_NULL_WERTE = ('', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', # Leere Werte wie
+                  'NULL', 'NaN', 'None', 'n/a', 'nan', 'null') # bei pd.read_csv, damit pyarrow und pandas dieselben Daten liefern
+CSV_PROBE_BYTES = 64 * 1024 # Umfang der Stichprobe für die Erkennung von Kodierung, Trennzeichen, Quoting und Kopfzeile
+CSV_TRENNZEICHEN_KANDIDATEN = ',;\t|' # Erkannte Trennzeichen (Komma, Semikolon, Tabulator, senkrechter Strich)
+CSV_ERSATZ_KODIERUNGEN = ('cp1252', 'latin-1') # Rückfall für als UTF-8 erkannte Dateien mit späteren ungültigen Bytes (Windows-Exporte)
+CSV_FORMAT_CACHE_GROESSE = 256 # Maximale Anzahl zwischengespeicherter CSV-Formate (LRU)
+EXCEL_BLOCK_GROESSE = 50_000 # Zeilen pro Block beim Streamen von .xlsx-Arbeitsblättern
+ZUSTANDS_VERZEICHNIS_NAME = 'vergleichszustand' # Unterverzeichnis für den Zustand des inkrementellen Vergleichs
+ZUSTANDS_VERSION = 2 # Formatversion der Zustandsdateien; ältere Zustände werden verworfen
+INKREMENTELLE_ENCODINGS = ('utf-8', 'utf-8-sig', 'cp1252', 'latin-1') # Kodierungen, bei denen ab einem Byte-Versatz gelesen werden kann
+HASH_LESE_BLOCK = 8 * 1024 * 1024 # Blockgröße beim Berechnen der Präfix-Prüfsumme
+VERGLEICH_ZUSATZ_SPALTEN = ('Alter',) # Spalten, die neben der Vergleichsspalte für die Metriken gelesen werden
+SHARD_MAX_ANZAHL = 4096 # Obergrenze der Partitionen beim partitionierten Vergleich
+SHARD_DATEI_RESERVE = 64 # Offene Dateien, die neben den Partitionsdateien frei bleiben (Eingabe, Log, Pipes des Prozesspools)
+SHARD_DATEI_GRENZE_OHNE_RLIMIT = 512 # Angenommene Grenze offener Dateien ohne das Modul 'resource' (Windows)
+SCHAETZ_FEHLER_STANDARD = 0.01 # Relativer Standardfehler der Skizzen im approximativen Vergleich
+SCHAETZ_FEHLER_MIN = 0.001 # Kleinster zulässiger Schätzfehler (Konfiguration und --schaetz_fehler)
+SCHAETZ_FEHLER_MAX = 0.2 # Größter zulässiger Schätzfehler
+HLL_MIN_PRAEZISION = 4 # Kleinste HyperLogLog-Präzision (16 Register)
+HLL_MAX_PRAEZISION = 18 # Größte HyperLogLog-Präzision (256 KB Register); begrenzt den Kardinalitätsfehler auf etwa 0.2 %
+SKIZZEN_DATEI_ENDUNG = '.skizze.npz' # Gespeicherte Skizzen je Datei im Zustandsverzeichnis
+STATISTIK_NAMEN = ('anzahl', 'leer', 'eindeutig', 'min', 'max', 'summe', 'mittelwert', 'std', 'median') # Zusätzlich Perzentile 'p1' bis 'p99'
+STATISTIK_STANDARD = ['anzahl', 'leer', 'eindeutig', 'min', 'max', 'summe', 'mittelwert', 'std', 'median', 'p5', 'p95'] # Standardauswahl je Spalte
+STATISTIK_QUANTILE_EXAKT_BIS = 5_000_000 # Werte je Spalte, bis zu denen Quantile exakt berechnet werden (darüber t-digest)
+STATISTIK_TDIGEST_KOMPRESSION = 200 # Kompressionsparameter des t-digest (ca. Anzahl der Zentroiden)
+STATISTIK_DATEI_ENDUNG = '_statistik.json' # Spaltenstatistik neben dem PDF-Bericht
+LAUF_CACHE_VERZEICHNIS_NAME = 'laufcache' # Unterverzeichnis des Zustandsverzeichnisses für zwischengespeicherte Läufe
+LAUF_CACHE_VERSION = 4 # Teil des Cache-Schlüssels; bei Änderungen am Ergebnis erhöhen
+LAUF_CACHE_TTL_STUNDEN_STANDARD = 168 # Lebensdauer eines Cache-Eintrags (7 Tage)
+LAUF_CACHE_MAX_MB_STANDARD = 500 # Maximale Größe des Lauf-Caches, darüber werden die am längsten nicht genutzten Einträge entfernt
+EXCEL_CACHE_MAX_MB_STANDARD = 500 # Maximale Größe des Excel-Caches, darüber werden die am längsten nicht genutzten Blätter entfernt
+CALAMINE_VERFUEGBAR = importlib.util.find_spec("python_calamine") is not None # Optionaler schneller Excel-Leser (pandas engine='calamine')
+VERGLEICH_BLOCK_GROESSE = 1_000_000 # Werte pro Block beim abbrechbaren Aufbau der Vergleichsmengen
+MENGEN_DIGEST_SCHLUESSEL = ('CipherCoreDigest', 'MengenVergleich2') # Zwei unabhängige 16-Byte-Hash-Schlüssel für den Spalten-Digest
+ABKUERZUNG_BYTE_IDENTISCH = 'byte_identisch' # Beide Dateien byte-identisch, nur einmal gelesen
+ABKUERZUNG_SCHLUESSEL_DIGEST = 'schluessel_digest' # Vergleichsspalten gleich (gleiche Reihenfolge oder gleicher Digest), nur eine Wertemenge gebildet
+DIGEST_BUCKETS_STANDARD = 1024 # Buckets K des Merkle-Digests; sollte etwa der erwarteten Anzahl abweichender Schlüssel entsprechen
+DIGEST_MAX_BUCKETS = 1 << 20 # Obergrenze der Buckets (Digest-Größe ca. 70 Bytes je Bucket)
+DIGEST_PRUEFSUMMEN_BYTES = 16 # Länge der BLAKE2b-Prüfsummen im Merkle-Baum
+DIGEST_VERSION = 3 # Formatversion der Digest-Dateien
+DIGEST_SCHLUESSEL_UMGEBUNG = 'CIPHERCORE_DIGEST_SCHLUESSEL' # Umgebungsvariable mit dem gemeinsamen Geheimnis beider Standorte
+DIGEST_SCHLUESSEL_MIN_LAENGE = 16 # Mindestlänge des Geheimnisses in Zeichen
+DIGEST_DATEI_ENDUNG = '.digest.json' # Digest neben der Eingabedatei, z.B. 'kunden.csv.digest.json'
+BUCKET_SCHLUESSEL_DATEI_ENDUNG = '.bucketschluessel.npz' # Exportierte Schlüssel-Hashes der abweichenden Buckets
+DIGEST_ANFORDERUNG_STANDARD = 'digest_anforderung.json' # Liste der abweichenden Buckets, die beide Standorte exportieren
+MEHRFACH_MAX_DATEIEN = 64 # Obergrenze des N-Wege-Vergleichs (Zugehörigkeit je Schlüssel als 64-Bit-Maske)
+MEHRFACH_PDF_MATRIX_MAX_DATEIEN = 16 # Bis zu dieser Dateianzahl enthält der PDF-Bericht die Überlappungsmatrix (sonst nur die JSON-Datei)
+MEHRFACH_DATEI_ENDUNG = '_mehrfach.json' # Ergebnis des N-Wege-Vergleichs neben dem PDF-Bericht
+UPSET_MAX_SCHNITTMENGEN = 20 # Anzahl der größten Schnittmengen im UpSet-Diagramm
+DUPLIKAT_TOP_ANZAHL = 10 # Häufigste mehrfach vorkommende Werte je Datei im Ergebnis
+DUPLIKAT_MAX_ZEILENNUMMERN = 20 # Gespeicherte Zeilennummern je häufigstem Wert (die CSV-Datei enthält alle)
+DUPLIKAT_DATEI_ENDUNG = '_duplikate.csv' # Gruppen mehrfach vorkommender Werte neben dem PDF-Bericht
+SORTIER_SPEICHER_MB_STANDARD = 256 # Speicherbudget des externen Sortierens für die Schlüssel eines Laufs
+SORTIER_MAX_LAEUFE = 64 # Höchstens gleichzeitig gemischte Läufe (offene Dateien, zusätzlich durch das Speicherbudget begrenzt)
+SORTIER_LAUF_BLOCK = 8_192 # Werte je gespeichertem Block eines Laufs (Lesepuffer je Lauf beim Mischen)
+SORTIER_BYTES_JE_WERT = 80 # Geschätzter Speicher je Schlüssel ohne Textlänge (Python-String, Zeiger, Sortierindex)
+ABKUERZUNG_VORSORTIERT = 'vorsortiert' # Beide Eingaben bereits nach dem Schlüssel sortiert, Sortierläufe übersprungen
+SQL_ENGINE_AUTO, SQL_ENGINE_DUCKDB, SQL_ENGINE_SQLITE = 'auto', 'duckdb', 'sqlite' # 'auto': DuckDB, falls installiert, sonst SQLite
+SQL_ENGINES = (SQL_ENGINE_AUTO, SQL_ENGINE_DUCKDB, SQL_ENGINE_SQLITE)
+SQL_ABRUF_ZEILEN = 50_000 # Zeilen je Abruf beim Schreiben der Differenz- und Duplikatdatei
+SQL_ABBRUCH_SCHRITTE = 100_000 # SQLite-Befehlsschritte zwischen zwei Abbruchprüfungen
+DIFF_DATEI_ENDUNG = '_diff.csv' # Werte, die nur in einer Datei vorkommen (SQL-Vergleich), neben dem PDF-Bericht
+SPEICHER_BUDGET_MB_STANDARD = 2048 # Speicherbudget, falls der verfügbare Arbeitsspeicher nicht ermittelt werden kann
+SPEICHER_BUDGET_ANTEIL = 0.5 # Automatisches Speicherbudget: Anteil des verfügbaren Arbeitsspeichers
+SPEICHER_BYTES_JE_ZEILE = 160 # Gemessener Bedarf des Standardvergleichs je Zeile ohne Textlänge (Laden, Faktorisierung, Mengen)
+SPEICHER_LESE_RESERVE_MB = 160 # Gemessener Bedarf des blockweisen Lesens (Arrow-Block, Umwandlung), unabhängig von der Dateigröße
+AUTOMATISCHER_VERFAHRENSWECHSEL = False # Verfahrenswahl wechselt nicht selbst zu externem Sortieren/SQL, bis alle Verfahren dieselben Kennzahlen liefern
+SCHAETZ_PROBE_BYTES = 1024 * 1024 # Stichprobe am Dateianfang für Zeilenanzahl und Schlüssellänge
+SCHAETZ_PROBE_ZEILEN = 10_000 # Stichprobe bei spaltenorientierten Dateien (Zeilenanzahl aus den Metadaten)
+SCHAETZ_KOMPRESSIONS_FAKTOR = 6 # Angenommenes Verhältnis entpackt/gepackt, wenn die entpackte Größe unbekannt ist (.zst ohne Größenangabe)
+SCHAETZ_SCHLUESSEL_BYTES_STANDARD = 32 # Angenommene Schlüssel- bzw. Zeilenlänge ohne auswertbare Stichprobe (z.B. Excel)
+SCHAETZ_XLSX_XML_BYTES_JE_ZEILE = 100 # Entpacktes Arbeitsblatt-XML je Zeile, falls das Blatt keine Bereichsangabe enthält
+SCHAETZ_XLS_BYTES_JE_ZEILE = 40 # Dateigröße je Zeile im binären .xls-Format
+CGROUP_SPEICHER_DATEIEN = (('/sys/fs/cgroup/memory.max', '/sys/fs/cgroup/memory.current'), # cgroup v2: Grenze und Verbrauch
+                           ('/sys/fs/cgroup/memory/memory.limit_in_bytes', '/sys/fs/cgroup/memory/memory.usage_in_bytes')) # cgroup v1
+
+VALIDIERUNG_MAX_VERSTOESSE = 20 # Anzahl der Verstöße, die im Validierungsfehler mit Zeilennummer aufgeführt werden
+SCHEMA_DATEI_ENDUNG = '.schema.json' # Dateispezifisches Validierungsschema neben der Eingabedatei, z.B. 'kunden.csv.schema.json'
+VALIDIERUNG_TYPEN = ('text', 'zahl', 'ganzzahl') # Unterstützte Spaltentypen im Validierungsschema
+STANDARD_VALIDIERUNGS_SCHEMA = { # Standardschema (entspricht der bisherigen festen Prüfung von Name und Alter)
+    "spalten": {
+        "Name": {"erforderlich": True},
+        "Alter": {"erforderlich": True, "typ": "zahl", "min": 0}
+    }
+}
 
 METRIK_ANZAHL_DATEI1 = 'Anzahl Einträge Datei 1 (Benutzereingabe)' # Klarstellung der Metrik
 METRIK_ANZAHL_DATEI2 = 'Anzahl Einträge Datei 2 (Hauptliste)' # Klarstellung der Metrik
@@ -58,8 +218,71 @@ METRIK_GLEICHE_NAMEN = 'Anzahl übereinstimmende Namen' # Präzisere Metrikbezei
 METRIK_PROZENTUALER_UNTERSCHIED_ANZAHL = 'Prozentualer Unterschied in der Anzahl der Einträge' # Präzisere Metrikbezeichnung
 METRIK_DURCHSCHNITTSALTER_DATEI1 = 'Durchschnittsalter Datei 1 (Benutzereingabe)' # Klarstellung der Metrik
 METRIK_DURCHSCHNITTSALTER_DATEI2 = 'Durchschnittsalter Datei 2 (Hauptliste)' # Klarstellung der Metrik
+METRIK_EINDEUTIGE_DATEI1 = 'Eindeutige Werte Datei 1 (Benutzereingabe)' # Verschiedene Schlüssel, Basis von METRIK_GLEICHE_NAMEN
+METRIK_EINDEUTIGE_DATEI2 = 'Eindeutige Werte Datei 2 (Hauptliste)'
+METRIK_DOPPELTE_WERTE_DATEI1 = 'Mehrfach vorkommende Werte Datei 1 (Benutzereingabe)' # Schlüssel mit mehr als einer Zeile
+METRIK_DOPPELTE_WERTE_DATEI2 = 'Mehrfach vorkommende Werte Datei 2 (Hauptliste)'
+METRIK_NUR_DATEI1 = 'Nur in Datei 1 (Benutzereingabe)' # Eindeutige Werte ohne Gegenstück in der anderen Datei
+METRIK_NUR_DATEI2 = 'Nur in Datei 2 (Hauptliste)'
+METRIK_EINDEUTIGE_DATEI1_SCHAETZUNG = 'Eindeutige Werte Datei 1 (Schätzung)' # HyperLogLog-Kardinalität
+METRIK_EINDEUTIGE_DATEI2_SCHAETZUNG = 'Eindeutige Werte Datei 2 (Schätzung)'
+METRIK_GLEICHE_NAMEN_SCHAETZUNG = 'Anzahl übereinstimmende Namen (Schätzung)' # MinHash-Jaccard x HyperLogLog-Vereinigung
+METRIK_JACCARD_SCHAETZUNG = 'Jaccard-Ähnlichkeit (Schätzung)'
+METRIK_SCHAETZ_FEHLER = 'Relativer Standardfehler der Schätzung'
+METRIK_SCHAETZUNGEN = [METRIK_EINDEUTIGE_DATEI1_SCHAETZUNG, METRIK_EINDEUTIGE_DATEI2_SCHAETZUNG, METRIK_GLEICHE_NAMEN_SCHAETZUNG,
+                       METRIK_JACCARD_SCHAETZUNG, METRIK_SCHAETZ_FEHLER] # Nur im approximativen Vergleich, im Bericht als Schätzung gekennzeichnet
+METRIK_PROZENT_METRIKEN = (METRIK_PROZENTUALER_UNTERSCHIED_ANZAHL, METRIK_JACCARD_SCHAETZUNG, METRIK_SCHAETZ_FEHLER) # Rohwert als Anteil (0-1)
+METRIK_DEZIMAL_METRIKEN = (METRIK_DURCHSCHNITTSALTER_DATEI1, METRIK_DURCHSCHNITTSALTER_DATEI2) # Anzeige mit einer Nachkommastelle
+VERFAHREN_STANDARD, VERFAHREN_INKREMENTELL, VERFAHREN_PARTITIONIERT, VERFAHREN_APPROXIMATIV = 'standard', 'inkrementell', 'partitioniert', 'approximativ'
+VERFAHREN_DIGEST = 'digest' # Vergleich zweier Merkle-Digests ohne Austausch der Dateien
+VERFAHREN_SORTIERT = 'sortiert' # Externes Sortieren und Mischen für Eingaben größer als der Arbeitsspeicher
+VERFAHREN_SQL = 'sql' # Joins und Aggregate in einer eingebetteten Datenbank (DuckDB oder SQLite)
 METRIK_REIHENFOLGE = [METRIK_ANZAHL_DATEI1, METRIK_ANZAHL_DATEI2, METRIK_PROZENTUALER_UNTERSCHIED_ANZAHL,
-                     METRIK_GLEICHE_NAMEN, METRIK_DURCHSCHNITTSALTER_DATEI1, METRIK_DURCHSCHNITTSALTER_DATEI2]
+                     METRIK_GLEICHE_NAMEN, METRIK_DURCHSCHNITTSALTER_DATEI1, METRIK_DURCHSCHNITTSALTER_DATEI2,
+                     METRIK_EINDEUTIGE_DATEI1, METRIK_EINDEUTIGE_DATEI2, METRIK_DOPPELTE_WERTE_DATEI1, METRIK_DOPPELTE_WERTE_DATEI2,
+                     METRIK_NUR_DATEI1, METRIK_NUR_DATEI2]
+
+VERLAUF_SEITEN_GROESSE = 100 # Anzahl Verlaufseinträge, die pro Seite aus dem DatenManager geladen werden
+SCHLIESSEN_PRUEF_MS = 100 # Abstand der Prüfungen beim Schließen, ob der Vergleichs-Worker beendet ist
+SCHLIESSEN_MAX_WARTEZEIT_S = 10 # Höchstens so lange wartet das Schließen auf den abgebrochenen Worker
+VERLAUF_SORTIER_SPALTEN = ('vergleichszeitpunkt', 'datei1_name', 'datei2_name') # Erlaubte Sortierspalten (Whitelist, Schutz vor SQL-Injection)
+VERLAUF_GRUPPIER_SPALTEN = ('datei1_name', 'datei2_name') # Erlaubte Gruppierungen der Trendabfrage
+VERLAUF_ZEITRAEUME = {'tag': '%Y-%m-%d', 'woche': '%G-W%V', 'monat': '%Y-%m', 'jahr': '%Y'} # Zeitraum -> Format des Periodenschlüssels (UTC)
+VERLAUF_ROLLUP_ZEITRAEUME = ('tag', 'woche', 'monat') # Vorberechnete Rollups der Verlaufsauswertung
+VERLAUF_AUSWERTUNG_DATEINAME = 'verlauf_auswertung.db' # Zusammenfassungstabellen neben JSON- bzw. Parquet-Verlauf
+VERLAUF_AUSWERTUNG_VERSION = 2 # Schema der Zusammenfassungstabellen; bei Änderungen werden sie aus dem Verlauf neu aufgebaut
+VERLAUF_ANTEIL_BASEN = { # Nenner des Überlappungsanteils in absteigender Priorität -> Kennung (nur Anteile gleicher Basis werden verglichen)
+    METRIK_EINDEUTIGE_DATEI1: 'eindeutig',
+    METRIK_EINDEUTIGE_DATEI1_SCHAETZUNG: 'eindeutig_geschaetzt',
+    METRIK_ANZAHL_DATEI1: 'zeilen',
+}
+VERLAUF_ANOMALIE_Z = 3.0 # Abweichung des Überlappungsanteils in Standardabweichungen, ab der ein Lauf als auffällig gilt
+VERLAUF_ANOMALIE_MIN_LAEUFE = 5 # Bisherige Läufe eines Dateipaars, bevor Auffälligkeiten gemeldet werden
+VERLAUF_ANOMALIE_MIN_STREUUNG = 0.01 # Untergrenze der Streuung (1 Prozentpunkt), damit konstante Verläufe nicht bei jeder Kleinigkeit auffallen
+VERLAUF_TOP_STANDARD = 10 # Dateipaare in der Rangliste der größten Änderungen
+VERLAUF_PUFFER_LAEUFE = 64 # Läufe im Anhänge-Puffer, bevor sie gemeinsam als eine Parquet-Datei geschrieben werden
+VERLAUF_PUFFER_DATEINAME = 'puffer.jsonl' # Anhänge-Puffer des ParquetDataManager (eine JSON-Zeile je Lauf)
+VERLAUF_PUFFER_UEBERNAHME_ENDUNG = '.schreiben' # Zum Schreiben übernommener Puffer ('puffer.jsonl.<zufall>.schreiben')
+VERLAUF_LAEUFE_VERZEICHNIS = 'laeufe' # Parquet-Dateien des Verlaufs, partitioniert nach 'monat=JJJJ-MM'
+VERLAUF_METRIK_SPALTEN = { # Metrik -> Spalte im spaltenorientierten Verlauf (eine Zahlenspalte je Metrik)
+    METRIK_ANZAHL_DATEI1: 'anzahl_datei1',
+    METRIK_ANZAHL_DATEI2: 'anzahl_datei2',
+    METRIK_PROZENTUALER_UNTERSCHIED_ANZAHL: 'prozentualer_unterschied',
+    METRIK_GLEICHE_NAMEN: 'gleiche_werte',
+    METRIK_DURCHSCHNITTSALTER_DATEI1: 'durchschnittsalter_datei1',
+    METRIK_DURCHSCHNITTSALTER_DATEI2: 'durchschnittsalter_datei2',
+    METRIK_EINDEUTIGE_DATEI1: 'eindeutige_datei1',
+    METRIK_EINDEUTIGE_DATEI2: 'eindeutige_datei2',
+    METRIK_DOPPELTE_WERTE_DATEI1: 'doppelte_werte_datei1',
+    METRIK_DOPPELTE_WERTE_DATEI2: 'doppelte_werte_datei2',
+    METRIK_NUR_DATEI1: 'nur_datei1',
+    METRIK_NUR_DATEI2: 'nur_datei2',
+    METRIK_EINDEUTIGE_DATEI1_SCHAETZUNG: 'eindeutige_datei1_schaetzung',
+    METRIK_EINDEUTIGE_DATEI2_SCHAETZUNG: 'eindeutige_datei2_schaetzung',
+    METRIK_GLEICHE_NAMEN_SCHAETZUNG: 'gleiche_werte_schaetzung',
+    METRIK_JACCARD_SCHAETZUNG: 'jaccard_schaetzung',
+    METRIK_SCHAETZ_FEHLER: 'schaetz_fehler',
+}
 
 # --- Logging Konfiguration (CipherCore Standard: Detailliert und Sicher) ---
 LOG_DATEIPFAD = 'log/ciphercore_datei_vergleich.log' # Log-Dateien in separatem Verzeichnis
@@ -80,7 +303,18 @@ STANDARD_KONFIGURATION = {
     CONFIG_SCHLUESSEL_LIZENZ_AKZEPTIERT: False, # Lizenzakzeptanzstatus
     CONFIG_SCHLUESSEL_DATENBANK_PFAD: DATENBANK_DATEINAME_STANDARD, # Standard Datenbankpfad
     "daten_verzeichnis": DATEN_VERZEICHNIS_STANDARD, # Standard Datenverzeichnis
-    CONFIG_SCHLUESSEL_LIZENZSCHLUESSEL: None # Standardmäßig kein Lizenzschlüssel
+    "parquet_verzeichnis": PARQUET_VERZEICHNIS_STANDARD, # Verzeichnis des spaltenorientierten Verlaufs (--daten_manager_typ parquet)
+    CONFIG_SCHLUESSEL_LIZENZSCHLUESSEL: None, # Standardmäßig kein Lizenzschlüssel
+    "validierungs_schema": None, # Globales Validierungsschema (None: STANDARD_VALIDIERUNGS_SCHEMA)
+    "excel_cache_verzeichnis": None, # Cache für spaltenorientierte Kopien von Excel-Blättern (None: deaktiviert, benötigt pyarrow)
+    "excel_cache_max_mb": EXCEL_CACHE_MAX_MB_STANDARD, # Maximale Größe des Excel-Caches
+    "schaetz_fehler": SCHAETZ_FEHLER_STANDARD, # Relativer Standardfehler im approximativen Vergleich (0.001-0.2)
+    "statistiken": STATISTIK_STANDARD, # Kennzahlen der Spaltenstatistik (--spalten_statistik)
+    "lauf_cache_ttl_stunden": LAUF_CACHE_TTL_STUNDEN_STANDARD, # Lebensdauer der Einträge im Lauf-Cache
+    "lauf_cache_max_mb": LAUF_CACHE_MAX_MB_STANDARD, # Maximale Größe des Lauf-Caches
+    "sortier_speicher_mb": SORTIER_SPEICHER_MB_STANDARD, # Speicherbudget je Sortierlauf beim externen Sortieren und der Datenbank beim SQL-Vergleich
+    "sortier_verzeichnis": None, # Lokales Arbeitsverzeichnis für Sortierläufe und SQL-Vergleich (None: System-Temp)
+    "speicher_budget_mb": None # Speicherbudget für die automatische Verfahrenswahl (None: Anteil des verfügbaren Arbeitsspeichers)
 }
 
 konfiguration = STANDARD_KONFIGURATION.copy() # Kopie der Standardkonfiguration
@@ -88,7 +322,8 @@ konfiguration = STANDARD_KONFIGURATION.copy() # Kopie der Standardkonfiguration
 def _lade_konfiguration(konfig_datei_pfad: str) -> Dict:
     """
     Lädt die Konfiguration aus einer JSON-Datei und validiert diese gegen ein Schema.
-    Sicherheitsmaßnahme: Verhindert das Laden unerwarteter oder schädlicher Konfigurationen.
+    Sicherheitsmaßnahme: Verhindert das Laden unerwarteter oder schädlicher Konfigurationen. Ungültige Einträge
+    werden einzeln auf ihren Standardwert zurückgesetzt (siehe _validiere_konfiguration), die übrigen bleiben erhalten.
     """
     try:
         if not os.path.exists(konfig_datei_pfad):
@@ -97,10 +332,15 @@ def _lade_konfiguration(konfig_datei_pfad: str) -> Dict:
 
         with open(konfig_datei_pfad, 'r', encoding='utf-8') as konfig_datei: # Explizite Encoding-Angabe für Robustheit
             benutzer_konfiguration = json.load(konfig_datei)
+            if not isinstance(benutzer_konfiguration, dict):
+                raise ValueError("Die Konfiguration muss ein JSON-Objekt sein.")
             konfiguration_temp = STANDARD_KONFIGURATION.copy()
             konfiguration_temp.update(benutzer_konfiguration) # Nur bekannte Schlüssel werden aktualisiert
-            _validiere_konfiguration(konfiguration_temp) # Validierung der geladenen Konfiguration
-            logger.info(f"Konfiguration aus '{konfig_datei_pfad}' geladen und validiert.")
+            zurueckgesetzt = _validiere_konfiguration(konfiguration_temp) # Ungültige Werte einzeln zurücksetzen
+            if zurueckgesetzt:
+                logger.warning(f"Konfiguration aus '{konfig_datei_pfad}' geladen, ungültige Einträge zurückgesetzt: {', '.join(zurueckgesetzt)}")
+            else:
+                logger.info(f"Konfiguration aus '{konfig_datei_pfad}' geladen und validiert.")
             return konfiguration_temp
 
     except json.JSONDecodeError as e:
@@ -117,30 +357,59 @@ def _lade_konfiguration(konfig_datei_pfad: str) -> Dict:
         return STANDARD_KONFIGURATION
 
 
-def _validiere_konfiguration(konfiguration_dict: Dict) -> None:
+def _validiere_konfiguration(konfiguration_dict: Dict) -> List[str]:
     """
     Validiert die Konfiguration gegen ein vordefiniertes Schema.
     Stellt sicher, dass kritische Konfigurationswerte gültig sind, um unerwartetes Verhalten zu verhindern.
+    Ungültige Werte werden einzeln mit einer Warnung auf ihren Standardwert zurückgesetzt; alle gültigen Einträge
+    (z.B. die Lizenzakzeptanz) bleiben erhalten.
+
+    Args:
+        konfiguration_dict (Dict): Die zu prüfende Konfiguration (wird bei ungültigen Werten angepasst).
+
+    Returns:
+        List[str]: Die Schlüssel, deren Werte zurückgesetzt wurden.
+    """
+    def _ist_text(wert: Any) -> bool: # Leere Angaben (None, '') sind erlaubt
+        return not wert or isinstance(wert, str)
+    def _ist_zahl(wert: Any) -> bool:
+        return isinstance(wert, (int, float)) and not isinstance(wert, bool)
+
+    pruefungen = {
+        "basis_verzeichnis": (lambda wert: bool(wert) and isinstance(wert, str), "Basisverzeichnis in der Konfiguration ungültig."),
+        "logo_pfad": (_ist_text, "Logo-Pfad in der Konfiguration ungültig."),
+        "ausgabe_pfad": (_ist_text, "Ausgabe-Pfad in der Konfiguration ungültig."),
+        CONFIG_SCHLUESSEL_DATENBANK_PFAD: (_ist_text, "Datenbank-Pfad in der Konfiguration ungültig."),
+        "daten_verzeichnis": (_ist_text, "Datenverzeichnis in der Konfiguration ungültig."),
+        "parquet_verzeichnis": (_ist_text, "Parquet-Verzeichnis in der Konfiguration ungültig."),
+        CONFIG_SCHLUESSEL_LIZENZSCHLUESSEL: (_ist_text, "Lizenzschlüssel in der Konfiguration ungültig."), # Lizenzschlüssel kann None sein oder ein String
+        "validierungs_schema": (lambda wert: wert is None or isinstance(wert, dict), "Validierungsschema in der Konfiguration ungültig."),
+        "excel_cache_verzeichnis": (lambda wert: wert is None or isinstance(wert, str), "Excel-Cache-Verzeichnis in der Konfiguration ungültig."),
+        "schaetz_fehler": (lambda wert: _ist_zahl(wert) and SCHAETZ_FEHLER_MIN <= wert <= SCHAETZ_FEHLER_MAX,
+                           f"Schätzfehler in der Konfiguration ungültig (erlaubt: {SCHAETZ_FEHLER_MIN} bis {SCHAETZ_FEHLER_MAX})."),
+        "statistiken": (lambda wert: isinstance(wert, list) and all(isinstance(name, str) and _ist_statistik_name(name) for name in wert),
+                        f"Statistiken in der Konfiguration ungültig (erlaubt: {', '.join(STATISTIK_NAMEN)}, p1-p99)."),
+        "sortier_verzeichnis": (lambda wert: wert is None or isinstance(wert, str), "Sortierverzeichnis in der Konfiguration ungültig."),
+        "speicher_budget_mb": (lambda wert: wert is None or (_ist_zahl(wert) and wert > 0),
+                               "'speicher_budget_mb' in der Konfiguration ungültig (muss größer als 0 oder null sein)."),
+    }
+    for schluessel in ("lauf_cache_ttl_stunden", "lauf_cache_max_mb", "excel_cache_max_mb", "sortier_speicher_mb"):
+        pruefungen[schluessel] = (lambda wert: _ist_zahl(wert) and wert > 0, f"'{schluessel}' in der Konfiguration ungültig (muss größer als 0 sein).")
+
+    zurueckgesetzt = []
+    for schluessel, (ist_gueltig, meldung) in pruefungen.items():
+        if not ist_gueltig(konfiguration_dict.get(schluessel)):
+            logger.warning(f"{meldung} Standardwert wird verwendet: {STANDARD_KONFIGURATION[schluessel]!r}")
+            konfiguration_dict[schluessel] = STANDARD_KONFIGURATION[schluessel]
+            zurueckgesetzt.append(schluessel)
+    return zurueckgesetzt
+
+
+def _ist_statistik_name(name: str) -> bool:
     """
-    basis_verzeichnis = konfiguration_dict.get("basis_verzeichnis")
-    logo_pfad = konfiguration_dict.get("logo_pfad")
-    ausgabe_pfad = konfiguration_dict.get("ausgabe_pfad")
-    datenbank_pfad = konfiguration_dict.get(CONFIG_SCHLUESSEL_DATENBANK_PFAD)
-    daten_verzeichnis = konfiguration_dict.get("daten_verzeichnis")
-    lizenzschluessel = konfiguration_dict.get(CONFIG_SCHLUESSEL_LIZENZSCHLUESSEL) # Lizenzschlüssel wird auch validiert
-
-    if not basis_verzeichnis or not isinstance(basis_verzeichnis, str):
-        raise ValueError("Basisverzeichnis in der Konfiguration ungültig.")
-    if logo_pfad and not isinstance(logo_pfad, str):
-        raise ValueError("Logo-Pfad in der Konfiguration ungültig.")
-    if ausgabe_pfad and not isinstance(ausgabe_pfad, str):
-        raise ValueError("Ausgabe-Pfad in der Konfiguration ungültig.")
-    if datenbank_pfad and not isinstance(datenbank_pfad, str):
-        raise ValueError("Datenbank-Pfad in der Konfiguration ungültig.")
-    if daten_verzeichnis and not isinstance(daten_verzeichnis, str):
-        raise ValueError("Datenverzeichnis in der Konfiguration ungültig.")
-    if lizenzschluessel and not isinstance(lizenzschluessel, str) and lizenzschluessel is not None: # Lizenzschlüssel kann None sein oder ein String
-        raise ValueError("Lizenzschlüssel in der Konfiguration ungültig.")
+    Prüft, ob eine Kennzahl der Spaltenstatistik unterstützt wird (feste Namen oder Perzentil 'p1' bis 'p99').
+    """
+    return name in STATISTIK_NAMEN or bool(re.fullmatch(r'p([1-9]|[1-9][0-9])', name))
 
 
 konfiguration = _lade_konfiguration(CONFIG_DATEI) # Konfiguration beim Start laden
@@ -150,7 +419,18 @@ LOGO_DATEIPFAD = konfiguration["logo_pfad"]
 AUSGABE_DATEIPFAD = konfiguration["ausgabe_pfad"]
 DATENBANK_PFAD = konfiguration[CONFIG_SCHLUESSEL_DATENBANK_PFAD]
 DATEN_VERZEICHNIS = konfiguration["daten_verzeichnis"]
+PARQUET_VERZEICHNIS = konfiguration.get("parquet_verzeichnis") or PARQUET_VERZEICHNIS_STANDARD # Spaltenorientierter Verlauf
 LIZENZSCHLUESSEL = konfiguration.get(CONFIG_SCHLUESSEL_LIZENZSCHLUESSEL) # Lizenzschlüssel aus Konfiguration laden
+VALIDIERUNGS_SCHEMA = konfiguration.get("validierungs_schema") or STANDARD_VALIDIERUNGS_SCHEMA # Globales Validierungsschema
+EXCEL_CACHE_VERZEICHNIS = konfiguration.get("excel_cache_verzeichnis") # Excel-Cache (None: deaktiviert)
+EXCEL_CACHE_MAX_MB = konfiguration.get("excel_cache_max_mb", EXCEL_CACHE_MAX_MB_STANDARD) # Maximale Größe des Excel-Caches
+SCHAETZ_FEHLER = konfiguration.get("schaetz_fehler", SCHAETZ_FEHLER_STANDARD) # Standardfehler des approximativen Vergleichs
+STATISTIKEN = konfiguration.get("statistiken", STATISTIK_STANDARD) # Kennzahlen der Spaltenstatistik
+LAUF_CACHE_TTL_STUNDEN = konfiguration.get("lauf_cache_ttl_stunden", LAUF_CACHE_TTL_STUNDEN_STANDARD) # Lebensdauer im Lauf-Cache
+LAUF_CACHE_MAX_MB = konfiguration.get("lauf_cache_max_mb", LAUF_CACHE_MAX_MB_STANDARD) # Maximale Größe des Lauf-Caches
+SORTIER_SPEICHER_MB = konfiguration.get("sortier_speicher_mb", SORTIER_SPEICHER_MB_STANDARD) # Speicherbudget des externen Sortierens
+SORTIER_VERZEICHNIS = konfiguration.get("sortier_verzeichnis") # Arbeitsverzeichnis der Sortierläufe
+SPEICHER_BUDGET_MB = konfiguration.get("speicher_budget_mb") # Speicherbudget der Verfahrenswahl (None: automatisch)
 
 
 # --- Lizenzbedingungen (CipherCore Standard: Klar und Rechtlich geprüft) ---
@@ -314,6 +594,318 @@ class CipherCoreLizenzFehler(CipherCoreDatenFehler):
     """Fehler im Zusammenhang mit der Lizenzierung."""
     pass
 
+class CipherCoreAbbruchFehler(CipherCoreDatenFehler):
+    """Vorgang wurde durch den Benutzer abgebrochen."""
+    pass
+
+
+# --- VergleichsAbbruchToken Klasse (CipherCore Standard: Kooperativer Abbruch) ---
+class VergleichsAbbruchToken:
+    """
+    Thread-sicheres Abbruchsignal für lang laufende Lade- und Vergleichsvorgänge.
+    Die Verarbeitung prüft das Token an definierten Stellen (z.B. nach jedem Datenblock) und bricht kooperativ ab.
+    """
+
+    def __init__(self):
+        """Initialisiert ein nicht ausgelöstes Abbruch-Token."""
+        self._ereignis = threading.Event()
+
+    def abbrechen(self) -> None:
+        """Fordert den Abbruch des zugehörigen Vorgangs an."""
+        self._ereignis.set()
+
+    @property
+    def ist_abgebrochen(self) -> bool:
+        """Gibt an, ob der Abbruch angefordert wurde."""
+        return self._ereignis.is_set()
+
+    def pruefe(self) -> None:
+        """
+        Prüft, ob der Abbruch angefordert wurde.
+
+        Raises:
+            CipherCoreAbbruchFehler: Wenn der Vorgang abgebrochen werden soll.
+        """
+        if self._ereignis.is_set():
+            raise CipherCoreAbbruchFehler("Vorgang wurde durch den Benutzer abgebrochen.")
+
+
+
+# --- DatenValidierer Klasse (CipherCore Standard: Deklarative Datenvalidierung) ---
+class DatenValidierer:
+    """
+    Prüft Daten gegen ein deklaratives Schema (Typ, Wertebereich, Eindeutigkeit, Null-Anteil, Regex je Spalte).
+    Das Schema wird einmalig kompiliert; jede Spalte wird pro Block in einem vektorisierten Durchlauf geprüft,
+    ohne den DataFrame zu kopieren. Blöcke können nacheinander übergeben werden (blockweises Laden).
+
+    Schemaformat:
+        {"spalten": {"Alter": {"erforderlich": true, "typ": "zahl", "min": 0, "max": 150,
+                               "eindeutig": false, "max_null_anteil": 0.0, "regex": "..."}},
+         "max_verstoesse": 20}
+    """
+
+    REGEL_SCHLUESSEL = ("erforderlich", "typ", "min", "max", "eindeutig", "max_null_anteil", "regex")
+
+    def __init__(self, schema: Dict, dateiname: str):
+        """
+        Kompiliert das Schema für eine Datei.
+
+        Args:
+            schema (Dict): Das Validierungsschema.
+            dateiname (str): Der Name der zu prüfenden Datei (für Fehlermeldungen).
+
+        Raises:
+            CipherCoreDatenValidierungsFehler: Wenn das Schema selbst ungültig ist.
+        """
+        self.dateiname = dateiname
+        try:
+            self.regeln = self._kompiliere(schema)
+            self.max_verstoesse = int(schema.get("max_verstoesse", VALIDIERUNG_MAX_VERSTOESSE))
+        except (TypeError, ValueError, AttributeError, re.error) as e:
+            logger.error(f"Ungültiges Validierungsschema für Datei '{dateiname}': {e}")
+            raise CipherCoreDatenValidierungsFehler(f"Ungültiges Validierungsschema für Datei '{dateiname}': {e}") from e
+        self.zuruecksetzen()
+
+
+    def zuruecksetzen(self) -> None:
+        """
+        Verwirft alle bisher geprüften Blöcke (z.B. wenn eine Datei mit anderer Kodierung erneut gelesen wird).
+        """
+        self.verstoesse: List[str] = []
+        self.anzahl_verstoesse = 0
+        self.zeilen_geprueft = 0
+        self._spalten_geprueft = False
+        self._null_anzahl: Dict[str, int] = {spalte: 0 for spalte in self.regeln}
+        self._erste_null_zeilen: Dict[str, List[int]] = {spalte: [] for spalte in self.regeln}
+        self._gesehene_werte: Dict[str, set] = {spalte: set() for spalte, regel in self.regeln.items() if regel.get("eindeutig")}
+
+
+    @classmethod
+    def _kompiliere(cls, schema: Dict) -> Dict[str, Dict]:
+        """
+        Prüft das Schema und bereitet die Regeln vor (z.B. vorkompilierte reguläre Ausdrücke).
+
+        Args:
+            schema (Dict): Das Validierungsschema.
+
+        Returns:
+            Dict[str, Dict]: Kompilierte Regeln je Spalte.
+
+        Raises:
+            ValueError: Wenn das Schema unbekannte Schlüssel oder ungültige Werte enthält.
+        """
+        regeln: Dict[str, Dict] = {}
+        for spalte, regel in schema.get("spalten", {}).items():
+            unbekannt = set(regel) - set(cls.REGEL_SCHLUESSEL)
+            if unbekannt:
+                raise ValueError(f"Unbekannte Regel(n) für Spalte '{spalte}': {', '.join(sorted(unbekannt))}")
+            kompiliert = dict(regel)
+            if "typ" in regel and regel["typ"] not in VALIDIERUNG_TYPEN:
+                raise ValueError(f"Ungültiger Typ '{regel['typ']}' für Spalte '{spalte}'. Erlaubt: {', '.join(VALIDIERUNG_TYPEN)}")
+            for grenze in ("min", "max"):
+                if grenze in regel:
+                    kompiliert[grenze] = float(regel[grenze])
+            if "max_null_anteil" in regel:
+                kompiliert["max_null_anteil"] = float(regel["max_null_anteil"])
+                if not 0.0 <= kompiliert["max_null_anteil"] <= 1.0:
+                    raise ValueError(f"max_null_anteil für Spalte '{spalte}' muss zwischen 0 und 1 liegen.")
+            if "regex" in regel:
+                kompiliert["regex"] = re.compile(regel["regex"])
+            regeln[spalte] = kompiliert
+        return regeln
+
+
+    def _verstoss(self, spalte: str, zeilen: np.ndarray, beschreibung: str) -> None:
+        """
+        Vermerkt Verstöße; nur die ersten `max_verstoesse` werden mit Zeilennummer gespeichert.
+
+        Args:
+            spalte (str): Die betroffene Spalte.
+            zeilen (np.ndarray): 1-basierte Datenzeilennummern (ohne Kopfzeile) der Verstöße.
+            beschreibung (str): Beschreibung des Verstoßes.
+        """
+        self.anzahl_verstoesse += len(zeilen)
+        frei = self.max_verstoesse - len(self.verstoesse)
+        for zeile in zeilen[:max(frei, 0)]:
+            self.verstoesse.append(f"Zeile {int(zeile)}, Spalte '{spalte}': {beschreibung}")
+
+
+    def pruefe_block(self, daten_frame: pd.DataFrame) -> None:
+        """
+        Prüft einen Block (oder den gesamten DataFrame) in einem vektorisierten Durchlauf je Spalte.
+
+        Args:
+            daten_frame (pd.DataFrame): Der zu prüfende Block.
+
+        Raises:
+            CipherCoreDatenValidierungsFehler: Wenn eine erforderliche Spalte fehlt.
+        """
+        if not self._spalten_geprueft:
+            for spalte, regel in self.regeln.items():
+                if regel.get("erforderlich") and spalte not in daten_frame.columns:
+                    logger.warning(f"Erforderliche Spalte '{spalte}' fehlt in Datei '{self.dateiname}'.")
+                    raise CipherCoreDatenValidierungsFehler(f"Erforderliche Spalte '{spalte}' fehlt in Datei '{self.dateiname}'.")
+            self._spalten_geprueft = True
+
+        zeilen_versatz = self.zeilen_geprueft + 1 # 1-basierte Datenzeilennummer der ersten Zeile dieses Blocks
+        for spalte, regel in self.regeln.items():
+            if spalte not in daten_frame.columns:
+                continue
+            serie = daten_frame[spalte] # Spaltenzugriff ohne Kopie
+            null_maske = serie.isna().to_numpy()
+            null_zeilen = np.flatnonzero(null_maske)
+            self._null_anzahl[spalte] += len(null_zeilen)
+            erste_nullen = self._erste_null_zeilen[spalte]
+            if len(erste_nullen) < self.max_verstoesse:
+                erste_nullen.extend((null_zeilen[:self.max_verstoesse - len(erste_nullen)] + zeilen_versatz).tolist())
+
+            typ = regel.get("typ")
+            werte = serie
+            if typ in ("zahl", "ganzzahl") or "min" in regel or "max" in regel:
+                if not pd.api.types.is_numeric_dtype(serie) or pd.api.types.is_bool_dtype(serie):
+                    werte = pd.to_numeric(serie, errors='coerce') # Nur bei nicht-numerischen Spalten wird konvertiert
+                    ungueltig = werte.isna().to_numpy() & ~null_maske
+                    if ungueltig.any():
+                        self._verstoss(spalte, np.flatnonzero(ungueltig) + zeilen_versatz, "Wert ist nicht numerisch")
+                werte_array = werte.to_numpy(dtype='float64', na_value=np.nan)
+                if typ == "ganzzahl":
+                    with np.errstate(invalid='ignore'):
+                        keine_ganzzahl = np.isfinite(werte_array) & (np.mod(werte_array, 1) != 0)
+                    if keine_ganzzahl.any():
+                        self._verstoss(spalte, np.flatnonzero(keine_ganzzahl) + zeilen_versatz, "Wert ist keine Ganzzahl")
+                with np.errstate(invalid='ignore'):
+                    if "min" in regel:
+                        zu_klein = werte_array < regel["min"]
+                        if zu_klein.any():
+                            self._verstoss(spalte, np.flatnonzero(zu_klein) + zeilen_versatz, f"Wert kleiner als {regel['min']:g}")
+                    if "max" in regel:
+                        zu_gross = werte_array > regel["max"]
+                        if zu_gross.any():
+                            self._verstoss(spalte, np.flatnonzero(zu_gross) + zeilen_versatz, f"Wert größer als {regel['max']:g}")
+            elif typ == "text" and pd.api.types.is_numeric_dtype(serie) and not null_maske.all():
+                self._verstoss(spalte, np.flatnonzero(~null_maske) + zeilen_versatz, "Wert ist kein Text")
+
+            if "regex" in regel:
+                text = serie if pd.api.types.is_string_dtype(serie) else serie.astype('string')
+                muster = regel["regex"].pattern if isinstance(text.dtype, pd.ArrowDtype) else regel["regex"] # Arrow-Spalten erwarten das Muster als Text
+                passt = text.str.fullmatch(muster).to_numpy(dtype=bool, na_value=False)
+                ungueltig = ~passt & ~null_maske # Nullwerte zählen nur für max_null_anteil
+                if ungueltig.any():
+                    self._verstoss(spalte, np.flatnonzero(ungueltig) + zeilen_versatz, f"Wert entspricht nicht dem Muster '{regel['regex'].pattern}'")
+
+            if regel.get("eindeutig"):
+                gesehen = self._gesehene_werte[spalte]
+                doppelt = serie.duplicated().to_numpy() & ~null_maske
+                if gesehen:
+                    doppelt |= serie.isin(gesehen).to_numpy()
+                if doppelt.any():
+                    self._verstoss(spalte, np.flatnonzero(doppelt) + zeilen_versatz, "Wert ist nicht eindeutig")
+                gesehen.update(serie.dropna().unique().tolist())
+
+        self.zeilen_geprueft += len(daten_frame)
+
+
+    def abschliessen(self) -> None:
+        """
+        Prüft dateiweite Regeln (Null-Anteil) und meldet alle gesammelten Verstöße.
+
+        Raises:
+            CipherCoreDatenValidierungsFehler: Wenn mindestens ein Verstoß gefunden wurde.
+        """
+        for spalte, regel in self.regeln.items():
+            if "max_null_anteil" in regel and self.zeilen_geprueft:
+                null_anteil = self._null_anzahl[spalte] / self.zeilen_geprueft
+                if null_anteil > regel["max_null_anteil"]:
+                    self._verstoss(spalte, np.asarray(self._erste_null_zeilen[spalte]),
+                                   f"Leerer Wert (Null-Anteil {null_anteil:.1%} > {regel['max_null_anteil']:.1%})")
+        if self.anzahl_verstoesse:
+            details = "\n".join(self.verstoesse)
+            weitere = self.anzahl_verstoesse - len(self.verstoesse)
+            if weitere > 0:
+                details += f"\n... und {weitere} weitere Verstöße"
+            logger.warning(f"Datei '{self.dateiname}' verletzt das Validierungsschema ({self.anzahl_verstoesse} Verstöße):\n{details}")
+            raise CipherCoreDatenValidierungsFehler(
+                f"Datei '{self.dateiname}' verletzt das Validierungsschema ({self.anzahl_verstoesse} Verstöße):\n{details}")
+
+
+
+# --- KodierungsRueckfallStrom Klasse (CipherCore Standard: Robuste Zeichenkodierung) ---
+class KodierungsRueckfallStrom(RawIOBase):
+    """
+    Binärer Datenstrom, der eine als UTF-8 erkannte Quelle in einem Durchlauf als UTF-8 ausgibt.
+    Gültige UTF-8-Bytes werden unverändert durchgereicht. Ab dem ersten ungültigen Byte wird der Rest der Quelle mit der
+    nächsten Kodierung aus CSV_ERSATZ_KODIERUNGEN gelesen und nach UTF-8 umkodiert, statt die Datei erneut zu lesen.
+    """
+
+    def __init__(self, quelle, bei_umschaltung: Optional[Callable[[str], None]] = None, block_bytes: int = 1024 * 1024):
+        """
+        Initialisiert den Datenstrom.
+
+        Args:
+            quelle: Binärer Datenstrom mit read(n) (z.B. Datei, gzip-Strom oder pyarrow-Eingabestrom).
+            bei_umschaltung (Optional[Callable[[str], None]]): Wird beim Wechsel mit der neuen Kodierung aufgerufen (optional).
+            block_bytes (int): Bytes je Lesezugriff auf die Quelle.
+        """
+        super().__init__()
+        self.quelle = quelle
+        self.bei_umschaltung = bei_umschaltung
+        self.block_bytes = block_bytes
+        self.kodierung = 'utf-8'
+        self._ersatz_kodierungen = list(CSV_ERSATZ_KODIERUNGEN)
+        self._dekodierer = codecs.getincrementaldecoder(self.kodierung)()
+        self._rest = b'' # Bytes eines am Blockende unvollständigen UTF-8-Zeichens (noch nicht ausgegeben)
+        self._ausgabe = memoryview(b'')
+        self._ende = False
+
+
+    def readable(self) -> bool:
+        return True
+
+
+    def readinto(self, puffer) -> int:
+        """
+        Füllt den Puffer mit den nächsten UTF-8-Bytes (0 am Ende der Quelle).
+        """
+        while not len(self._ausgabe) and not self._ende:
+            block = self.quelle.read(self.block_bytes)
+            self._ende = not block
+            self._ausgabe = memoryview(self._umkodieren(block, final=self._ende))
+        anzahl = min(len(puffer), len(self._ausgabe))
+        puffer[:anzahl] = self._ausgabe[:anzahl]
+        self._ausgabe = self._ausgabe[anzahl:]
+        return anzahl
+
+
+    def _umkodieren(self, block: bytes, final: bool) -> bytes:
+        """
+        Kodiert einen Block der Quelle nach UTF-8 um und wechselt bei einem Dekodierfehler die Kodierung.
+
+        Raises:
+            UnicodeDecodeError: Wenn auch die letzte Ersatzkodierung den Block nicht dekodieren kann.
+        """
+        daten = self._rest + block # Der Dekodierer hält _rest intern; Fehlerpositionen beziehen sich auf daten
+        teile: List[bytes] = []
+        while True:
+            try:
+                text = self._dekodierer.decode(block, final)
+            except UnicodeDecodeError as e:
+                if not self._ersatz_kodierungen:
+                    raise
+                gueltig = daten[:e.start]
+                teile.append(gueltig if self.kodierung == 'utf-8' else gueltig.decode(self.kodierung).encode('utf-8'))
+                daten = block = daten[e.start:]
+                self.kodierung = self._ersatz_kodierungen.pop(0)
+                self._dekodierer, self._rest = codecs.getincrementaldecoder(self.kodierung)(), b''
+                if self.bei_umschaltung:
+                    self.bei_umschaltung(self.kodierung)
+                continue
+            if self.kodierung == 'utf-8':
+                self._rest = self._dekodierer.getstate()[0]
+                teile.append(daten[:len(daten) - len(self._rest)])
+            else:
+                teile.append(text.encode('utf-8'))
+            return b''.join(teile)
+
 
 
 # --- DatenLader Klasse (CipherCore Standard: Sicheres und Robustes Laden) ---
@@ -323,25 +915,39 @@ class DatenLader:
     Implementiert strenge Sicherheitsprüfungen für Dateipfade und umfassende Datenvalidierung.
     """
 
-    def __init__(self, basis_verzeichnis: str):
+    def __init__(self, basis_verzeichnis: str, validierungs_schema: Optional[Dict] = None,
+                 excel_cache_verzeichnis: Optional[str] = EXCEL_CACHE_VERZEICHNIS, excel_cache_max_mb: float = EXCEL_CACHE_MAX_MB):
         """
         Initialisiert den Datenlader mit dem Basisverzeichnis für sichere Dateipfade.
 
         Args:
             basis_verzeichnis (str): Das Basisverzeichnis, auf das Dateipfade beschränkt werden.
+            validierungs_schema (Optional[Dict]): Validierungsschema für alle Dateien (optional, Standard: aus config.json).
+                                                  Eine Datei '<datei>.schema.json' neben der Eingabedatei hat Vorrang.
+            excel_cache_verzeichnis (Optional[str]): Verzeichnis für spaltenorientierte Kopien gelesener .xlsx-Blätter
+                                                     (optional, Standard: aus config.json; None deaktiviert den Cache).
+            excel_cache_max_mb (float): Maximale Größe des Excel-Caches in MB (optional, Standard: aus config.json).
         """
         if not basis_verzeichnis or not isinstance(basis_verzeichnis, str):
             raise ValueError("Basisverzeichnis muss ein gültiger Pfad sein.")
         self.basis_verzeichnis = os.path.abspath(basis_verzeichnis) # Absoluter Pfad für sichere Pfadvergleiche
+        self.validierungs_schema = validierungs_schema or VALIDIERUNGS_SCHEMA
+        self.excel_cache_verzeichnis = excel_cache_verzeichnis
+        self.excel_cache_max_bytes = int(excel_cache_max_mb * 1024 * 1024)
         logger.debug(f"DatenLader initialisiert mit Basisverzeichnis: {self.basis_verzeichnis}")
 
 
-    def lade_daten(self, datei_pfad: str) -> Tuple[pd.DataFrame, str]:
+    def lade_daten(self, datei_pfad: str, abbruch_token: Optional[VergleichsAbbruchToken] = None,
+                   spalten: Optional[List[str]] = None, blatt_name: Optional[str] = None) -> Tuple[pd.DataFrame, str]:
         """
         Lädt Daten aus der angegebenen Datei. Führt Sicherheitsprüfungen und Validierung durch.
 
         Args:
             datei_pfad (str): Der Pfad zur zu ladenden Datei.
+            abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch des Ladevorgangs (optional).
+            spalten (Optional[List[str]]): Benötigte Spalten (optional). Bei Excel-, Parquet-, Feather- und Arrow-Dateien
+                                           werden nur diese Spalten und die Spalten des Validierungsschemas gelesen.
+            blatt_name (Optional[str]): Arbeitsblatt von Excel-Dateien (optional, Standard: erstes Blatt).
 
         Returns:
             Tuple[pd.DataFrame, str]: Ein DataFrame mit den geladenen Daten und der Dateiname.
@@ -350,6 +956,7 @@ class DatenLader:
             CipherCoreDateiFehler: Wenn der Dateipfad ungültig ist, das Dateiformat nicht unterstützt wird,
                                   die Datei nicht gefunden wird oder ein Fehler beim Lesen der Datei auftritt.
             CipherCoreDatenValidierungsFehler: Wenn die Datenvalidierung fehlschlägt.
+            CipherCoreAbbruchFehler: Wenn der Ladevorgang über das Abbruch-Token abgebrochen wurde.
         """
         dateiname = os.path.basename(datei_pfad)
         logger.info(f"Starte Ladevorgang für Datei: '{dateiname}'")
@@ -358,8 +965,18 @@ class DatenLader:
             logger.error(f"Unsicherer Dateipfad: '{datei_pfad}'. Pfad liegt außerhalb des Basisverzeichnisses.")
             raise CipherCoreDateiFehler(f"Ungültiger Dateipfad. Sicherheitshinweis: Pfad muss innerhalb des Basisverzeichnisses liegen.")
 
+        schema = self._lade_validierungs_schema(datei_pfad)
+        validierer = DatenValidierer(schema, dateiname)
+        if spalten is not None:
+            spalten = list(dict.fromkeys(list(spalten) + list(schema.get("spalten", {})))) # Reihenfolge erhalten, Duplikate entfernen
         try:
-            daten_frame = self._datei_laden(datei_pfad)
+            daten_frame = self._datei_laden(datei_pfad, abbruch_token, validierer, spalten, blatt_name)
+        except CipherCoreDatenValidierungsFehler as e:
+            logger.error(f"Datenvalidierung für Datei '{dateiname}' fehlgeschlagen: {e}")
+            raise # Validierungsfehler beim blockweisen Laden unverändert weiterleiten
+        except CipherCoreAbbruchFehler:
+            logger.info(f"Ladevorgang für Datei '{dateiname}' abgebrochen.")
+            raise # Abbruch unverändert weiterleiten
         except FileNotFoundError as e:
             logger.error(f"Datei nicht gefunden: {e.filename}")
             raise CipherCoreDateiLadeFehler(f"Datei nicht gefunden: {e.filename}") from e
@@ -371,7 +988,7 @@ class DatenLader:
             raise CipherCoreDateiLadeFehler(f"Unerwarteter Fehler beim Laden der Datei '{dateiname}': {e}") from e
 
         try:
-            self._validiere_daten(daten_frame, dateiname)
+            self._validiere_daten(daten_frame, dateiname, validierer)
         except CipherCoreDatenValidierungsFehler as e:
             logger.error(f"Datenvalidierung für Datei '{dateiname}' fehlgeschlagen: {e}")
             raise e # Fehler weiterleiten
@@ -380,12 +997,20 @@ class DatenLader:
         return daten_frame, dateiname
 
 
-    def _datei_laden(self, datei_pfad: str) -> pd.DataFrame:
+    def _datei_laden(self, datei_pfad: str, abbruch_token: Optional[VergleichsAbbruchToken] = None,
+                     validierer: Optional[DatenValidierer] = None, spalten: Optional[List[str]] = None,
+                     blatt_name: Optional[str] = None) -> pd.DataFrame:
         """
-        Interne Hilfsfunktion zum Laden einer einzelnen Datei (CSV, TXT oder Excel).
+        Interne Hilfsfunktion zum Laden einer einzelnen Datei (CSV, TXT, Excel, Parquet, Feather oder Arrow IPC).
+        Mit Abbruch-Token werden CSV/TXT-Dateien blockweise gelesen, damit ein Abbruch zwischen den Blöcken greift;
+        ein übergebener Validierer prüft dabei jeden Block direkt nach dem Lesen. .xlsx-Dateien werden immer blockweise gestreamt.
 
         Args:
             datei_pfad (str): Der Pfad zur Datei.
+            abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch (optional).
+            validierer (Optional[DatenValidierer]): Validierer für die blockweise Prüfung (optional).
+            spalten (Optional[List[str]]): Zu lesende Spalten von Excel- und spaltenorientierten Dateien (optional, Standard: alle).
+            blatt_name (Optional[str]): Arbeitsblatt von Excel-Dateien (optional, Standard: erstes Blatt).
 
         Returns:
             pd.DataFrame: Ein DataFrame mit den Daten aus der Datei.
@@ -394,1381 +1019,9177 @@ class DatenLader:
             ValueError: Wenn das Dateiformat nicht unterstützt wird.
         """
         dateiname = os.path.basename(datei_pfad)
-        datei_endung = datei_pfad.lower()
+        datei_endung = self._innerer_dateiname(datei_pfad).lower() # Bei komprimierten Dateien das enthaltene Format
+        if self._kompression(datei_pfad) and not datei_endung.endswith((DATEIFORMAT_CSV, DATEIFORMAT_TEXT)):
+            raise ValueError(f"Komprimierte Eingaben ({', '.join(UNTERSTUETZTE_KOMPRESSIONEN)}) werden nur für CSV/TXT-Dateien unterstützt: {dateiname}")
         if datei_endung.endswith(DATEIFORMAT_CSV) or datei_endung.endswith(DATEIFORMAT_TEXT):
             try:
-                daten_frame = pd.read_csv(datei_pfad, encoding='utf-8') # Explizite Encoding-Angabe für Robustheit
-                logger.debug(f"Datei '{dateiname}' als CSV/TXT geladen.")
+                csv_format = self._erkenne_csv_format(datei_pfad)
+                daten_frame = self._csv_laden(datei_pfad, abbruch_token, validierer, csv_format) # Ein Durchlauf, auch bei späteren Nicht-UTF-8-Bytes
+                logger.debug(f"Datei '{dateiname}' als CSV/TXT geladen (Format: {csv_format}).")
+            except (CipherCoreAbbruchFehler, CipherCoreDatenValidierungsFehler, FileNotFoundError):
+                raise
             except Exception as e:
                 logger.error(f"Fehler beim Lesen der CSV/TXT-Datei '{dateiname}': {e}")
                 raise ValueError(f"Fehler beim Lesen der CSV/TXT-Datei '{dateiname}': {e}") from e
 
-        elif datei_endung.endswith(DATEIFORMAT_EXCEL_XLS) or datei_endung.endswith(DATEIFORMAT_EXCEL_XLSX):
+        elif datei_endung.endswith(SPALTEN_DATEIFORMATE):
+            try:
+                daten_frame = self._spaltenformat_laden(datei_pfad, abbruch_token, validierer, spalten)
+                logger.debug(f"Datei '{dateiname}' als spaltenorientierte Datei geladen.")
+            except (CipherCoreAbbruchFehler, CipherCoreDatenValidierungsFehler, FileNotFoundError):
+                raise
+            except Exception as e:
+                logger.error(f"Fehler beim Lesen der Datei '{dateiname}': {e}")
+                raise ValueError(f"Fehler beim Lesen der spaltenorientierten Datei '{dateiname}': {e}") from e
+
+        elif datei_endung.endswith(DATEIFORMAT_EXCEL_XLSX):
             try:
-                daten_frame = pd.read_excel(datei_pfad)
+                daten_frame = self._xlsx_laden(datei_pfad, abbruch_token, validierer, spalten, blatt_name)
+            except (CipherCoreAbbruchFehler, CipherCoreDatenValidierungsFehler, FileNotFoundError):
+                raise
+            except Exception as e:
+                logger.error(f"Fehler beim Lesen der Excel-Datei '{dateiname}': {e}")
+                raise ValueError(f"Fehler beim Lesen der Excel-Datei '{dateiname}': {e}") from e
+
+        elif datei_endung.endswith(DATEIFORMAT_EXCEL_XLS):
+            if abbruch_token:
+                abbruch_token.pruefe() # .xls-Dateien können nicht blockweise gelesen werden, daher Prüfung vor dem Lesen
+            try:
+                daten_frame = pd.read_excel(datei_pfad, sheet_name=blatt_name or 0,
+                                            usecols=(lambda spalte: spalte in spalten) if spalten else None)
                 logger.debug(f"Datei '{dateiname}' als Excel geladen.")
             except Exception as e:
                 logger.error(f"Fehler beim Lesen der Excel-Datei '{dateiname}': {e}")
                 raise ValueError(f"Fehler beim Lesen der Excel-Datei '{dateiname}': {e}") from e
         else:
-            logger.error(f"Ungültiges Dateiformat für Datei: '{dateiname}'. Unterstützte Formate: {', '.join(UNTERSTUETZTE_DATEIFORMATE)}.")
+            logger.error(f"Ungültiges Dateiformat für Datei: '{dateiname}'. Unterstützte Formate: {', '.join(UNTERSTUETZTE_DATEIFORMATE)} "
+                         f"(CSV/TXT auch komprimiert: {', '.join(UNTERSTUETZTE_KOMPRESSIONEN)}).")
             raise ValueError(
-                f"Ungültiges Dateiformat für Datei: {dateiname}. Nur {', '.join(UNTERSTUETZTE_DATEIFORMATE)} Dateien werden unterstützt.")
+                f"Ungültiges Dateiformat für Datei: {dateiname}. Nur {', '.join(UNTERSTUETZTE_DATEIFORMATE)} Dateien werden unterstützt "
+                f"(CSV/TXT auch komprimiert: {', '.join(UNTERSTUETZTE_KOMPRESSIONEN)}).")
 
         return daten_frame
 
 
-    def _ist_pfad_sicher(self, datei_pfad: str) -> bool:
+    def _spaltenformat_laden(self, datei_pfad: str, abbruch_token: Optional[VergleichsAbbruchToken] = None,
+                             validierer: Optional[DatenValidierer] = None, spalten: Optional[List[str]] = None) -> pd.DataFrame:
         """
-        Interne Hilfsfunktion zur Überprüfung, ob ein Dateipfad sicher ist (innerhalb des Basisverzeichnisses).
-        Verhindert Path-Traversal-Angriffe, ein wichtiger Sicherheitsaspekt.
+        Interne Hilfsfunktion zum Laden von Parquet-, Feather- und Arrow-IPC-Dateien mit pyarrow.
+        Es werden nur die benötigten Spalten gelesen (Projektion); bei Parquet werden nur deren Spaltenblöcke
+        aus den Row-Groups dekodiert, Feather/Arrow-Dateien werden per mmap ohne Kopie eingeblendet.
+        Mit Abbruch-Token wird Row-Group- bzw. Batch-weise gelesen, auf Abbruch geprüft und validiert.
 
         Args:
-            datei_pfad (str): Der zu überprüfende Dateipfad.
+            datei_pfad (str): Der Pfad zur Datei.
+            abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch (optional).
+            validierer (Optional[DatenValidierer]): Validierer für die blockweise Prüfung (optional).
+            spalten (Optional[List[str]]): Zu lesende Spalten (optional, Standard: alle). Fehlende Spalten werden
+                                           ignoriert und von der Validierung gemeldet.
 
         Returns:
-            bool: True, wenn der Pfad sicher ist, False sonst.
+            pd.DataFrame: Ein DataFrame mit Arrow-Spalten (pd.ArrowDtype).
+
+        Raises:
+            ValueError: Wenn pyarrow nicht installiert ist.
         """
-        absoluter_pfad = os.path.abspath(datei_pfad)
-        ist_sicher = absoluter_pfad.startswith(self.basis_verzeichnis)
-        logger.debug(f"Pfad '{datei_pfad}' (absolut: '{absoluter_pfad}') ist sicher im Basisverzeichnis '{self.basis_verzeichnis}': {ist_sicher}")
-        return ist_sicher
+        if pa is None:
+            raise ValueError(f"Für {', '.join(SPALTEN_DATEIFORMATE)}-Dateien wird das Paket 'pyarrow' benötigt.")
+        if not os.path.exists(datei_pfad):
+            raise FileNotFoundError(2, "Datei nicht gefunden", datei_pfad)
+
+        def _projektion(vorhandene_spalten: List[str]) -> Optional[List[str]]:
+            return None if spalten is None else [spalte for spalte in vorhandene_spalten if spalte in spalten]
+
+        def _batch_verarbeiten(batch) -> None:
+            abbruch_token.pruefe()
+            if validierer:
+                validierer.pruefe_block(batch.to_pandas(types_mapper=pd.ArrowDtype))
+
+        if datei_pfad.lower().endswith(DATEIFORMAT_PARQUET):
+            parquet_datei = pa_parquet.ParquetFile(datei_pfad, memory_map=True)
+            projektion = _projektion(parquet_datei.schema_arrow.names)
+            if abbruch_token is None:
+                tabelle = parquet_datei.read(columns=projektion, use_threads=True)
+            else:
+                batches = []
+                for row_group in range(parquet_datei.num_row_groups):
+                    batch = parquet_datei.read_row_group(row_group, columns=projektion, use_threads=True)
+                    _batch_verarbeiten(batch)
+                    batches.append(batch)
+                tabelle = pa.concat_tables(batches) if batches else parquet_datei.schema_arrow.empty_table().select(projektion or parquet_datei.schema_arrow.names)
+        else:
+            with pa.memory_map(datei_pfad, 'r') as quelle:
+                try:
+                    leser = pa.ipc.open_file(quelle) # Feather V2 / Arrow IPC-Dateiformat (wahlfreier Zugriff)
+                    batches = (leser.get_batch(index) for index in range(leser.num_record_batches))
+                except pa.ArrowInvalid:
+                    quelle.seek(0)
+                    leser = pa.ipc.open_stream(quelle) # Arrow IPC-Streamformat
+                    batches = iter(leser)
+                projektion = _projektion(leser.schema.names)
+                gelesen = []
+                for batch in batches:
+                    if projektion is not None:
+                        batch = batch.select(projektion) # Nur Verweise auf die Spaltenpuffer, keine Kopie
+                    if abbruch_token:
+                        _batch_verarbeiten(batch)
+                    gelesen.append(batch)
+                schema = leser.schema if projektion is None else pa.schema([leser.schema.field(spalte) for spalte in projektion])
+                tabelle = pa.Table.from_batches(gelesen, schema=schema)
+        if abbruch_token:
+            abbruch_token.pruefe()
+        return tabelle.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+    def _xlsx_laden(self, datei_pfad: str, abbruch_token: Optional[VergleichsAbbruchToken] = None,
+                    validierer: Optional[DatenValidierer] = None, spalten: Optional[List[str]] = None,
+                    blatt_name: Optional[str] = None) -> pd.DataFrame:
+        """
+        Interne Hilfsfunktion zum Laden eines .xlsx-Arbeitsblatts.
+        Reihenfolge: spaltenorientierter Cache (falls aktiviert und aktuell), python-calamine (falls installiert),
+        sonst openpyxl im read-only-Modus als Block-Stream. Nach dem Lesen wird der Cache geschrieben und aufgeräumt.
+
+        Args:
+            datei_pfad (str): Der Pfad zur Datei.
+            abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch (optional).
+            validierer (Optional[DatenValidierer]): Validierer für die blockweise Prüfung (optional).
+            spalten (Optional[List[str]]): Zu lesende Spalten (optional, Standard: alle).
+            blatt_name (Optional[str]): Arbeitsblatt (optional, Standard: erstes Blatt).
+
+        Returns:
+            pd.DataFrame: Ein DataFrame mit den Daten des Arbeitsblatts.
+        """
+        dateiname = os.path.basename(datei_pfad)
+        cache_pfad = self._excel_cache_pfad(datei_pfad, spalten, blatt_name)
+        if cache_pfad and os.path.exists(cache_pfad):
+            if abbruch_token:
+                abbruch_token.pruefe()
+            try:
+                os.utime(cache_pfad) # Letzte Nutzung für die Verdrängung
+            except OSError:
+                pass
+            logger.debug(f"Excel-Datei '{dateiname}' aus Cache '{cache_pfad}' geladen.")
+            return pa_feather.read_table(cache_pfad, memory_map=True).to_pandas(types_mapper=pd.ArrowDtype)
+
+        if CALAMINE_VERFUEGBAR:
+            if abbruch_token:
+                abbruch_token.pruefe() # calamine liest das Blatt am Stück; Abbruchprüfung davor und danach
+            daten_frame = pd.read_excel(datei_pfad, sheet_name=blatt_name or 0, engine='calamine',
+                                        usecols=(lambda spalte: spalte in spalten) if spalten else None)
+            if abbruch_token:
+                abbruch_token.pruefe()
+            logger.debug(f"Datei '{dateiname}' mit calamine geladen.")
+        else:
+            daten_frame = self._xlsx_blockweise_laden(datei_pfad, abbruch_token, validierer, spalten, blatt_name)
+            logger.debug(f"Datei '{dateiname}' mit openpyxl (read-only) gestreamt.")
+
+        if cache_pfad:
+            self._schreibe_excel_cache(daten_frame, cache_pfad)
+            self._raeume_excel_cache_auf(cache_pfad)
+        return daten_frame
 
 
-    def _validiere_daten(self, daten_frame: pd.DataFrame, dateiname: str) -> None:
+    def _xlsx_blockweise_laden(self, datei_pfad: str, abbruch_token: Optional[VergleichsAbbruchToken] = None,
+                               validierer: Optional[DatenValidierer] = None, spalten: Optional[List[str]] = None,
+                               blatt_name: Optional[str] = None) -> pd.DataFrame:
         """
-        Interne Hilfsfunktion zur Validierung der geladenen Daten (Datentypen, Spalten, etc.).
-        Stellt Datenintegrität sicher und verhindert Fehler durch unerwartete Datenformate.
+        Interne Hilfsfunktion zum Streamen eines .xlsx-Arbeitsblatts mit openpyxl im read-only-Modus.
+        Es werden nur die ausgewählten Spalten übernommen; nach jedem Block wird auf Abbruch geprüft und validiert.
+        Leere Zeilen am Blattende werden wie bei pd.read_excel verworfen.
 
         Args:
-            daten_frame (pd.DataFrame): Der DataFrame mit den zu validierenden Daten.
-            dateiname (str): Der Name der Datei, aus der die Daten geladen wurden.
+            datei_pfad (str): Der Pfad zur Datei.
+            abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch (optional).
+            validierer (Optional[DatenValidierer]): Validierer für die blockweise Prüfung (optional).
+            spalten (Optional[List[str]]): Zu lesende Spalten (optional, Standard: alle).
+            blatt_name (Optional[str]): Arbeitsblatt (optional, Standard: erstes Blatt).
+
+        Returns:
+            pd.DataFrame: Ein DataFrame mit den Daten des Arbeitsblatts.
 
         Raises:
-            CipherCoreDatenValidierungsFehler: Wenn die Daten ungültig sind.
+            ValueError: Wenn das Arbeitsblatt nicht existiert.
         """
-        erforderliche_spalten = ['Name', 'Alter'] # Beispiel für erforderliche Spalten
+        from openpyxl import load_workbook # Optionale Abhängigkeit, nur für .xlsx benötigt
 
-        for spalte in erforderliche_spalten:
-            if spalte not in daten_frame.columns:
-                logger.warning(f"Erforderliche Spalte '{spalte}' fehlt in Datei '{dateiname}'.")
-                raise CipherCoreDatenValidierungsFehler(f"Erforderliche Spalte '{spalte}' fehlt in Datei '{dateiname}'.")
-
-        if 'Alter' in daten_frame.columns:
-            if not pd.api.types.is_numeric_dtype(daten_frame['Alter']):
-                logger.warning(f"Spalte 'Alter' in Datei '{dateiname}' ist nicht numerisch.")
-                raise CipherCoreDatenValidierungsFehler(f"Spalte 'Alter' in Datei '{dateiname}' ist nicht numerisch.")
-            # Validierung: Sicherstellen, dass Alter eine nicht-negative Zahl ist
-            negative_alter_werte = daten_frame[daten_frame['Alter'] < 0]['Alter']
-            if not negative_alter_werte.empty:
-                 logger.warning(f"Spalte 'Alter' in Datei '{dateiname}' enthält ungültige Werte (negative Alter): {negative_alter_werte.tolist()}")
-                 raise CipherCoreDatenValidierungsFehler(f"Spalte 'Alter' in Datei '{dateiname}' enthält ungültige Werte (negative Alter). Bitte korrigieren Sie die Datei.")
+        arbeitsmappe = load_workbook(datei_pfad, read_only=True, data_only=True)
+        try:
+            if blatt_name is None:
+                blatt = arbeitsmappe.worksheets[0]
+            elif blatt_name in arbeitsmappe.sheetnames:
+                blatt = arbeitsmappe[blatt_name]
+            else:
+                raise ValueError(f"Arbeitsblatt '{blatt_name}' nicht gefunden. Vorhanden: {', '.join(arbeitsmappe.sheetnames)}")
+            blatt.reset_dimensions() # Gespeicherte Blattgröße ist oft falsch; Zeilen bis zum tatsächlichen Ende lesen
+
+            zeilen = blatt.iter_rows(values_only=True)
+            kopfzeile = next(zeilen, None) or ()
+            spaltennamen = self._excel_spaltennamen(kopfzeile)
+            indizes = [i for i, name in enumerate(spaltennamen) if spalten is None or name in spalten]
+            namen = [spaltennamen[i] for i in indizes]
+
+            bloecke: List[pd.DataFrame] = []
+            puffer: List[tuple] = []
+            leere_zeilen = 0
+            for zeile in zeilen:
+                if all(wert is None for wert in zeile):
+                    leere_zeilen += 1 # Erst übernehmen, wenn noch eine nicht-leere Zeile folgt
+                    continue
+                if leere_zeilen:
+                    puffer.extend([(None,) * len(indizes)] * leere_zeilen)
+                    leere_zeilen = 0
+                puffer.append(tuple(zeile[i] if i < len(zeile) else None for i in indizes))
+                if len(puffer) >= EXCEL_BLOCK_GROESSE:
+                    bloecke.append(self._excel_block(puffer, namen, abbruch_token, validierer))
+                    puffer = []
+            if puffer or not bloecke:
+                bloecke.append(self._excel_block(puffer, namen, abbruch_token, validierer))
+        finally:
+            arbeitsmappe.close()
+        return bloecke[0] if len(bloecke) == 1 else pd.concat(bloecke, ignore_index=True)
 
-        logger.debug(f"Daten aus Datei '{dateiname}' erfolgreich validiert.")
 
+    @staticmethod
+    def _excel_spaltennamen(kopfzeile: tuple) -> List:
+        """
+        Bildet Spaltennamen aus der Kopfzeile wie pd.read_excel ('Unnamed: <i>' für leere Zellen, '.1', '.2' für Duplikate).
+        """
+        namen: List = []
+        for index, wert in enumerate(kopfzeile):
+            name = f"Unnamed: {index}" if wert is None else wert
+            basis_name, zaehler = name, 1
+            while name in namen:
+                name = f"{basis_name}.{zaehler}"
+                zaehler += 1
+            namen.append(name)
+        return namen
+
+
+    @staticmethod
+    def _excel_block(puffer: List[tuple], namen: List, abbruch_token: Optional[VergleichsAbbruchToken],
+                     validierer: Optional[DatenValidierer]) -> pd.DataFrame:
+        """
+        Wandelt gepufferte Excel-Zeilen in einen DataFrame-Block, prüft auf Abbruch und validiert den Block.
+        """
+        if abbruch_token:
+            abbruch_token.pruefe()
+        block = pd.DataFrame.from_records(puffer, columns=namen)
+        if validierer:
+            validierer.pruefe_block(block)
+        return block
 
 
-# --- DateiVergleicher Klasse (CipherCore Standard: Effiziente Datenverarbeitung) ---
-class DateiVergleicher:
-    """
-    Modul zum Vergleichen von zwei DataFrames und zur Berechnung relevanter Vergleichsmetriken.
-    Fokus auf Effizienz und Genauigkeit der Vergleichsberechnungen.
-    """
+    def _excel_cache_pfad(self, datei_pfad: str, spalten: Optional[List[str]], blatt_name: Optional[str]) -> Optional[str]:
+        """
+        Ermittelt den Cache-Pfad eines Excel-Blatts: '<datei>_<quelle>_<stand>.feather'. Die Quelle besteht aus Pfad,
+        Blatt und Spaltenauswahl, der Stand aus Größe und Änderungszeit (ns) der Datei, sodass geänderte Dateien
+        automatisch neu gelesen und ihre veralteten Kopien beim Aufräumen erkannt werden.
 
-    def vergleiche_daten(self, daten_frame1: pd.DataFrame, daten_frame2: pd.DataFrame, spalte_datei1: str = 'Name', spalte_datei2: str = 'Name') -> Dict[str, str]:
+        Returns:
+            Optional[str]: Der Cache-Pfad oder None, wenn der Cache deaktiviert ist oder pyarrow fehlt.
         """
-        Vergleicht die DataFrames basierend auf angegebenen Spalten und ermittelt verschiedene Statistiken.
+        if not self.excel_cache_verzeichnis or pa is None:
+            return None
+        datei_status = os.stat(datei_pfad)
+        quelle = json.dumps([os.path.abspath(datei_pfad), blatt_name, sorted(map(str, spalten)) if spalten else None])
+        stand = json.dumps([datei_status.st_size, datei_status.st_mtime_ns])
+        digests = [hashlib.sha256(text.encode('utf-8')).hexdigest()[:16] for text in (quelle, stand)]
+        dateiname = os.path.splitext(os.path.basename(datei_pfad))[0]
+        return os.path.join(self.excel_cache_verzeichnis, f"{dateiname}_{digests[0]}_{digests[1]}.feather")
+
+
+    @staticmethod
+    def _schreibe_excel_cache(daten_frame: pd.DataFrame, cache_pfad: str) -> None:
+        """
+        Schreibt ein gelesenes Excel-Blatt als Feather-Datei (Arrow IPC) in den Cache. Fehler werden nur protokolliert.
+        """
+        try:
+            os.makedirs(os.path.dirname(cache_pfad) or '.', exist_ok=True)
+            tabelle = pa.Table.from_pandas(daten_frame, preserve_index=False)
+            temporaer_pfad = cache_pfad + '.tmp'
+            pa_feather.write_feather(tabelle, temporaer_pfad)
+            os.replace(temporaer_pfad, cache_pfad) # Atomar ersetzen, damit kein halb geschriebener Cache gelesen wird
+            logger.debug(f"Excel-Cache geschrieben: '{cache_pfad}'")
+        except (pa.ArrowException, OSError) as e:
+            logger.warning(f"Excel-Cache '{cache_pfad}' konnte nicht geschrieben werden: {e}")
 
-        Args:
-            daten_frame1 (pd.DataFrame): Der erste DataFrame (Benutzereingabe).
-            daten_frame2 (pd.DataFrame): Der zweite DataFrame (Hauptliste).
-            spalte_datei1 (str, optional): Die Spalte aus Datei 1, die verglichen werden soll. Standard ist 'Name'.
-            spalte_datei2 (str, optional): Die Spalte aus Datei 2, die verglichen werden soll. Standard ist 'Name'.
 
-        Returns:
-            Dict[str, str]: Ein Dictionary mit den Vergleichsergebnissen (Metriken und formatierte Werte).
+    def _raeume_excel_cache_auf(self, cache_pfad: str) -> None:
         """
-        logger.info("Starte Datenvergleich...")
-        vergleichs_ergebnisse: Dict[str, str] = {} # Type-Hinting für Klarheit
-        vergleichs_ergebnisse[METRIK_ANZAHL_DATEI1] = str(len(daten_frame1)) # Explizite String-Konvertierung
-        vergleichs_ergebnisse[METRIK_ANZAHL_DATEI2] = str(len(daten_frame2))
+        Entfernt veraltete Kopien desselben Blatts (anderer Stand der Datei) und danach die am längsten nicht
+        genutzten Kopien, bis die Maximalgröße eingehalten ist. Die gerade geschriebene Kopie bleibt erhalten.
+        Fehler werden nur protokolliert.
+        """
+        praefix = os.path.basename(cache_pfad).rsplit('_', 1)[0] + '_' # '<datei>_<quelle>_'
+        eintraege = []
+        try:
+            namen = os.listdir(self.excel_cache_verzeichnis)
+        except OSError as e:
+            logger.warning(f"Excel-Cache '{self.excel_cache_verzeichnis}' konnte nicht aufgeräumt werden: {e}")
+            return
+        for name in namen:
+            pfad = os.path.join(self.excel_cache_verzeichnis, name)
+            if not name.endswith(DATEIFORMAT_FEATHER) or pfad == cache_pfad:
+                continue
+            try:
+                if name.startswith(praefix):
+                    os.remove(pfad)
+                    logger.debug(f"Veraltete Excel-Cache-Datei entfernt: '{pfad}'")
+                    continue
+                datei_status = os.stat(pfad)
+            except OSError:
+                continue # Datei wird gerade von einem anderen Prozess ersetzt oder entfernt
+            eintraege.append((datei_status.st_mtime, datei_status.st_size, pfad))
+        try:
+            gesamt = os.path.getsize(cache_pfad) + sum(groesse for _, groesse, _ in eintraege)
+        except OSError:
+            gesamt = sum(groesse for _, groesse, _ in eintraege) # Kopie nicht geschrieben
+        for _, groesse, pfad in sorted(eintraege):
+            if gesamt <= self.excel_cache_max_bytes:
+                break
+            try:
+                os.remove(pfad)
+            except OSError:
+                continue
+            gesamt -= groesse
+            logger.debug(f"Excel-Cache-Datei verdrängt: '{pfad}'")
 
-        try: # Fehlerbehandlung für ungültige Spaltennamen
-            # Vergleich der angegebenen Spalten
-            gleiche_werte = set(daten_frame1[spalte_datei1]).intersection(set(daten_frame2[spalte_datei2]))
-            vergleichs_ergebnisse[METRIK_GLEICHE_NAMEN] = str(len(gleiche_werte)) # Verwendung der generischen Metrik
-        except KeyError as e:
-            logger.error(f"Spaltenname Fehler beim Datenvergleich: {e}")
-            raise CipherCoreDatenValidierungsFehler(f"Ungültiger Spaltenname für den Vergleich: {e}") from e
 
+    @staticmethod
+    def _kompression(datei_pfad: str) -> Optional[str]:
+        """
+        Liefert die Kompressionsendung einer Datei ('.gz', '.zst', '.zip') oder None für unkomprimierte Dateien.
+        """
+        endung = os.path.splitext(datei_pfad.lower())[1]
+        return endung if endung in UNTERSTUETZTE_KOMPRESSIONEN else None
 
-        anzahl_unterschied_prozentual = abs(len(daten_frame1) - len(daten_frame2)) / max(len(daten_frame1), len(daten_frame2)) if max(len(daten_frame1), len(daten_frame2)) > 0 else 0 # Division durch Null verhindern
-        vergleichs_ergebnisse[METRIK_PROZENTUALER_UNTERSCHIED_ANZAHL] = f"{anzahl_unterschied_prozentual:.2%}"
 
-        if 'Alter' in daten_frame1.columns and 'Alter' in daten_frame2.columns:
-            vergleichs_ergebnisse[METRIK_DURCHSCHNITTSALTER_DATEI1] = f"{daten_frame1['Alter'].mean():.1f}"
-            vergleichs_ergebnisse[METRIK_DURCHSCHNITTSALTER_DATEI2] = f"{daten_frame2['Alter'].mean():.1f}"
+    @staticmethod
+    def _zip_mitglied(archiv: zipfile.ZipFile) -> str:
+        """
+        Ermittelt die CSV/TXT-Datei in einem ZIP-Archiv. Das Archiv muss genau eine solche Datei enthalten.
 
-        logger.debug(f"Vergleichsergebnisse: {vergleichs_ergebnisse}")
-        logger.info("Datenvergleich abgeschlossen.")
-        return vergleichs_ergebnisse
+        Raises:
+            ValueError: Wenn keine oder mehrere CSV/TXT-Dateien enthalten sind.
+        """
+        kandidaten = [name for name in archiv.namelist()
+                      if not name.endswith('/') and name.lower().endswith((DATEIFORMAT_CSV, DATEIFORMAT_TEXT))]
+        if len(kandidaten) != 1:
+            raise ValueError(f"ZIP-Archiv muss genau eine CSV/TXT-Datei enthalten, gefunden: {len(kandidaten)}")
+        return kandidaten[0]
 
 
-# --- DiagrammGenerator Klasse (CipherCore Standard: Klare Visualisierung) ---
-class DiagrammGenerator:
-    """
-    Modul zum Erstellen von Diagrammen zur Visualisierung von Vergleichsergebnissen.
-    Unterstützt verschiedene Diagrammtypen und generiert Base64-kodierte PNG-Bilder.
-    Fokus auf klare und verständliche Diagramme.
-    """
+    def _innerer_dateiname(self, datei_pfad: str) -> str:
+        """
+        Liefert den Dateinamen des eigentlichen Inhalts: bei '.gz'/'.zst' ohne Kompressionsendung,
+        bei '.zip' den Namen der enthaltenen CSV/TXT-Datei, sonst den Pfad selbst.
+        """
+        kompression = self._kompression(datei_pfad)
+        if kompression == KOMPRESSION_ZIP:
+            with zipfile.ZipFile(datei_pfad) as archiv:
+                return self._zip_mitglied(archiv)
+        if kompression:
+            return datei_pfad[:-len(kompression)]
+        return datei_pfad
 
-    def erstelle_diagramm(self, vergleichs_ergebnisse: Dict[str, str], diagramm_typ: str = DIAGRAMM_TYP_BALKEN, ist_pro_version: bool = False) -> str:
+
+    @contextlib.contextmanager
+    def _oeffne_dekomprimiert(self, datei_pfad: str):
         """
-        Erstellt ein Diagramm zur Visualisierung der Vergleichsergebnisse.
+        Öffnet eine (ggf. komprimierte) Datei als binären Datenstrom. Der Inhalt wird beim Lesen dekomprimiert,
+        ohne ihn auf die Festplatte zu entpacken.
 
         Args:
-            vergleichs_ergebnisse (Dict[str, str]): Die Vergleichsergebnisse (Metriken und Werte).
-            diagramm_typ (str): Der gewünschte Diagrammtyp ('balken' oder 'kreis').
-            ist_pro_version (bool): Gibt an, ob die Pro-Version aktiv ist.
-
-        Returns:
-            str: Base64-kodierte PNG-Bilddaten des Diagramms.
+            datei_pfad (str): Der Pfad zur Datei.
 
         Raises:
-            CipherCoreUngültigerDiagrammTypFehler: Wenn ein ungültiger Diagrammtyp angegeben wird.
+            ValueError: Wenn für '.zst' weder zstandard noch pyarrow installiert ist.
         """
-        logger.info(f"Starte Diagrammerstellung vom Typ '{diagramm_typ}'...")
+        kompression = self._kompression(datei_pfad)
+        if kompression == KOMPRESSION_GZIP:
+            with gzip.open(datei_pfad, 'rb') as datenstrom:
+                yield datenstrom
+        elif kompression == KOMPRESSION_ZSTD:
+            if zstandard is not None:
+                with zstandard.open(datei_pfad, 'rb') as datenstrom:
+                    yield datenstrom
+            elif pa is not None:
+                with pa.input_stream(datei_pfad, compression='zstd') as datenstrom:
+                    yield datenstrom
+            else:
+                raise ValueError("Für .zst-Dateien wird das Paket 'zstandard' oder 'pyarrow' benötigt.")
+        elif kompression == KOMPRESSION_ZIP:
+            with zipfile.ZipFile(datei_pfad) as archiv, archiv.open(self._zip_mitglied(archiv)) as datenstrom:
+                yield datenstrom
+        else:
+            with open(datei_pfad, 'rb') as datenstrom:
+                yield datenstrom
 
-        if diagramm_typ not in UNTERSTUETZTE_DIAGRAMM_TYPEN:
-            logger.error(f"Ungültiger Diagrammtyp angefordert: '{diagramm_typ}'. Unterstützte Typen: {', '.join(UNTERSTUETZTE_DIAGRAMM_TYPEN)}.")
-            raise CipherCoreUngültigerDiagrammTypFehler(
-                f"Ungültiger Diagrammtyp: '{diagramm_typ}'. Unterstützte Typen: {', '.join(UNTERSTUETZTE_DIAGRAMM_TYPEN)}.")
 
-        metrik_bezeichnungen = list(vergleichs_ergebnisse.keys())
-        werte_str = list(vergleichs_ergebnisse.values())
-        try:
-            werte = [float(wert.replace('%','')) if '%' in wert else float(wert) for wert in werte_str] # Konvertierung zu float, Prozentzeichen entfernen
-        except ValueError as e:
-            logger.error(f"Fehler beim Konvertieren der Werte für das Diagramm: {e}")
-            raise CipherCoreDatenFehler(f"Fehler beim Konvertieren der Werte für das Diagramm: {e}") from e
+    # Erkennungsergebnisse je Quelldatei (Pfad, Änderungszeit, Größe), gemeinsam für alle DatenLader-Instanzen;
+    # begrenzt auf CSV_FORMAT_CACHE_GROESSE Einträge, die am längsten nicht verwendeten werden verdrängt
+    _csv_format_cache: 'OrderedDict[Tuple[str, int, int], Dict]' = OrderedDict()
+    _csv_format_sperre = threading.Lock()
 
+    @staticmethod
+    def _csv_format_schluessel(datei_pfad: str) -> Tuple[str, int, int]:
+        """
+        Bildet den Cache-Schlüssel einer Quelldatei; geänderte Dateien werden dadurch neu erkannt.
+        """
+        datei_status = os.stat(datei_pfad)
+        return os.path.abspath(datei_pfad), datei_status.st_mtime_ns, datei_status.st_size
 
-        plt.figure(figsize=(12, 7))
 
-        if diagramm_typ == DIAGRAMM_TYP_BALKEN:
-            plt.bar(metrik_bezeichnungen, werte,
-                    color=['skyblue', 'lightcoral', 'lightgreen', 'lightsalmon', 'lightseagreen', 'lightgoldenrodyellow'])
-            plt.ylabel('Anzahl / Prozent / Durchschnitt')
-        elif diagramm_typ == DIAGRAMM_TYP_KREIS and ist_pro_version: # Kreisdiagramm nur in Pro Version
-            plt.pie(werte, labels=metrik_bezeichnungen, autopct='%1.1f%%', startangle=90)
-            plt.ylabel('')
-        elif diagramm_typ == DIAGRAMM_TYP_KREIS and not ist_pro_version: # Fallback auf Balken wenn Kreisdiagramm in Testversion gewählt
-            plt.bar(metrik_bezeichnungen, werte,
-                    color=['skyblue', 'lightcoral', 'lightgreen', 'lightsalmon', 'lightseagreen', 'lightgoldenrodyellow'])
-            plt.ylabel('Anzahl / Prozent / Durchschnitt')
-            logger.warning(
-                "Kreisdiagramm-Typ ist in der Testversion nicht verfügbar. Es wird stattdessen ein Balkendiagramm erstellt.")
-            diagramm_typ = DIAGRAMM_TYP_BALKEN # Fallback auf Balkendiagramm für Testversion
+    def _erkenne_csv_format(self, datei_pfad: str) -> Dict:
+        """
+        Interne Hilfsfunktion zur Ermittlung von Kodierung, Trennzeichen, Quoting und Kopfzeile einer CSV/TXT-Datei.
+        Gelesen werden nur die ersten CSV_PROBE_BYTES Bytes; das Ergebnis wird je Quelldatei zwischengespeichert.
 
-        plt.title('Vergleich der Dateien')
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
+        Args:
+            datei_pfad (str): Der Pfad zur Datei.
 
-        try:
-            buffer = BytesIO()
-            plt.savefig(buffer, format='png')
-            buffer.seek(0)
-            bild_daten = base64.b64encode(buffer.read()).decode('utf-8')
-            plt.close()
-        except Exception as e:
-            logger.error(f"Fehler beim Erstellen des Diagrammbildes: {e}")
-            raise CipherCoreDatenFehler(f"Fehler beim Erstellen des Diagrammbildes: {e}") from e
+        Returns:
+            Dict: Erkanntes Format mit den Schlüsseln 'encoding', 'trennzeichen', 'quotechar' und 'kopfzeile'.
+        """
+        schluessel = self._csv_format_schluessel(datei_pfad)
+        with self._csv_format_sperre:
+            csv_format = self._csv_format_cache.get(schluessel)
+            if csv_format is not None:
+                self._csv_format_cache.move_to_end(schluessel)
+        if csv_format is not None:
+            return csv_format
+        with self._oeffne_dekomprimiert(datei_pfad) as datenstrom:
+            probe = datenstrom.read(CSV_PROBE_BYTES)
+        csv_format = self._sniffe_csv_format(probe, vollstaendig=len(probe) < CSV_PROBE_BYTES)
+        logger.debug(f"CSV-Format von '{os.path.basename(datei_pfad)}' erkannt: {csv_format}")
+        return self._merke_csv_format(datei_pfad, csv_format)
+
+
+    def _merke_csv_format(self, datei_pfad: str, csv_format: Dict) -> Dict:
+        """
+        Speichert ein erkanntes CSV-Format im Cache und gibt es zurück.
+        """
+        schluessel = self._csv_format_schluessel(datei_pfad)
+        with self._csv_format_sperre:
+            self._csv_format_cache[schluessel] = csv_format
+            self._csv_format_cache.move_to_end(schluessel)
+            while len(self._csv_format_cache) > CSV_FORMAT_CACHE_GROESSE:
+                self._csv_format_cache.popitem(last=False)
+        return csv_format
 
 
-        logger.debug(f"Diagramm vom Typ '{diagramm_typ}' als Base64-String erzeugt.")
-        logger.info("Diagrammerstellung abgeschlossen.")
-        return bild_daten
+    @contextlib.contextmanager
+    def _oeffne_csv(self, datei_pfad: str, csv_format: Dict, fuer_arrow: bool = False):
+        """
+        Öffnet eine CSV/TXT-Datei zum Parsen. Als UTF-8 erkannte Dateien werden über einen KodierungsRueckfallStrom
+        gelesen: Enthalten spätere Bytes ungültiges UTF-8, wird ab dort als cp1252 gelesen, ohne die Datei erneut
+        zu lesen, und das Format wird für folgende Lesevorgänge umgestellt. Die Ausgabe bleibt UTF-8.
 
+        Args:
+            datei_pfad (str): Der Pfad zur Datei.
+            csv_format (Dict): Das erkannte CSV-Format.
+            fuer_arrow (bool): Quelle für pyarrow öffnen (mmap bzw. native Dekompression, siehe _arrow_quelle).
+        """
+        oeffnen = self._arrow_quelle if fuer_arrow else self._oeffne_dekomprimiert
+        with oeffnen(datei_pfad) as quelle:
+            if csv_format["encoding"] != 'utf-8':
+                yield quelle
+                return
 
+            def umschalten(kodierung: str) -> None:
+                logger.warning(f"Datei '{os.path.basename(datei_pfad)}' ist kein gültiges UTF-8. Weitere Bytes werden als '{kodierung}' gelesen.")
+                self._merke_csv_format(datei_pfad, {**csv_format, "encoding": kodierung})
 
-# --- Abstrakte Basisklasse für DatenManager (CipherCore Standard: Erweiterbarkeit) ---
-class AbstractDataManager(ABC):
-    """
-    Abstrakte Basisklasse für Daten-Manager-Implementierungen.
-    Definiert die Schnittstelle für Daten-Manager-Operationen zur Persistierung von Vergleichsergebnissen.
-    Ermöglicht verschiedene Persistenzmechanismen (Datei, Datenbank, etc.).
-    """
+            with BufferedReader(KodierungsRueckfallStrom(quelle, umschalten)) as datenstrom:
+                yield datenstrom
 
-    @abstractmethod
-    def erstelle_schema(self) -> None:
-        """Erstellt das Daten-Schema (Datenbanktabellen, Verzeichnisstruktur etc.)."""
-        pass
 
-    @abstractmethod
-    def speichere_ergebnisse(self, vergleichs_ergebnisse: Dict[str, str], dateiname_datei1: str, dateiname_datei2: str, ist_pro_version: bool = False) -> None:
-        """Speichert die Vergleichsergebnisse."""
-        pass
+    @staticmethod
+    def _sniffe_csv_format(probe: bytes, vollstaendig: bool = False) -> Dict:
+        """
+        Erkennt das Format aus einer Byte-Stichprobe.
+        Kodierung: BOM, sonst UTF-8, sonst cp1252 (Windows-Exporte), sonst latin-1.
+        Trennzeichen und Quoting: csv.Sniffer auf vollständigen Zeilen, sonst Komma.
+        Kopfzeile: Es wird eine Kopfzeile angenommen, außer die erste Zeile ist in allen durchgehend
+        numerischen Spalten ebenfalls numerisch.
 
-    @abstractmethod
-    def lade_alle_ergebnisse(self) -> List[Dict]:
-        """Lädt alle Vergleichsergebnisse."""
-        pass
+        Args:
+            probe (bytes): Die ersten Bytes der Datei.
+            vollstaendig (bool): True, wenn die Stichprobe die gesamte Datei umfasst.
 
+        Returns:
+            Dict: Erkanntes Format mit den Schlüsseln 'encoding', 'trennzeichen', 'quotechar' und 'kopfzeile'.
+        """
+        if probe.startswith(codecs.BOM_UTF8):
+            encoding = 'utf-8-sig'
+        elif probe.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            encoding = 'utf-16'
+        else:
+            encoding = None
+            for kandidat in ('utf-8', 'cp1252', 'latin-1'):
+                try:
+                    codecs.getincrementaldecoder(kandidat)().decode(probe, final=vollstaendig) # Abgeschnittene Mehrbytezeichen am Ende tolerieren
+                    encoding = kandidat
+                    break
+                except UnicodeDecodeError:
+                    continue
+        text = probe.decode(encoding, errors='ignore')
+        if not vollstaendig and '\n' in text:
+            text = text[:text.rfind('\n')] # Nur vollständige Zeilen auswerten
+
+        trennzeichen, quotechar = ',', '"'
+        try:
+            dialekt = csv.Sniffer().sniff(text, delimiters=CSV_TRENNZEICHEN_KANDIDATEN)
+            trennzeichen, quotechar = dialekt.delimiter, dialekt.quotechar or '"'
+        except csv.Error:
+            pass # Keine eindeutige Struktur (z.B. nur eine Spalte): Standard beibehalten
+
+        zeilen = [zeile for zeile in csv.reader(text.splitlines(), delimiter=trennzeichen, quotechar=quotechar) if zeile]
+        kopfzeile = True
+        if len(zeilen) > 1:
+            def _ist_zahl(wert: str) -> bool:
+                try:
+                    float(wert.replace(',', '.') if trennzeichen != ',' else wert)
+                    return True
+                except ValueError:
+                    return False
+            stimmen_kopf, stimmen_daten = 0, 0
+            for index, wert in enumerate(zeilen[0]):
+                spaltenwerte = [zeile[index] for zeile in zeilen[1:] if index < len(zeile) and zeile[index].strip()]
+                if spaltenwerte and all(_ist_zahl(w) for w in spaltenwerte):
+                    if _ist_zahl(wert):
+                        stimmen_daten += 1
+                    else:
+                        stimmen_kopf += 1
+            kopfzeile = not (stimmen_daten and not stimmen_kopf)
+        return {"encoding": encoding, "trennzeichen": trennzeichen, "quotechar": quotechar, "kopfzeile": kopfzeile}
+
+
+    @staticmethod
+    def _pandas_csv_optionen(csv_format: Dict) -> Dict:
+        """
+        Übersetzt ein erkanntes CSV-Format in Parameter für pd.read_csv.
+        """
+        return {"encoding": csv_format["encoding"], "sep": csv_format["trennzeichen"],
+                "quotechar": csv_format["quotechar"], "header": 0 if csv_format["kopfzeile"] else None}
 
-# --- SQLiteDataManager Klasse (CipherCore Standard: Sichere Datenbankinteraktion) ---
-class SQLiteDataManager(AbstractDataManager):
-    """
-    DataManager-Implementierung für SQLite-Datenbank.
-    Implementiert sicheren Datenbankzugriff und Fehlerbehandlung.
-    Nutzt Prepared Statements zum Schutz vor SQL-Injection (Best Practice).
-    """
 
-    def __init__(self, datenbank_pfad: str = DATENBANK_DATEINAME_STANDARD):
+    def _csv_laden(self, datei_pfad: str, abbruch_token: Optional[VergleichsAbbruchToken],
+                   validierer: Optional[DatenValidierer], csv_format: Dict) -> pd.DataFrame:
         """
-        Initialisiert den SQLiteDataManager.
+        Interne Hilfsfunktion zum Parsen einer CSV/TXT-Datei in einem Durchlauf mit dem erkannten Format:
+        pyarrow (falls installiert), sonst pandas (mit Abbruch-Token blockweise).
 
         Args:
-            datenbank_pfad (str): Der Pfad zur SQLite-Datenbankdatei.
+            datei_pfad (str): Der Pfad zur Datei.
+            abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch (optional).
+            validierer (Optional[DatenValidierer]): Validierer für die blockweise Prüfung (optional).
+            csv_format (Dict): Das erkannte CSV-Format.
+
+        Returns:
+            pd.DataFrame: Ein DataFrame mit den Daten aus der Datei.
         """
-        if not datenbank_pfad or not isinstance(datenbank_pfad, str):
-            raise ValueError("Datenbankpfad muss ein gültiger Pfad sein.")
-        self.datenbank_pfad = datenbank_pfad
-        self.erstelle_schema()
-        logger.debug(f"SQLiteDataManager initialisiert mit Datenbankpfad: {self.datenbank_pfad}")
+        if pa is not None:
+            daten_frame = self._csv_arrow_laden(datei_pfad, abbruch_token, csv_format, validierer)
+            if daten_frame is not None:
+                return daten_frame
+        if abbruch_token is None:
+            with self._oeffne_csv(datei_pfad, csv_format) as datenstrom:
+                return pd.read_csv(datenstrom, **self._pandas_csv_optionen(csv_format))
+        return self._csv_blockweise_laden(datei_pfad, abbruch_token, validierer, csv_format)
+
+
+    def _csv_arrow_laden(self, datei_pfad: str, abbruch_token: Optional[VergleichsAbbruchToken] = None,
+                         csv_format: Optional[Dict] = None, validierer: Optional[DatenValidierer] = None) -> Optional[pd.DataFrame]:
+        """
+        Interne Hilfsfunktion zum Laden einer CSV/TXT-Datei mit dem mehrthreadigen pyarrow-Parser.
+        Die Datei wird per mmap eingeblendet und ohne Umweg über Python-Objekte in Arrow-Spalten (pd.ArrowDtype) geparst.
+        '.gz'/'.zst' werden nativ von pyarrow dekomprimiert (im Lese-Thread, parallel zum mehrthreadigen Parsen),
+        '.zip' über einen Python-Datenstrom.
+        Gelesen wird als Strom von Blöcken (ARROW_CSV_BLOCK_BYTES): Nach jedem Block werden das Abbruch-Token geprüft
+        und der Block validiert, wie beim blockweisen pandas-Parser. Leere Werte wie bei pd.read_csv (CSV_NULL_WERTE).
 
+        Args:
+            datei_pfad (str): Der Pfad zur Datei.
+            abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch (optional).
+            csv_format (Optional[Dict]): Das erkannte CSV-Format (optional, Standard: UTF-8, Komma, mit Kopfzeile).
+            validierer (Optional[DatenValidierer]): Validierer, der jeden Block direkt prüft (optional).
 
-    def erstelle_schema(self) -> None:
-        """
-        Erstellt das Datenbank-Schema (Tabellen), falls nicht vorhanden.
-        Nutzt IF NOT EXISTS Klausel für sichere Schemaerstellung.
+        Returns:
+            Optional[pd.DataFrame]: Der DataFrame oder None, wenn pyarrow die Datei nicht lesen kann
+                                    (z.B. wechselnde Spaltentypen); dann wird auf den pandas-Parser zurückgefallen.
+
+        Raises:
+            FileNotFoundError: Wenn die Datei nicht existiert.
+            CipherCoreAbbruchFehler: Wenn der Ladevorgang abgebrochen wurde.
         """
-        verbindung = None # Verbindung außerhalb des try-Blocks definieren für finally-Zugriff
+        if abbruch_token:
+            abbruch_token.pruefe()
+        csv_format = csv_format or {"encoding": 'utf-8', "trennzeichen": ',', "quotechar": '"', "kopfzeile": True}
+        lese_optionen = pa_csv.ReadOptions(use_threads=True, block_size=ARROW_CSV_BLOCK_BYTES,
+                                           encoding=csv_format["encoding"].replace('utf-8-sig', 'utf8'),
+                                           autogenerate_column_names=not csv_format["kopfzeile"])
+        parse_optionen = pa_csv.ParseOptions(delimiter=csv_format["trennzeichen"], quote_char=csv_format["quotechar"])
+        bloecke: List[pd.DataFrame] = []
         try:
-            verbindung = sqlite3.connect(self.datenbank_pfad)
-            zeiger = verbindung.cursor()
-            zeiger.execute("""
-                CREATE TABLE IF NOT EXISTS vergleichsergebnisse (
-                    vergleich_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    datei1_name TEXT NOT NULL,
-                    datei2_name TEXT NOT NULL,
-                    vergleichszeitpunkt DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    metrik_name TEXT NOT NULL,
-                    metrik_wert TEXT
-                )
-            """)
-            verbindung.commit()
-            logger.info(f"Datenbank-Schema in '{self.datenbank_pfad}' erstellt oder geprüft.")
-        except sqlite3.Error as e:
-            logger.error(f"Fehler beim Erstellen des Datenbank-Schemas: {e}")
-            raise CipherCoreDatenbankSchemaFehler(f"Fehler beim Erstellen des Datenbank-Schemas: {e}") from e
-        finally:
-            if verbindung:
-                verbindung.close()
+            with self._oeffne_csv(datei_pfad, csv_format, fuer_arrow=True) as quelle:
+                leser = pa_csv.open_csv(quelle, read_options=lese_optionen, parse_options=parse_optionen,
+                                        convert_options=self._arrow_konvertier_optionen())
+                for batch in leser:
+                    if abbruch_token:
+                        abbruch_token.pruefe()
+                    block = batch.to_pandas(types_mapper=pd.ArrowDtype) # Arrow-Puffer werden übernommen statt in Python-Objekte gewandelt
+                    if not csv_format["kopfzeile"]:
+                        block.columns = range(len(block.columns)) # Wie pandas: Spalten 0..n-1
+                    if validierer:
+                        validierer.pruefe_block(block)
+                    bloecke.append(block)
+                schema = leser.schema
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e: # z.B. spätere Blöcke mit anderem Typ als der erste
+            logger.warning(f"pyarrow konnte '{os.path.basename(datei_pfad)}' nicht lesen ({e}). Verwende pandas-Parser.")
+            if validierer:
+                validierer.zuruecksetzen() # Bereits geprüfte Blöcke werden mit pandas erneut gelesen
+            return None
+        if not bloecke: # Nur Kopfzeile: leere Spalten mit den erkannten Namen
+            daten_frame = schema.empty_table().to_pandas(types_mapper=pd.ArrowDtype)
+            if not csv_format["kopfzeile"]:
+                daten_frame.columns = range(len(daten_frame.columns))
+        else:
+            daten_frame = bloecke[0] if len(bloecke) == 1 else pd.concat(bloecke, ignore_index=True)
+        logger.debug(f"Datei '{os.path.basename(datei_pfad)}' mit pyarrow geladen ({len(daten_frame)} Zeilen in {len(bloecke)} Blöcken).")
+        return daten_frame
 
 
-    def speichere_ergebnisse(self, vergleichs_ergebnisse: Dict[str, str], dateiname_datei1: str, dateiname_datei2: str, ist_pro_version: bool = False) -> None:
+    @staticmethod
+    def _arrow_konvertier_optionen() -> 'pa_csv.ConvertOptions':
         """
-        Speichert die Vergleichsergebnisse in der SQLite-Datenbank.
-        Verwendet Prepared Statements zum Schutz vor SQL-Injection.
-        Speichern erfolgt nur in der Pro Version.
-
-        Args:
-            vergleichs_ergebnisse (Dict[str, str]): Die Vergleichsergebnisse.
-            dateiname_datei1 (str): Der Dateiname der ersten Datei.
-            dateiname_datei2 (str): Der Dateiname der zweiten Datei.
-            ist_pro_version (bool): Gibt an, ob die Pro-Version aktiv ist.
+        Konvertierungsoptionen des pyarrow-CSV-Lesers mit denselben leeren Werten wie pd.read_csv: Leere Felder und
+        CSV_NULL_WERTE werden auch in Textspalten zu Null statt zu '' bzw. Text.
         """
-        if not ist_pro_version: # Speichern nur in Pro Version
-            logger.info("Testversion: Vergleichsergebnisse werden nicht in der Datenbank gespeichert.")
-            return
+        return pa_csv.ConvertOptions(null_values=list(CSV_NULL_WERTE), strings_can_be_null=True)
 
-        verbindung = None
-        try:
-            verbindung = sqlite3.connect(self.datenbank_pfad)
-            zeiger = verbindung.cursor()
-            sql_einfuegen = """
-                INSERT INTO vergleichsergebnisse (datei1_name, datei2_name, metrik_name, metrik_wert)
-                VALUES (?, ?, ?, ?)
-            """
-            for metrik_name, metrik_wert in vergleichs_ergebnisse.items():
-                zeiger.execute(sql_einfuegen, (dateiname_datei1, dateiname_datei2, metrik_name, str(metrik_wert))) # Prepared Statement
-            verbindung.commit()
-            logger.info(f"Vergleichsergebnisse in Datenbank '{self.datenbank_pfad}' gespeichert.")
-        except sqlite3.Error as e:
-            logger.error(f"Fehler beim Speichern der Vergleichsergebnisse in der Datenbank: {e}")
-            raise CipherCoreDatenbankSpeicherFehler(f"Fehler beim Speichern der Vergleichsergebnisse in der Datenbank: {e}") from e
-        finally:
-            if verbindung:
-                verbindung.close()
 
+    def _arrow_quelle(self, datei_pfad: str):
+        """
+        Öffnet eine (ggf. komprimierte) CSV/TXT-Datei als Eingabe für pyarrow: unkomprimiert per mmap,
+        '.gz'/'.zst' mit nativer Dekompression, '.zip' über einen Python-Datenstrom.
+        """
+        kompression = self._kompression(datei_pfad)
+        if kompression is None:
+            return pa.memory_map(datei_pfad, 'r')
+        if kompression in (KOMPRESSION_GZIP, KOMPRESSION_ZSTD):
+            return pa.input_stream(datei_pfad, compression='gzip' if kompression == KOMPRESSION_GZIP else 'zstd')
+        return self._oeffne_dekomprimiert(datei_pfad)
 
-    def lade_alle_ergebnisse(self) -> List[Dict]:
+
+    def _csv_arrow_bloecke(self, datei_pfad: str, csv_format: Dict, spalten: Optional[List[str]],
+                           block_groesse: int = CSV_BLOCK_GROESSE) -> Iterator[pd.DataFrame]:
         """
-        Lädt alle Vergleichsergebnisse aus der Datenbank.
+        Interne Hilfsfunktion zum Streamen einer CSV/TXT-Datei mit dem pyarrow-Leser (ein Block je Arrow-Batch).
+        pyarrow leitet die Spaltentypen aus dem ersten Block ab; passt ein späterer Block nicht dazu (z.B. 'X123' in
+        einer bisher ganzzahligen Spalte) oder kann pyarrow die Datei nicht lesen, wird ab der ersten noch nicht
+        ausgegebenen Zeile mit dem blockweisen pandas-Parser weitergelesen (siehe _csv_pandas_bloecke).
 
-        Returns:
-            List[Dict]: Eine Liste von Dictionaries, wobei jedes Dictionary ein Vergleichsergebnis darstellt.
+        Raises:
+            ValueError: Wenn auch der pandas-Parser die Datei nicht lesen kann.
         """
-        ergebnisse: List[Dict] = []
-        verbindung = None
+        lese_optionen = pa_csv.ReadOptions(use_threads=True, block_size=ARROW_CSV_BLOCK_BYTES,
+                                           encoding=csv_format["encoding"].replace('utf-8-sig', 'utf8'),
+                                           autogenerate_column_names=not csv_format["kopfzeile"])
+        parse_optionen = pa_csv.ParseOptions(delimiter=csv_format["trennzeichen"], quote_char=csv_format["quotechar"])
+        konvertier_optionen = self._arrow_konvertier_optionen()
+        if spalten is not None and csv_format["kopfzeile"]:
+            with self._oeffne_csv(datei_pfad, csv_format, fuer_arrow=True) as quelle: # Nur die Kopfzeile lesen, um vorhandene Spalten zu projizieren
+                vorhandene_spalten = pa_csv.open_csv(quelle, read_options=lese_optionen, parse_options=parse_optionen).schema.names
+            konvertier_optionen.include_columns = [spalte for spalte in vorhandene_spalten if spalte in spalten]
+        ausgegebene_zeilen = 0
         try:
-            verbindung = sqlite3.connect(self.datenbank_pfad)
-            zeiger = verbindung.cursor()
-            zeiger.execute("SELECT * FROM vergleichsergebnisse ORDER BY vergleichszeitpunkt DESC") # Keine Benutzereingaben, daher kein Prepared Statement nötig
-            spalten_namen = [beschreibung[0] for beschreibung in zeiger.description]
-            daten_saetze = zeiger.fetchall()
-            for daten_satz in daten_saetze:
-                ergebnis_dict = dict(zip(spalten_namen, daten_satz))
-                ergebnisse.append(ergebnis_dict)
-            logger.info(f"Alle Vergleichsergebnisse aus Datenbank '{self.datenbank_pfad}' geladen.")
-        except sqlite3.Error as e:
-            logger.error(f"Fehler beim Laden der Vergleichsergebnisse aus der Datenbank: {e}")
-            raise CipherCoreDatenbankLadeFehler(f"Fehler beim Laden der Vergleichsergebnisse aus der Datenbank: {e}") from e
-        finally:
-            if verbindung:
-                verbindung.close()
-        return ergebnisse
+            with self._oeffne_csv(datei_pfad, csv_format, fuer_arrow=True) as quelle:
+                leser = pa_csv.open_csv(quelle, read_options=lese_optionen, parse_options=parse_optionen, convert_options=konvertier_optionen)
+                for batch in leser:
+                    daten_frame = batch.to_pandas(types_mapper=pd.ArrowDtype)
+                    if not csv_format["kopfzeile"]:
+                        daten_frame.columns = range(len(daten_frame.columns))
+                    ausgegebene_zeilen += len(daten_frame)
+                    yield daten_frame
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e: # z.B. spätere Blöcke mit anderem Typ als der erste
+            logger.warning(f"pyarrow konnte '{os.path.basename(datei_pfad)}' ab Zeile {ausgegebene_zeilen + 1} nicht lesen ({e}). "
+                           f"Verwende pandas-Parser für die restlichen Zeilen.")
+            yield from self._csv_pandas_bloecke(datei_pfad, csv_format, spalten, block_groesse, ausgegebene_zeilen)
+
+
+    def _csv_pandas_bloecke(self, datei_pfad: str, csv_format: Dict, spalten: Optional[List[str]], block_groesse: int,
+                            ab_zeile: int = 0) -> Iterator[pd.DataFrame]:
+        """
+        Interne Hilfsfunktion zum Streamen einer CSV/TXT-Datei mit dem blockweisen pandas-Parser.
 
+        Args:
+            datei_pfad (str): Der Pfad zur Datei.
+            csv_format (Dict): Das erkannte CSV-Format.
+            spalten (Optional[List[str]]): Benötigte Spalten (None: alle).
+            block_groesse (int): Zeilen je Block.
+            ab_zeile (int): Anzahl bereits gelesener Datenzeilen, die übersprungen werden (optional). Die Zeilen
+                            werden geparst und verworfen, damit Anführungszeichen über Zeilenumbrüche und leere
+                            Zeilen genau wie beim ersten Lesen gezählt werden.
+
+        Yields:
+            pd.DataFrame: Die Blöcke ab der Zeile 'ab_zeile' (Zeilenindex wie bei pd.read_csv ab 0 fortlaufend).
+        """
+        csv_optionen = self._pandas_csv_optionen(csv_format)
+        if spalten is not None and csv_format["kopfzeile"]:
+            csv_optionen["usecols"] = lambda spalte: spalte in spalten # Nur benötigte Spalten parsen
+        with self._oeffne_csv(datei_pfad, csv_format) as datenstrom, \
+                pd.read_csv(datenstrom, chunksize=block_groesse, **csv_optionen) as leser:
+            for block in leser:
+                if ab_zeile >= len(block):
+                    ab_zeile -= len(block)
+                    continue
+                yield block.iloc[ab_zeile:] if ab_zeile else block
+                ab_zeile = 0
+
+
+    def _csv_blockweise_laden(self, datei_pfad: str, abbruch_token: VergleichsAbbruchToken,
+                              validierer: Optional[DatenValidierer] = None, csv_format: Optional[Dict] = None) -> pd.DataFrame:
+        """
+        Interne Hilfsfunktion zum blockweisen Laden einer CSV/TXT-Datei mit Abbruchprüfung nach jedem Block.
 
+        Args:
+            datei_pfad (str): Der Pfad zur Datei.
+            abbruch_token (VergleichsAbbruchToken): Token für den kooperativen Abbruch.
+            validierer (Optional[DatenValidierer]): Validierer, der jeden Block direkt prüft (optional).
+            csv_format (Optional[Dict]): Das erkannte CSV-Format (optional, Standard: wird erkannt).
 
-# --- FileDataManager Klasse (CipherCore Standard: Sichere Dateiverarbeitung) ---
-class FileDataManager(AbstractDataManager):
-    """
-    DataManager-Implementierung, die Vergleichsergebnisse in JSON-Dateien in einem dedizierten Verzeichnis speichert.
-    Implementiert sichere Dateiverarbeitung und Fehlerbehandlung.
-    Sichere Dateinamensgenerierung und Pfadkonstruktion.
-    """
+        Returns:
+            pd.DataFrame: Ein DataFrame mit den Daten aus der Datei.
 
-    def __init__(self, daten_verzeichnis: str = DATEN_VERZEICHNIS_STANDARD):
+        Raises:
+            CipherCoreAbbruchFehler: Wenn der Ladevorgang abgebrochen wurde.
+            CipherCoreDatenValidierungsFehler: Wenn eine erforderliche Spalte fehlt.
         """
-        Initialisiert den FileDataManager.
-
-        Args:
-            daten_verzeichnis (str): Das Verzeichnis, in dem JSON-Dateien gespeichert werden.
+        csv_format = csv_format or self._erkenne_csv_format(datei_pfad)
+        csv_optionen = self._pandas_csv_optionen(csv_format)
+        bloecke: List[pd.DataFrame] = []
+        with self._oeffne_csv(datei_pfad, csv_format) as datenstrom, \
+                pd.read_csv(datenstrom, chunksize=CSV_BLOCK_GROESSE, **csv_optionen) as leser:
+            for block in leser:
+                abbruch_token.pruefe()
+                if validierer:
+                    validierer.pruefe_block(block)
+                bloecke.append(block)
+        if not bloecke:
+            with self._oeffne_csv(datei_pfad, csv_format) as datenstrom:
+                return pd.read_csv(datenstrom, **csv_optionen) # Leere Datei: Spaltenköpfe regulär einlesen
+        return pd.concat(bloecke, ignore_index=True)
+
+
+    def lade_bloecke(self, datei_pfad: str, abbruch_token: Optional[VergleichsAbbruchToken] = None,
+                     spalten: Optional[List[str]] = None, blatt_name: Optional[str] = None,
+                     block_groesse: int = CSV_BLOCK_GROESSE) -> Iterator[pd.DataFrame]:
         """
-        if not daten_verzeichnis or not isinstance(daten_verzeichnis, str):
-            raise ValueError("Datenverzeichnis muss ein gültiger Pfad sein.")
+        Liest eine Datei als Folge von Blöcken, ohne sie vollständig im Speicher zu halten (CSV/TXT, auch komprimiert,
+        und Parquet). Andere Formate werden wie bei lade_daten geladen und in Blöcken ausgegeben. Jeder Block wird
+        validiert, die dateiweiten Regeln (eindeutig, max_null_anteil) nach dem letzten Block.
 
-        self.daten_verzeichnis = daten_verzeichnis
-        self.erstelle_schema()
-        logger.debug(f"FileDataManager initialisiert mit Datenverzeichnis: {self.daten_verzeichnis}")
+        Args:
+            datei_pfad (str): Der Pfad zur Datei.
+            abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch (optional).
+            spalten (Optional[List[str]]): Benötigte Spalten (optional, Standard: alle). Die Spalten des
+                                           Validierungsschemas werden immer mitgelesen.
+            blatt_name (Optional[str]): Arbeitsblatt von Excel-Dateien (optional, Standard: erstes Blatt).
+            block_groesse (int): Zeilen je Block (optional).
 
+        Yields:
+            pd.DataFrame: Die Blöcke der Datei in Dateireihenfolge.
 
-    def erstelle_schema(self) -> None:
-        """
-        Erstellt das Datenverzeichnis, falls es nicht existiert.
-        Verwendet exist_ok=True für sichere Verzeichniserstellung.
+        Raises:
+            CipherCoreDateiFehler: Wenn der Dateipfad unsicher ist.
+            CipherCoreDateiLadeFehler: Wenn die Datei nicht gelesen werden kann.
+            CipherCoreDatenValidierungsFehler: Wenn ein Block oder die Datei ungültig ist.
         """
+        dateiname = os.path.basename(datei_pfad)
+        if not self._ist_pfad_sicher(datei_pfad):
+            logger.error(f"Unsicherer Dateipfad: '{datei_pfad}'. Pfad liegt außerhalb des Basisverzeichnisses.")
+            raise CipherCoreDateiFehler(f"Ungültiger Dateipfad. Sicherheitshinweis: Pfad muss innerhalb des Basisverzeichnisses liegen.")
+        if not os.path.exists(datei_pfad):
+            raise CipherCoreDateiLadeFehler(f"Datei nicht gefunden: {datei_pfad}")
+        schema = self._lade_validierungs_schema(datei_pfad)
+        validierer = DatenValidierer(schema, dateiname)
+        if spalten is not None:
+            spalten = list(dict.fromkeys(list(spalten) + list(schema.get("spalten", {}))))
+        datei_endung = self._innerer_dateiname(datei_pfad).lower()
+
+        def _bloecke() -> Iterator[pd.DataFrame]:
+            if datei_endung.endswith((DATEIFORMAT_CSV, DATEIFORMAT_TEXT)):
+                csv_format = self._erkenne_csv_format(datei_pfad)
+                if pa is not None:
+                    yield from self._csv_arrow_bloecke(datei_pfad, csv_format, spalten, block_groesse)
+                else:
+                    yield from self._csv_pandas_bloecke(datei_pfad, csv_format, spalten, block_groesse)
+            elif datei_endung.endswith(DATEIFORMAT_PARQUET) and pa is not None and not self._kompression(datei_pfad):
+                parquet_datei = pa_parquet.ParquetFile(datei_pfad, memory_map=True)
+                namen = parquet_datei.schema_arrow.names
+                projektion = None if spalten is None else [spalte for spalte in namen if spalte in spalten]
+                for batch in parquet_datei.iter_batches(batch_size=block_groesse, columns=projektion, use_threads=True):
+                    yield batch.to_pandas(types_mapper=pd.ArrowDtype)
+            else:
+                daten_frame = self._datei_laden(datei_pfad, abbruch_token, None, spalten, blatt_name)
+                for start in range(0, max(len(daten_frame), 1), block_groesse):
+                    yield daten_frame.iloc[start:start + block_groesse]
+
         try:
-            os.makedirs(self.daten_verzeichnis, exist_ok=True)
-            logger.info(f"Datenverzeichnis '{self.daten_verzeichnis}' erstellt oder geprüft.")
-        except OSError as e:
-            logger.error(f"Fehler beim Erstellen des Datenverzeichnisses '{self.daten_verzeichnis}': {e}")
-            raise CipherCoreDateiSchemaFehler(f"Fehler beim Erstellen des Datenverzeichnisses: {e}") from e
+            for block in _bloecke():
+                if abbruch_token:
+                    abbruch_token.pruefe()
+                validierer.pruefe_block(block)
+                yield block
+            validierer.abschliessen()
+        except (CipherCoreAbbruchFehler, CipherCoreDatenValidierungsFehler, CipherCoreDateiFehler):
+            raise
+        except (OSError, ValueError) as e:
+            logger.error(f"Fehler beim blockweisen Lesen der Datei '{dateiname}': {e}")
+            raise CipherCoreDateiLadeFehler(f"Fehler beim Lesen der Datei '{dateiname}': {e}") from e
 
 
-    def _generiere_dateinamen(self, dateiname_datei1: str, dateiname_datei2: str) -> str:
+    def inkrementell_lesbar(self, datei_pfad: str, zustand: Optional[Dict]) -> Optional[str]:
         """
-        Generiert einen eindeutigen und sicheren Dateinamen für die JSON-Datei.
-        Sanitized Dateinamen, um Dateisystem- und Sicherheitsprobleme zu vermeiden.
+        Prüft, ob eine Datei ab dem gespeicherten Byte-Versatz weitergelesen werden kann.
 
         Args:
-            dateiname_datei1 (str): Der Dateiname der ersten Datei.
-            dateiname_datei2 (str): Der Dateiname der zweiten Datei.
+            datei_pfad (str): Der Pfad zur Datei.
+            zustand (Optional[Dict]): Der gespeicherte Vergleichszustand.
 
         Returns:
-            str: Der generierte Dateipfad für die JSON-Datei.
+            Optional[str]: None, wenn inkrementelles Lesen möglich ist, sonst der Grund für den vollständigen Vergleich.
         """
-        zeitstempel = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        datei_sicher_datei1 = "".join(x if x.isalnum() else "_" for x in dateiname_datei1) # Dateinamen "sanitieren"
-        datei_sicher_datei2 = "".join(x if x.isalnum() else "_" for x in dateiname_datei2) # Dateinamen "sanitieren"
-        dateiname = f"vergleichsergebnis_{datei_sicher_datei1}_vs_{datei_sicher_datei2}_{zeitstempel}.json"
-        return os.path.join(self.daten_verzeichnis, dateiname) # Sichere Pfadkonstruktion
+        if zustand is None:
+            return "kein gespeicherter Zustand"
+        if zustand.get("versatz") is None:
+            return "Format unterstützt kein inkrementelles Lesen"
+        if os.path.getsize(datei_pfad) < zustand["versatz"]:
+            return "Datei ist kleiner geworden"
+        regeln = self._lade_validierungs_schema(datei_pfad).get("spalten", {}).values()
+        if any(regel.get("eindeutig") or "max_null_anteil" in regel for regel in regeln):
+            return "Validierungsschema enthält dateiweite Regeln (eindeutig, max_null_anteil)"
+        return None
+
+
+    def inkrementelle_lesemarke(self, datei_pfad: str, spalten: List[str]) -> Dict:
+        """
+        Liefert Versatz, Präfix-Prüfsumme, CSV-Format und Spaltennamen für das spätere Weiterlesen einer Datei.
+        Nur unkomprimierte CSV/TXT-Dateien mit einer Kodierung ohne Zustandsbytes, die mit einem Zeilenumbruch
+        enden, erhalten einen Versatz; sonst wird beim nächsten Lauf vollständig verglichen.
 
+        Args:
+            datei_pfad (str): Der Pfad zur Datei.
+            spalten (List[str]): Die Spaltennamen der vollständig geladenen Datei.
 
-    def speichere_ergebnisse(self, vergleichs_ergebnisse: Dict[str, str], dateiname_datei1: str, dateiname_datei2: str, ist_pro_version: bool = False) -> None:
+        Returns:
+            Dict: Felder 'versatz', 'praefix_digest', 'csv_format' und 'spalten' für den Vergleichszustand.
         """
-        Speichert die Vergleichsergebnisse in einer JSON-Datei im Datenverzeichnis.
-        Verwendet sichere Dateiverarbeitung mit 'with open' Kontextmanager.
-        Speichern erfolgt nur in der Pro Version.
+        lesemarke: Dict = {"versatz": None, "praefix_digest": None, "csv_format": None, "spalten": spalten}
+        if self._kompression(datei_pfad) or not datei_pfad.lower().endswith((DATEIFORMAT_CSV, DATEIFORMAT_TEXT)):
+            return lesemarke
+        csv_format = self._erkenne_csv_format(datei_pfad)
+        if csv_format["encoding"] not in INKREMENTELLE_ENCODINGS or not csv_format["kopfzeile"]:
+            return lesemarke
+        with open(datei_pfad, 'rb') as datei:
+            datei.seek(0, os.SEEK_END)
+            if datei.tell() == 0:
+                return lesemarke
+            datei.seek(-1, os.SEEK_END)
+            if datei.read(1) != b'\n': # Letzte Zeile unvollständig: ein Anhang könnte sie verlängern
+                return lesemarke
+            datei.seek(0)
+            _, digest = _praefix_pruefsumme(datei, None, None)
+            versatz = datei.tell()
+        lesemarke.update({"versatz": versatz, "praefix_digest": digest, "csv_format": csv_format})
+        return lesemarke
+
+
+    def lade_angehaengte_zeilen(self, datei_pfad: str, zustand: Dict,
+                                abbruch_token: Optional[VergleichsAbbruchToken] = None) -> pd.DataFrame:
+        """
+        Liest nur die seit dem gespeicherten Versatz angehängten Zeilen einer CSV/TXT-Datei und validiert sie
+        (Zeilennummern fortlaufend zur bisherigen Datei). Wie beim vollständigen Lesen (siehe _oeffne_csv) werden
+        angehängte Bytes einer UTF-8-Datei ab dem ersten ungültigen Byte als cp1252 gelesen; das gespeicherte Format
+        der Datei bleibt unverändert, da die bisherigen Zeilen gültiges UTF-8 sind.
 
         Args:
-            vergleichs_ergebnisse (Dict[str, str]): Die Vergleichsergebnisse.
-            dateiname_datei1 (str): Der Dateiname der ersten Datei.
-            dateiname_datei2 (str): Der Dateiname der zweiten Datei.
-            ist_pro_version (bool): Gibt an, ob die Pro-Version aktiv ist.
-        """
-        if not ist_pro_version: # Speichern nur in Pro Version
-            logger.info("Testversion: Vergleichsergebnisse werden nicht in Dateien gespeichert.")
-            return
+            datei_pfad (str): Der Pfad zur Datei.
+            zustand (Dict): Der gespeicherte Vergleichszustand (Versatz, CSV-Format, Spalten, Zeilenanzahl).
+            abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch (optional).
 
-        datei_pfad = self._generiere_dateinamen(dateiname_datei1, dateiname_datei2)
-        daten_zum_speichern = {
-            "datei1_name": dateiname_datei1,
-            "datei2_name": dateiname_datei2,
-            "vergleichszeitpunkt": datetime.datetime.now().isoformat(),
-            "metriken": vergleichs_ergebnisse
-        }
-        try:
-            with open(datei_pfad, 'w', encoding='utf-8') as json_datei: # Sichere Dateiverarbeitung mit 'with open' und Encoding
-                json.dump(daten_zum_speichern, json_datei, indent=4, ensure_ascii=False) # Konfiguration als JSON speichern, ensure_ascii=False für korrekte Zeichenkodierung
-            logger.info(f"Vergleichsergebnisse in Datei '{datei_pfad}' gespeichert.")
-        except OSError as e:
-            logger.error(f"Fehler beim Speichern der Vergleichsergebnisse in Datei '{datei_pfad}': {e}")
-            raise CipherCoreDateiSpeicherFehler(f"Fehler beim Speichern der Vergleichsergebnisse in Datei: {e}") from e
+        Returns:
+            pd.DataFrame: Die angehängten Zeilen.
+
+        Raises:
+            CipherCoreDateiLadeFehler: Wenn die neuen Zeilen nicht gelesen werden können.
+            CipherCoreDatenValidierungsFehler: Wenn die neuen Zeilen ungültig sind.
+        """
+        dateiname = os.path.basename(datei_pfad)
+        csv_format = zustand["csv_format"]
+        kodierung = csv_format["encoding"].replace('utf-8-sig', 'utf-8') # Die BOM steht nur am Dateianfang
+        if abbruch_token:
+            abbruch_token.pruefe()
 
+        def umschalten(ersatz_kodierung: str) -> None:
+            logger.warning(f"Angehängte Zeilen von '{dateiname}' sind kein gültiges UTF-8. Weitere Bytes werden als '{ersatz_kodierung}' gelesen.")
 
-    def lade_alle_ergebnisse(self) -> List[Dict]:
+        try:
+            with open(datei_pfad, 'rb') as datei:
+                datei.seek(zustand["versatz"])
+                with (BufferedReader(KodierungsRueckfallStrom(datei, umschalten)) if kodierung == 'utf-8'
+                      else contextlib.nullcontext(datei)) as datenstrom:
+                    delta = pd.read_csv(datenstrom, encoding=kodierung, sep=csv_format["trennzeichen"],
+                                        quotechar=csv_format["quotechar"], header=None, names=zustand["spalten"])
+        except pd.errors.EmptyDataError:
+            delta = pd.DataFrame(columns=zustand["spalten"])
+        except (OSError, ValueError) as e:
+            logger.error(f"Fehler beim Lesen der angehängten Zeilen von '{dateiname}': {e}")
+            raise CipherCoreDateiLadeFehler(f"Fehler beim Lesen der angehängten Zeilen von '{dateiname}': {e}") from e
+        validierer = DatenValidierer(self._lade_validierungs_schema(datei_pfad), dateiname)
+        validierer.zeilen_geprueft = zustand["zeilen"] # Zeilennummern der neuen Zeilen fortlaufend melden
+        validierer.pruefe_block(delta)
+        validierer.abschliessen()
+        return delta
+
+
+    def ist_byte_identisch(self, datei_pfad1: str, datei_pfad2: str) -> bool:
         """
-        Lädt alle Vergleichsergebnisse aus den JSON-Dateien im Datenverzeichnis.
-        Behandelt Fehler beim Lesen einzelner Dateien robust und setzt den Ladevorgang fort.
+        Prüft, ob zwei Eingaben dasselbe Ergebnis beim Laden liefern: gleiche Dateiendung, gleiches Validierungsschema
+        und byte-identischer Inhalt (erst Dateigröße, dann blockweiser Vergleich mit Abbruch beim ersten Unterschied).
+
+        Args:
+            datei_pfad1 (str): Pfad der ersten Datei.
+            datei_pfad2 (str): Pfad der zweiten Datei.
 
         Returns:
-            List[Dict]: Eine Liste von Dictionaries, wobei jedes Dictionary ein Vergleichsergebnis darstellt.
+            bool: True, wenn die zweite Datei nicht gelesen werden muss.
         """
-        ergebnisse: List[Dict] = []
+        if not (self._ist_pfad_sicher(datei_pfad1) and self._ist_pfad_sicher(datei_pfad2)):
+            return False # Fehlermeldung übernimmt lade_daten
+        if os.path.splitext(datei_pfad1)[1].lower() != os.path.splitext(datei_pfad2)[1].lower():
+            return False
         try:
-            dateien = [f for f in os.listdir(self.daten_verzeichnis) if f.endswith('.json') and f.startswith('vergleichsergebnis_')]
-            for datei_name in dateien:
-                datei_pfad = os.path.join(self.daten_verzeichnis, datei_name) # Sichere Pfadkonstruktion
-                try:
-                    with open(datei_pfad, 'r', encoding='utf-8') as json_datei: # Sichere Dateiverarbeitung mit 'with open' und Encoding
-                        daten = json.load(json_datei)
-                        ergebnisse.append(daten)
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Fehler beim Lesen der JSON-Datei '{datei_pfad}'. Datei wird übersprungen. Fehler: {e}")
-                except OSError as e:
-                    logger.warning(f"Fehler beim Zugriff auf JSON-Datei '{datei_pfad}'. Datei wird übersprungen. Fehler: {e}")
-            logger.info(f"Alle Vergleichsergebnisse aus Datenverzeichnis '{self.daten_verzeichnis}' geladen.")
-        except OSError as e:
-            logger.error(f"Fehler beim Zugriff auf das Datenverzeichnis '{self.daten_verzeichnis}': {e}")
-            raise CipherCoreDateiLadeFehler(f"Fehler beim Laden der Vergleichsergebnisse aus dem Datenverzeichnis: {e}") from e
+            if os.path.getsize(datei_pfad1) != os.path.getsize(datei_pfad2):
+                return False
+            if self._lade_validierungs_schema(datei_pfad1) != self._lade_validierungs_schema(datei_pfad2):
+                return False
+            return filecmp.cmp(datei_pfad1, datei_pfad2, shallow=False)
+        except (OSError, CipherCoreDatenValidierungsFehler):
+            return False
 
-        ergebnisse.sort(key=lambda x: x.get('vergleichszeitpunkt', '1970-01-01T00:00:00'), reverse=True) # Sortierung beibehalten
-        return ergebnisse
 
+    def schaetze_eingabe(self, datei_pfad: str, spalte: str = 'Name', blatt_name: Optional[str] = None) -> 'EingabeSchaetzung':
+        """
+        Schätzt Zeilenanzahl, Zeilen- und Schlüssellänge einer Eingabe, ohne sie zu laden. CSV/TXT: Stichprobe der
+        ersten SCHAETZ_PROBE_BYTES (entpackten) Bytes, hochgerechnet auf die entpackte Dateigröße. Parquet, Feather
+        und Arrow: Zeilenanzahl aus den Metadaten, Schlüssellänge aus den ersten SCHAETZ_PROBE_ZEILEN Zeilen.
+        Excel: Zeilenanzahl aus der Bereichsangabe bzw. der Größe des größten Arbeitsblatts (höchstens EXCEL_MAX_ZEILEN).
 
+        Args:
+            datei_pfad (str): Der Pfad zur Datei.
+            spalte (str, optional): Vergleichsspalte, deren mittlere Länge geschätzt wird. Standard ist 'Name'.
+            blatt_name (Optional[str]): Arbeitsblatt von Excel-Dateien (optional, für die Schätzung nicht ausgewertet).
 
-# --- BerichtsGenerator Klasse (CipherCore Standard: Professionelle Berichterstellung) ---
-class BerichtsGenerator:
-    """
-    Modul zum Erstellen von Berichten im PDF-Format.
-    Integriert Logo, Statistiken, Diagramm und CipherCore Firmendetails in professionelle Berichte.
-    Sichere Einbindung von Ressourcen (Logo) und robuste Dateispeicherung.
-    """
+        Returns:
+            EingabeSchaetzung: Der geschätzte Umfang der Eingabe.
 
-    def __init__(self, logo_pfad: str = LOGO_DATEIPFAD_STANDARD, ausgabe_pfad: str = AUSGABE_DATEIPFAD, daten_manager: Optional[AbstractDataManager] = None):
+        Raises:
+            CipherCoreDateiFehler: Wenn der Dateipfad unsicher ist.
+            OSError, ValueError: Wenn die Datei nicht gelesen werden kann.
         """
-        Initialisiert den Berichtsgenerator.
-
-        Args:
-            logo_pfad (str): Der Pfad zum Logo für den Bericht.
-            ausgabe_pfad (str): Der Pfad, in dem der PDF-Bericht gespeichert wird.
-            daten_manager (Optional[AbstractDataManager]): Der Daten-Manager für die Speicherung der Ergebnisse (optional).
+        if not self._ist_pfad_sicher(datei_pfad):
+            raise CipherCoreDateiFehler(f"Ungültiger Dateipfad. Sicherheitshinweis: Pfad muss innerhalb des Basisverzeichnisses liegen.")
+        datei_endung = self._innerer_dateiname(datei_pfad).lower()
+        if datei_endung.endswith((DATEIFORMAT_CSV, DATEIFORMAT_TEXT)):
+            return self._schaetze_csv(datei_pfad, spalte)
+        if datei_endung.endswith(SPALTEN_DATEIFORMATE) and pa is not None and not self._kompression(datei_pfad):
+            if datei_endung.endswith(DATEIFORMAT_PARQUET):
+                parquet_datei = pa_parquet.ParquetFile(datei_pfad, memory_map=True)
+                projektion = [spalte] if spalte in parquet_datei.schema_arrow.names else None
+                batch = next(parquet_datei.iter_batches(batch_size=SCHAETZ_PROBE_ZEILEN, columns=projektion), None)
+                probe = batch.to_pandas() if batch is not None else None
+                zeilen, exakt = parquet_datei.metadata.num_rows, True
+            else:
+                with pa.memory_map(datei_pfad, 'r') as quelle:
+                    try:
+                        leser = pa.ipc.open_file(quelle) # Batches sind per mmap eingeblendet, das Zählen liest keine Daten
+                        batches = [leser.get_batch(index) for index in range(leser.num_record_batches)]
+                        batch, zeilen, exakt = (batches[0] if batches else None), sum(batch.num_rows for batch in batches), True
+                    except pa.ArrowInvalid:
+                        quelle.seek(0)
+                        batch = next(iter(pa.ipc.open_stream(quelle)), None) # Streamformat: aus dem ersten Batch hochrechnen
+                        zeilen = int(os.path.getsize(datei_pfad) * batch.num_rows / max(batch.nbytes, 1)) if batch is not None else 0
+                        exakt = False
+                    if batch is not None and spalte in batch.schema.names:
+                        batch = batch.select([spalte])
+                    probe = batch.slice(0, SCHAETZ_PROBE_ZEILEN).to_pandas() if batch is not None else None # Kopie vor dem Schließen der mmap
+            schluessel_bytes = self._mittlere_laenge(probe[spalte]) if probe is not None and spalte in probe else SCHAETZ_SCHLUESSEL_BYTES_STANDARD
+            return EingabeSchaetzung(datei_pfad, zeilen, schluessel_bytes, schluessel_bytes, exakt) # Es wird nur die Vergleichsspalte geladen
+        if datei_endung.endswith((DATEIFORMAT_EXCEL_XLSX, DATEIFORMAT_EXCEL_XLS)):
+            zeilen, exakt = self._schaetze_excel_zeilen(datei_pfad)
+            return EingabeSchaetzung(datei_pfad, zeilen, SCHAETZ_SCHLUESSEL_BYTES_STANDARD, SCHAETZ_SCHLUESSEL_BYTES_STANDARD, exakt)
+        raise ValueError(f"Eingabegröße für '{os.path.basename(datei_pfad)}' nicht schätzbar (Dateiformat).")
+
+
+    @staticmethod
+    def _schaetze_excel_zeilen(datei_pfad: str) -> Tuple[int, bool]:
         """
-        if logo_pfad and not isinstance(logo_pfad, str):
-            raise ValueError("Logo-Pfad muss ein gültiger Pfad sein.")
-        if ausgabe_pfad and not isinstance(ausgabe_pfad, str):
-            raise ValueError("Ausgabe-Pfad muss ein gültiger Pfad sein.")
+        Schätzt die Zeilenanzahl einer Excel-Datei, ohne sie zu laden. .xlsx: Bereichsangabe (<dimension ref="A1:C5000"/>)
+        am Anfang des größten Arbeitsblatts, sonst dessen entpackte Größe (aus dem ZIP-Verzeichnis) je
+        SCHAETZ_XLSX_XML_BYTES_JE_ZEILE. .xls und andere: Dateigröße je SCHAETZ_XLS_BYTES_JE_ZEILE.
 
-        self.logo_pfad = logo_pfad
-        self.ausgabe_pfad = ausgabe_pfad
-        self.daten_manager = daten_manager
-        logger.debug(f"BerichtsGenerator initialisiert. Logo-Pfad: '{self.logo_pfad}', Ausgabe-Pfad: '{self.ausgabe_pfad}', Daten-Manager: {daten_manager.__class__.__name__ if daten_manager else 'Kein'}")
+        Returns:
+            Tuple[int, bool]: Zeilenanzahl (höchstens EXCEL_MAX_ZEILEN) und ob sie aus der Bereichsangabe stammt.
+        """
+        if zipfile.is_zipfile(datei_pfad):
+            with zipfile.ZipFile(datei_pfad) as archiv:
+                blaetter = [eintrag for eintrag in archiv.infolist() if eintrag.filename.startswith('xl/worksheets/') and eintrag.filename.endswith('.xml')]
+                if blaetter:
+                    blatt = max(blaetter, key=lambda eintrag: eintrag.file_size)
+                    with archiv.open(blatt) as blatt_datei:
+                        anfang = blatt_datei.read(4096).decode('utf-8', errors='replace') # Nur der Anfang wird entpackt
+                    bereich = re.search(r'<(?:\w+:)?dimension ref="[A-Z]+\d+:[A-Z]+(\d+)"', anfang)
+                    if bereich:
+                        return min(max(int(bereich.group(1)) - 1, 0), EXCEL_MAX_ZEILEN), True # Ohne Kopfzeile
+                    return min(blatt.file_size // SCHAETZ_XLSX_XML_BYTES_JE_ZEILE, EXCEL_MAX_ZEILEN), False
+        return min(os.path.getsize(datei_pfad) // SCHAETZ_XLS_BYTES_JE_ZEILE, EXCEL_MAX_ZEILEN), False
+
+
+    def _schaetze_csv(self, datei_pfad: str, spalte: str) -> 'EingabeSchaetzung':
+        """
+        Schätzt den Umfang einer CSV/TXT-Datei aus einer Stichprobe vollständiger Zeilen am Dateianfang.
+        Beim Standardvergleich wird die gesamte Zeile geladen, daher zählt die Zeilenlänge.
+        """
+        csv_format = self._erkenne_csv_format(datei_pfad)
+        with self._oeffne_dekomprimiert(datei_pfad) as datenstrom:
+            probe = datenstrom.read(SCHAETZ_PROBE_BYTES + 1)
+        vollstaendig = len(probe) <= SCHAETZ_PROBE_BYTES
+        if not vollstaendig:
+            ende = probe.rfind(b'\n', 0, SCHAETZ_PROBE_BYTES)
+            probe = probe[:ende + 1] if ende >= 0 else probe[:SCHAETZ_PROBE_BYTES]
+        try:
+            stichprobe = pd.read_csv(BytesIO(probe), dtype=str, **self._pandas_csv_optionen(csv_format))
+        except (ValueError, UnicodeDecodeError, pd.errors.ParserError):
+            stichprobe = None # Unlesbare Stichprobe: Zeilen zählen, Fehlermeldung übernimmt das Laden
+        kopf_bytes = probe.find(b'\n') + 1 if csv_format["kopfzeile"] else 0
+        anzahl = len(stichprobe) if stichprobe is not None else probe.count(b'\n') - bool(kopf_bytes)
+        zeilen_bytes = (len(probe) - kopf_bytes) / max(anzahl, 1)
+        if vollstaendig:
+            zeilen = anzahl
+        else:
+            zeilen = int((self._entpackte_groesse(datei_pfad) - kopf_bytes) / max(zeilen_bytes, 1))
+        if stichprobe is not None and spalte in stichprobe:
+            schluessel_bytes = self._mittlere_laenge(stichprobe[spalte])
+        else:
+            schluessel_bytes = zeilen_bytes # Ohne Kopfzeile: Zeilenlänge als obere Schranke
+        return EingabeSchaetzung(datei_pfad, zeilen, zeilen_bytes, schluessel_bytes, vollstaendig)
 
 
-    def erstelle_pdf_bericht(self, vergleichs_ergebnisse: Dict[str, str], diagramm_bild_daten: str, dateiname_datei1: str, dateiname_datei2: str, ist_pro_version: bool = False) -> str:
+    def _entpackte_groesse(self, datei_pfad: str) -> int:
         """
-        Erstellt einen PDF-Bericht mit Statistiken, Diagramm und CipherCore Firmendetails.
+        Ermittelt die entpackte Größe einer (ggf. komprimierten) Datei: ZIP aus dem Verzeichniseintrag, gzip aus dem
+        ISIZE-Feld am Dateiende (Größe modulo 4 GiB, daher bis zur gepackten Größe aufgefüllt), zstd aus dem
+        Frame-Header. Ist sie nicht bekannt, wird mit SCHAETZ_KOMPRESSIONS_FAKTOR hochgerechnet.
+        """
+        datei_bytes = os.path.getsize(datei_pfad)
+        kompression = self._kompression(datei_pfad)
+        if kompression == KOMPRESSION_ZIP:
+            with zipfile.ZipFile(datei_pfad) as archiv:
+                return archiv.getinfo(self._zip_mitglied(archiv)).file_size
+        if kompression == KOMPRESSION_GZIP and datei_bytes >= 18: # Kleinste gzip-Datei: Header und Trailer
+            with open(datei_pfad, 'rb') as datei:
+                datei.seek(-4, os.SEEK_END)
+                groesse = int.from_bytes(datei.read(4), 'little')
+            while groesse < datei_bytes:
+                groesse += 1 << 32
+            return groesse
+        if kompression == KOMPRESSION_ZSTD:
+            if zstandard is not None:
+                with open(datei_pfad, 'rb') as datei:
+                    try:
+                        groesse = zstandard.frame_content_size(datei.read(18)) # Maximale Länge des Frame-Headers
+                    except zstandard.ZstdError:
+                        groesse = -1
+                if groesse >= 0:
+                    return groesse
+            return datei_bytes * SCHAETZ_KOMPRESSIONS_FAKTOR
+        return datei_bytes
+
+
+    @staticmethod
+    def _mittlere_laenge(werte: pd.Series) -> float:
+        """
+        Mittlere Textlänge der nicht leeren Werte einer Stichprobe (0 ohne Werte).
+        """
+        werte = werte.dropna().astype(str)
+        return float(werte.str.len().mean()) if len(werte) else 0.0
 
-        Args:
-            vergleichs_ergebnisse (Dict[str, str]): Die Vergleichsergebnisse.
-            diagramm_bild_daten (str): Base64-kodierte PNG-Bilddaten des Diagramms.
-            dateiname_datei1 (str): Der Dateiname der ersten Datei.
-            dateiname_datei2 (str): Der Dateiname der zweiten Datei.
-            ist_pro_version (bool): Gibt an, ob die Pro-Version aktiv ist.
 
-        Returns:
-            str: Der Pfad zum erstellten PDF-Bericht.
+    def _ist_pfad_sicher(self, datei_pfad: str) -> bool:
         """
-        logger.info(f"Starte PDF-Berichterstellung: '{self.ausgabe_pfad}'...")
-
-        if self.daten_manager: # Speichern der Ergebnisse, Datenmanager entscheidet ob Pro Version benötigt wird
-            try:
-                self.daten_manager.speichere_ergebnisse(vergleichs_ergebnisse, dateiname_datei1, dateiname_datei2, ist_pro_version) # Pro Version Status übergeben
-            except CipherCoreDatenbankFehler as e:
-                logger.error(f"Fehler beim Speichern der Ergebnisse über den Daten-Manager: {e}")
-                raise e # Fehler weiterleiten
-            except CipherCoreDateiFehler as e:
-                logger.error(f"Fehler beim Speichern der Ergebnisse über den Daten-Manager: {e}")
-                raise e # Fehler weiterleiten
-            except Exception as e:
-                logger.exception(f"Unerwarteter Fehler beim Speichern der Ergebnisse über den Daten-Manager: {e}")
-                raise CipherCoreDatenFehler(f"Unerwarteter Fehler beim Speichern der Ergebnisse: {e}") from e
-        elif not self.daten_manager:
-            logger.warning("Kein DatenManager konfiguriert. Vergleichsergebnisse werden nicht persistent gespeichert.")
+        Interne Hilfsfunktion zur Überprüfung, ob ein Dateipfad sicher ist (innerhalb des Basisverzeichnisses).
+        Verhindert Path-Traversal-Angriffe, ein wichtiger Sicherheitsaspekt.
 
+        Args:
+            datei_pfad (str): Der zu überprüfende Dateipfad.
 
-        pdf = FPDF()
-        pdf.add_page()
+        Returns:
+            bool: True, wenn der Pfad sicher ist, False sonst.
+        """
+        absoluter_pfad = os.path.abspath(datei_pfad)
+        ist_sicher = absoluter_pfad.startswith(self.basis_verzeichnis)
+        logger.debug(f"Pfad '{datei_pfad}' (absolut: '{absoluter_pfad}') ist sicher im Basisverzeichnis '{self.basis_verzeichnis}': {ist_sicher}")
+        return ist_sicher
 
-        self._pdf_kopfzeile_erstellen(pdf, "Datei-Vergleichsbericht") # Kopfzeile erstellen
 
-        pdf.set_font("Arial", "I", 10)
-        pdf.cell(0, 6, f"Verglichene Dateien: {dateiname_datei1}, {dateiname_datei2}", ln=1, align='C')
-        pdf.cell(0, 6, f"Vergleichszeitpunkt: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", ln=1, align='C')
-        pdf.ln(5)
+    def _lade_validierungs_schema(self, datei_pfad: str) -> Dict:
+        """
+        Interne Hilfsfunktion zur Ermittlung des Validierungsschemas einer Datei.
+        Eine Schemadatei '<datei>.schema.json' neben der Eingabedatei hat Vorrang vor dem globalen Schema.
 
-        self._pdf_statistik_tabelle_erstellen(pdf, vergleichs_ergebnisse) # Statistik Tabelle erstellen
+        Args:
+            datei_pfad (str): Der Pfad zur Eingabedatei.
 
-        pdf.ln(5)
+        Returns:
+            Dict: Das anzuwendende Validierungsschema.
 
-        pdf.set_font("Arial", "B", 12)
-        pdf.cell(0, 10, "Grafische Darstellung", ln=1)
-        pdf.set_font("Arial", "", 10)
-        diagramm_breite = 140
-        seiten_breite = 210
-        x_position_diagramm = (seiten_breite - diagramm_breite) / 2
+        Raises:
+            CipherCoreDatenValidierungsFehler: Wenn die Schemadatei nicht gelesen werden kann.
+        """
+        schema_pfad = datei_pfad + SCHEMA_DATEI_ENDUNG
+        if not os.path.exists(schema_pfad):
+            return self.validierungs_schema
         try:
-            # Korrigierter Code für pdf.image() mit PIL
-            bild_bytes = base64.b64decode(diagramm_bild_daten)
-            bild = Image.open(BytesIO(bild_bytes))
-            temp_datei = "temp_diagramm.png"
-            bild.save(temp_datei, format="PNG")
-            pdf.image(temp_datei, x=x_position_diagramm, y=pdf.get_y(), w=diagramm_breite)
-            os.remove(temp_datei) # Temporäre Datei löschen
-        except Exception as e:
-            logger.error(f"Fehler beim Einbetten des Diagrammbildes in den PDF-Bericht: {e}")
-            raise CipherCoreDatenFehler(f"Fehler beim Einbetten des Diagrammbildes in den PDF-Bericht: {e}") from e
+            with open(schema_pfad, 'r', encoding='utf-8') as schema_datei:
+                schema = json.load(schema_datei)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"Validierungsschema '{schema_pfad}' konnte nicht gelesen werden: {e}")
+            raise CipherCoreDatenValidierungsFehler(f"Validierungsschema '{os.path.basename(schema_pfad)}' konnte nicht gelesen werden: {e}") from e
+        if not isinstance(schema, dict):
+            raise CipherCoreDatenValidierungsFehler(f"Validierungsschema '{os.path.basename(schema_pfad)}' muss ein JSON-Objekt sein.")
+        logger.debug(f"Dateispezifisches Validierungsschema '{schema_pfad}' verwendet.")
+        return schema
+
+
+    def _validiere_daten(self, daten_frame: pd.DataFrame, dateiname: str, validierer: Optional[DatenValidierer] = None) -> None:
+        """
+        Interne Hilfsfunktion zur Validierung der geladenen Daten gegen das Validierungsschema.
+        Wurde die Datei bereits blockweise geprüft, werden nur noch die dateiweiten Regeln ausgewertet.
 
+        Args:
+            daten_frame (pd.DataFrame): Der DataFrame mit den zu validierenden Daten.
+            dateiname (str): Der Name der Datei, aus der die Daten geladen wurden.
+            validierer (Optional[DatenValidierer]): Validierer der Datei (optional, Standard: globales Schema).
 
-        self._pdf_fusszeile_erstellen(pdf, "CipherCore GmbH") # Fußzeile erstellen
+        Raises:
+            CipherCoreDatenValidierungsFehler: Wenn die Daten ungültig sind.
+        """
+        if validierer is None:
+            validierer = DatenValidierer(self.validierungs_schema, dateiname)
+        if validierer.zeilen_geprueft < len(daten_frame) or not len(daten_frame): # Noch nicht blockweise geprüft
+            validierer.pruefe_block(daten_frame)
+        validierer.abschliessen()
+        logger.debug(f"Daten aus Datei '{dateiname}' erfolgreich validiert.")
 
-        pdf.set_y(-25)
-        pdf.set_font("Arial", "I", 8)
-        pdf.cell(0, 10, f"{__copyright__} - {__license__}", 0, 0, 'C')
 
-        try:
-            os.makedirs(os.path.dirname(self.ausgabe_pfad), exist_ok=True) # Ausgabe-Verzeichnis erstellen falls nicht existent
-            pdf.output(self.ausgabe_pfad, "F") # PDF-Datei speichern
-            logger.info(f"PDF-Bericht erfolgreich gespeichert: '{self.ausgabe_pfad}'")
-        except OSError as e:
-            logger.error(f"Fehler beim Speichern des PDF-Berichts unter '{self.ausgabe_pfad}': {e}")
-            raise CipherCoreDateiSpeicherFehler(f"Fehler beim Speichern des PDF-Berichts: {e}") from e
 
-        return self.ausgabe_pfad
+# --- VergleichsZustandsSpeicher Klasse (CipherCore Standard: Inkrementelle Verarbeitung) ---
+def _praefix_pruefsumme(datei, versatz: Optional[int], erwarteter_digest: Optional[str],
+                        abbruch_token: Optional[VergleichsAbbruchToken] = None) -> Tuple[bool, str]:
+    """
+    Berechnet in einem Lesedurchlauf die BLAKE2b-Prüfsumme der ersten `versatz` Bytes und der gesamten Datei.
 
+    Args:
+        datei: Binär geöffnete Datei.
+        versatz (Optional[int]): Länge des zu prüfenden Präfixes (None: nur Gesamtprüfsumme).
+        erwarteter_digest (Optional[str]): Erwartete Präfix-Prüfsumme.
+        abbruch_token (Optional[VergleichsAbbruchToken]): Wird vor jedem gelesenen Block geprüft (optional).
 
-    def _pdf_kopfzeile_erstellen(self, pdf: FPDF, titel: str) -> None:
-        """
-        Interne Hilfsfunktion zum Erstellen der PDF-Kopfzeile (Logo und Titel).
-        Sichere Logo-Einbindung mit Pfadsicherheitsprüfung.
+    Returns:
+        Tuple[bool, str]: (Präfix unverändert, Prüfsumme der gesamten Datei).
 
-        Args:
-            pdf (FPDF): Das FPDF-Objekt.
-            titel (str): Der Titel der Kopfzeile.
-        """
-        if self.logo_pfad and os.path.exists(self.logo_pfad):
-            basis_verzeichnis = os.path.dirname(os.path.abspath(__file__))
-            if not _ist_pfad_sicher_static(self.logo_pfad, BASIS_VERZEICHNIS):
-                logger.warning(f"Unsicherer Logo-Dateipfad: '{self.logo_pfad}'. Logo wird nicht eingebunden.")
-            else:
-                try:
-                    pdf.image(self.logo_pfad, x=10, y=8, w=25) # Logo einbinden
-                    logger.debug(f"Logo in Kopfzeile eingebunden: '{self.logo_pfad}'")
-                except Exception as e:
-                    logger.warning(f"Fehler beim Laden des Logos für Kopfzeile: {e}")
+    Raises:
+        CipherCoreAbbruchFehler: Wenn der Lauf abgebrochen wurde.
+    """
+    pruefsumme = hashlib.blake2b(digest_size=32)
+    praefix_gleich = versatz is None
+    gelesen = 0
+    while True:
+        if abbruch_token:
+            abbruch_token.pruefe()
+        if versatz is not None and gelesen < versatz:
+            block = datei.read(min(HASH_LESE_BLOCK, versatz - gelesen))
         else:
-            logger.warning(f"Logo-Datei nicht gefunden oder Pfad nicht angegeben: '{self.logo_pfad}'. Kopfzeile ohne Logo.")
-
-        pdf.set_font("Arial", "B", 15)
-        pdf.cell(0, 10, titel, 0, 1, 'C')
-        pdf.ln(5)
-
+            block = datei.read(HASH_LESE_BLOCK)
+        if not block:
+            break
+        pruefsumme.update(block)
+        gelesen += len(block)
+        if versatz is not None and gelesen == versatz:
+            praefix_gleich = pruefsumme.copy().hexdigest() == erwarteter_digest # Zwischenstand ohne zweiten Lesedurchlauf
+    if versatz == 0:
+        praefix_gleich = hashlib.blake2b(digest_size=32).hexdigest() == erwarteter_digest
+    return praefix_gleich, pruefsumme.hexdigest()
+
+
+class VergleichsZustandsSpeicher:
+    """
+    Speichert den Vergleichszustand je Datei und Vergleichsspalte: Metadaten (Zeilenanzahl, Alterssumme/-anzahl,
+    Byte-Versatz, Präfix-Prüfsumme, CSV-Format) als JSON sowie die sortierten Schlüssel-Hashes und die Hashes
+    mehrfach vorkommender Werte als .npz-Datei.
+    """
 
-    def _pdf_statistik_tabelle_erstellen(self, pdf: FPDF, vergleichs_ergebnisse: Dict[str, str]) -> None:
+    def __init__(self, verzeichnis: str):
         """
-        Interne Hilfsfunktion zum Erstellen der tabellarischen Statistik im PDF.
-        Generiert eine übersichtliche Tabelle der Vergleichsergebnisse.
+        Initialisiert den Speicher.
 
         Args:
-            pdf (FPDF): Das FPDF-Objekt.
-            vergleichs_ergebnisse (Dict[str, str]): Die Vergleichsergebnisse.
+            verzeichnis (str): Verzeichnis der Zustandsdateien.
         """
-        pdf.set_font("Arial", "B", 12)
-        pdf.cell(0, 10, "Statistische Auswertung", ln=1)
-        pdf.set_font("Arial", "", 10)
-
-        pdf.set_fill_color(240, 240, 240)
-        pdf.set_draw_color(200, 200, 200)
-        pdf.set_line_width(0.1)
-        pdf.cell(90, 8, "Metrik", 1, 0, 'L', 1) # Breite der Metrik-Spalte angepasst
-        pdf.cell(50, 8, "Wert", 1, 0, 'R', 1) # Breite der Wert-Spalte angepasst
-        pdf.ln()
+        self.verzeichnis = verzeichnis
 
-        pdf.set_fill_color(255, 255, 255)
-        pdf.set_font("Arial", "", 10)
 
-        for metrik in METRIK_REIHENFOLGE:
-            if metrik in vergleichs_ergebnisse:
-                wert = vergleichs_ergebnisse[metrik]
-                pdf.cell(90, 7, metrik, 1, 0, 'L', 1) # Breite der Metrik-Spalte angepasst
-                pdf.cell(50, 7, str(wert), 1, 0, 'R', 1) # Breite der Wert-Spalte angepasst
-                pdf.ln()
+    def _basis_pfad(self, datei_pfad: str, spalte: str, blatt_name: Optional[str]) -> str:
+        schluessel = json.dumps([os.path.abspath(datei_pfad), str(spalte), blatt_name])
+        return os.path.join(self.verzeichnis, hashlib.sha256(schluessel.encode('utf-8')).hexdigest()[:24])
 
 
-    def _pdf_fusszeile_erstellen(self, pdf: FPDF, firmenname: str) -> None:
+    def lade(self, datei_pfad: str, spalte: str, blatt_name: Optional[str] = None) -> Tuple[Optional[Dict], Optional[np.ndarray], Optional[np.ndarray]]:
         """
-        Interne Hilfsfunktion zum Erstellen der PDF-Fußzeile (Seitenzahl und Firmenname).
-        Standardisierte Fußzeile für professionelles Erscheinungsbild.
+        Lädt den gespeicherten Zustand einer Datei.
 
-        Args:
-            pdf (FPDF): Das FPDF-Objekt.
-            firmenname (str): Der Firmenname für die Fußzeile.
+        Returns:
+            Tuple[Optional[Dict], Optional[np.ndarray], Optional[np.ndarray]]: Zustand, Schlüssel-Hashes und Hashes
+                mehrfach vorkommender Werte oder (None, None, None), wenn kein gültiger Zustand vorhanden ist.
         """
-        pdf.set_y(-15)
-        pdf.set_font("Arial", "I", 8)
-        pdf.cell(0, 10, f"Seite {pdf.page_no()}", 0, 0, 'C')
-        pdf.cell(0, 10, firmenname, 0, 0, 'R')
-
+        basis_pfad = self._basis_pfad(datei_pfad, spalte, blatt_name)
+        try:
+            with open(basis_pfad + '.json', 'r', encoding='utf-8') as zustands_datei:
+                zustand = json.load(zustands_datei)
+            if zustand.get("version") != ZUSTANDS_VERSION:
+                return None, None, None
+            with np.load(basis_pfad + '.npz', allow_pickle=False) as daten:
+                return zustand, daten["hashes"], daten["doppelte"]
+        except FileNotFoundError:
+            return None, None, None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Vergleichszustand für '{os.path.basename(datei_pfad)}' unlesbar, wird neu aufgebaut: {e}")
+            return None, None, None
+
+
+    def speichere(self, datei_pfad: str, spalte: str, blatt_name: Optional[str], zustand: Dict, hashes: np.ndarray, doppelte: np.ndarray) -> None:
+        """
+        Speichert Zustand und Schlüssel-Hashes atomar (erst Hashes, dann Metadaten). Fehler werden nur protokolliert.
+        """
+        basis_pfad = self._basis_pfad(datei_pfad, spalte, blatt_name)
+        try:
+            os.makedirs(self.verzeichnis, exist_ok=True)
+            with open(basis_pfad + '.npz.tmp', 'wb') as hash_datei:
+                np.savez(hash_datei, hashes=hashes, doppelte=doppelte)
+            os.replace(basis_pfad + '.npz.tmp', basis_pfad + '.npz')
+            with open(basis_pfad + '.json.tmp', 'w', encoding='utf-8') as zustands_datei:
+                json.dump({**zustand, "datei_pfad": os.path.abspath(datei_pfad), "spalte": str(spalte)}, zustands_datei, ensure_ascii=False)
+            os.replace(basis_pfad + '.json.tmp', basis_pfad + '.json')
+            logger.debug(f"Vergleichszustand für '{os.path.basename(datei_pfad)}' gespeichert: {basis_pfad}.json")
+        except OSError as e:
+            logger.warning(f"Vergleichszustand für '{os.path.basename(datei_pfad)}' konnte nicht gespeichert werden: {e}")
 
 
-# --- Hilfsfunktionen (CipherCore Standard: Wiederverwendbarkeit und Sicherheit) ---
 
-def _ist_pfad_sicher_static(datei_pfad: str, basis_verzeichnis: str) -> bool:
+# --- DatenSkizze Klasse (CipherCore Standard: Approximative Verarbeitung) ---
+def kanonische_schluessel(serie: pd.Series) -> pd.Series:
     """
-    Statische Hilfsfunktion zur Sicherheitsprüfung eines Dateipfads.
-    Überprüft, ob ein Dateipfad innerhalb des Basisverzeichnisses liegt, um Path-Traversal-Angriffe zu verhindern.
-    Wiederverwendbare Funktion für Pfadsicherheitsprüfungen.
+    Wandelt eine Schlüsselspalte in kanonischen Text um, damit alle Vergleichsverfahren (Standardvergleich, Hashes,
+    externes Sortieren, SQL) dieselben Werte als gleich ansehen - unabhängig davon, mit welchem Datentyp eine Datei
+    oder ein Block eingelesen wurde (1 in einer Ganzzahlspalte entspricht '1' in einer Textspalte). Ganzzahlige Gleitkommawerte werden als Ganzzahl dargestellt (1.0 -> '1'),
+    NaN, None und NA werden einheitlich zu NA (ein gemeinsamer leerer Wert wie beim Standardvergleich).
 
     Args:
-        datei_pfad (str): Der zu überprüfende Dateipfad.
-        basis_verzeichnis (str): Das Basisverzeichnis.
+        serie (pd.Series): Schlüsselspalte eines Blocks (beliebiger Datentyp).
 
     Returns:
-        bool: True, wenn der Pfad sicher ist, False sonst.
+        pd.Series: Spalte vom Typ 'string' mit NA für leere Werte.
     """
-    absoluter_pfad = os.path.abspath(datei_pfad)
-    basis_verzeichnis_absolut = os.path.abspath(basis_verzeichnis)
-    ist_sicher = absoluter_pfad.startswith(basis_verzeichnis_absolut)
-    logger.debug(f"Statische Pfadsicherheitsprüfung: Pfad '{datei_pfad}' (absolut: '{absoluter_pfad}') ist sicher im Basisverzeichnis '{basis_verzeichnis}': {ist_sicher}")
-    return ist_sicher
-
+    if pd.api.types.is_float_dtype(serie.dtype):
+        zahlen = serie.astype('float64').to_numpy(na_value=np.nan)
+        ganzzahlig = np.isfinite(zahlen) & (np.floor(zahlen) == zahlen) & (np.abs(zahlen) < 2.0 ** 63)
+        text = serie.astype('string')
+        text[np.isnan(zahlen)] = pd.NA # NaN in Arrow-Spalten ist kein Null-Wert, wird aber wie einer behandelt
+        if ganzzahlig.any():
+            text[ganzzahlig] = pd.array(zahlen[ganzzahlig].astype(np.int64), dtype='string')
+        return text
+    if serie.dtype == object: # Gemischte Python-Objekte (z.B. aus Excel): Gleitkommawerte einzeln vereinheitlichen
+        return serie.map(lambda wert: None if pd.isna(wert) else
+                         str(int(wert)) if isinstance(wert, float) and wert.is_integer() and abs(wert) < 2.0 ** 63 else
+                         str(wert)).astype('string')
+    return serie.astype('string')
+
+
+def _sortiert_eindeutig(werte: np.ndarray) -> np.ndarray:
+    """
+    Sortiert ein Array und entfernt Duplikate (schneller als np.unique für große uint64-Arrays).
+    """
+    werte = np.sort(werte)
+    return werte[np.concatenate(([True], werte[1:] != werte[:-1]))] if len(werte) else werte
 
-# --- Hauptfunktion (CipherCore Standard: Robuste Ausführung und Fehlerbehandlung) ---
 
-def dateien_vergleichen_und_bericht_erstellen(datei_pfad1: str, datei_pfad2: str, logo_pfad: str = LOGO_DATEIPFAD, ausgabe_pfad: str = AUSGABE_DATEIPFAD,
-                                              diagramm_typ: str = DIAGRAMM_TYP_BALKEN, daten_manager: Optional[AbstractDataManager] = None,
-                                              ui_status_rueckruf: Optional[Callable[[str], None]] = None,
-                                              spalte_datei1: str = 'Name', spalte_datei2: str = 'Name', lizenzschluessel: Optional[str] = None) -> Tuple[str, Optional[Dict[str, str]]]:
+def _sortiert_eindeutig_mit_doppelten(werte: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Hauptfunktion: Vergleicht zwei Dateien, erstellt Statistiken, Diagramm und PDF-Bericht.
-    Implementiert umfassende Fehlerbehandlung und Logging für robuste Ausführung.
-    Klare Schnittstelle mit Rückgabewerten und optionalem UI-Status-Rückruf.
+    Wie _sortiert_eindeutig; liefert zusätzlich die sortierten, eindeutigen Werte, die mehrfach vorkommen.
+    """
+    werte = np.sort(werte)
+    neu = werte[1:] != werte[:-1]
+    if not len(werte):
+        return werte, werte
+    return werte[np.concatenate(([True], neu))], _sortiert_eindeutig(werte[1:][~neu])
 
-    Pro Version Funktionalität:
-        - Kreisdiagramm ist nur in der Pro Version verfügbar.
-        - Speichern der Vergleichsergebnisse im DatenManager ist nur in der Pro Version aktiv.
 
-    Args:
-        datei_pfad1 (str): Der Pfad zur ersten Datei (Benutzereingabe).
-        datei_pfad2 (str): Der Pfad zur zweiten Datei (Hauptliste).
-        logo_pfad (str): Der Pfad zum Logo für den Bericht (optional).
-        ausgabe_pfad (str): Der Pfad für den PDF-Bericht (optional).
-        diagramm_typ (str): Der Diagrammtyp ('balken' oder 'kreis', optional).
-        daten_manager (Optional[AbstractDataManager]): Der Daten-Manager für die Speicherung der Ergebnisse (optional).
-        ui_status_rueckruf (Optional[Callable[[str], None]]): Eine Rückruffunktion zur Aktualisierung des UI-Status (optional).
-        spalte_datei1 (str, optional): Spalte für Vergleich aus Datei 1. Standard 'Name'.
-        spalte_datei2 (str, optional): Spalte für Vergleich aus Datei 2. Standard 'Name'.
-        lizenzschluessel (Optional[str]): Der Lizenzschlüssel zur Validierung (optional).
 
-    Returns:
-        Tuple[str, Optional[Dict[str, str]]]: Ein Tuple mit dem Pfad zum PDF-Bericht und den Vergleichsergebnissen.
-               Im Fehlerfall wird ein Fehlerstring und None zurückgegeben.
+class DatenSkizze:
+    """
+    Kompakte Skizze einer Schlüsselspalte für den approximativen Vergleich: HyperLogLog-Register für die
+    Kardinalität und eine Bottom-k-MinHash-Skizze (die k kleinsten Schlüssel-Hashes) für die Jaccard-Ähnlichkeit.
+    Zeilenanzahl sowie Summe und Anzahl der Alterswerte werden exakt mitgeführt.
+    Die Größe hängt nur vom Schätzfehler ab, nicht von der Anzahl der Zeilen.
     """
-    logger.info(f"Starte Dateivergleich: Datei 1='{datei_pfad1}', Datei 2='{datei_pfad2}'")
-    if ui_status_rueckruf:
-        ui_status_rueckruf("Vergleich gestartet...")
 
-    ist_pro = ist_pro_version(lizenzschluessel) # Prüfen ob Pro Version aktiv ist
+    def __init__(self, schaetz_fehler: float = SCHAETZ_FEHLER_STANDARD):
+        """
+        Initialisiert eine leere Skizze.
 
-    if lizenzschluessel and not ist_pro:
-        fehler_meldung = "Ungültiger Lizenzschlüssel. Bitte überprüfen Sie Ihren Lizenzschlüssel."
-        logger.error(fehler_meldung)
-        if ui_status_rueckruf:
-            ui_status_rueckruf(fehler_meldung)
-        return fehler_meldung, None # Abbruch, da Lizenz ungültig
+        Args:
+            schaetz_fehler (float): Relativer Standardfehler (optional). Bestimmt die Anzahl der HyperLogLog-Register
+                                    (1.04 / sqrt(m) <= Fehler, höchstens 2^HLL_MAX_PRAEZISION) und die Größe k der
+                                    MinHash-Skizze (1 / sqrt(k) <= Fehler).
 
-    try:
-        daten_lader = DatenLader(BASIS_VERZEICHNIS)
-        daten_frame1, dateiname_datei1 = daten_lader.lade_daten(datei_pfad1)
-        daten_frame2, dateiname_datei2 = daten_lader.lade_daten(datei_pfad2)
-        if ui_status_rueckruf:
-            ui_status_rueckruf("Daten erfolgreich geladen...")
+        Raises:
+            ValueError: Wenn der Schätzfehler außerhalb von SCHAETZ_FEHLER_MIN bis SCHAETZ_FEHLER_MAX liegt.
+        """
+        if not SCHAETZ_FEHLER_MIN <= float(schaetz_fehler) <= SCHAETZ_FEHLER_MAX:
+            raise ValueError(f"Schätzfehler {schaetz_fehler} liegt außerhalb von {SCHAETZ_FEHLER_MIN}-{SCHAETZ_FEHLER_MAX}.")
+        self.schaetz_fehler = float(schaetz_fehler)
+        self.praezision = min(max(int(np.ceil(np.log2((1.04 / self.schaetz_fehler) ** 2))), HLL_MIN_PRAEZISION), HLL_MAX_PRAEZISION)
+        self.hll_fehler = 1.04 / np.sqrt(1 << self.praezision) # Tatsächlich erreichter Kardinalitätsfehler (durch die Präzisionsgrenze ggf. größer als angefordert)
+        self.register = np.zeros(1 << self.praezision, dtype=np.uint8)
+        self.k = int(np.ceil(1 / self.schaetz_fehler ** 2))
+        self.minimum_hashes = np.empty(0, dtype=np.uint64)
+        self.zeilen = 0
+        self.hat_alter = False
+        self.alter_summe = 0.0
+        self.alter_anzahl = 0
+
+
+    def aktualisiere(self, hashes: np.ndarray) -> None:
+        """
+        Nimmt die 64-Bit-Schlüssel-Hashes eines Blocks auf (Zeilenanzahl wird nicht verändert).
 
-        datei_vergleicher = DateiVergleicher()
-        vergleichs_ergebnisse = datei_vergleicher.vergleiche_daten(daten_frame1, daten_frame2, spalte_datei1, spalte_datei2) # Spalten für Vergleich übergeben
-        if ui_status_rueckruf:
-            ui_status_rueckruf("Datenvergleich abgeschlossen...")
+        Args:
+            hashes (np.ndarray): Schlüssel-Hashes (uint64).
+        """
+        if not len(hashes):
+            return
+        index = (hashes >> np.uint64(64 - self.praezision)).astype(np.int64)
+        rest = hashes << np.uint64(self.praezision)
+        bitlaenge = np.zeros(len(rest), dtype=np.uint8) # Vektorisierte Bitlänge per binärer Suche über die Verschiebungen
+        verschoben = rest.copy()
+        for verschiebung in (32, 16, 8, 4, 2, 1):
+            maske = verschoben >= np.uint64(1 << verschiebung)
+            bitlaenge[maske] += verschiebung
+            verschoben[maske] >>= np.uint64(verschiebung)
+        bitlaenge += (verschoben > 0).astype(np.uint8)
+        rang = np.where(rest == 0, 65 - self.praezision, 65 - bitlaenge.astype(np.int64)).astype(np.uint8) # Führende Nullen + 1
+        np.maximum.at(self.register, index, rang)
+        if len(self.minimum_hashes) == self.k:
+            hashes = hashes[hashes < self.minimum_hashes[-1]] # Nur Kandidaten unterhalb des bisherigen k-ten Minimums
+        kandidaten = np.concatenate([self.minimum_hashes, hashes])
+        if len(kandidaten) > self.k:
+            kleinste = _sortiert_eindeutig(np.partition(kandidaten, self.k - 1)[:self.k]) # O(n) statt vollständiger Sortierung
+            if len(kleinste) == self.k:
+                self.minimum_hashes = kleinste
+                return
+        self.minimum_hashes = _sortiert_eindeutig(kandidaten)[:self.k] # Duplikate unter den Kandidaten: vollständig sortieren
 
-        diagramm_generator = DiagrammGenerator()
-        diagramm_bild_daten = diagramm_generator.erstelle_diagramm(vergleichs_ergebnisse, diagramm_typ, ist_pro) # Pro Version Status übergeben
-        if ui_status_rueckruf:
-            ui_status_rueckruf("Diagramm erstellt...")
 
-        berichts_generator = BerichtsGenerator(logo_pfad, ausgabe_pfad, daten_manager)
-        pdf_pfad = berichts_generator.erstelle_pdf_bericht(vergleichs_ergebnisse, diagramm_bild_daten,
-                                                            dateiname_datei1, dateiname_datei2, ist_pro) # Pro Version Status übergeben
-        if ui_status_rueckruf:
-            ui_status_rueckruf(f"PDF-Bericht erfolgreich erstellt: {pdf_pfad}")
+    def kardinalitaet(self) -> float:
+        """
+        Schätzt die Anzahl eindeutiger Schlüssel (HyperLogLog, Linear Counting für kleine Mengen).
+        Solange weniger als k eindeutige Schlüssel gesehen wurden, ist das Ergebnis exakt.
 
-        logger.info(f"PDF-Bericht erfolgreich erstellt: '{pdf_pfad}'")
-        return pdf_pfad, vergleichs_ergebnisse
+        Returns:
+            float: Die geschätzte Anzahl eindeutiger Schlüssel.
+        """
+        if len(self.minimum_hashes) < self.k:
+            return float(len(self.minimum_hashes))
+        return self._hll_schaetzung(self.register)
 
-    except CipherCoreDateiLadeFehler as e: # Spezifische Fehlerbehandlung für Dateiladefehler
-        fehler_meldung = f"Fehler beim Laden der Datei: {e}"
-        logger.error(fehler_meldung)
-        if ui_status_rueckruf:
-            ui_status_rueckruf(fehler_meldung)
-        return fehler_meldung, None
-    except CipherCoreDatenValidierungsFehler as e: # Spezifische Fehlerbehandlung für Datenvalidierungsfehler
-        fehler_meldung = f"Datenvalidierungsfehler: {e}"
-        logger.error(fehler_meldung)
-        if ui_status_rueckruf:
-            ui_status_rueckruf(fehler_meldung)
-        return fehler_meldung, None
-    except CipherCoreDatenbankFehler as e: # Spezifische Fehlerbehandlung für Datenbankfehler
-        fehler_meldung = f"Datenbankfehler: {e}"
-        logger.error(fehler_meldung)
-        if ui_status_rueckruf:
-            ui_status_rueckruf(fehler_meldung)
-        return fehler_meldung, None
-    except CipherCoreDateiFehler as e: # Generische Fehlerbehandlung für Dateifehler
-        fehler_meldung = f"Dateifehler: {e}"
-        logger.error(fehler_meldung)
-        if ui_status_rueckruf:
-            ui_status_rueckruf(fehler_meldung)
-        return fehler_meldung, None
-    except CipherCoreUngültigerDiagrammTypFehler as e: # Spezifische Fehlerbehandlung für ungültigen Diagrammtyp
-        fehler_meldung = f"Ungültiger Diagrammtyp: {e}"
-        logger.error(fehler_meldung)
-        if ui_status_rueckruf:
-            ui_status_rueckruf(fehler_meldung)
-        return fehler_meldung, None
-    except CipherCoreLizenzFehler as e: # Spezifische Fehlerbehandlung für Lizenzfehler
-        fehler_meldung = f"Lizenzfehler: {e}"
-        logger.error(fehler_meldung)
-        if ui_status_rueckruf:
-            ui_status_rueckruf(fehler_meldung)
-        return fehler_meldung, None
-    except Exception as e: # Unerwartete Fehlerbehandlung (Generischer Catch-All)
-        logger.exception(f"Unerwarteter Fehler: {e}")
-        if ui_status_rueckruf:
-            ui_status_rueckruf(f"Unerwarteter Fehler: {e}")
-        return f"Unerwarteter Fehler: {e}", None
 
+    @staticmethod
+    def _hll_schaetzung(register: np.ndarray) -> float:
+        anzahl_register = len(register)
+        alpha = 0.7213 / (1 + 1.079 / anzahl_register)
+        schaetzung = alpha * anzahl_register ** 2 / float(np.sum(np.ldexp(1.0, -register.astype(np.int64))))
+        leere_register = int(np.count_nonzero(register == 0))
+        if schaetzung <= 2.5 * anzahl_register and leere_register:
+            schaetzung = anzahl_register * np.log(anzahl_register / leere_register)
+        return float(schaetzung)
 
 
-# --- UI-Teil mit Tkinter (CipherCore Standard: Benutzerfreundlichkeit und Robustheit) ---
-class DateiVergleichsApp:
+    def vergleiche(self, andere: 'DatenSkizze') -> Tuple[float, float]:
+        """
+        Schätzt Jaccard-Ähnlichkeit und Schnittmenge zweier Skizzen gleicher Genauigkeit.
+        Die Jaccard-Ähnlichkeit stammt aus den k kleinsten Hashes der Vereinigung, die Vereinigung aus den
+        zusammengeführten HyperLogLog-Registern; Schnittmenge = Jaccard x Vereinigung.
+
+        Args:
+            andere (DatenSkizze): Die Skizze der zweiten Datei.
+
+        Returns:
+            Tuple[float, float]: (Jaccard-Ähnlichkeit, geschätzte Anzahl gemeinsamer Schlüssel).
+
+        Raises:
+            ValueError: Wenn die Skizzen mit unterschiedlichem Schätzfehler erstellt wurden.
+        """
+        if self.praezision != andere.praezision or self.k != andere.k:
+            raise ValueError("Skizzen mit unterschiedlichem Schätzfehler können nicht verglichen werden.")
+        vereinigung_minima = np.union1d(self.minimum_hashes, andere.minimum_hashes)[:self.k]
+        if not len(vereinigung_minima):
+            return 0.0, 0.0
+        gemeinsam = np.isin(vereinigung_minima, self.minimum_hashes, assume_unique=True) & \
+            np.isin(vereinigung_minima, andere.minimum_hashes, assume_unique=True)
+        jaccard = float(np.count_nonzero(gemeinsam)) / len(vereinigung_minima)
+        if len(self.minimum_hashes) < self.k and len(andere.minimum_hashes) < self.k:
+            return jaccard, float(np.count_nonzero(gemeinsam)) # Beide Skizzen vollständig: exakt
+        vereinigung = self._hll_schaetzung(np.maximum(self.register, andere.register))
+        return jaccard, jaccard * vereinigung
+
+
+    def speichere(self, pfad: str, kennung: Dict) -> None:
+        """
+        Speichert die Skizze atomar als .npz-Datei. Fehler werden nur protokolliert.
+
+        Args:
+            pfad (str): Zielpfad.
+            kennung (Dict): Merkmale der Quelldatei (Pfad, Größe, Änderungszeit, Spalte), mit denen lade die Aktualität prüft.
+        """
+        try:
+            os.makedirs(os.path.dirname(pfad) or '.', exist_ok=True)
+            with open(pfad + '.tmp', 'wb') as skizzen_datei:
+                np.savez(skizzen_datei, register=self.register, minimum_hashes=self.minimum_hashes,
+                         kennzahlen=np.array([self.schaetz_fehler, self.zeilen, self.hat_alter, self.alter_summe, self.alter_anzahl], dtype=np.float64),
+                         kennung=np.array(json.dumps(kennung, sort_keys=True)))
+            os.replace(pfad + '.tmp', pfad)
+        except OSError as e:
+            logger.warning(f"Skizze konnte nicht gespeichert werden ('{pfad}'): {e}")
+
+
+    @classmethod
+    def lade(cls, pfad: str, kennung: Dict) -> Optional['DatenSkizze']:
+        """
+        Lädt eine gespeicherte Skizze, sofern sie zur angegebenen Kennung der Quelldatei passt.
+
+        Returns:
+            Optional[DatenSkizze]: Die Skizze oder None, wenn keine aktuelle Skizze vorhanden ist.
+        """
+        try:
+            with np.load(pfad, allow_pickle=False) as daten:
+                if str(daten["kennung"]) != json.dumps(kennung, sort_keys=True):
+                    return None
+                schaetz_fehler, zeilen, hat_alter, alter_summe, alter_anzahl = daten["kennzahlen"].tolist()
+                skizze = cls(schaetz_fehler)
+                skizze.register, skizze.minimum_hashes = daten["register"], daten["minimum_hashes"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Skizze '{pfad}' unlesbar, wird neu erstellt: {e}")
+            return None
+        skizze.zeilen, skizze.hat_alter = int(zeilen), bool(hat_alter)
+        skizze.alter_summe, skizze.alter_anzahl = alter_summe, int(alter_anzahl)
+        return skizze
+
+
+
+# --- StatistikEngine Klasse (CipherCore Standard: Numerisch robuste Kennzahlen) ---
+def _tdigest_komprimieren(mittelwerte: np.ndarray, gewichte: np.ndarray, kompression: int) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Tkinter-Anwendung für das CipherCore Datei-Vergleichs-Tool.
-    Bietet eine benutzerfreundliche Oberfläche mit klarer Statusanzeige und Fehlerbehandlung.
-    Thread-sichere UI-Updates für reaktionsschnelle Anwendung.
+    Verdichtet gewichtete Zentroiden zu einem t-digest (Skalenfunktion k1): Nach Mittelwert sortierte Zentroiden,
+    deren Quantilmitte in dieselbe Einheit von k(q) = kompression / (2 pi) * asin(2q - 1) fällt, werden zusammengefasst.
+    Dadurch bleiben die Ränder (kleine und große Quantile) fein aufgelöst.
 
-    Pro Version Funktionalität in der UI:
-        - Kreisdiagramm Option ist nur in der Pro Version aktiv.
-        - Verlauf anzeigen Button ist nur in der Pro Version aktiv.
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Mittelwerte und Gewichte der verdichteten Zentroiden.
     """
-    def __init__(self, root: tk.Tk, daten_manager: AbstractDataManager):
+    reihenfolge = np.argsort(mittelwerte, kind='stable')
+    mittelwerte, gewichte = mittelwerte[reihenfolge], gewichte[reihenfolge]
+    kumuliert = np.cumsum(gewichte)
+    quantil_mitte = (kumuliert - gewichte / 2) / kumuliert[-1]
+    einheit = np.floor(kompression / (2 * np.pi) * np.arcsin(2 * quantil_mitte - 1))
+    anfaenge = np.flatnonzero(np.concatenate(([True], einheit[1:] != einheit[:-1])))
+    neue_gewichte = np.add.reduceat(gewichte, anfaenge)
+    return np.add.reduceat(mittelwerte * gewichte, anfaenge) / neue_gewichte, neue_gewichte
+
+
+class SpaltenStatistik:
+    """
+    Akkumuliert die Kennzahlen einer Spalte blockweise in einem Durchlauf.
+    Numerische Spalten: Mittelwert und Standardabweichung über Welford/Chan (blockweise zusammengeführt),
+    Summe mit Kahan-Neumaier-Kompensation über die Blöcke, Quantile exakt bis STATISTIK_QUANTILE_EXAKT_BIS Werte,
+    darüber per t-digest. Kategoriale Spalten: Anzahl, leere Werte, eindeutige Werte sowie lexikographisches Min/Max.
+    """
+
+    def __init__(self, statistiken: List[str], quantile_exakt_bis: int = STATISTIK_QUANTILE_EXAKT_BIS):
         """
-        Initialisiert die DateiVergleichsApp.
+        Initialisiert den Akkumulator.
 
         Args:
-            root (tk.Tk): Das Hauptfenster der Tkinter-Anwendung.
-            daten_manager (AbstractDataManager): Der Daten-Manager für die Ergebnispersistenz.
+            statistiken (List[str]): Zu berechnende Kennzahlen (siehe STATISTIK_NAMEN, Perzentile 'p1' bis 'p99').
+            quantile_exakt_bis (int): Werte, bis zu denen Quantile exakt berechnet werden (optional).
         """
-        self.root = root
-        root.title("CipherCore Datei Vergleichs Tool Pro") # Firmenname im Fenstertitel - Pro Version
-        self.daten_manager = daten_manager
-        self.datei_pfad1 = tk.StringVar()
-        self.datei_pfad2 = tk.StringVar()
-        self.diagramm_typ = tk.StringVar(value=DIAGRAMM_TYP_BALKEN)
-        self.status_meldung = tk.StringVar()
-        self.ergebnis_text = None
-        self.lizenz_akzeptiert = tk.BooleanVar(value=konfiguration.get(CONFIG_SCHLUESSEL_LIZENZ_AKZEPTIERT, False))
-        self.verlauf_text = None
-        self.spalte_datei1 = tk.StringVar(value='Name') # Standardspalte für Datei 1
-        self.spalte_datei2 = tk.StringVar(value='Name') # Standardspalte für Datei 2
-        self.lizenzschluessel_var = tk.StringVar(value=LIZENZSCHLUESSEL if LIZENZSCHLUESSEL else "") # Lizenzschlüssel Variable
-        self.pro_version_aktiv = tk.BooleanVar(value=ist_pro_version(self.lizenzschluessel_var.get())) # Pro Version Status Variable
+        self.statistiken = list(statistiken)
+        self.quantile = {name: (0.5 if name == 'median' else int(name[1:]) / 100) for name in self.statistiken
+                         if name == 'median' or name.startswith('p')}
+        self.quantile_exakt_bis = quantile_exakt_bis
+        self.numerisch: Optional[bool] = None # Wird anhand des ersten Blocks festgelegt
+        self.anzahl = 0
+        self.leer = 0
+        self.mittelwert = 0.0
+        self.m2 = 0.0
+        self.summe = 0.0
+        self.summe_korrektur = 0.0
+        self.minimum: Any = None
+        self.maximum: Any = None
+        self.werte_puffer: List[np.ndarray] = []
+        self.gepufferte_werte = 0
+        self.digest: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self.eindeutige_bloecke: List[np.ndarray] = []
+        self.eindeutige_hashes = np.empty(0, dtype=np.uint64)
+
+
+    def aktualisiere(self, serie: pd.Series) -> None:
+        """
+        Nimmt einen Block der Spalte auf.
+
+        Args:
+            serie (pd.Series): Die Werte des Blocks.
+        """
+        if self.numerisch is None:
+            self.numerisch = pd.api.types.is_numeric_dtype(serie.dtype) and not pd.api.types.is_bool_dtype(serie.dtype)
+        null_maske = serie.isna().to_numpy(dtype=bool)
+        if self.numerisch:
+            # Abweichend typisierte Blöcke werden konvertiert; nicht numerische Werte zählen als leer
+            werte = pd.to_numeric(serie, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+            werte = werte[~np.isnan(werte)]
+            self.leer += len(serie) - len(werte)
+            self._numerisch_aktualisieren(werte)
+            if 'eindeutig' in self.statistiken and len(werte):
+                self.eindeutige_bloecke.append(_sortiert_eindeutig((werte + 0.0).view(np.uint64))) # Bitmuster; +0.0 vereinheitlicht -0.0
+        else:
+            gueltig = serie[~null_maske]
+            self.leer += int(null_maske.sum())
+            self.anzahl += len(gueltig)
+            if len(gueltig) and ('min' in self.statistiken or 'max' in self.statistiken):
+                texte = gueltig.astype('string')
+                self.minimum = texte.min() if self.minimum is None else min(self.minimum, texte.min())
+                self.maximum = texte.max() if self.maximum is None else max(self.maximum, texte.max())
+            if 'eindeutig' in self.statistiken and len(gueltig):
+                self.eindeutige_bloecke.append(_sortiert_eindeutig(pd.util.hash_pandas_object(gueltig.astype('string'), index=False).to_numpy()))
+        if sum(len(block) for block in self.eindeutige_bloecke) > max(2 * len(self.eindeutige_hashes), 1_000_000):
+            self._eindeutige_zusammenfuehren() # Blockweise Eindeutigkeiten gelegentlich verdichten, um Speicher zu begrenzen
+
+
+    def _numerisch_aktualisieren(self, werte: np.ndarray) -> None:
+        anzahl_block = len(werte)
+        if not anzahl_block:
+            return
+        mittelwert_block = float(np.mean(werte)) # Paarweise Summation in numpy
+        m2_block = float(np.sum(np.square(werte - mittelwert_block)))
+        gesamt = self.anzahl + anzahl_block
+        differenz = mittelwert_block - self.mittelwert
+        self.mittelwert += differenz * anzahl_block / gesamt # Chan et al.: Zusammenführen zweier Welford-Zustände
+        self.m2 += m2_block + differenz ** 2 * self.anzahl * anzahl_block / gesamt
+        self.anzahl = gesamt
+
+        summe_block = float(np.sum(werte))
+        neue_summe = self.summe + summe_block # Kahan-Neumaier über die Blocksummen
+        if abs(self.summe) >= abs(summe_block):
+            self.summe_korrektur += (self.summe - neue_summe) + summe_block
+        else:
+            self.summe_korrektur += (summe_block - neue_summe) + self.summe
+        self.summe = neue_summe
+
+        minimum_block, maximum_block = float(np.min(werte)), float(np.max(werte))
+        self.minimum = minimum_block if self.minimum is None else min(self.minimum, minimum_block)
+        self.maximum = maximum_block if self.maximum is None else max(self.maximum, maximum_block)
+
+        if self.quantile:
+            if self.digest is None:
+                self.werte_puffer.append(werte)
+                self.gepufferte_werte += anzahl_block
+                if self.gepufferte_werte > self.quantile_exakt_bis: # Ab hier Quantile per t-digest
+                    alle_werte = np.concatenate(self.werte_puffer)
+                    self.digest = _tdigest_komprimieren(alle_werte, np.ones(len(alle_werte)), STATISTIK_TDIGEST_KOMPRESSION)
+                    self.werte_puffer, self.gepufferte_werte = [], 0
+            else:
+                self.digest = _tdigest_komprimieren(np.concatenate([self.digest[0], werte]),
+                                                    np.concatenate([self.digest[1], np.ones(anzahl_block)]), STATISTIK_TDIGEST_KOMPRESSION)
+
+
+    def _eindeutige_zusammenfuehren(self) -> None:
+        if self.eindeutige_bloecke:
+            self.eindeutige_hashes = _sortiert_eindeutig(np.concatenate([self.eindeutige_hashes, *self.eindeutige_bloecke]))
+            self.eindeutige_bloecke = []
+
+
+    def _quantil(self, anteil: float) -> Optional[float]:
+        if self.digest is None:
+            if not self.gepufferte_werte:
+                return None
+            return float(np.quantile(np.concatenate(self.werte_puffer), anteil)) # Lineare Interpolation wie pandas
+        mittelwerte, gewichte = self.digest
+        kumuliert = np.cumsum(gewichte)
+        positionen = np.concatenate(([0.0], (kumuliert - gewichte / 2) / kumuliert[-1], [1.0]))
+        return float(np.interp(anteil, positionen, np.concatenate(([self.minimum], mittelwerte, [self.maximum]))))
+
+
+    def ergebnis(self) -> Dict[str, Union[int, float, str, bool, None]]:
+        """
+        Liefert die konfigurierten Kennzahlen als typisierte Werte (int/float/str, None bei leerer Spalte).
+
+        Returns:
+            Dict[str, Union[int, float, str, bool, None]]: Kennzahlen der Spalte sowie 'numerisch' und bei Quantilen 'quantile_exakt'.
+        """
+        self._eindeutige_zusammenfuehren()
+        kennzahlen: Dict[str, Union[int, float, str, bool, None]] = {"numerisch": bool(self.numerisch)}
+        for name in self.statistiken:
+            if name == 'anzahl':
+                kennzahlen[name] = self.anzahl
+            elif name == 'leer':
+                kennzahlen[name] = self.leer
+            elif name == 'eindeutig':
+                kennzahlen[name] = len(self.eindeutige_hashes)
+            elif name in ('min', 'max'):
+                kennzahlen[name] = self.minimum if name == 'min' else self.maximum
+            elif not self.numerisch:
+                kennzahlen[name] = None # Summe, Mittelwert, Streuung und Quantile nur für numerische Spalten
+            elif name == 'summe':
+                kennzahlen[name] = self.summe + self.summe_korrektur if self.anzahl else None
+            elif name == 'mittelwert':
+                kennzahlen[name] = self.mittelwert if self.anzahl else None
+            elif name == 'std':
+                kennzahlen[name] = float(np.sqrt(self.m2 / (self.anzahl - 1))) if self.anzahl > 1 else None # Stichproben-Std wie pandas
+            else:
+                kennzahlen[name] = self._quantil(self.quantile[name])
+        if self.quantile and self.numerisch:
+            kennzahlen["quantile_exakt"] = self.digest is None
+        return kennzahlen
+
+
+class StatistikEngine:
+    """
+    Berechnet die konfigurierten Kennzahlen für alle (oder ausgewählte) Spalten eines DataFrames in einem Durchlauf.
+    Blöcke können nacheinander übergeben werden (z.B. aus DatenLader.lade_bloecke), ohne die Datei vollständig zu laden.
+    """
+
+    def __init__(self, statistiken: Optional[List[str]] = None, spalten: Optional[List[str]] = None,
+                 quantile_exakt_bis: int = STATISTIK_QUANTILE_EXAKT_BIS):
+        """
+        Initialisiert die Engine.
+
+        Args:
+            statistiken (Optional[List[str]]): Zu berechnende Kennzahlen (optional, Standard: aus config.json).
+            spalten (Optional[List[str]]): Auszuwertende Spalten (optional, Standard: alle Spalten des ersten Blocks).
+            quantile_exakt_bis (int): Werte je Spalte, bis zu denen Quantile exakt berechnet werden (optional).
+
+        Raises:
+            ValueError: Wenn eine Kennzahl nicht unterstützt wird.
+        """
+        self.statistiken = list(statistiken if statistiken is not None else STATISTIKEN)
+        ungueltig = [name for name in self.statistiken if not _ist_statistik_name(name)]
+        if ungueltig:
+            raise ValueError(f"Nicht unterstützte Kennzahlen: {', '.join(ungueltig)}")
+        self.spalten = spalten
+        self.quantile_exakt_bis = quantile_exakt_bis
+        self.zeilen = 0
+        self.spalten_statistiken: Dict[str, SpaltenStatistik] = {}
+
+
+    def aktualisiere(self, block: pd.DataFrame) -> None:
+        """
+        Nimmt einen Block auf. Spalten, die in einem Block fehlen, werden für diesen Block übersprungen.
+
+        Args:
+            block (pd.DataFrame): Die Zeilen des Blocks.
+        """
+        self.zeilen += len(block)
+        for spalte in (self.spalten if self.spalten is not None else block.columns):
+            if spalte not in block.columns:
+                continue
+            name = str(spalte)
+            if name not in self.spalten_statistiken:
+                self.spalten_statistiken[name] = SpaltenStatistik(self.statistiken, self.quantile_exakt_bis)
+            self.spalten_statistiken[name].aktualisiere(block[spalte])
+
+
+    def ergebnis(self) -> Dict[str, Dict[str, Union[int, float, str, bool, None]]]:
+        """
+        Liefert die Kennzahlen je Spalte.
+
+        Returns:
+            Dict[str, Dict[str, Union[int, float, str, bool, None]]]: Spaltenname -> Kennzahlen (typisierte Werte).
+        """
+        return {name: statistik.ergebnis() for name, statistik in self.spalten_statistiken.items()}
+
+
+
+# --- VergleichsErgebnis Klasse (CipherCore Standard: Typisierte Ergebnisse) ---
+def formatiere_metrik(metrik: str, wert: Union[int, float, str, None]) -> str:
+    """
+    Formatiert den Rohwert einer Metrik für die Anzeige (UI, PDF): Anteile als Prozent, Durchschnittsalter mit
+    einer Nachkommastelle, Anzahlen ganzzahlig. Texte (z.B. Verlaufseinträge älterer Versionen) bleiben unverändert.
+
+    Args:
+        metrik (str): Name der Metrik (METRIK_* Konstante).
+        wert (Union[int, float, str, None]): Der Rohwert.
+
+    Returns:
+        str: Der Anzeigetext ('' für fehlende Werte).
+    """
+    if wert is None:
+        return ''
+    if isinstance(wert, str):
+        return wert
+    if metrik in METRIK_PROZENT_METRIKEN:
+        return f"{wert:.2%}"
+    if metrik in METRIK_DEZIMAL_METRIKEN:
+        return f"{wert:.1f}"
+    return f"{wert:.0f}"
+
+
+@dataclass(**DATACLASS_SLOTS)
+class DuplikatStatistik:
+    """
+    Mehrfach vorkommende Werte einer Vergleichsspalte, berechnet aus denselben faktorisierten Schlüsselcodes wie der
+    Vergleich (beim externen Sortieren aus den Anzahlen der Läufe, bei den hashbasierten Verfahren aus den
+    Schlüssel-Hashes; dort jeweils ohne häufigste Werte). Zeilennummern sind 1-basierte Datenzeilen (ohne Kopfzeile),
+    wie bei der Validierung.
+    """
+    eindeutige_werte: int
+    doppelte_werte: int # Werte, die in mehr als einer Zeile vorkommen
+    doppelte_zeilen: int # Zeilen über das erste Vorkommen ihres Werts hinaus (Zeilen - eindeutige Werte)
+    haeufigste: List[Dict[str, Any]] = field(default_factory=list) # {"wert", "anzahl", "zeilen"}, absteigend nach Anzahl
+
+
+@dataclass(**DATACLASS_SLOTS)
+class VergleichsErgebnis:
+    """
+    Ergebnis eines Dateivergleichs mit Rohwerten (Anzahlen als int, Anteile als float 0-1) und Metadaten.
+    Die Formatierung erfolgt erst bei der Anzeige (formatiert, formatiere_metrik); Diagramm und Datenbank
+    verwenden die Zahlen direkt.
+    """
+    anzahl_datei1: int
+    anzahl_datei2: int
+    gleiche_werte: Optional[int] = None # Exakte Übereinstimmungen (None im approximativen Vergleich)
+    durchschnittsalter_datei1: Optional[float] = None # None, wenn eine Datei keine Spalte 'Alter' hat
+    durchschnittsalter_datei2: Optional[float] = None
+    eindeutige_datei1_schaetzung: Optional[float] = None # Nur im approximativen Vergleich
+    eindeutige_datei2_schaetzung: Optional[float] = None
+    gleiche_werte_schaetzung: Optional[float] = None
+    jaccard_schaetzung: Optional[float] = None
+    schaetz_fehler: Optional[float] = None
+    verfahren: str = VERFAHREN_STANDARD
+    abkuerzung: Optional[str] = None # Genutzte Abkürzung (ABKUERZUNG_* Konstante) oder None
+    duplikate_datei1: Optional[DuplikatStatistik] = None # Alle exakten Verfahren (nicht approximativ)
+    duplikate_datei2: Optional[DuplikatStatistik] = None
+    laufzeiten: Dict[str, float] = field(default_factory=dict) # Sekunden je Pipeline-Stufe
+
+    @classmethod
+    def aus_dict(cls, daten: Dict) -> 'VergleichsErgebnis':
+        """
+        Erstellt ein Ergebnis aus seiner Dict-Form (dataclasses.asdict, z.B. im Lauf-Cache).
+        """
+        daten = dict(daten)
+        for schluessel in ("duplikate_datei1", "duplikate_datei2"):
+            if daten.get(schluessel) is not None:
+                daten[schluessel] = DuplikatStatistik(**daten[schluessel])
+        return cls(**daten)
+
+
+    @property
+    def prozentualer_unterschied(self) -> float:
+        """
+        Relativer Unterschied der Zeilenanzahl bezogen auf die größere Datei (0-1).
+        """
+        groesste_anzahl = max(self.anzahl_datei1, self.anzahl_datei2)
+        return abs(self.anzahl_datei1 - self.anzahl_datei2) / groesste_anzahl if groesste_anzahl > 0 else 0.0
+
+
+    def metriken(self) -> Dict[str, Union[int, float]]:
+        """
+        Liefert die vorhandenen Metriken als Rohwerte in Anzeigereihenfolge (ohne fehlende Werte).
+
+        Returns:
+            Dict[str, Union[int, float]]: Metrikname -> Rohwert.
+        """
+        werte = {
+            METRIK_ANZAHL_DATEI1: self.anzahl_datei1,
+            METRIK_ANZAHL_DATEI2: self.anzahl_datei2,
+            METRIK_PROZENTUALER_UNTERSCHIED_ANZAHL: self.prozentualer_unterschied,
+            METRIK_GLEICHE_NAMEN: self.gleiche_werte,
+            METRIK_DURCHSCHNITTSALTER_DATEI1: self.durchschnittsalter_datei1,
+            METRIK_DURCHSCHNITTSALTER_DATEI2: self.durchschnittsalter_datei2,
+            METRIK_EINDEUTIGE_DATEI1: self.duplikate_datei1.eindeutige_werte if self.duplikate_datei1 else None,
+            METRIK_EINDEUTIGE_DATEI2: self.duplikate_datei2.eindeutige_werte if self.duplikate_datei2 else None,
+            METRIK_DOPPELTE_WERTE_DATEI1: self.duplikate_datei1.doppelte_werte if self.duplikate_datei1 else None,
+            METRIK_DOPPELTE_WERTE_DATEI2: self.duplikate_datei2.doppelte_werte if self.duplikate_datei2 else None,
+            METRIK_NUR_DATEI1: self.duplikate_datei1.eindeutige_werte - self.gleiche_werte if self.duplikate_datei1 and self.gleiche_werte is not None else None,
+            METRIK_NUR_DATEI2: self.duplikate_datei2.eindeutige_werte - self.gleiche_werte if self.duplikate_datei2 and self.gleiche_werte is not None else None,
+            METRIK_EINDEUTIGE_DATEI1_SCHAETZUNG: self.eindeutige_datei1_schaetzung,
+            METRIK_EINDEUTIGE_DATEI2_SCHAETZUNG: self.eindeutige_datei2_schaetzung,
+            METRIK_GLEICHE_NAMEN_SCHAETZUNG: self.gleiche_werte_schaetzung,
+            METRIK_JACCARD_SCHAETZUNG: self.jaccard_schaetzung,
+            METRIK_SCHAETZ_FEHLER: self.schaetz_fehler,
+        }
+        return {metrik: wert for metrik, wert in werte.items() if wert is not None}
+
+
+    def formatiert(self) -> Dict[str, str]:
+        """
+        Liefert die vorhandenen Metriken als Anzeigetexte (siehe formatiere_metrik).
+
+        Returns:
+            Dict[str, str]: Metrikname -> Anzeigetext.
+        """
+        return {metrik: formatiere_metrik(metrik, wert) for metrik, wert in self.metriken().items()}
+
+
+
+@dataclass(**DATACLASS_SLOTS)
+class MehrfachVergleichsErgebnis:
+    """
+    Ergebnis eines N-Wege-Vergleichs: Überlappungsmatrix aller Dateipaare (Diagonale: eindeutige Werte je Datei)
+    und die exklusiven Schnittmengen je Zugehörigkeitsmaske (Bit i gesetzt: Schlüssel kommt in Datei i vor), aus
+    denen sich UpSet-Diagramm und die Anzahl der Schlüssel in genau k Dateien ergeben.
+    """
+    dateinamen: List[str]
+    anzahl_zeilen: List[int]
+    ueberlappung: List[List[int]] # Gemeinsame eindeutige Schlüssel je Dateipaar
+    schnittmengen: Dict[int, int] # Zugehörigkeitsmaske -> Anzahl Schlüssel, die in genau diesen Dateien vorkommen
+    durchschnittsalter: List[Optional[float]] # None, wenn eine Datei keine Spalte 'Alter' hat
+    doppelte_werte: Optional[List[int]] = None # Mehrfach vorkommende Werte je Datei
+    laufzeiten: Dict[str, float] = field(default_factory=dict) # Sekunden je Pipeline-Stufe
+
+    @property
+    def eindeutige_werte(self) -> int:
+        """Anzahl eindeutiger Schlüssel über alle Dateien (Vereinigung)."""
+        return sum(self.schnittmengen.values())
+
+
+    def in_genau_k_dateien(self) -> List[int]:
+        """
+        Liefert je k (1 bis N) die Anzahl der Schlüssel, die in genau k Dateien vorkommen.
+
+        Returns:
+            List[int]: Element k-1 ist die Anzahl für k Dateien.
+        """
+        anzahlen = [0] * len(self.dateinamen)
+        for maske, anzahl in self.schnittmengen.items():
+            anzahlen[bin(maske).count('1') - 1] += anzahl
+        return anzahlen
+
+
+    def mitglieder(self, maske: int) -> List[int]:
+        """Liefert die Dateinummern (0-basiert) einer Zugehörigkeitsmaske."""
+        return [nummer for nummer in range(len(self.dateinamen)) if maske >> nummer & 1]
+
+
+    def paar_ergebnis(self, nummer1: int, nummer2: int) -> VergleichsErgebnis:
+        """
+        Leitet das Vergleichsergebnis eines Dateipaars ab (dieselben Metriken wie vergleiche_daten).
+
+        Args:
+            nummer1 (int): Nummer der ersten Datei (0-basiert).
+            nummer2 (int): Nummer der zweiten Datei (0-basiert).
+
+        Returns:
+            VergleichsErgebnis: Das Vergleichsergebnis des Paars.
+        """
+        vergleichs_ergebnisse = VergleichsErgebnis(self.anzahl_zeilen[nummer1], self.anzahl_zeilen[nummer2], self.ueberlappung[nummer1][nummer2])
+        if self.durchschnittsalter[nummer1] is not None and self.durchschnittsalter[nummer2] is not None:
+            vergleichs_ergebnisse.durchschnittsalter_datei1 = self.durchschnittsalter[nummer1]
+            vergleichs_ergebnisse.durchschnittsalter_datei2 = self.durchschnittsalter[nummer2]
+        if self.doppelte_werte is not None: # Diagonale der Überlappungsmatrix: eindeutige Werte je Datei
+            vergleichs_ergebnisse.duplikate_datei1, vergleichs_ergebnisse.duplikate_datei2 = (
+                DuplikatStatistik(self.ueberlappung[nummer][nummer], self.doppelte_werte[nummer], self.anzahl_zeilen[nummer] - self.ueberlappung[nummer][nummer])
+                for nummer in (nummer1, nummer2))
+        return vergleichs_ergebnisse
+
+
+    def als_dict(self) -> Dict:
+        """
+        Liefert das Ergebnis JSON-serialisierbar (Schnittmengen als Listen der Dateinummern, absteigend nach Größe;
+        ein Durchschnittsalter ohne Alterswerte (NaN) als None, da NaN kein gültiges JSON ist).
+        """
+        durchschnittsalter = [None if alter is not None and np.isnan(alter) else alter for alter in self.durchschnittsalter]
+        return {"dateinamen": self.dateinamen, "anzahl_zeilen": self.anzahl_zeilen, "durchschnittsalter": durchschnittsalter,
+                "doppelte_werte": self.doppelte_werte, "eindeutige_werte": self.eindeutige_werte, "ueberlappung": self.ueberlappung,
+                "in_genau_k_dateien": self.in_genau_k_dateien(),
+                "schnittmengen": [{"dateien": self.mitglieder(maske), "anzahl": anzahl}
+                                  for maske, anzahl in sorted(self.schnittmengen.items(), key=lambda eintrag: -eintrag[1])],
+                "laufzeiten": self.laufzeiten}
+
+
+
+# --- DateiVergleicher Klasse (CipherCore Standard: Effiziente Datenverarbeitung) ---
+class DateiVergleicher:
+    """
+    Modul zum Vergleichen von zwei DataFrames und zur Berechnung relevanter Vergleichsmetriken.
+    Fokus auf Effizienz und Genauigkeit der Vergleichsberechnungen.
+    """
+
+    def vergleiche_daten(self, daten_frame1: pd.DataFrame, daten_frame2: pd.DataFrame, spalte_datei1: str = 'Name', spalte_datei2: str = 'Name',
+                         abbruch_token: Optional[VergleichsAbbruchToken] = None, duplikat_pfad: Optional[str] = None) -> VergleichsErgebnis:
+        """
+        Vergleicht die DataFrames basierend auf angegebenen Spalten und ermittelt verschiedene Statistiken.
+        Die Vergleichsspalten werden wie bei den übrigen Verfahren als kanonische Schlüssel verglichen (siehe
+        _vergleichbare_schluessel). Jede Vergleichsspalte wird einmal faktorisiert (Schlüsselcode je Zeile und eindeutige Werte); die
+        Schnittmenge wird über die eindeutigen Werte gebildet, die Duplikatstatistik aus denselben Codes.
+
+        Args:
+            daten_frame1 (pd.DataFrame): Der erste DataFrame (Benutzereingabe).
+            daten_frame2 (pd.DataFrame): Der zweite DataFrame (Hauptliste).
+            spalte_datei1 (str, optional): Die Spalte aus Datei 1, die verglichen werden soll. Standard ist 'Name'.
+            spalte_datei2 (str, optional): Die Spalte aus Datei 2, die verglichen werden soll. Standard ist 'Name'.
+            abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch des Vergleichs (optional).
+            duplikat_pfad (Optional[str]): CSV-Datei für die Gruppen mehrfach vorkommender Werte beider Dateien (optional).
+
+        Returns:
+            VergleichsErgebnis: Die Vergleichsergebnisse als Rohwerte.
+
+        Raises:
+            CipherCoreAbbruchFehler: Wenn der Vergleich über das Abbruch-Token abgebrochen wurde.
+            CipherCoreDateiSpeicherFehler: Wenn die Duplikatdatei nicht geschrieben werden kann.
+        """
+        logger.info("Starte Datenvergleich...")
+        vergleichs_ergebnisse = VergleichsErgebnis(len(daten_frame1), len(daten_frame2))
+
+        try: # Fehlerbehandlung für ungültige Spaltennamen
+            # Vergleich der angegebenen Spalten
+            serie1, serie2 = daten_frame1[spalte_datei1], daten_frame2[spalte_datei2]
+            schluessel1, schluessel2 = self._vergleichbare_schluessel(serie1, serie2)
+            codes1, eindeutige1 = self._faktorisiere(schluessel1, abbruch_token)
+            vergleichs_ergebnisse.duplikate_datei1 = self._duplikat_statistik(codes1, eindeutige1)
+            codes2, eindeutige2 = None, None
+            if daten_frame1 is daten_frame2 and spalte_datei1 == spalte_datei2: # Byte-identische Dateien, nur einmal geladen
+                vergleichs_ergebnisse.abkuerzung = ABKUERZUNG_BYTE_IDENTISCH
+                codes2, eindeutige2 = codes1, eindeutige1
+                vergleichs_ergebnisse.duplikate_datei2 = vergleichs_ergebnisse.duplikate_datei1
+                anzahl_gleiche_werte = len(eindeutige1)
+            elif self._ist_permutation(serie1, serie2, abbruch_token): # Gleiche Häufigkeiten, nur die Zeilennummern können abweichen
+                vergleichs_ergebnisse.abkuerzung = ABKUERZUNG_SCHLUESSEL_DIGEST
+                vergleichs_ergebnisse.duplikate_datei2 = self._mit_zeilen_aus(vergleichs_ergebnisse.duplikate_datei1, serie2)
+                anzahl_gleiche_werte = len(eindeutige1)
+            else:
+                codes2, eindeutige2 = self._faktorisiere(schluessel2, abbruch_token)
+                vergleichs_ergebnisse.duplikate_datei2 = self._duplikat_statistik(codes2, eindeutige2)
+                anzahl_gleiche_werte = self._anzahl_gemeinsame_werte(eindeutige1, eindeutige2)
+            vergleichs_ergebnisse.gleiche_werte = int(anzahl_gleiche_werte)
+            if duplikat_pfad:
+                if codes2 is None:
+                    codes2, eindeutige2 = self._faktorisiere(schluessel2, abbruch_token)
+                self.schreibe_duplikat_gruppen(duplikat_pfad, [(codes1, eindeutige1), (codes2, eindeutige2)], abbruch_token)
+        except KeyError as e:
+            logger.error(f"Spaltenname Fehler beim Datenvergleich: {e}")
+            raise CipherCoreDatenValidierungsFehler(f"Ungültiger Spaltenname für den Vergleich: {e}") from e
+
+
+        if 'Alter' in daten_frame1.columns and 'Alter' in daten_frame2.columns:
+            durchschnitte = []
+            for daten_frame in ((daten_frame1,) if daten_frame1 is daten_frame2 else (daten_frame1, daten_frame2)):
+                statistik_engine = StatistikEngine(['mittelwert'], ['Alter']) # Welford-Mittelwert statt naiver Summe
+                statistik_engine.aktualisiere(daten_frame)
+                durchschnitt = statistik_engine.ergebnis()['Alter']['mittelwert']
+                durchschnitte.append(durchschnitt if durchschnitt is not None else float('nan'))
+            if daten_frame1 is daten_frame2:
+                durchschnitte *= 2 # Identische Daten: Mittelwert nur einmal berechnet
+            vergleichs_ergebnisse.durchschnittsalter_datei1, vergleichs_ergebnisse.durchschnittsalter_datei2 = durchschnitte
+
+        if vergleichs_ergebnisse.abkuerzung:
+            logger.info(f"Datenvergleich mit Abkürzung '{vergleichs_ergebnisse.abkuerzung}' (keine Schnittmenge gebildet).")
+        logger.debug(f"Vergleichsergebnisse: {vergleichs_ergebnisse}")
+        logger.info("Datenvergleich abgeschlossen.")
+        return vergleichs_ergebnisse
+
+
+    @staticmethod
+    def _ergebnis_aus_zustaenden(zustand1: Dict, zustand2: Dict, anzahl_gleiche_werte: Optional[int], verfahren: str) -> VergleichsErgebnis:
+        """
+        Bildet das Vergleichsergebnis aus den aggregierten Zuständen zweier Dateien
+        (Zeilenanzahl, Alterssumme und -anzahl), mit denselben Metriken wie vergleiche_daten. Enthält ein Zustand
+        'eindeutige_werte' und 'doppelte_werte', wird daraus die Duplikatstatistik der Datei gebildet (ohne häufigste Werte).
+
+        Args:
+            zustand1 (Dict): Zustand von Datei 1.
+            zustand2 (Dict): Zustand von Datei 2.
+            anzahl_gleiche_werte (Optional[int]): Anzahl gemeinsamer Schlüsselwerte (None: nicht exakt bekannt).
+            verfahren (str): Das Vergleichsverfahren (VERFAHREN_* Konstante).
+
+        Returns:
+            VergleichsErgebnis: Das Vergleichsergebnis.
+        """
+        vergleichs_ergebnisse = VergleichsErgebnis(int(zustand1["zeilen"]), int(zustand2["zeilen"]), anzahl_gleiche_werte, verfahren=verfahren)
+        if zustand1["hat_alter"] and zustand2["hat_alter"]:
+            durchschnitte = [zustand["alter_summe"] / zustand["alter_anzahl"] if zustand["alter_anzahl"] else float('nan')
+                             for zustand in (zustand1, zustand2)]
+            vergleichs_ergebnisse.durchschnittsalter_datei1, vergleichs_ergebnisse.durchschnittsalter_datei2 = durchschnitte
+        for nummer, zustand in (("1", zustand1), ("2", zustand2)):
+            if zustand.get("doppelte_werte") is not None:
+                setattr(vergleichs_ergebnisse, "duplikate_datei" + nummer, DuplikatStatistik(
+                    int(zustand["eindeutige_werte"]), int(zustand["doppelte_werte"]), int(zustand["zeilen"] - zustand["eindeutige_werte"])))
+        return vergleichs_ergebnisse
+
+
+    def vergleiche_dateien_inkrementell(self, datei_pfad1: str, datei_pfad2: str, daten_lader: 'DatenLader', zustands_verzeichnis: str,
+                                        spalte_datei1: str = 'Name', spalte_datei2: str = 'Name',
+                                        abbruch_token: Optional[VergleichsAbbruchToken] = None,
+                                        blatt_datei1: Optional[str] = None, blatt_datei2: Optional[str] = None) -> Tuple[VergleichsErgebnis, str, str]:
+        """
+        Vergleicht zwei Dateien anhand eines gespeicherten Vergleichszustands je Datei.
+        Wurden an eine CSV/TXT-Datei seit dem letzten Lauf nur Zeilen angehängt, werden nur die neuen Zeilen gelesen
+        und validiert; unveränderte Dateien werden gar nicht geparst. Bei jeder anderen Änderung wird die Datei
+        vollständig geladen und der Zustand neu aufgebaut. Übereinstimmungen werden über 64-Bit-Hashes der
+        (als Text normalisierten) Schlüsselwerte gezählt.
+
+        Args:
+            datei_pfad1 (str): Pfad zu Datei 1 (Benutzereingabe).
+            datei_pfad2 (str): Pfad zu Datei 2 (Hauptliste).
+            daten_lader (DatenLader): Lader für Pfadprüfung, Formaterkennung, Validierung und vollständiges Laden.
+            zustands_verzeichnis (str): Verzeichnis der Zustandsdateien (siehe AbstractDataManager.zustands_verzeichnis).
+            spalte_datei1 (str, optional): Vergleichsspalte in Datei 1. Standard ist 'Name'.
+            spalte_datei2 (str, optional): Vergleichsspalte in Datei 2. Standard ist 'Name'.
+            abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch (optional).
+            blatt_datei1 (Optional[str]): Arbeitsblatt von Datei 1, falls Excel (optional).
+            blatt_datei2 (Optional[str]): Arbeitsblatt von Datei 2, falls Excel (optional).
+
+        Returns:
+            Tuple[VergleichsErgebnis, str, str]: Vergleichsergebnisse und die Dateinamen beider Dateien.
+
+        Raises:
+            CipherCoreDateiFehler: Wenn ein Dateipfad unsicher ist oder eine Datei nicht gelesen werden kann.
+            CipherCoreDatenValidierungsFehler: Wenn die (neuen) Daten ungültig sind oder die Vergleichsspalte fehlt.
+            CipherCoreAbbruchFehler: Wenn der Vergleich abgebrochen wurde.
+        """
+        logger.info("Starte inkrementellen Datenvergleich...")
+        speicher = VergleichsZustandsSpeicher(zustands_verzeichnis)
+        zustand1, hashes1 = self._aktualisiere_zustand(datei_pfad1, spalte_datei1, daten_lader, speicher, abbruch_token, blatt_datei1)
+        zustand2, hashes2 = self._aktualisiere_zustand(datei_pfad2, spalte_datei2, daten_lader, speicher, abbruch_token, blatt_datei2)
+        if abbruch_token:
+            abbruch_token.pruefe()
+        anzahl_gleiche_werte = len(np.intersect1d(hashes1, hashes2, assume_unique=True))
+        vergleichs_ergebnisse = self._ergebnis_aus_zustaenden(zustand1, zustand2, anzahl_gleiche_werte, VERFAHREN_INKREMENTELL)
+        logger.debug(f"Vergleichsergebnisse (inkrementell): {vergleichs_ergebnisse}")
+        logger.info("Inkrementeller Datenvergleich abgeschlossen.")
+        return vergleichs_ergebnisse, os.path.basename(datei_pfad1), os.path.basename(datei_pfad2)
+
+
+    def vergleiche_dateien_approximativ(self, datei_pfad1: str, datei_pfad2: str, daten_lader: 'DatenLader', skizzen_verzeichnis: str,
+                                        spalte_datei1: str = 'Name', spalte_datei2: str = 'Name',
+                                        abbruch_token: Optional[VergleichsAbbruchToken] = None,
+                                        blatt_datei1: Optional[str] = None, blatt_datei2: Optional[str] = None,
+                                        schaetz_fehler: float = SCHAETZ_FEHLER_STANDARD) -> Tuple[VergleichsErgebnis, str, str]:
+        """
+        Approximativer Vergleich über HyperLogLog- und MinHash-Skizzen. Die Dateien werden blockweise gelesen, ohne
+        Wertemengen aufzubauen; die Skizzen werden je Datei gespeichert, sodass zwei bereits gesehene, unveränderte
+        Dateien ohne erneutes Lesen verglichen werden. Zeilenanzahl und Durchschnittsalter sind exakt, eindeutige
+        Werte und Übereinstimmungen werden unter eigenen, als Schätzung gekennzeichneten Metriken ausgegeben.
+
+        Args:
+            datei_pfad1 (str): Pfad zu Datei 1 (Benutzereingabe).
+            datei_pfad2 (str): Pfad zu Datei 2 (Hauptliste).
+            daten_lader (DatenLader): Lader für Pfadprüfung, blockweises Lesen und Validierung.
+            skizzen_verzeichnis (str): Verzeichnis der gespeicherten Skizzen.
+            spalte_datei1 (str, optional): Vergleichsspalte in Datei 1. Standard ist 'Name'.
+            spalte_datei2 (str, optional): Vergleichsspalte in Datei 2. Standard ist 'Name'.
+            abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch (optional).
+            blatt_datei1 (Optional[str]): Arbeitsblatt von Datei 1, falls Excel (optional).
+            blatt_datei2 (Optional[str]): Arbeitsblatt von Datei 2, falls Excel (optional).
+            schaetz_fehler (float): Relativer Standardfehler der Skizzen (optional).
+
+        Returns:
+            Tuple[VergleichsErgebnis, str, str]: Vergleichsergebnisse und die Dateinamen beider Dateien.
+
+        Raises:
+            CipherCoreDateiFehler: Wenn eine Datei nicht sicher ist oder nicht gelesen werden kann.
+            CipherCoreDatenValidierungsFehler: Wenn die Daten ungültig sind oder die Vergleichsspalte fehlt.
+            CipherCoreAbbruchFehler: Wenn der Vergleich abgebrochen wurde.
+        """
+        logger.info(f"Starte approximativen Datenvergleich (Standardfehler {schaetz_fehler:.2%})...")
+        skizze1 = self._lade_oder_erstelle_skizze(datei_pfad1, spalte_datei1, daten_lader, skizzen_verzeichnis, abbruch_token, blatt_datei1, schaetz_fehler)
+        skizze2 = self._lade_oder_erstelle_skizze(datei_pfad2, spalte_datei2, daten_lader, skizzen_verzeichnis, abbruch_token, blatt_datei2, schaetz_fehler)
+        jaccard, gemeinsame_werte = skizze1.vergleiche(skizze2)
+        effektiver_fehler = max(schaetz_fehler, skizze1.hll_fehler)
+        if effektiver_fehler > schaetz_fehler:
+            logger.warning(f"Angeforderter Schätzfehler {schaetz_fehler:.2%} ist mit höchstens 2^{HLL_MAX_PRAEZISION} HyperLogLog-Registern nicht erreichbar; "
+                           f"die Kardinalität wird mit {effektiver_fehler:.2%} Standardfehler geschätzt.")
+        vergleichs_ergebnisse = self._ergebnis_aus_zustaenden(vars(skizze1), vars(skizze2), None, VERFAHREN_APPROXIMATIV) # Nur die gekennzeichnete Schätzung
+        vergleichs_ergebnisse.eindeutige_datei1_schaetzung = skizze1.kardinalitaet()
+        vergleichs_ergebnisse.eindeutige_datei2_schaetzung = skizze2.kardinalitaet()
+        vergleichs_ergebnisse.gleiche_werte_schaetzung = gemeinsame_werte
+        vergleichs_ergebnisse.jaccard_schaetzung = jaccard
+        vergleichs_ergebnisse.schaetz_fehler = effektiver_fehler
+        logger.debug(f"Vergleichsergebnisse (approximativ): {vergleichs_ergebnisse}")
+        logger.info("Approximativer Datenvergleich abgeschlossen.")
+        return vergleichs_ergebnisse, os.path.basename(datei_pfad1), os.path.basename(datei_pfad2)
+
+
+    def vergleiche_mehrfach(self, datei_pfade: List[str], daten_lader: 'DatenLader', spalten: Optional[List[str]] = None,
+                            abbruch_token: Optional[VergleichsAbbruchToken] = None,
+                            blaetter: Optional[List[Optional[str]]] = None) -> MehrfachVergleichsErgebnis:
+        """
+        N-Wege-Vergleich in einem Durchlauf: Jede Datei wird einmal blockweise gelesen, die Vereinigung aller
+        Schlüssel-Hashes einmal faktorisiert und je Schlüssel eine N-Bit-Zugehörigkeitsmaske gesetzt. Die
+        Überlappungen aller Dateipaare folgen aus den Anzahlen je Maske (höchstens min(2^N, Schlüssel) Masken),
+        statt N*(N-1)/2 paarweise Vergleiche auszuführen.
+
+        Args:
+            datei_pfade (List[str]): Pfade der Dateien (2 bis MEHRFACH_MAX_DATEIEN).
+            daten_lader (DatenLader): Lader für Pfadprüfung, blockweises Lesen und Validierung.
+            spalten (Optional[List[str]]): Vergleichsspalte je Datei (optional, Standard: 'Name').
+            abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch (optional).
+            blaetter (Optional[List[Optional[str]]]): Arbeitsblatt je Datei, falls Excel (optional).
+
+        Returns:
+            MehrfachVergleichsErgebnis: Überlappungsmatrix und Schnittmengen.
+
+        Raises:
+            ValueError: Wenn die Anzahl der Dateien ungültig ist.
+            CipherCoreDateiFehler: Wenn eine Datei nicht sicher ist oder nicht gelesen werden kann.
+            CipherCoreDatenValidierungsFehler: Wenn die Daten ungültig sind oder eine Vergleichsspalte fehlt.
+            CipherCoreAbbruchFehler: Wenn der Vergleich abgebrochen wurde.
+        """
+        anzahl_dateien = len(datei_pfade)
+        if not 2 <= anzahl_dateien <= MEHRFACH_MAX_DATEIEN:
+            raise ValueError(f"Der N-Wege-Vergleich benötigt 2 bis {MEHRFACH_MAX_DATEIEN} Dateien: {anzahl_dateien}")
+        spalten = spalten or ['Name'] * anzahl_dateien
+        blaetter = blaetter or [None] * anzahl_dateien
+        logger.info(f"Starte N-Wege-Vergleich von {anzahl_dateien} Dateien...")
+        hashes_je_datei, zustaende = [], []
+        for datei_pfad, spalte, blatt in zip(datei_pfade, spalten, blaetter):
+            hashes, zustand = self.lese_schluessel_hashes(datei_pfad, spalte, daten_lader, abbruch_token, blatt)
+            hashes_je_datei.append(hashes)
+            zustaende.append(zustand)
+
+        vereinigung = _sortiert_eindeutig(np.concatenate(hashes_je_datei))
+        masken = np.zeros(len(vereinigung), dtype=np.uint64)
+        for nummer, hashes in enumerate(hashes_je_datei):
+            if abbruch_token:
+                abbruch_token.pruefe()
+            masken[np.searchsorted(vereinigung, hashes)] |= np.uint64(1) << np.uint64(nummer) # Hashes je Datei eindeutig: keine Kollision beim Setzen
+        eindeutige_masken, anzahlen = np.unique(masken, return_counts=True)
+        bits = ((eindeutige_masken[:, None] >> np.arange(anzahl_dateien, dtype=np.uint64)) & np.uint64(1)).astype(np.int64)
+        ueberlappung = bits.T @ (bits * anzahlen[:, None]) # Paar (i, j): Summe der Masken mit Bit i und Bit j
+
+        ergebnis = MehrfachVergleichsErgebnis(
+            dateinamen=[os.path.basename(datei_pfad) for datei_pfad in datei_pfade],
+            anzahl_zeilen=[int(zustand["zeilen"]) for zustand in zustaende],
+            ueberlappung=ueberlappung.tolist(),
+            schnittmengen=dict(zip(eindeutige_masken.tolist(), anzahlen.tolist())),
+            durchschnittsalter=[(zustand["alter_summe"] / zustand["alter_anzahl"] if zustand["alter_anzahl"] else float('nan'))
+                                if zustand["hat_alter"] else None for zustand in zustaende],
+            doppelte_werte=[int(zustand["doppelte_werte"]) for zustand in zustaende])
+        logger.info(f"N-Wege-Vergleich abgeschlossen: {ergebnis.eindeutige_werte} eindeutige Schlüssel in {len(ergebnis.schnittmengen)} Schnittmengen.")
+        return ergebnis
+
+
+    def _lade_oder_erstelle_skizze(self, datei_pfad: str, spalte: str, daten_lader: 'DatenLader', skizzen_verzeichnis: str,
+                                   abbruch_token: Optional[VergleichsAbbruchToken], blatt_name: Optional[str],
+                                   schaetz_fehler: float) -> DatenSkizze:
+        """
+        Liefert die gespeicherte Skizze einer unveränderten Datei oder erstellt sie blockweise neu.
+        """
+        if not daten_lader._ist_pfad_sicher(datei_pfad):
+            logger.error(f"Unsicherer Dateipfad: '{datei_pfad}'. Pfad liegt außerhalb des Basisverzeichnisses.")
+            raise CipherCoreDateiFehler(f"Ungültiger Dateipfad. Sicherheitshinweis: Pfad muss innerhalb des Basisverzeichnisses liegen.")
+        try:
+            datei_status = os.stat(datei_pfad)
+        except FileNotFoundError as e:
+            raise CipherCoreDateiLadeFehler(f"Datei nicht gefunden: {datei_pfad}") from e
+        kennung = {"datei_pfad": os.path.abspath(datei_pfad), "spalte": str(spalte), "blatt": blatt_name,
+                   "groesse": datei_status.st_size, "mtime_ns": datei_status.st_mtime_ns, "schaetz_fehler": schaetz_fehler}
+        schluessel = json.dumps([kennung["datei_pfad"], kennung["spalte"], blatt_name, schaetz_fehler])
+        skizzen_pfad = os.path.join(skizzen_verzeichnis, hashlib.sha256(schluessel.encode('utf-8')).hexdigest()[:24] + SKIZZEN_DATEI_ENDUNG)
+        skizze = DatenSkizze.lade(skizzen_pfad, kennung)
+        if skizze is not None:
+            logger.info(f"Verwende gespeicherte Skizze für '{os.path.basename(datei_pfad)}'.")
+            return skizze
+
+        skizze = DatenSkizze(schaetz_fehler)
+        for block in daten_lader.lade_bloecke(datei_pfad, abbruch_token, [spalte, *VERGLEICH_ZUSATZ_SPALTEN], blatt_name):
+            if spalte not in block.columns:
+                raise CipherCoreDatenValidierungsFehler(f"Ungültiger Spaltenname für den Vergleich: '{spalte}'")
+            skizze.aktualisiere(pd.util.hash_pandas_object(kanonische_schluessel(block[spalte]), index=False).to_numpy())
+            hat_alter, alter_summe, alter_anzahl = self._alter_aggregat(block)
+            skizze.zeilen += len(block)
+            skizze.hat_alter = hat_alter
+            skizze.alter_summe += alter_summe
+            skizze.alter_anzahl += alter_anzahl
+        skizze.speichere(skizzen_pfad, kennung)
+        return skizze
+
+
+    @staticmethod
+    def _schluessel_hashes(serie: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Berechnet die sortierten, eindeutigen 64-Bit-Hashes einer Schlüsselspalte (Werte als Text normalisiert,
+        damit z.B. Arrow- und pandas-Spalten sowie Teilblöcke mit anderer Typinferenz gleiche Hashes liefern)
+        und die Hashes der mehrfach vorkommenden Werte.
+        """
+        return _sortiert_eindeutig_mit_doppelten(pd.util.hash_pandas_object(kanonische_schluessel(serie), index=False).to_numpy())
+
+
+    @classmethod
+    def lese_schluessel_hashes(cls, datei_pfad: str, spalte: str, daten_lader: 'DatenLader',
+                               abbruch_token: Optional[VergleichsAbbruchToken] = None,
+                               blatt_name: Optional[str] = None, hash_schluessel: Optional[str] = None) -> Tuple[np.ndarray, Dict]:
+        """
+        Liest eine Datei blockweise und liefert die sortierten, eindeutigen Schlüssel-Hashes sowie den aggregierten
+        Zustand (Zeilenanzahl, Alterssumme und -anzahl, eindeutige und mehrfach vorkommende Werte, wie bei
+        _ergebnis_aus_zustaenden).
+
+        Args:
+            datei_pfad (str): Der Pfad zur Datei.
+            spalte (str): Die Vergleichsspalte.
+            daten_lader (DatenLader): Lader für Pfadprüfung, blockweises Lesen und Validierung.
+            abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch (optional).
+            blatt_name (Optional[str]): Arbeitsblatt, falls Excel (optional).
+            hash_schluessel (Optional[str]): 16-Byte-Schlüssel der SipHash-Funktion (optional, Standard: öffentlicher
+                                             pandas-Schlüssel, nur für lokal gespeicherte Hashes geeignet).
+
+        Returns:
+            Tuple[np.ndarray, Dict]: Die Schlüssel-Hashes (uint64) und der Zustand der Datei.
+
+        Raises:
+            CipherCoreDateiFehler: Wenn die Datei nicht sicher ist oder nicht gelesen werden kann.
+            CipherCoreDatenValidierungsFehler: Wenn die Daten ungültig sind oder die Vergleichsspalte fehlt.
+            CipherCoreAbbruchFehler: Wenn das Lesen abgebrochen wurde.
+        """
+        return cls._lese_bloecke_als_hashes(datei_pfad, spalte, daten_lader, abbruch_token, blatt_name, hash_schluessel)
+
+
+    @classmethod
+    def _lese_bloecke_als_hashes(cls, datei_pfad: str, spalte: str, daten_lader: 'DatenLader',
+                                 abbruch_token: Optional[VergleichsAbbruchToken], blatt_name: Optional[str],
+                                 hash_schluessel: Optional[str] = None) -> Tuple[np.ndarray, Dict]:
+        """
+        Ein Durchlauf von lese_schluessel_hashes.
+        """
+        zustand = {"zeilen": 0, "hat_alter": False, "alter_summe": 0.0, "alter_anzahl": 0}
+        block_hashes: List[np.ndarray] = []
+        block_doppelte: List[np.ndarray] = [] # Innerhalb eines Blocks mehrfach vorkommende Hashes
+        for block in daten_lader.lade_bloecke(datei_pfad, abbruch_token, [spalte, *VERGLEICH_ZUSATZ_SPALTEN], blatt_name):
+            if spalte not in block.columns:
+                raise CipherCoreDatenValidierungsFehler(f"Ungültiger Spaltenname für den Vergleich: '{spalte}'")
+            eindeutige, doppelte = _sortiert_eindeutig_mit_doppelten(pd.util.hash_pandas_object(kanonische_schluessel(block[spalte]), index=False,
+                                                                                                hash_key=hash_schluessel).to_numpy())
+            block_hashes.append(eindeutige)
+            block_doppelte.append(doppelte)
+            hat_alter, alter_summe, alter_anzahl = cls._alter_aggregat(block)
+            zustand["zeilen"] += len(block)
+            zustand["hat_alter"] = hat_alter
+            zustand["alter_summe"] += alter_summe
+            zustand["alter_anzahl"] += alter_anzahl
+        hashes, doppelte = _sortiert_eindeutig_mit_doppelten(np.concatenate(block_hashes) if block_hashes else np.empty(0, dtype=np.uint64))
+        zustand["eindeutige_werte"] = len(hashes)
+        zustand["doppelte_werte"] = len(_sortiert_eindeutig(np.concatenate([doppelte, *block_doppelte]))) # Auch über Blockgrenzen mehrfach
+        return hashes, zustand
+
+
+    @staticmethod
+    def _alter_aggregat(daten_frame: pd.DataFrame) -> Tuple[bool, float, int]:
+        """
+        Liefert (Spalte vorhanden, Summe, Anzahl nicht-leerer Werte) der Spalte 'Alter'.
+        """
+        if 'Alter' not in daten_frame.columns:
+            return False, 0.0, 0
+        alter = pd.to_numeric(daten_frame['Alter'], errors='coerce')
+        return True, float(alter.sum()), int(alter.count())
+
+
+    def _aktualisiere_zustand(self, datei_pfad: str, spalte: str, daten_lader: 'DatenLader', speicher: 'VergleichsZustandsSpeicher',
+                              abbruch_token: Optional[VergleichsAbbruchToken], blatt_name: Optional[str]) -> Tuple[Dict, np.ndarray]:
+        """
+        Aktualisiert den Vergleichszustand einer Datei: unverändert, nur angehängte Zeilen (Delta) oder vollständig neu.
+
+        Returns:
+            Tuple[Dict, np.ndarray]: Der aktuelle Zustand und die sortierten Schlüssel-Hashes.
+        """
+        dateiname = os.path.basename(datei_pfad)
+        if not daten_lader._ist_pfad_sicher(datei_pfad):
+            logger.error(f"Unsicherer Dateipfad: '{datei_pfad}'. Pfad liegt außerhalb des Basisverzeichnisses.")
+            raise CipherCoreDateiFehler(f"Ungültiger Dateipfad. Sicherheitshinweis: Pfad muss innerhalb des Basisverzeichnisses liegen.")
+        if not os.path.exists(datei_pfad):
+            raise CipherCoreDateiLadeFehler(f"Datei nicht gefunden: {datei_pfad}")
+
+        alter_zustand, alte_hashes, alte_doppelte = speicher.lade(datei_pfad, spalte, blatt_name)
+        grund = daten_lader.inkrementell_lesbar(datei_pfad, alter_zustand)
+        if grund is None:
+            try:
+                with open(datei_pfad, 'rb') as datei:
+                    praefix_gleich, gesamt_digest = _praefix_pruefsumme(datei, alter_zustand["versatz"], alter_zustand["praefix_digest"])
+            except OSError as e:
+                raise CipherCoreDateiLadeFehler(f"Fehler beim Lesen der Datei '{dateiname}': {e}") from e
+            if praefix_gleich:
+                if os.path.getsize(datei_pfad) == alter_zustand["versatz"]:
+                    logger.info(f"Datei '{dateiname}' unverändert seit dem letzten Lauf. Verwende gespeicherten Zustand.")
+                    return alter_zustand, alte_hashes
+                delta = daten_lader.lade_angehaengte_zeilen(datei_pfad, alter_zustand, abbruch_token)
+                _, alter_summe, alter_anzahl = self._alter_aggregat(delta)
+                try:
+                    delta_hashes, delta_doppelte = self._schluessel_hashes(delta[spalte])
+                except KeyError as e:
+                    raise CipherCoreDatenValidierungsFehler(f"Ungültiger Spaltenname für den Vergleich: {e}") from e
+                hashes = np.union1d(alte_hashes, delta_hashes)
+                doppelte = _sortiert_eindeutig(np.concatenate([alte_doppelte, delta_doppelte, # Auch Werte, die schon vor dem Anhang vorkamen
+                                                               np.intersect1d(alte_hashes, delta_hashes, assume_unique=True)]))
+                zustand = {**alter_zustand, "zeilen": alter_zustand["zeilen"] + len(delta),
+                           "alter_summe": alter_zustand["alter_summe"] + alter_summe,
+                           "alter_anzahl": alter_zustand["alter_anzahl"] + alter_anzahl,
+                           "versatz": os.path.getsize(datei_pfad), "praefix_digest": gesamt_digest,
+                           "eindeutige_werte": len(hashes), "doppelte_werte": len(doppelte)}
+                speicher.speichere(datei_pfad, spalte, blatt_name, zustand, hashes, doppelte)
+                logger.info(f"Datei '{dateiname}': {len(delta)} angehängte Zeilen inkrementell verarbeitet.")
+                return zustand, hashes
+            grund = "Dateianfang hat sich geändert"
+        logger.info(f"Datei '{dateiname}' wird vollständig verglichen ({grund}).")
+
+        daten_frame, _ = daten_lader.lade_daten(datei_pfad, abbruch_token, [spalte, *VERGLEICH_ZUSATZ_SPALTEN], blatt_name)
+        try:
+            hashes, doppelte = self._schluessel_hashes(daten_frame[spalte])
+        except KeyError as e:
+            logger.error(f"Spaltenname Fehler beim Datenvergleich: {e}")
+            raise CipherCoreDatenValidierungsFehler(f"Ungültiger Spaltenname für den Vergleich: {e}") from e
+        hat_alter, alter_summe, alter_anzahl = self._alter_aggregat(daten_frame)
+        zustand = {"version": ZUSTANDS_VERSION, "zeilen": len(daten_frame), "hat_alter": hat_alter,
+                   "alter_summe": alter_summe, "alter_anzahl": alter_anzahl, "versatz": None, "praefix_digest": None,
+                   "eindeutige_werte": len(hashes), "doppelte_werte": len(doppelte)}
+        zustand.update(daten_lader.inkrementelle_lesemarke(datei_pfad, [str(spalte_name) for spalte_name in daten_frame.columns]))
+        speicher.speichere(datei_pfad, spalte, blatt_name, zustand, hashes, doppelte)
+        return zustand, hashes
+
+
+    @staticmethod
+    def _vergleichbare_schluessel(serie1: pd.Series, serie2: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """
+        Bringt zwei Vergleichsspalten in eine vergleichbare Form: kanonischer Text (siehe kanonische_schluessel), damit
+        der Standardvergleich dieselben Werte wie die übrigen Verfahren als gleich ansieht (z.B. 1 und '1', wenn eine
+        Datei die Spalte als Zahl und die andere als Text einliest). Sind beide Spalten Text- bzw. numerische Spalten
+        (ohne Wahrheitswerte) oder vom selben Typ, ändert die Umwandlung keine Gleichheit; sie werden dann unverändert
+        verglichen, damit die schnellen Pfade (Arrow-Hash-Kernel, Digest) erhalten bleiben.
+
+        Returns:
+            Tuple[pd.Series, pd.Series]: Die zu vergleichenden Spalten.
+        """
+        def _ist_text(dtype: Any) -> bool:
+            return isinstance(dtype, pd.StringDtype) or (pa is not None and isinstance(dtype, pd.ArrowDtype) and
+                                                         (pa.types.is_string(dtype.pyarrow_dtype) or pa.types.is_large_string(dtype.pyarrow_dtype)))
+        def _ist_zahl(dtype: Any) -> bool:
+            return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype) and dtype != object
+
+        if ((_ist_text(serie1.dtype) and _ist_text(serie2.dtype)) or (_ist_zahl(serie1.dtype) and _ist_zahl(serie2.dtype)) or
+                (serie1.dtype == serie2.dtype and serie1.dtype != object)):
+            return serie1, serie2
+        return kanonische_schluessel(serie1), kanonische_schluessel(serie2) # Gemischte Typen (auch innerhalb einer Objektspalte)
+
+
+    def _faktorisiere(self, serie: pd.Series, abbruch_token: Optional[VergleichsAbbruchToken] = None) -> Tuple[np.ndarray, Any]:
+        """
+        Faktorisiert eine Vergleichsspalte in einen Schlüsselcode je Zeile und die eindeutigen Werte (in der Reihenfolge
+        ihres ersten Vorkommens). Arrow-Spalten werden mit dem Hash-Kernel von pyarrow direkt auf den Arrow-Puffern
+        kodiert, ohne die Werte in Python-Objekte umzuwandeln. Leere Werte zählen wie ein gemeinsamer Wert.
+
+        Args:
+            serie (pd.Series): Die Vergleichsspalte.
+            abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch (optional).
+
+        Returns:
+            Tuple[np.ndarray, Any]: Codes (int64, 0 bis Anzahl eindeutiger Werte - 1) und die eindeutigen Werte
+            (pa.Array bei Arrow-Spalten, sonst pd.Index).
+        """
+        if abbruch_token:
+            abbruch_token.pruefe()
+        if pa is not None and isinstance(serie.dtype, pd.ArrowDtype):
+            werte = pa.array(serie)
+            if isinstance(werte, pa.ChunkedArray):
+                werte = werte.combine_chunks()
+            kodiert = pa_compute.dictionary_encode(werte, null_encoding='encode')
+            codes, eindeutige = kodiert.indices.to_numpy(zero_copy_only=False).astype(np.int64, copy=False), kodiert.dictionary
+        else:
+            codes, eindeutige = pd.factorize(serie, use_na_sentinel=False)
+            codes, eindeutige = codes.astype(np.int64, copy=False), pd.Index(eindeutige)
+        if abbruch_token:
+            abbruch_token.pruefe()
+        return codes, eindeutige
+
+
+    @staticmethod
+    def _anzahl_gemeinsame_werte(eindeutige1: Any, eindeutige2: Any) -> int:
+        """
+        Zählt die Werte, die in beiden Mengen eindeutiger Werte vorkommen (Arrow: is_in-Kernel, sonst Index.isin).
+        """
+        if pa is not None and isinstance(eindeutige1, pa.Array) and isinstance(eindeutige2, pa.Array) and eindeutige1.type == eindeutige2.type:
+            return int(pa_compute.sum(pa_compute.is_in(eindeutige1, value_set=eindeutige2)).as_py() or 0) # Leere Werte gelten als gleich
+        if isinstance(eindeutige1, pa.Array if pa is not None else ()):
+            eindeutige1 = pd.Index(eindeutige1.to_pandas())
+        if isinstance(eindeutige2, pa.Array if pa is not None else ()):
+            eindeutige2 = pd.Index(eindeutige2.to_pandas())
+        return int(np.count_nonzero(eindeutige1.isin(eindeutige2)))
+
+
+    @staticmethod
+    def _wert_anzeige(eindeutige: Any, code: int) -> str:
+        """Anzeigetext eines eindeutigen Werts ('' für leere Werte)."""
+        wert = eindeutige[code].as_py() if pa is not None and isinstance(eindeutige, pa.Array) else eindeutige[code]
+        return '' if wert is None or wert is pd.NA or (isinstance(wert, float) and np.isnan(wert)) else str(wert)
+
+
+    def _duplikat_statistik(self, codes: np.ndarray, eindeutige: Any) -> DuplikatStatistik:
+        """
+        Bildet die Duplikatstatistik aus den Schlüsselcodes einer Spalte (ohne erneutes Lesen oder Hashen der Werte).
+
+        Args:
+            codes (np.ndarray): Schlüsselcodes je Zeile (siehe _faktorisiere).
+            eindeutige (Any): Die eindeutigen Werte.
+
+        Returns:
+            DuplikatStatistik: Eindeutige und mehrfach vorkommende Werte sowie die häufigsten mit Zeilennummern.
+        """
+        anzahlen = np.bincount(codes, minlength=len(eindeutige))
+        doppelt = np.flatnonzero(anzahlen > 1)
+        haeufigste = doppelt[np.argsort(-anzahlen[doppelt], kind='stable')[:DUPLIKAT_TOP_ANZAHL]]
+        return DuplikatStatistik(
+            eindeutige_werte=len(eindeutige), doppelte_werte=len(doppelt), doppelte_zeilen=int(len(codes) - len(eindeutige)),
+            haeufigste=[{"wert": self._wert_anzeige(eindeutige, code), "anzahl": int(anzahlen[code]),
+                         "zeilen": (np.flatnonzero(codes == code)[:DUPLIKAT_MAX_ZEILENNUMMERN] + 1).tolist()} for code in haeufigste])
+
+
+    @staticmethod
+    def _mit_zeilen_aus(statistik: DuplikatStatistik, serie: pd.Series) -> DuplikatStatistik:
+        """
+        Überträgt die Duplikatstatistik auf eine Spalte mit denselben Werten in anderer Reihenfolge: Anzahlen bleiben
+        gleich, die Zeilennummern der häufigsten Werte werden in der Spalte gesucht (nur numerische Spalten werden
+        umsortiert erkannt; bei gleicher Reihenfolge ergeben sich dieselben Nummern).
+        """
+        if not pd.api.types.is_numeric_dtype(serie.dtype):
+            return statistik # Nur gleiche Reihenfolge möglich (siehe _ist_permutation)
+        def _wert(text: str) -> Any: # Anzeigetext (siehe _wert_anzeige) zurück in den Datentyp der Spalte; np.bool_('False') wäre True
+            wert = pd.Series([text])
+            wert = wert.map({'True': True, 'False': False}) if pd.api.types.is_bool_dtype(serie.dtype) else pd.to_numeric(wert)
+            return wert.astype(serie.dtype).iloc[0]
+
+        haeufigste = [dict(eintrag, zeilen=(np.flatnonzero(serie.eq(_wert(eintrag["wert"])).to_numpy(dtype=bool, na_value=False))
+                                            [:DUPLIKAT_MAX_ZEILENNUMMERN] + 1).tolist())
+                      if eintrag["wert"] != '' else eintrag for eintrag in statistik.haeufigste]
+        return DuplikatStatistik(statistik.eindeutige_werte, statistik.doppelte_werte, statistik.doppelte_zeilen, haeufigste)
+
+
+    def schreibe_duplikat_gruppen(self, pfad: str, spalten: List[Tuple[np.ndarray, Any]],
+                                  abbruch_token: Optional[VergleichsAbbruchToken] = None) -> None:
+        """
+        Schreibt alle Zeilen mehrfach vorkommender Werte gruppiert als CSV ('datei', 'wert', 'anzahl', 'zeile').
+        Die Gruppen folgen dem ersten Vorkommen des Werts; geschrieben wird blockweise, ohne die Ausgabe im Speicher aufzubauen.
+
+        Args:
+            pfad (str): Zielpfad der CSV-Datei.
+            spalten (List[Tuple[np.ndarray, Any]]): Schlüsselcodes und eindeutige Werte je Datei (siehe _faktorisiere).
+            abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch (optional).
+
+        Raises:
+            CipherCoreDateiSpeicherFehler: Wenn die Datei nicht geschrieben werden kann.
+        """
+        try:
+            os.makedirs(os.path.dirname(pfad) or '.', exist_ok=True)
+            with open(pfad, 'w', encoding='utf-8', newline='') as csv_datei:
+                schreiber = csv.writer(csv_datei)
+                schreiber.writerow(['datei', 'wert', 'anzahl', 'zeile'])
+                for datei_nummer, (codes, eindeutige) in enumerate(spalten, start=1):
+                    anzahlen = np.bincount(codes, minlength=len(eindeutige))
+                    zeilen = np.flatnonzero(anzahlen[codes] > 1)
+                    zeilen = zeilen[np.argsort(codes[zeilen], kind='stable')] # Codes folgen dem ersten Vorkommen
+                    for start in range(0, len(zeilen), VERGLEICH_BLOCK_GROESSE):
+                        if abbruch_token:
+                            abbruch_token.pruefe()
+                        teil = zeilen[start:start + VERGLEICH_BLOCK_GROESSE]
+                        teil_codes = codes[teil]
+                        if pa is not None and isinstance(eindeutige, pa.Array):
+                            werte = eindeutige.take(pa.array(teil_codes)).to_pylist()
+                        else:
+                            werte = eindeutige.take(teil_codes)
+                            werte = werte.astype(object).where(werte.notna(), '').tolist() # Leere Werte wie bei Arrow als ''
+                        schreiber.writerows(zip(itertools.repeat(datei_nummer), werte, anzahlen[teil_codes].tolist(), (teil + 1).tolist()))
+        except OSError as e:
+            raise CipherCoreDateiSpeicherFehler(f"Duplikatdatei konnte nicht geschrieben werden ('{pfad}'): {e}") from e
+        logger.info(f"Gruppen mehrfach vorkommender Werte gespeichert: '{pfad}'")
+
+
+    @staticmethod
+    def _mengen_digest(serie: pd.Series, hash_schluessel: str) -> int:
+        """
+        Reihenfolgeunabhängiger Digest einer Spalte: Summe der 64-Bit-Hashes aller Werte (modulo 2^64).
+        """
+        hashes = pd.util.hash_pandas_object(serie, index=False, hash_key=hash_schluessel).to_numpy()
+        return int(hashes.sum(dtype=np.uint64))
+
+
+    def _ist_permutation(self, serie1: pd.Series, serie2: pd.Series, abbruch_token: Optional[VergleichsAbbruchToken] = None) -> bool:
+        """
+        Prüft ohne Mengenbildung, ob zwei Vergleichsspalten dieselben Werte enthalten (daraus folgt Mengengleichheit):
+        zuerst auf gleiche Reihenfolge (z.B. Re-Export mit anderem Quoting oder Spaltenreihenfolge), danach für
+        numerische NumPy-Spalten reihenfolgeunabhängig über Digests unter zwei Hash-Schlüsseln (der zweite nur, wenn
+        der erste übereinstimmt). Arrow-Spalten und Textspalten werden nicht gehasht, da der Mengenvergleich mit den
+        Arrow-Hash-Kernels bzw. mit set() dort schneller ist als das Hashen mit pandas.
+
+        Returns:
+            bool: True, wenn die Spalten (mit an Sicherheit grenzender Wahrscheinlichkeit) dieselben Werte enthalten.
+        """
+        if len(serie1) != len(serie2) or serie1.dtype != serie2.dtype or len(serie1) == 0:
+            return False
+        if serie1.equals(serie2):
+            return True
+        if isinstance(serie1.dtype, pd.ArrowDtype) or not pd.api.types.is_numeric_dtype(serie1.dtype):
+            return False
+        for hash_schluessel in MENGEN_DIGEST_SCHLUESSEL:
+            if abbruch_token:
+                abbruch_token.pruefe()
+            if self._mengen_digest(serie1, hash_schluessel) != self._mengen_digest(serie2, hash_schluessel):
+                return False
+        return True
+
+
+# --- ShardVergleicher Klasse (CipherCore Standard: Skalierbare Verarbeitung) ---
+def _max_offene_dateien() -> int:
+    """
+    Liefert die (weiche) Grenze offener Dateien des Prozesses; ohne das Modul 'resource' SHARD_DATEI_GRENZE_OHNE_RLIMIT.
+    """
+    if resource is None:
+        return SHARD_DATEI_GRENZE_OHNE_RLIMIT
+    weich, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    return sys.maxsize if weich == resource.RLIM_INFINITY else weich
+
+
+def vergleiche_shard(shard: Dict[str, str]) -> Dict[str, float]:
+    """
+    Vergleicht ein Partitionspaar und liefert die Teilmetriken. Läuft in einem eigenen Prozess und benötigt nur
+    die Pfade der Partitionsdateien; die Rückgabe besteht aus reinen Zahlen (JSON-serialisierbar), damit ein
+    Runner auf mehreren Rechnern dieselbe Funktion verwenden kann.
+
+    Args:
+        shard (Dict[str, str]): Pfade 'schluessel1', 'alter1', 'schluessel2', 'alter2' der Partitionsdateien.
+
+    Returns:
+        Dict[str, float]: Zeilenanzahl, gemeinsame Schlüssel, eindeutige und mehrfach vorkommende Schlüssel sowie
+                          Alterssumme und -anzahl je Datei.
+    """
+    teil_metriken: Dict[str, float] = {}
+    eindeutige: List[np.ndarray] = []
+    for nummer in ("1", "2"):
+        schluessel = np.fromfile(shard["schluessel" + nummer], dtype=np.uint64)
+        teil_eindeutige, teil_doppelte = _sortiert_eindeutig_mit_doppelten(schluessel)
+        teil_metriken.update({"zeilen" + nummer: len(schluessel), "eindeutige" + nummer: len(teil_eindeutige), "doppelte" + nummer: len(teil_doppelte)})
+        eindeutige.append(teil_eindeutige)
+        del schluessel # Speicher vor dem Lesen der zweiten Partition freigeben
+    teil_metriken["gleiche"] = len(np.intersect1d(eindeutige[0], eindeutige[1], assume_unique=True))
+    del eindeutige # Speicher vor dem Lesen der Altersspalten freigeben
+    for nummer in ("1", "2"):
+        alter = np.fromfile(shard["alter" + nummer], dtype=np.float64)
+        teil_metriken["alter_summe" + nummer] = float(np.nansum(alter))
+        teil_metriken["alter_anzahl" + nummer] = int(np.count_nonzero(~np.isnan(alter)))
+    return teil_metriken
+
+
+class ShardVergleicher:
+    """
+    Partitionierter Vergleich für sehr große Dateien: Beide Eingaben werden blockweise gelesen und nach dem
+    64-Bit-Hash des Vergleichsschlüssels in N Partitionen auf die Festplatte geschrieben. Gleiche Schlüssel landen
+    in derselben Partition, daher kann jedes Partitionspaar unabhängig in einem eigenen Prozess verglichen werden.
+    Der Speicherbedarf je Prozess ist durch die Partitionsgröße begrenzt (16 Bytes je Zeile).
+    Übereinstimmungen werden wie beim inkrementellen Vergleich über die Hashes der als Text normalisierten Schlüssel gezählt.
+    """
+
+    def __init__(self, anzahl_shards: int, arbeits_verzeichnis: Optional[str] = None, max_prozesse: Optional[int] = None):
+        """
+        Initialisiert den partitionierten Vergleich.
+
+        Args:
+            anzahl_shards (int): Anzahl der Partitionen (2 bis SHARD_MAX_ANZAHL).
+            arbeits_verzeichnis (Optional[str]): Verzeichnis für die temporären Partitionsdateien (optional, Standard: System-Temp).
+            max_prozesse (Optional[int]): Anzahl paralleler Prozesse (optional, Standard: Anzahl der CPU-Kerne, höchstens anzahl_shards).
+
+        Raises:
+            ValueError: Wenn die Anzahl der Partitionen ungültig ist.
+        """
+        if not isinstance(anzahl_shards, int) or not 2 <= anzahl_shards <= SHARD_MAX_ANZAHL:
+            raise ValueError(f"Anzahl der Partitionen muss zwischen 2 und {SHARD_MAX_ANZAHL} liegen: {anzahl_shards}")
+        self.anzahl_shards = anzahl_shards
+        self.arbeits_verzeichnis = arbeits_verzeichnis
+        self.max_prozesse = max_prozesse or min(anzahl_shards, os.cpu_count() or 1)
+
+
+    def vergleiche_dateien(self, datei_pfad1: str, datei_pfad2: str, daten_lader: 'DatenLader',
+                           spalte_datei1: str = 'Name', spalte_datei2: str = 'Name',
+                           abbruch_token: Optional[VergleichsAbbruchToken] = None,
+                           blatt_datei1: Optional[str] = None, blatt_datei2: Optional[str] = None) -> Tuple[VergleichsErgebnis, str, str]:
+        """
+        Partitioniert beide Dateien, vergleicht die Partitionspaare parallel und führt die Teilmetriken zusammen.
+
+        Args:
+            datei_pfad1 (str): Pfad zu Datei 1 (Benutzereingabe).
+            datei_pfad2 (str): Pfad zu Datei 2 (Hauptliste).
+            daten_lader (DatenLader): Lader für Pfadprüfung, blockweises Lesen und Validierung.
+            spalte_datei1 (str, optional): Vergleichsspalte in Datei 1. Standard ist 'Name'.
+            spalte_datei2 (str, optional): Vergleichsspalte in Datei 2. Standard ist 'Name'.
+            abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch (optional).
+            blatt_datei1 (Optional[str]): Arbeitsblatt von Datei 1, falls Excel (optional).
+            blatt_datei2 (Optional[str]): Arbeitsblatt von Datei 2, falls Excel (optional).
+
+        Returns:
+            Tuple[VergleichsErgebnis, str, str]: Vergleichsergebnisse (wie vergleiche_daten) und die Dateinamen.
+
+        Raises:
+            CipherCoreDateiFehler: Wenn eine Datei nicht sicher ist oder nicht gelesen werden kann.
+            CipherCoreDatenValidierungsFehler: Wenn die Daten ungültig sind oder die Vergleichsspalte fehlt.
+            CipherCoreDateiSpeicherFehler: Wenn die Partitionsdateien nicht geschrieben werden können.
+            CipherCoreAbbruchFehler: Wenn der Vergleich abgebrochen wurde.
+        """
+        logger.info(f"Starte partitionierten Datenvergleich mit {self.anzahl_shards} Partitionen und {self.max_prozesse} Prozessen...")
+        with tempfile.TemporaryDirectory(prefix='ciphercore_shards_', dir=self.arbeits_verzeichnis) as verzeichnis:
+            hat_alter1 = self.partitioniere(datei_pfad1, spalte_datei1, os.path.join(verzeichnis, 'datei1'), daten_lader, abbruch_token, blatt_datei1)
+            hat_alter2 = self.partitioniere(datei_pfad2, spalte_datei2, os.path.join(verzeichnis, 'datei2'), daten_lader, abbruch_token, blatt_datei2)
+            shards = [{"schluessel1": os.path.join(verzeichnis, f'datei1_{nummer}.schluessel'), "alter1": os.path.join(verzeichnis, f'datei1_{nummer}.alter'),
+                       "schluessel2": os.path.join(verzeichnis, f'datei2_{nummer}.schluessel'), "alter2": os.path.join(verzeichnis, f'datei2_{nummer}.alter')}
+                      for nummer in range(self.anzahl_shards)]
+            teil_metriken = self._vergleiche_shards(shards, abbruch_token)
+        vergleichs_ergebnisse = self.fuehre_zusammen(teil_metriken, hat_alter1 and hat_alter2)
+        logger.debug(f"Vergleichsergebnisse (partitioniert): {vergleichs_ergebnisse}")
+        logger.info("Partitionierter Datenvergleich abgeschlossen.")
+        return vergleichs_ergebnisse, os.path.basename(datei_pfad1), os.path.basename(datei_pfad2)
+
+
+    def partitioniere(self, datei_pfad: str, spalte: str, praefix: str, daten_lader: 'DatenLader',
+                      abbruch_token: Optional[VergleichsAbbruchToken] = None, blatt_name: Optional[str] = None) -> bool:
+        """
+        Schreibt die Schlüssel-Hashes (uint64) und Alterswerte (float64, NaN für leere Werte) einer Datei
+        blockweise in die Partitionsdateien '<praefix>_<n>.schluessel' und '<praefix>_<n>.alter'.
+
+        Args:
+            datei_pfad (str): Der Pfad zur Datei.
+            spalte (str): Die Vergleichsspalte.
+            praefix (str): Pfadpräfix der Partitionsdateien.
+            daten_lader (DatenLader): Lader für das blockweise Lesen.
+            abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch (optional).
+            blatt_name (Optional[str]): Arbeitsblatt, falls Excel (optional).
+
+        Returns:
+            bool: True, wenn die Datei eine Spalte 'Alter' hat.
+
+        Raises:
+            CipherCoreDatenValidierungsFehler: Wenn die Vergleichsspalte fehlt oder die Daten ungültig sind.
+            CipherCoreDateiSpeicherFehler: Wenn die Partitionsdateien nicht geschrieben werden können.
+        """
+        return self._schreibe_partitionen(datei_pfad, spalte, praefix, daten_lader, abbruch_token, blatt_name)
+
+
+    def _schreibe_partitionen(self, datei_pfad: str, spalte: str, praefix: str, daten_lader: 'DatenLader',
+                              abbruch_token: Optional[VergleichsAbbruchToken], blatt_name: Optional[str]) -> bool:
+        """
+        Ein Durchlauf der Partitionierung; vorhandene Partitionsdateien werden überschrieben. Passen alle
+        2 x N Partitionsdateien unter die Grenze offener Dateien (abzüglich SHARD_DATEI_RESERVE), bleiben sie offen,
+        sonst wird jede Partition je Block zum Anhängen geöffnet und sofort wieder geschlossen.
+
+        Raises:
+            CipherCoreDateiSpeicherFehler: Wenn die Partitionsdateien nicht geschrieben werden können.
+        """
+        pfade = [(f'{praefix}_{nummer}.schluessel', f'{praefix}_{nummer}.alter') for nummer in range(self.anzahl_shards)]
+        alle_offen = 2 * self.anzahl_shards <= _max_offene_dateien() - SHARD_DATEI_RESERVE
+        hat_alter = False
+        try:
+            with contextlib.ExitStack() as offene_dateien: # Schließt auch bei Fehlern oder Abbruch alle Partitionsdateien
+                if alle_offen:
+                    ziel_dateien = [(offene_dateien.enter_context(open(schluessel_pfad, 'wb')), offene_dateien.enter_context(open(alter_pfad, 'wb')))
+                                    for schluessel_pfad, alter_pfad in pfade]
+                else:
+                    logger.info(f"{self.anzahl_shards} Partitionen übersteigen die Grenze offener Dateien, Partitionen werden je Block geöffnet.")
+                    for schluessel_pfad, alter_pfad in pfade:
+                        open(schluessel_pfad, 'wb').close()
+                        open(alter_pfad, 'wb').close()
+                for block in daten_lader.lade_bloecke(datei_pfad, abbruch_token, [spalte, *VERGLEICH_ZUSATZ_SPALTEN], blatt_name):
+                    if spalte not in block.columns:
+                        raise CipherCoreDatenValidierungsFehler(f"Ungültiger Spaltenname für den Vergleich: '{spalte}'")
+                    hashes = pd.util.hash_pandas_object(kanonische_schluessel(block[spalte]), index=False).to_numpy()
+                    hat_alter = 'Alter' in block.columns
+                    alter = (pd.to_numeric(block['Alter'], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+                             if hat_alter else np.full(len(block), np.nan))
+                    partition = hashes % np.uint64(self.anzahl_shards)
+                    reihenfolge = np.argsort(partition, kind='stable')
+                    grenzen = np.cumsum(np.bincount(partition.astype(np.int64), minlength=self.anzahl_shards))[:-1]
+                    for nummer, (teil_hashes, teil_alter) in enumerate(zip(np.split(hashes[reihenfolge], grenzen), np.split(alter[reihenfolge], grenzen))):
+                        if alle_offen:
+                            teil_hashes.tofile(ziel_dateien[nummer][0])
+                            teil_alter.tofile(ziel_dateien[nummer][1])
+                        elif len(teil_hashes):
+                            with open(pfade[nummer][0], 'ab') as schluessel_datei, open(pfade[nummer][1], 'ab') as alter_datei:
+                                teil_hashes.tofile(schluessel_datei)
+                                teil_alter.tofile(alter_datei)
+        except OSError as e:
+            logger.error(f"Partitionsdateien konnten nicht geschrieben werden ('{praefix}'): {e}")
+            raise CipherCoreDateiSpeicherFehler(f"Partitionsdateien konnten nicht geschrieben werden ('{praefix}'): {e}") from e
+        return hat_alter
+
+
+    def _vergleiche_shards(self, shards: List[Dict[str, str]], abbruch_token: Optional[VergleichsAbbruchToken]) -> List[Dict[str, float]]:
+        """
+        Vergleicht die Partitionspaare in einem Prozesspool; bei Abbruch werden ausstehende Aufgaben verworfen.
+        """
+        teil_metriken: List[Dict[str, float]] = []
+        with ProcessPoolExecutor(max_workers=self.max_prozesse) as pool:
+            auftraege = [pool.submit(vergleiche_shard, shard) for shard in shards]
+            try:
+                for auftrag in as_completed(auftraege):
+                    if abbruch_token:
+                        abbruch_token.pruefe()
+                    teil_metriken.append(auftrag.result())
+            except BaseException:
+                for offen in auftraege: # Wie shutdown(cancel_futures=True), das erst ab Python 3.9 verfügbar ist
+                    offen.cancel()
+                pool.shutdown(wait=True)
+                raise
+        return teil_metriken
+
+
+    @staticmethod
+    def fuehre_zusammen(teil_metriken: List[Dict[str, float]], hat_alter: bool) -> VergleichsErgebnis:
+        """
+        Führt die Teilmetriken aller Partitionen zu den Vergleichsergebnissen zusammen.
+
+        Args:
+            teil_metriken (List[Dict[str, float]]): Rückgaben von vergleiche_shard.
+            hat_alter (bool): Ob beide Dateien eine Spalte 'Alter' haben.
+
+        Returns:
+            VergleichsErgebnis: Die Vergleichsergebnisse.
+        """
+        summen = {schluessel: sum(teil[schluessel] for teil in teil_metriken)
+                  for schluessel in ("zeilen1", "zeilen2", "gleiche", "alter_summe1", "alter_anzahl1", "alter_summe2", "alter_anzahl2",
+                                     "eindeutige1", "doppelte1", "eindeutige2", "doppelte2")} # Gleiche Schlüssel in derselben Partition: Anzahlen addieren sich
+        zustaende = [{"zeilen": int(summen["zeilen" + nummer]), "hat_alter": hat_alter,
+                      "alter_summe": summen["alter_summe" + nummer], "alter_anzahl": summen["alter_anzahl" + nummer],
+                      "eindeutige_werte": summen["eindeutige" + nummer], "doppelte_werte": summen["doppelte" + nummer]} for nummer in ("1", "2")]
+        return DateiVergleicher._ergebnis_aus_zustaenden(zustaende[0], zustaende[1], int(summen["gleiche"]), VERFAHREN_PARTITIONIERT)
+
+
+
+# --- ExternerSortierVergleicher Klasse (CipherCore Standard: Verarbeitung größer als der Arbeitsspeicher) ---
+def _gleiche_zusammenfassen(werte: np.ndarray, anzahlen: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fasst aufeinanderfolgende gleiche Werte eines sortierten Arrays zusammen und summiert ihre Anzahlen.
+    """
+    if len(werte) == 0:
+        return werte, anzahlen
+    anfaenge = np.flatnonzero(np.concatenate(([True], werte[1:] != werte[:-1])))
+    return werte[anfaenge], np.add.reduceat(anzahlen, anfaenge)
+
+
+def _sortier_reihenfolge(werte: np.ndarray) -> np.ndarray:
+    """
+    Sortierreihenfolge eines Arrays von Textschlüsseln (object). Mit pyarrow über den Arrow-Sortierkernel; die
+    Bytereihenfolge von UTF-8 entspricht der Codepunkt-Reihenfolge der Python-Vergleiche beim Mischen.
+    """
+    if pa is not None:
+        return pa_compute.sort_indices(pa.array(werte, type=pa.string())).to_numpy()
+    return np.argsort(werte, kind='stable')
+
+
+def _lies_lauf(pfad: str) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Liest die Blöcke (sortierte eindeutige Werte, Anzahlen) eines Sortierlaufs nacheinander.
+    """
+    with open(pfad, 'rb') as lauf_datei:
+        while True:
+            try:
+                yield pickle.load(lauf_datei) # Nur vom eigenen Prozess geschriebene Arbeitsdateien
+            except EOFError:
+                return
+
+
+def _schreibe_lauf_bloecke(lauf_datei, werte: np.ndarray, anzahlen: np.ndarray) -> None:
+    """
+    Hängt sortierte eindeutige Werte mit ihren Anzahlen in Blöcken von SORTIER_LAUF_BLOCK an eine Laufdatei an.
+    """
+    for start in range(0, len(werte), SORTIER_LAUF_BLOCK):
+        pickle.dump((werte[start:start + SORTIER_LAUF_BLOCK], anzahlen[start:start + SORTIER_LAUF_BLOCK]),
+                    lauf_datei, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def mische_laeufe(quellen: List[Iterator[Tuple[np.ndarray, np.ndarray]]],
+                  abbruch_token: Optional[VergleichsAbbruchToken] = None) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Mischt sortierte Läufe blockweise in einem sequentiellen Durchlauf. Je Schritt werden aus allen Puffern die Werte
+    bis zum kleinsten Pufferende eines noch nicht vollständig gelesenen Laufs entnommen; kleinere Werte können in
+    keinem Lauf mehr folgen. Der Speicherbedarf ist durch die Blockgröße je Lauf begrenzt.
+
+    Args:
+        quellen (List[Iterator[Tuple[np.ndarray, np.ndarray]]]): Blöcke je Lauf (sortierte, im Lauf eindeutige Werte und Anzahlen).
+        abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch (optional).
+
+    Returns:
+        Iterator[Tuple[np.ndarray, np.ndarray]]: Je Schritt die sortierten eindeutigen Werte und ihre Anzahlen je
+        Quelle (Matrix Werte x Quellen); aufeinanderfolgende Schritte sind aufsteigend und überschneidungsfrei.
+    """
+    puffer: List[Tuple[np.ndarray, np.ndarray]] = [(np.empty(0, dtype=object), np.empty(0, dtype=np.int64)) for _ in quellen]
+    offen = [True] * len(quellen) # Lauf hat weitere Blöcke
+    while True:
+        if abbruch_token:
+            abbruch_token.pruefe()
+        for nummer, quelle in enumerate(quellen):
+            while offen[nummer] and len(puffer[nummer][0]) == 0:
+                block = next(quelle, None)
+                if block is None:
+                    offen[nummer] = False
+                else:
+                    puffer[nummer] = block
+        if not any(len(werte) for werte, _ in puffer):
+            return
+        grenzen = [puffer[nummer][0][-1] for nummer in range(len(quellen)) if offen[nummer]]
+        grenze = min(grenzen) if grenzen else None
+        teil_werte, teil_anzahlen, teil_quellen = [], [], []
+        for nummer, (werte, anzahlen) in enumerate(puffer):
+            ende = len(werte) if grenze is None else int(np.searchsorted(werte, grenze, side='right'))
+            if ende:
+                teil_werte.append(werte[:ende])
+                teil_anzahlen.append(anzahlen[:ende])
+                teil_quellen.append(np.full(ende, nummer, dtype=np.int64))
+                puffer[nummer] = (werte[ende:], anzahlen[ende:])
+        werte, anzahlen, herkunft = np.concatenate(teil_werte), np.concatenate(teil_anzahlen), np.concatenate(teil_quellen)
+        if len(teil_werte) > 1:
+            reihenfolge = _sortier_reihenfolge(werte)
+            werte, anzahlen, herkunft = werte[reihenfolge], anzahlen[reihenfolge], herkunft[reihenfolge]
+        neuer_wert = np.concatenate(([True], werte[1:] != werte[:-1]))
+        matrix = np.zeros((int(np.count_nonzero(neuer_wert)), len(quellen)), dtype=np.int64)
+        matrix[np.cumsum(neuer_wert) - 1, herkunft] = anzahlen # Jeder Wert höchstens einmal je Lauf
+        yield werte[neuer_wert], matrix
+
+
+class ExternerSortierVergleicher:
+    """
+    Vergleich für Eingaben, deren Schlüsselmenge nicht in den Arbeitsspeicher passt: Die (als Text normalisierten)
+    Schlüssel jeder Datei werden blockweise gelesen und innerhalb eines Speicherbudgets zu sortierten Läufen mit
+    Anzahlen je Wert auf die lokale Festplatte geschrieben. Anschließend werden die Läufe beider Dateien in einem
+    sequentiellen Durchlauf gemischt: gemeinsame Werte, nur in einer Datei vorkommende sowie eindeutige und mehrfach
+    vorkommende Werte je Datei. Die Altersaggregate entstehen beim Lesen. Bereits nach dem Schlüssel sortierte
+    Eingaben werden erkannt und ohne Sortieren direkt als ein Lauf geschrieben.
+    Verglichen werden die Werte selbst (keine Hashes); leere Werte zählen wie ein gemeinsamer Wert.
+    """
+
+    def __init__(self, speicher_mb: float = SORTIER_SPEICHER_MB_STANDARD, arbeits_verzeichnis: Optional[str] = None,
+                 max_laeufe: int = SORTIER_MAX_LAEUFE):
+        """
+        Initialisiert den Vergleich mit externem Sortieren.
+
+        Args:
+            speicher_mb (float): Speicherbudget für die Schlüssel eines Sortierlaufs in MB (optional).
+            arbeits_verzeichnis (Optional[str]): Verzeichnis für die temporären Sortierläufe (optional, Standard: System-Temp).
+            max_laeufe (int): Höchstzahl gleichzeitig gemischter Läufe (optional, mindestens 2). Die Lesepuffer aller
+                              gemischten Läufe müssen zusätzlich in das Speicherbudget passen.
+
+        Raises:
+            ValueError: Wenn Speicherbudget oder Anzahl der Läufe ungültig sind.
+        """
+        if not isinstance(speicher_mb, (int, float)) or isinstance(speicher_mb, bool) or speicher_mb <= 0:
+            raise ValueError(f"Speicherbudget muss größer als 0 sein: {speicher_mb}")
+        if not isinstance(max_laeufe, int) or max_laeufe < 2:
+            raise ValueError(f"Anzahl gleichzeitig gemischter Läufe muss mindestens 2 sein: {max_laeufe}")
+        self.budget_bytes = int(speicher_mb * 1024 * 1024)
+        self.arbeits_verzeichnis = arbeits_verzeichnis
+        self.max_laeufe = max(2, min(max_laeufe, self.budget_bytes // (2 * SORTIER_LAUF_BLOCK * SORTIER_BYTES_JE_WERT))) # Puffer und Kopie je Lauf
+
+
+    def vergleiche_dateien(self, datei_pfad1: str, datei_pfad2: str, daten_lader: 'DatenLader',
+                           spalte_datei1: str = 'Name', spalte_datei2: str = 'Name',
+                           abbruch_token: Optional[VergleichsAbbruchToken] = None,
+                           blatt_datei1: Optional[str] = None, blatt_datei2: Optional[str] = None) -> Tuple[VergleichsErgebnis, str, str]:
+        """
+        Sortiert beide Dateien extern und mischt die Läufe zu den Vergleichsergebnissen.
+
+        Args:
+            datei_pfad1 (str): Pfad zu Datei 1 (Benutzereingabe).
+            datei_pfad2 (str): Pfad zu Datei 2 (Hauptliste).
+            daten_lader (DatenLader): Lader für Pfadprüfung, blockweises Lesen und Validierung.
+            spalte_datei1 (str, optional): Vergleichsspalte in Datei 1. Standard ist 'Name'.
+            spalte_datei2 (str, optional): Vergleichsspalte in Datei 2. Standard ist 'Name'.
+            abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch (optional).
+            blatt_datei1 (Optional[str]): Arbeitsblatt von Datei 1, falls Excel (optional).
+            blatt_datei2 (Optional[str]): Arbeitsblatt von Datei 2, falls Excel (optional).
+
+        Returns:
+            Tuple[VergleichsErgebnis, str, str]: Vergleichsergebnisse (wie vergleiche_daten, ohne häufigste Duplikate) und die Dateinamen.
+
+        Raises:
+            CipherCoreDateiFehler: Wenn eine Datei nicht sicher ist oder nicht gelesen werden kann.
+            CipherCoreDatenValidierungsFehler: Wenn die Daten ungültig sind oder die Vergleichsspalte fehlt.
+            CipherCoreAbbruchFehler: Wenn der Vergleich abgebrochen wurde.
+        """
+        logger.info(f"Starte Datenvergleich mit externem Sortieren (Speicherbudget {self.budget_bytes // (1024 * 1024)} MB je Lauf)...")
+        with tempfile.TemporaryDirectory(prefix='ciphercore_sortierung_', dir=self.arbeits_verzeichnis) as verzeichnis:
+            laeufe1, zustand1 = self.sortiere(datei_pfad1, spalte_datei1, os.path.join(verzeichnis, 'datei1'), daten_lader, abbruch_token, blatt_datei1)
+            laeufe2, zustand2 = self.sortiere(datei_pfad2, spalte_datei2, os.path.join(verzeichnis, 'datei2'), daten_lader, abbruch_token, blatt_datei2)
+            laeufe1, laeufe2 = self._reduziere_laeufe([laeufe1, laeufe2], abbruch_token)
+            zaehler = self._mische_vergleich(laeufe1, laeufe2, zustand1["leere"], zustand2["leere"], abbruch_token)
+        vergleichs_ergebnisse = DateiVergleicher._ergebnis_aus_zustaenden(zustand1, zustand2, zaehler["gleiche"], VERFAHREN_SORTIERT)
+        vergleichs_ergebnisse.duplikate_datei1, vergleichs_ergebnisse.duplikate_datei2 = (
+            DuplikatStatistik(zaehler["eindeutige" + nummer], zaehler["doppelte" + nummer], zustand["zeilen"] - zaehler["eindeutige" + nummer])
+            for nummer, zustand in (("1", zustand1), ("2", zustand2)))
+        if zustand1["vorsortiert"] and zustand2["vorsortiert"]:
+            vergleichs_ergebnisse.abkuerzung = ABKUERZUNG_VORSORTIERT
+        logger.debug(f"Vergleichsergebnisse (extern sortiert): {vergleichs_ergebnisse}")
+        logger.info("Datenvergleich mit externem Sortieren abgeschlossen.")
+        return vergleichs_ergebnisse, os.path.basename(datei_pfad1), os.path.basename(datei_pfad2)
+
+
+    def sortiere(self, datei_pfad: str, spalte: str, praefix: str, daten_lader: 'DatenLader',
+                 abbruch_token: Optional[VergleichsAbbruchToken] = None, blatt_name: Optional[str] = None) -> Tuple[List[str], Dict]:
+        """
+        Schreibt die Schlüssel einer Datei als sortierte Läufe '<praefix>_<n>.lauf' (eindeutige Werte mit Anzahlen)
+        und liefert den aggregierten Zustand (Zeilenanzahl, Alterssumme und -anzahl wie bei _ergebnis_aus_zustaenden,
+        Anzahl leerer Schlüssel, ob die Datei bereits sortiert war).
+
+        Args:
+            datei_pfad (str): Der Pfad zur Datei.
+            spalte (str): Die Vergleichsspalte.
+            praefix (str): Pfadpräfix der Laufdateien.
+            daten_lader (DatenLader): Lader für das blockweise Lesen.
+            abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch (optional).
+            blatt_name (Optional[str]): Arbeitsblatt, falls Excel (optional).
+
+        Returns:
+            Tuple[List[str], Dict]: Die Pfade der Läufe und der Zustand der Datei.
+
+        Raises:
+            CipherCoreDatenValidierungsFehler: Wenn die Vergleichsspalte fehlt oder die Daten ungültig sind.
+        """
+        return self._schreibe_laeufe(datei_pfad, spalte, praefix, daten_lader, abbruch_token, blatt_name)
+
+
+    def _schreibe_laeufe(self, datei_pfad: str, spalte: str, praefix: str, daten_lader: 'DatenLader',
+                         abbruch_token: Optional[VergleichsAbbruchToken], blatt_name: Optional[str]) -> Tuple[List[str], Dict]:
+        """
+        Ein Durchlauf von sortiere. Solange die Blöcke aufsteigend sortiert sind, werden sie ohne Sortieren in den
+        ersten Lauf geschrieben; ab dem ersten unsortierten Block werden die Schlüssel bis zum Speicherbudget
+        gesammelt, sortiert und als weitere Läufe geschrieben.
+        """
+        zustand = {"zeilen": 0, "hat_alter": False, "alter_summe": 0.0, "alter_anzahl": 0, "leere": 0, "vorsortiert": True}
+        laeufe: List[str] = []
+        puffer: List[np.ndarray] = []
+        puffer_bytes = 0
+        sortiert_datei, rest = None, None # Vorsortierter Lauf und sein zurückgehaltener letzter Wert (kann im nächsten Block fortgesetzt werden)
+        try:
+            for block in daten_lader.lade_bloecke(datei_pfad, abbruch_token, [spalte, *VERGLEICH_ZUSATZ_SPALTEN], blatt_name):
+                if spalte not in block.columns:
+                    raise CipherCoreDatenValidierungsFehler(f"Ungültiger Spaltenname für den Vergleich: '{spalte}'")
+                hat_alter, alter_summe, alter_anzahl = DateiVergleicher._alter_aggregat(block)
+                zustand["zeilen"] += len(block)
+                zustand["hat_alter"] = hat_alter
+                zustand["alter_summe"] += alter_summe
+                zustand["alter_anzahl"] += alter_anzahl
+                for start in range(0, len(block), SORTIER_LAUF_BLOCK): # Schlüssel in Teilblöcken umwandeln, nicht den ganzen Leseblock
+                    schluessel = kanonische_schluessel(block[spalte].iloc[start:start + SORTIER_LAUF_BLOCK])
+                    leer = schluessel.isna().to_numpy()
+                    zustand["leere"] += int(np.count_nonzero(leer))
+                    schluessel = schluessel[~leer]
+                    werte = schluessel.to_numpy(dtype=object)
+                    if not len(werte):
+                        continue
+                    if zustand["vorsortiert"] and (rest is None or werte[0] >= rest[0][0]) and bool(np.all(werte[1:] >= werte[:-1])):
+                        if sortiert_datei is None:
+                            laeufe.append(f'{praefix}_0.lauf')
+                            sortiert_datei = open(laeufe[0], 'wb')
+                        anzahlen = np.ones(len(werte), dtype=np.int64)
+                        if rest is not None:
+                            werte, anzahlen = np.concatenate((rest[0], werte)), np.concatenate((rest[1], anzahlen))
+                        werte, anzahlen = _gleiche_zusammenfassen(werte, anzahlen)
+                        _schreibe_lauf_bloecke(sortiert_datei, werte[:-1], anzahlen[:-1])
+                        rest = (werte[-1:], anzahlen[-1:])
+                        continue
+                    if zustand["vorsortiert"]:
+                        zustand["vorsortiert"] = False
+                        if sortiert_datei is not None: # Bisher sortierter Teil bleibt als erster Lauf erhalten
+                            _schreibe_lauf_bloecke(sortiert_datei, *rest)
+                            sortiert_datei.close()
+                            sortiert_datei = None
+                        logger.info(f"Datei '{os.path.basename(datei_pfad)}' ist nicht nach '{spalte}' sortiert, Schlüssel werden in Läufen sortiert.")
+                    bytes_je_wert = int(schluessel.str.len().sum()) / len(werte) + SORTIER_BYTES_JE_WERT
+                    while len(werte): # Auf das restliche Budget aufteilen, damit kein Lauf das Speicherbudget überschreitet
+                        anzahl = max(1, int((self.budget_bytes - puffer_bytes) / bytes_je_wert))
+                        puffer.append(werte[:anzahl])
+                        puffer_bytes += len(puffer[-1]) * bytes_je_wert
+                        werte = werte[anzahl:]
+                        if puffer_bytes >= self.budget_bytes:
+                            laeufe.append(self._schreibe_sortierten_lauf(np.concatenate(puffer), f'{praefix}_{len(laeufe)}.lauf'))
+                            puffer, puffer_bytes = [], 0
+            if sortiert_datei is not None:
+                _schreibe_lauf_bloecke(sortiert_datei, *rest)
+            if puffer:
+                laeufe.append(self._schreibe_sortierten_lauf(np.concatenate(puffer), f'{praefix}_{len(laeufe)}.lauf'))
+        finally:
+            if sortiert_datei is not None:
+                sortiert_datei.close()
+        if zustand["vorsortiert"]:
+            logger.info(f"Datei '{os.path.basename(datei_pfad)}' ist bereits nach '{spalte}' sortiert, Sortieren übersprungen.")
+        return laeufe, zustand
+
+
+    @staticmethod
+    def _schreibe_sortierten_lauf(werte: np.ndarray, pfad: str) -> str:
+        """
+        Sortiert die gesammelten Schlüssel, fasst gleiche Werte mit ihrer Anzahl zusammen und schreibt sie als Lauf.
+        """
+        werte = werte[_sortier_reihenfolge(werte)]
+        werte, anzahlen = _gleiche_zusammenfassen(werte, np.ones(len(werte), dtype=np.int64))
+        with open(pfad, 'wb') as lauf_datei:
+            _schreibe_lauf_bloecke(lauf_datei, werte, anzahlen)
+        return pfad
+
+
+    def _reduziere_laeufe(self, laeufe_je_datei: List[List[str]], abbruch_token: Optional[VergleichsAbbruchToken]) -> List[List[str]]:
+        """
+        Mischt Läufe derselben Datei zusammen, bis alle Läufe beider Dateien gleichzeitig gemischt werden können
+        (höchstens max_laeufe offene Dateien). Gemischte Läufe werden gelöscht.
+        """
+        laeufe_je_datei = [list(laeufe) for laeufe in laeufe_je_datei]
+        while sum(len(laeufe) for laeufe in laeufe_je_datei) > self.max_laeufe:
+            laeufe = max(laeufe_je_datei, key=len)
+            teil, laeufe[:] = laeufe[:self.max_laeufe], laeufe[self.max_laeufe:]
+            ziel = os.path.splitext(teil[0])[0] + '_m.lauf'
+            with open(ziel, 'wb') as lauf_datei:
+                for werte, matrix in mische_laeufe([_lies_lauf(pfad) for pfad in teil], abbruch_token):
+                    _schreibe_lauf_bloecke(lauf_datei, werte, matrix.sum(axis=1))
+            for pfad in teil:
+                os.remove(pfad)
+            laeufe.append(ziel)
+            logger.debug(f"{len(teil)} Sortierläufe zu '{os.path.basename(ziel)}' gemischt.")
+        return laeufe_je_datei
+
+
+    @staticmethod
+    def _mische_vergleich(laeufe1: List[str], laeufe2: List[str], leere1: int, leere2: int,
+                          abbruch_token: Optional[VergleichsAbbruchToken]) -> Dict[str, int]:
+        """
+        Mischt die Läufe beider Dateien in einem Durchlauf und zählt gemeinsame, eindeutige und mehrfach vorkommende
+        Werte je Datei (leere Schlüssel als ein zusätzlicher Wert).
+        """
+        zaehler = {"gleiche": int(leere1 > 0 and leere2 > 0), "eindeutige1": int(leere1 > 0), "eindeutige2": int(leere2 > 0),
+                   "doppelte1": int(leere1 > 1), "doppelte2": int(leere2 > 1)}
+        for _, matrix in mische_laeufe([_lies_lauf(pfad) for pfad in laeufe1 + laeufe2], abbruch_token):
+            anzahlen1, anzahlen2 = matrix[:, :len(laeufe1)].sum(axis=1), matrix[:, len(laeufe1):].sum(axis=1)
+            zaehler["gleiche"] += int(np.count_nonzero((anzahlen1 > 0) & (anzahlen2 > 0)))
+            for nummer, anzahlen in (("1", anzahlen1), ("2", anzahlen2)):
+                zaehler["eindeutige" + nummer] += int(np.count_nonzero(anzahlen > 0))
+                zaehler["doppelte" + nummer] += int(np.count_nonzero(anzahlen > 1))
+        return zaehler
+
+
+
+# --- SqlVergleicher Klasse (CipherCore Standard: Vergleich in einer eingebetteten Datenbank) ---
+class SqlVergleicher:
+    """
+    Vergleich in einer eingebetteten Datenbank statt in pandas: Beide Eingaben werden blockweise gelesen, validiert
+    und mit ihren Zeilennummern als Tabellen 'datei1' und 'datei2' (Schlüssel als Text) in eine temporäre
+    Datenbankdatei eingefügt. Gezählt wird mit GROUP BY und Joins, die bei großen Eingaben auf die Festplatte
+    auslagern. Verwendet DuckDB (falls installiert, spaltenorientiert und mehrthreadig), sonst SQLite aus der
+    Standardbibliothek. Liefert dieselben Kennzahlen wie vergleiche_daten einschließlich der häufigsten Duplikate
+    mit Zeilennummern und schreibt auf Wunsch die vollständige Differenz sowie alle Duplikatzeilen als CSV.
+    Leere Werte zählen wie ein gemeinsamer Wert.
+    """
+
+    def __init__(self, engine: str = SQL_ENGINE_AUTO, speicher_mb: float = SORTIER_SPEICHER_MB_STANDARD,
+                 arbeits_verzeichnis: Optional[str] = None):
+        """
+        Initialisiert den SQL-Vergleich.
+
+        Args:
+            engine (str): 'duckdb', 'sqlite' oder 'auto' (optional, Standard: DuckDB, falls installiert, sonst SQLite).
+            speicher_mb (float): Arbeitsspeicher der Datenbank in MB, darüber wird ausgelagert (optional;
+                                 DuckDB: memory_limit, SQLite: Seiten-Cache).
+            arbeits_verzeichnis (Optional[str]): Verzeichnis der temporären Datenbank (optional, Standard: System-Temp).
+
+        Raises:
+            ValueError: Wenn die Engine unbekannt oder nicht installiert bzw. das Speicherbudget ungültig ist.
+        """
+        if engine not in SQL_ENGINES:
+            raise ValueError(f"Unbekannte SQL-Engine '{engine}'. Erlaubt: {', '.join(SQL_ENGINES)}")
+        if engine == SQL_ENGINE_DUCKDB and duckdb is None:
+            raise ValueError("Für die SQL-Engine 'duckdb' wird das Paket 'duckdb' benötigt.")
+        if not isinstance(speicher_mb, (int, float)) or isinstance(speicher_mb, bool) or speicher_mb <= 0:
+            raise ValueError(f"Speicherbudget muss größer als 0 sein: {speicher_mb}")
+        self.engine = engine if engine != SQL_ENGINE_AUTO else (SQL_ENGINE_DUCKDB if duckdb is not None else SQL_ENGINE_SQLITE)
+        self.speicher_mb = speicher_mb
+        self.arbeits_verzeichnis = arbeits_verzeichnis
+        self._gleich = 'IS NOT DISTINCT FROM' if self.engine == SQL_ENGINE_DUCKDB else 'IS' # Gleichheit, bei der NULL gleich NULL ist
+
+
+    def vergleiche_dateien(self, datei_pfad1: str, datei_pfad2: str, daten_lader: 'DatenLader',
+                           spalte_datei1: str = 'Name', spalte_datei2: str = 'Name',
+                           abbruch_token: Optional[VergleichsAbbruchToken] = None,
+                           blatt_datei1: Optional[str] = None, blatt_datei2: Optional[str] = None,
+                           diff_pfad: Optional[str] = None, duplikat_pfad: Optional[str] = None) -> Tuple[VergleichsErgebnis, str, str]:
+        """
+        Lädt beide Dateien in die Datenbank und berechnet die Vergleichsergebnisse mit SQL.
+
+        Args:
+            datei_pfad1 (str): Pfad zu Datei 1 (Benutzereingabe).
+            datei_pfad2 (str): Pfad zu Datei 2 (Hauptliste).
+            daten_lader (DatenLader): Lader für Pfadprüfung, blockweises Lesen und Validierung.
+            spalte_datei1 (str, optional): Vergleichsspalte in Datei 1. Standard ist 'Name'.
+            spalte_datei2 (str, optional): Vergleichsspalte in Datei 2. Standard ist 'Name'.
+            abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch (optional).
+            blatt_datei1 (Optional[str]): Arbeitsblatt von Datei 1, falls Excel (optional).
+            blatt_datei2 (Optional[str]): Arbeitsblatt von Datei 2, falls Excel (optional).
+            diff_pfad (Optional[str]): CSV-Datei für alle Werte, die nur in einer Datei vorkommen (optional).
+            duplikat_pfad (Optional[str]): CSV-Datei für die Zeilen mehrfach vorkommender Werte (optional, wie vergleiche_daten).
+
+        Returns:
+            Tuple[VergleichsErgebnis, str, str]: Vergleichsergebnisse (wie vergleiche_daten) und die Dateinamen.
+
+        Raises:
+            CipherCoreDateiFehler: Wenn eine Datei nicht sicher ist oder nicht gelesen werden kann.
+            CipherCoreDatenValidierungsFehler: Wenn die Daten ungültig sind oder die Vergleichsspalte fehlt.
+            CipherCoreDateiSpeicherFehler: Wenn Differenz- oder Duplikatdatei nicht geschrieben werden können.
+            CipherCoreDatenbankFehler: Wenn die Datenbank einen Fehler meldet (z.B. Festplatte voll).
+            CipherCoreAbbruchFehler: Wenn der Vergleich abgebrochen wurde.
+        """
+        logger.info(f"Starte SQL-Datenvergleich mit {self.engine} (Arbeitsspeicher {self.speicher_mb:.0f} MB)...")
+        with tempfile.TemporaryDirectory(prefix='ciphercore_sql_', dir=self.arbeits_verzeichnis) as verzeichnis:
+            verbindung = self._verbinde(verzeichnis, abbruch_token)
+            try:
+                zustaende = [self.lade_tabelle(verbindung, tabelle, datei_pfad, spalte, daten_lader, abbruch_token, blatt_name)
+                             for tabelle, datei_pfad, spalte, blatt_name in (('datei1', datei_pfad1, spalte_datei1, blatt_datei1),
+                                                                             ('datei2', datei_pfad2, spalte_datei2, blatt_datei2))]
+                for nummer in ("1", "2"): # Eindeutige Werte je Datei mit Anzahl und erstem Vorkommen
+                    self._fuehre_aus(verbindung, abbruch_token, f"CREATE TABLE werte{nummer} AS SELECT schluessel, COUNT(*) AS anzahl, "
+                                                                f"MIN(zeile) AS erste FROM datei{nummer} GROUP BY schluessel")
+                    if self.engine == SQL_ENGINE_SQLITE: # DuckDB verwendet Hash-Joins, SQLite benötigt einen Index
+                        self._fuehre_aus(verbindung, abbruch_token, f"CREATE INDEX werte{nummer}_schluessel ON werte{nummer} (schluessel)")
+                anzahl_gleiche_werte = self._fuehre_aus(verbindung, abbruch_token, f"SELECT COUNT(*) FROM werte1 JOIN werte2 "
+                                                                                   f"ON werte1.schluessel {self._gleich} werte2.schluessel").fetchone()[0]
+                vergleichs_ergebnisse = DateiVergleicher._ergebnis_aus_zustaenden(zustaende[0], zustaende[1], int(anzahl_gleiche_werte), VERFAHREN_SQL)
+                vergleichs_ergebnisse.duplikate_datei1, vergleichs_ergebnisse.duplikate_datei2 = (
+                    self._duplikat_statistik(verbindung, nummer, zustand["zeilen"], abbruch_token) for nummer, zustand in (("1", zustaende[0]), ("2", zustaende[1])))
+                if diff_pfad:
+                    self._schreibe_differenz(verbindung, diff_pfad, abbruch_token)
+                if duplikat_pfad:
+                    self._schreibe_duplikate(verbindung, duplikat_pfad, abbruch_token)
+            except (sqlite3.Error, *((duckdb.Error,) if duckdb is not None else ())) as e:
+                logger.error(f"Fehler im SQL-Vergleich ({self.engine}): {e}")
+                raise CipherCoreDatenbankFehler(f"Fehler im SQL-Vergleich ({self.engine}): {e}") from e
+            finally:
+                verbindung.close()
+        logger.debug(f"Vergleichsergebnisse (SQL): {vergleichs_ergebnisse}")
+        logger.info("SQL-Datenvergleich abgeschlossen.")
+        return vergleichs_ergebnisse, os.path.basename(datei_pfad1), os.path.basename(datei_pfad2)
+
+
+    def _verbinde(self, verzeichnis: str, abbruch_token: Optional[VergleichsAbbruchToken]):
+        """
+        Öffnet die temporäre Datenbankdatei im Arbeitsverzeichnis mit dem Speicherbudget und Auslagerung auf die Festplatte.
+        """
+        if self.engine == SQL_ENGINE_DUCKDB:
+            verbindung = duckdb.connect(os.path.join(verzeichnis, 'vergleich.duckdb'),
+                                        config={"memory_limit": f"{max(int(self.speicher_mb), 1)}MB", "temp_directory": verzeichnis,
+                                                "preserve_insertion_order": False})
+            verbindung.execute("CREATE TABLE datei1 (schluessel VARCHAR, zeile BIGINT)")
+            verbindung.execute("CREATE TABLE datei2 (schluessel VARCHAR, zeile BIGINT)")
+            return verbindung
+        verbindung = sqlite3.connect(os.path.join(verzeichnis, 'vergleich.sqlite'))
+        verbindung.execute("PRAGMA journal_mode = OFF") # Temporäre Datenbank: kein Journal, keine Synchronisierung nötig
+        verbindung.execute("PRAGMA synchronous = OFF")
+        verbindung.execute("PRAGMA temp_store = FILE") # Sortierungen für GROUP BY auf die Festplatte auslagern
+        verbindung.execute(f"PRAGMA cache_size = -{max(int(self.speicher_mb * 1024), 1024)}") # Negativ: Größe in KiB
+        if abbruch_token:
+            verbindung.set_progress_handler(lambda: abbruch_token.ist_abgebrochen, SQL_ABBRUCH_SCHRITTE) # True bricht die Anweisung ab
+        verbindung.execute("CREATE TABLE datei1 (schluessel TEXT, zeile INTEGER)")
+        verbindung.execute("CREATE TABLE datei2 (schluessel TEXT, zeile INTEGER)")
+        return verbindung
+
+
+    @staticmethod
+    def _fuehre_aus(verbindung, abbruch_token: Optional[VergleichsAbbruchToken], sql: str, parameter: Tuple = ()):
+        """
+        Führt eine SQL-Anweisung aus; ein über den Fortschritts-Handler abgebrochener SQLite-Befehl wird als Abbruch gemeldet.
+        """
+        return SqlVergleicher._mit_abbruch(abbruch_token, verbindung.execute, sql, parameter)
+
+
+    @staticmethod
+    def _mit_abbruch(abbruch_token: Optional[VergleichsAbbruchToken], aufruf: Callable, *argumente):
+        """
+        Ruft eine Datenbankfunktion (execute, fetchmany) auf und meldet einen über den Fortschritts-Handler
+        abgebrochenen SQLite-Befehl als CipherCoreAbbruchFehler statt als Datenbankfehler.
+        """
+        if abbruch_token:
+            abbruch_token.pruefe()
+        try:
+            return aufruf(*argumente)
+        except sqlite3.OperationalError:
+            if abbruch_token:
+                abbruch_token.pruefe()
+            raise
+
+
+    def lade_tabelle(self, verbindung, tabelle: str, datei_pfad: str, spalte: str, daten_lader: 'DatenLader',
+                     abbruch_token: Optional[VergleichsAbbruchToken] = None, blatt_name: Optional[str] = None) -> Dict:
+        """
+        Fügt die Schlüssel einer Datei blockweise mit ihren Zeilennummern (ab 1) in eine Tabelle ein und liefert den
+        aggregierten Zustand (Zeilenanzahl, Alterssumme und -anzahl wie bei _ergebnis_aus_zustaenden).
+
+        Raises:
+            CipherCoreDatenValidierungsFehler: Wenn die Vergleichsspalte fehlt oder die Daten ungültig sind.
+        """
+        zustand = {"zeilen": 0, "hat_alter": False, "alter_summe": 0.0, "alter_anzahl": 0}
+        try:
+            for block in daten_lader.lade_bloecke(datei_pfad, abbruch_token, [spalte, *VERGLEICH_ZUSATZ_SPALTEN], blatt_name):
+                if spalte not in block.columns:
+                    raise CipherCoreDatenValidierungsFehler(f"Ungültiger Spaltenname für den Vergleich: '{spalte}'")
+                hat_alter, alter_summe, alter_anzahl = DateiVergleicher._alter_aggregat(block)
+                werte = kanonische_schluessel(block[spalte]).to_numpy(dtype=object, na_value=None) # Kanonischer Text wie beim externen Sortieren
+                zeilen = np.arange(zustand["zeilen"] + 1, zustand["zeilen"] + len(block) + 1, dtype=np.int64)
+                if self.engine == SQL_ENGINE_DUCKDB:
+                    verbindung.register('block_daten', pd.DataFrame({'schluessel': werte, 'zeile': zeilen}))
+                    verbindung.execute(f"INSERT INTO {tabelle} SELECT schluessel, zeile FROM block_daten")
+                    verbindung.unregister('block_daten')
+                else:
+                    verbindung.executemany(f"INSERT INTO {tabelle} VALUES (?, ?)", zip(werte.tolist(), zeilen.tolist()))
+                zustand["zeilen"] += len(block)
+                zustand["hat_alter"] = hat_alter
+                zustand["alter_summe"] += alter_summe
+                zustand["alter_anzahl"] += alter_anzahl
+            return zustand
+        except sqlite3.OperationalError:
+            if abbruch_token:
+                abbruch_token.pruefe() # Über den Fortschritts-Handler abgebrochenes Einfügen
+            raise
+
+
+    def _duplikat_statistik(self, verbindung, nummer: str, zeilen: int, abbruch_token: Optional[VergleichsAbbruchToken]) -> DuplikatStatistik:
+        """
+        Bildet die Duplikatstatistik einer Datei aus ihrer Wertetabelle; die häufigsten Werte sind wie bei
+        vergleiche_daten absteigend nach Anzahl und bei gleicher Anzahl nach erstem Vorkommen sortiert.
+        """
+        eindeutige_werte, doppelte_werte = self._fuehre_aus(
+            verbindung, abbruch_token, f"SELECT COUNT(*), SUM(CASE WHEN anzahl > 1 THEN 1 ELSE 0 END) FROM werte{nummer}").fetchone()
+        if not doppelte_werte:
+            return DuplikatStatistik(int(eindeutige_werte), 0, int(zeilen - eindeutige_werte), [])
+        top_werte = (f"SELECT schluessel, anzahl, erste FROM werte{nummer} WHERE anzahl > 1 "
+                     f"ORDER BY anzahl DESC, erste LIMIT {DUPLIKAT_TOP_ANZAHL}")
+        if self.engine == SQL_ENGINE_SQLITE: # Zeilen über einen Index statt je Wert mit einem vollständigen Tabellendurchlauf suchen
+            self._fuehre_aus(verbindung, abbruch_token, f"CREATE INDEX IF NOT EXISTS datei{nummer}_schluessel ON datei{nummer} (schluessel, zeile)")
+        haeufigste = {erste: {"wert": '' if wert is None else wert, "anzahl": int(anzahl), "zeilen": []}
+                      for wert, anzahl, erste in self._fuehre_aus(verbindung, abbruch_token, top_werte).fetchall()}
+        for erste, zeile in self._fuehre_aus(verbindung, abbruch_token, # Zeilennummern aller häufigsten Werte in einer Abfrage
+                                             f"SELECT erste, zeile FROM (SELECT top.erste, datei.zeile, ROW_NUMBER() OVER "
+                                             f"(PARTITION BY top.erste ORDER BY datei.zeile) AS rang FROM ({top_werte}) AS top "
+                                             f"JOIN datei{nummer} AS datei ON datei.schluessel {self._gleich} top.schluessel) "
+                                             f"WHERE rang <= {DUPLIKAT_MAX_ZEILENNUMMERN} ORDER BY erste, zeile").fetchall():
+            haeufigste[erste]["zeilen"].append(int(zeile))
+        return DuplikatStatistik(int(eindeutige_werte), int(doppelte_werte), int(zeilen - eindeutige_werte), list(haeufigste.values()))
+
+
+    def _schreibe_abfrage(self, verbindung, pfad: str, kopfzeile: List[str], abfragen: List[str],
+                          abbruch_token: Optional[VergleichsAbbruchToken]) -> None:
+        """
+        Schreibt die Ergebnisse mehrerer Abfragen abschnittsweise (fetchmany) in eine CSV-Datei; leere Werte als ''.
+        """
+        try:
+            os.makedirs(os.path.dirname(pfad) or '.', exist_ok=True)
+            with open(pfad, 'w', encoding='utf-8', newline='') as csv_datei:
+                schreiber = csv.writer(csv_datei)
+                schreiber.writerow(kopfzeile)
+                for abfrage in abfragen:
+                    cursor = self._fuehre_aus(verbindung, abbruch_token, abfrage)
+                    while zeilen := self._mit_abbruch(abbruch_token, cursor.fetchmany, SQL_ABRUF_ZEILEN): # Abrufen führt die Abfrage weiter aus
+                        schreiber.writerows((datei, '' if wert is None else wert, *rest) for datei, wert, *rest in zeilen)
+        except OSError as e:
+            raise CipherCoreDateiSpeicherFehler(f"Datei konnte nicht geschrieben werden ('{pfad}'): {e}") from e
+
+
+    def _schreibe_differenz(self, verbindung, pfad: str, abbruch_token: Optional[VergleichsAbbruchToken]) -> None:
+        """
+        Schreibt alle Werte, die nur in einer Datei vorkommen ('datei', 'wert', 'anzahl', 'erste_zeile'),
+        je Datei in der Reihenfolge ihres ersten Vorkommens (Anti-Join).
+        """
+        abfragen = [f"SELECT {nummer}, schluessel, anzahl, erste FROM werte{nummer} AS eigene WHERE NOT EXISTS "
+                    f"(SELECT 1 FROM werte{andere} AS andere WHERE andere.schluessel {self._gleich} eigene.schluessel) ORDER BY erste"
+                    for nummer, andere in ((1, 2), (2, 1))]
+        self._schreibe_abfrage(verbindung, pfad, ['datei', 'wert', 'anzahl', 'erste_zeile'], abfragen, abbruch_token)
+        logger.info(f"Differenz (Werte nur in einer Datei) gespeichert: '{pfad}'")
+
+
+    def _schreibe_duplikate(self, verbindung, pfad: str, abbruch_token: Optional[VergleichsAbbruchToken]) -> None:
+        """
+        Schreibt alle Zeilen mehrfach vorkommender Werte im Format von DateiVergleicher.schreibe_duplikat_gruppen
+        (Gruppen in der Reihenfolge des ersten Vorkommens).
+        """
+        abfragen = [f"SELECT {nummer}, datei.schluessel, werte.anzahl, datei.zeile FROM datei{nummer} AS datei JOIN werte{nummer} AS werte "
+                    f"ON datei.schluessel {self._gleich} werte.schluessel WHERE werte.anzahl > 1 ORDER BY werte.erste, datei.zeile"
+                    for nummer in (1, 2)]
+        self._schreibe_abfrage(verbindung, pfad, ['datei', 'wert', 'anzahl', 'zeile'], abfragen, abbruch_token)
+        logger.info(f"Gruppen mehrfach vorkommender Werte gespeichert: '{pfad}'")
+
+
+# --- MerkleDigest Klasse (CipherCore Standard: Standortübergreifender Vergleich) ---
+class MerkleDigest:
+    """
+    Kompakter Merkle-Digest der Vergleichsspalte einer Datei für den Vergleich zwischen zwei Standorten, ohne die
+    Dateien auszutauschen. Die eindeutigen 64-Bit-Schlüssel-Hashes (wie beim inkrementellen Vergleich) werden nach
+    ihren oberen 32 Bit auf K Buckets verteilt; jedes Blatt ist die BLAKE2b-Prüfsumme der sortierten Hashes eines
+    Buckets, jeder innere Knoten die Prüfsumme seiner beiden Kinder. Zwei Digests werden von der Wurzel abwärts
+    verglichen, sodass nur für die abweichenden Buckets Schlüssel-Hashes ausgetauscht werden müssen
+    (Bucket-Schlüsseldatei). Übereinstimmende Buckets zählen vollständig als gemeinsame Werte.
+
+    Die Hashes werden mit einem aus dem gemeinsamen Geheimnis beider Standorte abgeleiteten SipHash-Schlüssel
+    berechnet. Mit dem öffentlichen Standardschlüssel von pandas ließen sich exportierte Hashes für bekannte oder
+    erratbare Werte (z.B. Namen) nachrechnen; ohne das Geheimnis ist das nicht möglich. Der Digest enthält nur eine
+    Kennung des Geheimnisses, damit Digests mit verschiedenen Geheimnissen nicht verglichen werden.
+    """
+
+    def __init__(self, anzahl_buckets: int = DIGEST_BUCKETS_STANDARD):
+        """
+        Initialisiert einen leeren Digest.
+
+        Args:
+            anzahl_buckets (int): Anzahl der Buckets K, eine Zweierpotenz (2 bis DIGEST_MAX_BUCKETS).
+
+        Raises:
+            ValueError: Wenn die Anzahl der Buckets ungültig ist.
+        """
+        if not isinstance(anzahl_buckets, int) or not 2 <= anzahl_buckets <= DIGEST_MAX_BUCKETS or anzahl_buckets & (anzahl_buckets - 1):
+            raise ValueError(f"Anzahl der Buckets muss eine Zweierpotenz zwischen 2 und {DIGEST_MAX_BUCKETS} sein: {anzahl_buckets}")
+        self.anzahl_buckets = anzahl_buckets
+        self.ebenen: List[List[str]] = [] # ebenen[0]: Blätter (Buckets), ebenen[-1]: [Wurzel]
+        self.anzahl_je_bucket: List[int] = []
+        self.dateiname = ''
+        self.spalte = ''
+        self.zeilen = 0
+        self.hat_alter = False
+        self.alter_summe = 0.0
+        self.alter_anzahl = 0
+        self.eindeutige_werte = 0
+        self.doppelte_werte = 0
+        self.schluessel_kennung = ''
+
+
+    @staticmethod
+    def hash_schluessel(geheimnis: str) -> str:
+        """
+        Leitet aus dem Geheimnis den 16-Byte-Schlüssel der SipHash-Funktion von pandas ab (96 Bit, Base64).
+
+        Args:
+            geheimnis (str): Das gemeinsame Geheimnis beider Standorte (mindestens DIGEST_SCHLUESSEL_MIN_LAENGE Zeichen).
+
+        Returns:
+            str: Der Schlüssel für `hash_pandas_object(..., hash_key=...)`.
+
+        Raises:
+            ValueError: Wenn das Geheimnis fehlt oder zu kurz ist.
+        """
+        if not geheimnis or len(geheimnis) < DIGEST_SCHLUESSEL_MIN_LAENGE:
+            raise ValueError(f"Das Geheimnis für Digests muss mindestens {DIGEST_SCHLUESSEL_MIN_LAENGE} Zeichen lang sein "
+                             f"(Umgebungsvariable {DIGEST_SCHLUESSEL_UMGEBUNG} oder --digest_schluessel_datei).")
+        abgeleitet = hashlib.blake2b(geheimnis.encode('utf-8'), digest_size=12, person=b'CipherCoreSipKey').digest()
+        return base64.urlsafe_b64encode(abgeleitet).decode('ascii')
+
+
+    @staticmethod
+    def kennung(geheimnis: str) -> str:
+        """
+        Liefert eine Kennung des Geheimnisses, die in der Digest-Datei gespeichert wird (unabhängig vom SipHash-Schlüssel).
+        """
+        return hashlib.blake2b(geheimnis.encode('utf-8'), digest_size=8, person=b'CipherCoreDigKen').hexdigest()
+
+
+    @property
+    def wurzel(self) -> str:
+        """Die Wurzelprüfsumme (leer, solange der Digest nicht aufgebaut ist)."""
+        return self.ebenen[-1][0] if self.ebenen else ''
+
+
+    def bucket_nummern(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Ordnet Schlüssel-Hashes ihren Buckets zu (obere 32 Bit modulo K; unabhängig von der Partitionierung nach Hash modulo N).
+
+        Args:
+            hashes (np.ndarray): Schlüssel-Hashes (uint64).
+
+        Returns:
+            np.ndarray: Die Bucket-Nummern (int64).
+        """
+        return ((hashes >> np.uint64(32)) % np.uint64(self.anzahl_buckets)).astype(np.int64)
+
+
+    @staticmethod
+    def _pruefsumme(daten: bytes) -> str:
+        return hashlib.blake2b(daten, digest_size=DIGEST_PRUEFSUMMEN_BYTES).hexdigest()
+
+
+    def _teile_auf(self, hashes: np.ndarray) -> List[np.ndarray]:
+        """
+        Teilt sortierte, eindeutige Hashes auf die Buckets auf (innerhalb jedes Buckets bleibt die Sortierung erhalten).
+        """
+        buckets = self.bucket_nummern(hashes)
+        reihenfolge = np.argsort(buckets, kind='stable')
+        grenzen = np.cumsum(np.bincount(buckets, minlength=self.anzahl_buckets))[:-1]
+        return np.split(hashes[reihenfolge], grenzen)
+
+
+    def baue(self, hashes: np.ndarray) -> None:
+        """
+        Baut Blätter und innere Knoten aus den sortierten, eindeutigen Schlüssel-Hashes der Datei auf.
+
+        Args:
+            hashes (np.ndarray): Sortierte, eindeutige Schlüssel-Hashes (uint64).
+        """
+        teile = self._teile_auf(hashes)
+        self.anzahl_je_bucket = [len(teil) for teil in teile]
+        self.eindeutige_werte = len(hashes)
+        self.ebenen = [[self._pruefsumme(teil.astype('<u8').tobytes()) for teil in teile]]
+        while len(self.ebenen[-1]) > 1:
+            kinder = self.ebenen[-1]
+            self.ebenen.append([self._pruefsumme(bytes.fromhex(links + rechts)) for links, rechts in zip(kinder[::2], kinder[1::2])])
+
+
+    def unterschiedliche_buckets(self, andere: 'MerkleDigest') -> List[int]:
+        """
+        Ermittelt die abweichenden Buckets, indem nur die Teilbäume mit abweichender Prüfsumme weiter verfolgt werden.
+
+        Args:
+            andere (MerkleDigest): Der Digest der zweiten Datei.
+
+        Returns:
+            List[int]: Die Nummern der abweichenden Buckets (aufsteigend).
+
+        Raises:
+            CipherCoreDatenValidierungsFehler: Wenn die Digests mit unterschiedlicher Bucket-Anzahl oder mit
+                                               unterschiedlichen Geheimnissen erstellt wurden.
+        """
+        if self.anzahl_buckets != andere.anzahl_buckets:
+            raise CipherCoreDatenValidierungsFehler(f"Digests mit unterschiedlicher Bucket-Anzahl ({self.anzahl_buckets} und {andere.anzahl_buckets}) können nicht verglichen werden.")
+        if self.schluessel_kennung != andere.schluessel_kennung:
+            raise CipherCoreDatenValidierungsFehler("Digests wurden mit unterschiedlichen Geheimnissen erstellt und können nicht verglichen werden.")
+        kandidaten = [0]
+        for ebene in range(len(self.ebenen) - 1, -1, -1):
+            kandidaten = [knoten for knoten in kandidaten if self.ebenen[ebene][knoten] != andere.ebenen[ebene][knoten]]
+            if ebene:
+                kandidaten = [kind for knoten in kandidaten for kind in (2 * knoten, 2 * knoten + 1)]
+        return kandidaten
+
+
+    def bucket_schluessel(self, hashes: np.ndarray, buckets: List[int]) -> Dict[int, np.ndarray]:
+        """
+        Liefert die Schlüssel-Hashes der angeforderten Buckets.
+
+        Args:
+            hashes (np.ndarray): Sortierte, eindeutige Schlüssel-Hashes der Datei, aus denen der Digest gebaut wurde.
+            buckets (List[int]): Die angeforderten Bucket-Nummern.
+
+        Returns:
+            Dict[int, np.ndarray]: Sortierte Schlüssel-Hashes je Bucket.
+        """
+        teile = self._teile_auf(hashes)
+        return {bucket: teile[bucket] for bucket in buckets}
+
+
+    def speichere(self, pfad: str) -> None:
+        """
+        Speichert den Digest atomar als JSON-Datei.
+
+        Args:
+            pfad (str): Zielpfad.
+
+        Raises:
+            CipherCoreDateiSpeicherFehler: Wenn die Datei nicht geschrieben werden kann.
+        """
+        inhalt = {"version": DIGEST_VERSION, "dateiname": self.dateiname, "spalte": self.spalte, "anzahl_buckets": self.anzahl_buckets,
+                  "zeilen": self.zeilen, "hat_alter": self.hat_alter, "alter_summe": self.alter_summe, "alter_anzahl": self.alter_anzahl,
+                  "doppelte_werte": self.doppelte_werte, "schluessel_kennung": self.schluessel_kennung, "anzahl_je_bucket": self.anzahl_je_bucket, "ebenen": self.ebenen}
+        try:
+            with open(pfad + '.tmp', 'w', encoding='utf-8') as digest_datei:
+                json.dump(inhalt, digest_datei, ensure_ascii=False)
+            os.replace(pfad + '.tmp', pfad)
+        except OSError as e:
+            raise CipherCoreDateiSpeicherFehler(f"Digest konnte nicht gespeichert werden ('{pfad}'): {e}") from e
+
+
+    @classmethod
+    def lade(cls, pfad: str) -> 'MerkleDigest':
+        """
+        Lädt einen gespeicherten Digest.
+
+        Args:
+            pfad (str): Pfad zur Digest-Datei.
+
+        Returns:
+            MerkleDigest: Der Digest.
+
+        Raises:
+            CipherCoreDateiLadeFehler: Wenn die Datei fehlt, unlesbar ist oder eine andere Formatversion hat.
+        """
+        try:
+            with open(pfad, encoding='utf-8') as digest_datei:
+                inhalt = json.load(digest_datei)
+            if inhalt.get("version") != DIGEST_VERSION:
+                raise ValueError(f"Formatversion {inhalt.get('version')} statt {DIGEST_VERSION}")
+            digest = cls(int(inhalt["anzahl_buckets"]))
+            digest.ebenen, digest.anzahl_je_bucket = inhalt["ebenen"], [int(anzahl) for anzahl in inhalt["anzahl_je_bucket"]]
+            digest.dateiname, digest.spalte = str(inhalt["dateiname"]), str(inhalt["spalte"])
+            digest.zeilen, digest.hat_alter = int(inhalt["zeilen"]), bool(inhalt["hat_alter"])
+            digest.alter_summe, digest.alter_anzahl = float(inhalt["alter_summe"]), int(inhalt["alter_anzahl"])
+            digest.eindeutige_werte, digest.doppelte_werte = sum(digest.anzahl_je_bucket), int(inhalt["doppelte_werte"])
+            digest.schluessel_kennung = str(inhalt["schluessel_kennung"])
+        except FileNotFoundError as e:
+            raise CipherCoreDateiLadeFehler(f"Digest-Datei nicht gefunden: {pfad}") from e
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            raise CipherCoreDateiLadeFehler(f"Digest-Datei '{os.path.basename(pfad)}' ist ungültig: {e}") from e
+        if len(digest.ebenen[0]) != digest.anzahl_buckets or len(digest.ebenen[-1]) != 1:
+            raise CipherCoreDateiLadeFehler(f"Digest-Datei '{os.path.basename(pfad)}' ist unvollständig.")
+        return digest
+
+
+    @staticmethod
+    def speichere_bucket_schluessel(pfad: str, wurzel: str, bucket_hashes: Dict[int, np.ndarray]) -> None:
+        """
+        Speichert die Schlüssel-Hashes der angeforderten Buckets als .npz-Datei (nur Hashes, keine Klartextwerte).
+
+        Args:
+            pfad (str): Zielpfad.
+            wurzel (str): Wurzelprüfsumme des Digests, zu dem die Schlüssel gehören.
+            bucket_hashes (Dict[int, np.ndarray]): Sortierte Schlüssel-Hashes je Bucket.
+
+        Raises:
+            CipherCoreDateiSpeicherFehler: Wenn die Datei nicht geschrieben werden kann.
+        """
+        buckets = sorted(bucket_hashes)
+        try:
+            with open(pfad + '.tmp', 'wb') as schluessel_datei:
+                np.savez(schluessel_datei, wurzel=np.array(wurzel), buckets=np.array(buckets, dtype=np.int64),
+                         anzahlen=np.array([len(bucket_hashes[bucket]) for bucket in buckets], dtype=np.int64),
+                         hashes=np.concatenate([bucket_hashes[bucket] for bucket in buckets]) if buckets else np.empty(0, dtype=np.uint64))
+            os.replace(pfad + '.tmp', pfad)
+        except OSError as e:
+            raise CipherCoreDateiSpeicherFehler(f"Bucket-Schlüssel konnten nicht gespeichert werden ('{pfad}'): {e}") from e
+
+
+    @staticmethod
+    def lade_bucket_schluessel(pfad: str) -> Tuple[str, Dict[int, np.ndarray]]:
+        """
+        Lädt eine Bucket-Schlüsseldatei.
+
+        Returns:
+            Tuple[str, Dict[int, np.ndarray]]: Wurzelprüfsumme des zugehörigen Digests und die Schlüssel-Hashes je Bucket.
+
+        Raises:
+            CipherCoreDateiLadeFehler: Wenn die Datei fehlt oder unlesbar ist.
+        """
+        try:
+            with np.load(pfad, allow_pickle=False) as daten:
+                wurzel, buckets, anzahlen, hashes = str(daten["wurzel"]), daten["buckets"], daten["anzahlen"], daten["hashes"]
+        except FileNotFoundError as e:
+            raise CipherCoreDateiLadeFehler(f"Bucket-Schlüsseldatei nicht gefunden: {pfad}") from e
+        except (OSError, ValueError, KeyError) as e:
+            raise CipherCoreDateiLadeFehler(f"Bucket-Schlüsseldatei '{os.path.basename(pfad)}' ist ungültig: {e}") from e
+        return wurzel, dict(zip(buckets.tolist(), np.split(hashes, np.cumsum(anzahlen)[:-1])))
+
+
+    def pruefe_bucket_schluessel(self, bucket_hashes: Dict[int, np.ndarray]) -> None:
+        """
+        Prüft exportierte Bucket-Schlüssel gegen die Blattprüfsummen dieses Digests.
+
+        Raises:
+            CipherCoreDatenValidierungsFehler: Wenn ein Bucket nicht zur Prüfsumme passt (z.B. Datei seit dem Digest geändert).
+        """
+        for bucket, teil in bucket_hashes.items():
+            if not 0 <= bucket < self.anzahl_buckets or self._pruefsumme(np.asarray(teil, dtype='<u8').tobytes()) != self.ebenen[0][bucket]:
+                raise CipherCoreDatenValidierungsFehler(f"Bucket-Schlüssel von '{self.dateiname}' passen nicht zum Digest (Bucket {bucket}).")
+
+
+    @classmethod
+    def aus_datei(cls, datei_pfad: str, daten_lader: 'DatenLader', geheimnis: str, spalte: str = 'Name', blatt_name: Optional[str] = None,
+                  anzahl_buckets: int = DIGEST_BUCKETS_STANDARD,
+                  abbruch_token: Optional[VergleichsAbbruchToken] = None) -> Tuple['MerkleDigest', np.ndarray]:
+        """
+        Liest eine Datei blockweise und erstellt ihren Digest.
+
+        Args:
+            datei_pfad (str): Der Pfad zur Datei.
+            daten_lader (DatenLader): Lader für Pfadprüfung, blockweises Lesen und Validierung.
+            geheimnis (str): Gemeinsames Geheimnis beider Standorte, aus dem der Hash-Schlüssel abgeleitet wird.
+            spalte (str, optional): Die Vergleichsspalte. Standard ist 'Name'.
+            blatt_name (Optional[str]): Arbeitsblatt, falls Excel (optional).
+            anzahl_buckets (int): Anzahl der Buckets (optional).
+            abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch (optional).
+
+        Returns:
+            Tuple[MerkleDigest, np.ndarray]: Der Digest und die sortierten, eindeutigen Schlüssel-Hashes (für den Bucket-Export).
+
+        Raises:
+            CipherCoreDateiFehler: Wenn die Datei nicht sicher ist oder nicht gelesen werden kann.
+            CipherCoreDatenValidierungsFehler: Wenn die Daten ungültig sind oder die Vergleichsspalte fehlt.
+            CipherCoreAbbruchFehler: Wenn das Lesen abgebrochen wurde.
+            ValueError: Wenn das Geheimnis fehlt oder zu kurz ist.
+        """
+        digest = cls(anzahl_buckets)
+        hash_schluessel = cls.hash_schluessel(geheimnis)
+        hashes, zustand = DateiVergleicher.lese_schluessel_hashes(datei_pfad, spalte, daten_lader, abbruch_token, blatt_name, hash_schluessel)
+        digest.dateiname, digest.spalte = os.path.basename(datei_pfad), str(spalte)
+        digest.schluessel_kennung = cls.kennung(geheimnis)
+        digest.zeilen, digest.hat_alter = zustand["zeilen"], zustand["hat_alter"]
+        digest.alter_summe, digest.alter_anzahl = zustand["alter_summe"], zustand["alter_anzahl"]
+        digest.doppelte_werte = zustand["doppelte_werte"]
+        digest.baue(hashes)
+        return digest, hashes
+
+
+
+def vergleiche_digests(digest1: MerkleDigest, digest2: MerkleDigest,
+                       bucket_schluessel: Optional[List[Tuple[str, Dict[int, np.ndarray]]]] = None) -> Tuple[VergleichsErgebnis, List[int]]:
+    """
+    Vergleicht zwei Merkle-Digests. Übereinstimmende Buckets zählen vollständig als gemeinsame Werte; sind die
+    Bucket-Schlüssel beider Seiten für alle abweichenden Buckets vorhanden, wird deren Schnittmenge exakt gebildet.
+    Andernfalls bleibt die Anzahl übereinstimmender Werte offen (None) und die abweichenden Buckets werden zurückgegeben,
+    damit beide Standorte deren Schlüssel exportieren können.
+
+    Args:
+        digest1 (MerkleDigest): Digest von Datei 1 (Benutzereingabe).
+        digest2 (MerkleDigest): Digest von Datei 2 (Hauptliste).
+        bucket_schluessel (Optional[List[Tuple[str, Dict[int, np.ndarray]]]]): Geladene Bucket-Schlüsseldateien
+            (Wurzelprüfsumme, Hashes je Bucket) in beliebiger Reihenfolge (optional).
+
+    Returns:
+        Tuple[VergleichsErgebnis, List[int]]: Das Vergleichsergebnis und die abweichenden Buckets.
+
+    Raises:
+        CipherCoreDatenValidierungsFehler: Wenn die Digests oder Bucket-Schlüssel nicht zueinander passen.
+    """
+    unterschiedliche = digest1.unterschiedliche_buckets(digest2)
+    anzahl_gleiche_werte: Optional[int] = None
+    schluessel_je_digest: Dict[str, Dict[int, np.ndarray]] = {}
+    for wurzel, bucket_hashes in bucket_schluessel or []:
+        if wurzel not in (digest1.wurzel, digest2.wurzel):
+            raise CipherCoreDatenValidierungsFehler("Bucket-Schlüsseldatei gehört zu keinem der beiden Digests.")
+        schluessel_je_digest.setdefault(wurzel, {}).update(bucket_hashes)
+    seiten = [schluessel_je_digest.get(digest.wurzel, {}) for digest in (digest1, digest2)]
+    if all(set(unterschiedliche) <= set(seite) for seite in seiten):
+        for digest, seite in zip((digest1, digest2), seiten):
+            digest.pruefe_bucket_schluessel({bucket: seite[bucket] for bucket in unterschiedliche})
+        anzahl_gleiche_werte = sum(digest1.anzahl_je_bucket) - sum(digest1.anzahl_je_bucket[bucket] for bucket in unterschiedliche)
+        anzahl_gleiche_werte += sum(len(np.intersect1d(seiten[0][bucket], seiten[1][bucket], assume_unique=True)) for bucket in unterschiedliche)
+    vergleichs_ergebnisse = DateiVergleicher._ergebnis_aus_zustaenden(vars(digest1), vars(digest2), anzahl_gleiche_werte, VERFAHREN_DIGEST)
+    logger.info(f"Digest-Vergleich: {len(unterschiedliche)} von {digest1.anzahl_buckets} Buckets abweichend"
+                f"{'' if anzahl_gleiche_werte is not None else ', Bucket-Schlüssel für den exakten Vergleich erforderlich'}.")
+    return vergleichs_ergebnisse, unterschiedliche
+
+
+
+# --- DiagrammGenerator Klasse (CipherCore Standard: Klare Visualisierung) ---
+class DiagrammGenerator:
+    """
+    Modul zum Erstellen von Diagrammen zur Visualisierung von Vergleichsergebnissen.
+    Unterstützt verschiedene Diagrammtypen und generiert Base64-kodierte PNG-Bilder.
+    Fokus auf klare und verständliche Diagramme.
+    """
+
+    def erstelle_diagramm(self, vergleichs_ergebnisse: VergleichsErgebnis, diagramm_typ: str = DIAGRAMM_TYP_BALKEN, ist_pro_version: bool = False) -> str:
+        """
+        Erstellt ein Diagramm zur Visualisierung der Vergleichsergebnisse.
+        Verwendet die Rohwerte direkt; Anteile werden als Prozentwerte (0-100) dargestellt.
+
+        Args:
+            vergleichs_ergebnisse (VergleichsErgebnis): Die Vergleichsergebnisse.
+            diagramm_typ (str): Der gewünschte Diagrammtyp ('balken' oder 'kreis').
+            ist_pro_version (bool): Gibt an, ob die Pro-Version aktiv ist.
+
+        Returns:
+            str: Base64-kodierte PNG-Bilddaten des Diagramms.
+
+        Raises:
+            CipherCoreUngültigerDiagrammTypFehler: Wenn ein ungültiger Diagrammtyp angegeben wird.
+        """
+        logger.info(f"Starte Diagrammerstellung vom Typ '{diagramm_typ}'...")
+
+        if diagramm_typ not in UNTERSTUETZTE_DIAGRAMM_TYPEN:
+            logger.error(f"Ungültiger Diagrammtyp angefordert: '{diagramm_typ}'. Unterstützte Typen: {', '.join(UNTERSTUETZTE_DIAGRAMM_TYPEN)}.")
+            raise CipherCoreUngültigerDiagrammTypFehler(
+                f"Ungültiger Diagrammtyp: '{diagramm_typ}'. Unterstützte Typen: {', '.join(UNTERSTUETZTE_DIAGRAMM_TYPEN)}.")
+
+        metriken = vergleichs_ergebnisse.metriken()
+        metrik_bezeichnungen = list(metriken.keys())
+        werte = [float(wert) * 100 if metrik in METRIK_PROZENT_METRIKEN else float(wert) for metrik, wert in metriken.items()]
+
+        plt.figure(figsize=(12, 7))
+
+        if diagramm_typ == DIAGRAMM_TYP_BALKEN:
+            plt.bar(metrik_bezeichnungen, werte,
+                    color=['skyblue', 'lightcoral', 'lightgreen', 'lightsalmon', 'lightseagreen', 'lightgoldenrodyellow'])
+            plt.ylabel('Anzahl / Prozent / Durchschnitt')
+        elif diagramm_typ == DIAGRAMM_TYP_KREIS and ist_pro_version: # Kreisdiagramm nur in Pro Version
+            plt.pie(werte, labels=metrik_bezeichnungen, autopct='%1.1f%%', startangle=90)
+            plt.ylabel('')
+        elif diagramm_typ == DIAGRAMM_TYP_KREIS and not ist_pro_version: # Fallback auf Balken wenn Kreisdiagramm in Testversion gewählt
+            plt.bar(metrik_bezeichnungen, werte,
+                    color=['skyblue', 'lightcoral', 'lightgreen', 'lightsalmon', 'lightseagreen', 'lightgoldenrodyellow'])
+            plt.ylabel('Anzahl / Prozent / Durchschnitt')
+            logger.warning(
+                "Kreisdiagramm-Typ ist in der Testversion nicht verfügbar. Es wird stattdessen ein Balkendiagramm erstellt.")
+            diagramm_typ = DIAGRAMM_TYP_BALKEN # Fallback auf Balkendiagramm für Testversion
+
+        plt.title('Vergleich der Dateien')
+        plt.xticks(rotation=45, ha='right')
+        plt.tight_layout()
+        bild_daten = self._als_base64_png()
+
+        logger.debug(f"Diagramm vom Typ '{diagramm_typ}' als Base64-String erzeugt.")
+        logger.info("Diagrammerstellung abgeschlossen.")
+        return bild_daten
+
+
+    def erstelle_upset_diagramm(self, mehrfach_ergebnis: MehrfachVergleichsErgebnis, max_schnittmengen: int = UPSET_MAX_SCHNITTMENGEN) -> str:
+        """
+        Erstellt ein UpSet-Diagramm des N-Wege-Vergleichs: Balken für die größten exklusiven Schnittmengen und
+        darunter eine Punktmatrix, welche Dateien zur jeweiligen Schnittmenge gehören.
+
+        Args:
+            mehrfach_ergebnis (MehrfachVergleichsErgebnis): Das Ergebnis des N-Wege-Vergleichs.
+            max_schnittmengen (int): Anzahl der dargestellten Schnittmengen (optional).
+
+        Returns:
+            str: Base64-kodierte PNG-Bilddaten des Diagramms.
+        """
+        logger.info(f"Starte Diagrammerstellung vom Typ '{DIAGRAMM_TYP_UPSET}'...")
+        schnittmengen = sorted(mehrfach_ergebnis.schnittmengen.items(), key=lambda eintrag: -eintrag[1])[:max_schnittmengen]
+        anzahl_dateien = len(mehrfach_ergebnis.dateinamen)
+        figur, (balken_achse, matrix_achse) = plt.subplots(2, 1, figsize=(12, 7), sharex=True,
+                                                           gridspec_kw={'height_ratios': [3, max(1, min(anzahl_dateien, 16) / 4)]})
+        positionen = range(len(schnittmengen))
+        balken_achse.bar(positionen, [anzahl for _, anzahl in schnittmengen], color='skyblue')
+        balken_achse.set_ylabel('Anzahl Schlüssel')
+        balken_achse.set_title('Schnittmengen der Dateien (UpSet)')
+        for position, (maske, _) in enumerate(schnittmengen):
+            mitglieder = mehrfach_ergebnis.mitglieder(maske)
+            matrix_achse.scatter([position] * anzahl_dateien, range(anzahl_dateien), color='lightgray', s=30)
+            matrix_achse.scatter([position] * len(mitglieder), mitglieder, color='black', s=30)
+            matrix_achse.plot([position, position], [min(mitglieder), max(mitglieder)], color='black', linewidth=1.5)
+        matrix_achse.set_yticks(range(anzahl_dateien))
+        matrix_achse.set_yticklabels(mehrfach_ergebnis.dateinamen, fontsize=8)
+        matrix_achse.set_xticks([])
+        matrix_achse.invert_yaxis()
+        plt.tight_layout()
+        bild_daten = self._als_base64_png()
+        logger.info("Diagrammerstellung abgeschlossen.")
+        return bild_daten
+
+
+    @staticmethod
+    def _als_base64_png() -> str:
+        """
+        Speichert die aktuelle Matplotlib-Abbildung als Base64-kodiertes PNG und schließt sie.
+
+        Raises:
+            CipherCoreDatenFehler: Wenn das Bild nicht erstellt werden kann.
+        """
+        try:
+            buffer = BytesIO()
+            plt.savefig(buffer, format='png')
+            buffer.seek(0)
+            return base64.b64encode(buffer.read()).decode('utf-8')
+        except Exception as e:
+            logger.error(f"Fehler beim Erstellen des Diagrammbildes: {e}")
+            raise CipherCoreDatenFehler(f"Fehler beim Erstellen des Diagrammbildes: {e}") from e
+        finally:
+            plt.close()
+
+
+
+# --- VerlaufsAuswertung Klasse (CipherCore Standard: Vorberechnete Trendauswertung statt Verlaufs-Scan) ---
+class VerlaufsAuswertung:
+    """
+    Führt Zusammenfassungstabellen des Verlaufs in einer SQLite-Datenbank, die bei jedem gespeicherten Lauf inkrementell
+    aktualisiert werden: Rollups je Tag, Woche und Monat und Dateipaar (Übereinstimmungen, Überlappungsanteil, Durchschnittsalter),
+    ein laufender Zustand je Dateipaar (Mittelwert und Streuung des Überlappungsanteils) und die dabei erkannten Auffälligkeiten.
+    Abfragen lesen ausschließlich diese Tabellen, nie den Rohverlauf.
+    """
+
+    def __init__(self, datenbank_pfad: str):
+        """
+        Initialisiert die Verlaufsauswertung und legt die Zusammenfassungstabellen an, falls nötig.
+
+        Args:
+            datenbank_pfad (str): Pfad der SQLite-Datenbank (kann die Datenbank des SQLiteDataManager sein).
+
+        Raises:
+            ValueError: Wenn der Pfad ungültig ist.
+            CipherCoreDatenbankSchemaFehler: Wenn die Tabellen nicht angelegt werden können.
+        """
+        if not datenbank_pfad or not isinstance(datenbank_pfad, str):
+            raise ValueError("Datenbankpfad der Verlaufsauswertung muss ein gültiger Pfad sein.")
+        self.datenbank_pfad = datenbank_pfad
+        self.ist_neu = False # True, wenn die Tabellen gerade erst angelegt wurden (Verlauf muss nachgetragen werden)
+        self.erstelle_schema()
+
+
+    def erstelle_schema(self) -> None:
+        """
+        Erstellt die Tabellen verlauf_status, verlauf_rollup, verlauf_paar und verlauf_anomalie, falls nicht vorhanden.
+        Tabellen einer älteren Schema-Version werden verworfen und beim nächsten Nachtragen aus dem Verlauf neu aufgebaut.
+
+        Raises:
+            CipherCoreDatenbankSchemaFehler: Bei Datenbankfehlern.
+        """
+        verbindung = None
+        try:
+            verbindung = sqlite3.connect(self.datenbank_pfad)
+            zeiger = verbindung.cursor()
+            zeiger.execute("CREATE TABLE IF NOT EXISTS verlauf_status (schluessel TEXT PRIMARY KEY, wert TEXT NOT NULL)")
+            version = zeiger.execute("SELECT wert FROM verlauf_status WHERE schluessel = 'version'").fetchone()
+            if version != (str(VERLAUF_AUSWERTUNG_VERSION),):
+                for tabelle in ('verlauf_rollup', 'verlauf_paar', 'verlauf_anomalie'):
+                    zeiger.execute(f"DROP TABLE IF EXISTS {tabelle}") # Feste Tabellennamen
+                zeiger.execute("DELETE FROM verlauf_status")
+                zeiger.execute("INSERT INTO verlauf_status VALUES ('version', ?)", (str(VERLAUF_AUSWERTUNG_VERSION),))
+            zeiger.execute("""
+                CREATE TABLE IF NOT EXISTS verlauf_rollup (
+                    zeitraum TEXT NOT NULL,
+                    periode TEXT NOT NULL,
+                    datei1_name TEXT NOT NULL,
+                    datei2_name TEXT NOT NULL,
+                    anteil_basis TEXT NOT NULL,
+                    laeufe INTEGER NOT NULL,
+                    summe_gleiche REAL NOT NULL, anzahl_gleiche INTEGER NOT NULL,
+                    summe_anteil REAL NOT NULL, anzahl_anteil INTEGER NOT NULL, min_anteil REAL, max_anteil REAL,
+                    summe_alter1 REAL NOT NULL, anzahl_alter1 INTEGER NOT NULL,
+                    summe_alter2 REAL NOT NULL, anzahl_alter2 INTEGER NOT NULL,
+                    PRIMARY KEY (zeitraum, periode, datei1_name, datei2_name, anteil_basis)
+                )
+            """) # Summen und Anzahlen statt Mittelwerten, damit jeder Lauf mit einem Upsert eingerechnet werden kann
+            zeiger.execute("""
+                CREATE TABLE IF NOT EXISTS verlauf_paar (
+                    datei1_name TEXT NOT NULL,
+                    datei2_name TEXT NOT NULL,
+                    anteil_basis TEXT NOT NULL,
+                    laeufe INTEGER NOT NULL,
+                    erster_zeitpunkt TEXT NOT NULL,
+                    letzter_zeitpunkt TEXT NOT NULL,
+                    letzter_anteil REAL,
+                    anzahl_anteil INTEGER NOT NULL,
+                    mittel_anteil REAL NOT NULL,
+                    m2_anteil REAL NOT NULL,
+                    PRIMARY KEY (datei1_name, datei2_name, anteil_basis)
+                )
+            """) # Laufender Mittelwert und Quadratsumme (Welford) des Überlappungsanteils je Dateipaar und Nenner
+            zeiger.execute("""
+                CREATE TABLE IF NOT EXISTS verlauf_anomalie (
+                    anomalie_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    vergleichszeitpunkt TEXT NOT NULL,
+                    datei1_name TEXT NOT NULL,
+                    datei2_name TEXT NOT NULL,
+                    anteil REAL NOT NULL,
+                    erwartet REAL NOT NULL,
+                    streuung REAL NOT NULL,
+                    z_wert REAL NOT NULL
+                )
+            """)
+            zeiger.execute("CREATE INDEX IF NOT EXISTS idx_verlauf_anomalie_zeitpunkt ON verlauf_anomalie (vergleichszeitpunkt)")
+            self.ist_neu = zeiger.execute("SELECT 1 FROM verlauf_status WHERE schluessel = 'nachgetragen'").fetchone() is None
+            verbindung.commit()
+            logger.debug(f"Tabellen der Verlaufsauswertung in '{self.datenbank_pfad}' erstellt oder geprüft.")
+        except sqlite3.Error as e:
+            logger.error(f"Fehler beim Erstellen der Tabellen der Verlaufsauswertung: {e}")
+            raise CipherCoreDatenbankSchemaFehler(f"Fehler beim Erstellen der Tabellen der Verlaufsauswertung: {e}") from e
+        finally:
+            if verbindung:
+                verbindung.close()
+
+
+    @staticmethod
+    def ueberlappungs_anteil(metriken: Dict[str, Union[int, float, str]]) -> Tuple[Optional[float], str]:
+        """
+        Berechnet den Überlappungsanteil eines Laufs: übereinstimmende Werte je eindeutigem Wert von Datei 1
+        (ersatzweise Schätzwerte bzw. die Zeilenanzahl, wenn keine eindeutigen Werte gespeichert sind).
+
+        Args:
+            metriken (Dict[str, Union[int, float, str]]): Metrikname -> Rohwert.
+
+        Returns:
+            Tuple[Optional[float], str]: Anteil zwischen 0 und 1 (None, wenn die Metriken fehlen) und die Kennung des
+                                         verwendeten Nenners aus VERLAUF_ANTEIL_BASEN ('' ohne Anteil).
+        """
+        gleiche = VerlaufsAuswertung._zahl(metriken, METRIK_GLEICHE_NAMEN, METRIK_GLEICHE_NAMEN_SCHAETZUNG)
+        for metrik, basis in VERLAUF_ANTEIL_BASEN.items():
+            nenner = VerlaufsAuswertung._zahl(metriken, metrik)
+            if nenner is not None:
+                if gleiche is None or not nenner:
+                    break
+                return min(gleiche / nenner, 1.0), basis
+        return None, ''
+
+
+    @staticmethod
+    def _zahl(metriken: Dict[str, Union[int, float, str]], *namen: str) -> Optional[float]:
+        """
+        Liefert den ersten vorhandenen Zahlenwert der angegebenen Metriken (Textwerte älterer Datenbanken werden übersprungen).
+
+        Returns:
+            Optional[float]: Der Wert oder None.
+        """
+        for name in namen:
+            wert = metriken.get(name)
+            if isinstance(wert, (int, float)) and not isinstance(wert, bool):
+                return float(wert)
+        return None
+
+
+    def aktualisiere(self, metriken: Dict[str, Union[int, float, str]], dateiname_datei1: str, dateiname_datei2: str,
+                     vergleichszeitpunkt: datetime.datetime, verbindung: Optional[sqlite3.Connection] = None) -> Optional[Dict]:
+        """
+        Rechnet einen Lauf in die Rollups und den Zustand seines Dateipaars ein (eine Transaktion).
+        Weicht der Überlappungsanteil um mindestens VERLAUF_ANOMALIE_Z Standardabweichungen vom bisherigen Mittel des Paars
+        mit demselben Nenner ab (ab VERLAUF_ANOMALIE_MIN_LAEUFE Läufen), wird der Lauf als Auffälligkeit gespeichert.
+
+        Args:
+            metriken (Dict[str, Union[int, float, str]]): Metrikname -> Rohwert des Laufs.
+            dateiname_datei1 (str): Der Dateiname der ersten Datei.
+            dateiname_datei2 (str): Der Dateiname der zweiten Datei.
+            vergleichszeitpunkt (datetime.datetime): Zeitpunkt des Laufs in UTC (ohne Zeitzone; Perioden in UTC).
+            verbindung (Optional[sqlite3.Connection]): Offene Verbindung zur Datenbank der Auswertung, deren Transaktion
+                                                      der Aufrufer abschließt (optional, z.B. zusammen mit dem Verlaufseintrag).
+
+        Returns:
+            Optional[Dict]: Die erkannte Auffälligkeit (siehe anomalien()) oder None.
+
+        Raises:
+            CipherCoreDatenbankSpeicherFehler: Bei Datenbankfehlern.
+        """
+        eigene_verbindung = None
+        try:
+            if verbindung is None:
+                verbindung = eigene_verbindung = sqlite3.connect(self.datenbank_pfad)
+            anomalie = self._rechne_ein(verbindung.cursor(), metriken, dateiname_datei1, dateiname_datei2, vergleichszeitpunkt)
+            if eigene_verbindung:
+                eigene_verbindung.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Fehler beim Aktualisieren der Verlaufsauswertung: {e}")
+            raise CipherCoreDatenbankSpeicherFehler(f"Fehler beim Aktualisieren der Verlaufsauswertung: {e}") from e
+        finally:
+            if eigene_verbindung:
+                eigene_verbindung.close()
+        if anomalie:
+            logger.warning(f"Auffälliger Überlappungsanteil {anomalie['anteil']:.2%} für '{dateiname_datei1}' / '{dateiname_datei2}' "
+                           f"(bisher {anomalie['erwartet']:.2%}, z = {anomalie['z_wert']:.1f}).")
+        return anomalie
+
+
+    def trage_nach(self, eintraege: Iterator[Tuple[Dict, str, str, datetime.datetime]]) -> int:
+        """
+        Baut die Zusammenfassungstabellen in einer Transaktion aus dem bestehenden Verlauf auf und setzt danach die
+        Markierung 'nachgetragen'. Bricht das Nachtragen ab, bleibt die Markierung aus und der nächste Versuch beginnt
+        von vorn; hat ein anderer Prozess inzwischen nachgetragen, wird nichts geändert.
+
+        Args:
+            eintraege (Iterator[Tuple[Dict, str, str, datetime.datetime]]): Läufe in chronologischer Reihenfolge als
+                (Metriken, Dateiname Datei 1, Dateiname Datei 2, Zeitpunkt in UTC ohne Zeitzone).
+
+        Returns:
+            int: Anzahl der nachgetragenen Läufe.
+
+        Raises:
+            CipherCoreDatenbankSpeicherFehler: Bei Datenbankfehlern.
+        """
+        verbindung = None
+        anzahl = 0
+        try:
+            verbindung = sqlite3.connect(self.datenbank_pfad, isolation_level=None) # Transaktion wird explizit gesteuert
+            zeiger = verbindung.cursor()
+            zeiger.execute("BEGIN IMMEDIATE") # Schreibsperre vor der Prüfung: nur ein Prozess trägt nach
+            if zeiger.execute("SELECT 1 FROM verlauf_status WHERE schluessel = 'nachgetragen'").fetchone() is None:
+                for tabelle in ('verlauf_rollup', 'verlauf_paar', 'verlauf_anomalie'):
+                    zeiger.execute(f"DELETE FROM {tabelle}") # Feste Tabellennamen
+                for metriken, dateiname_datei1, dateiname_datei2, zeitpunkt in eintraege:
+                    self._rechne_ein(zeiger, metriken, dateiname_datei1, dateiname_datei2, zeitpunkt)
+                    anzahl += 1
+                zeiger.execute("INSERT INTO verlauf_status VALUES ('nachgetragen', ?)",
+                               (datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m-%d %H:%M:%S'),))
+            zeiger.execute("COMMIT")
+        except sqlite3.Error as e:
+            logger.error(f"Fehler beim Nachtragen der Verlaufsauswertung: {e}")
+            raise CipherCoreDatenbankSpeicherFehler(f"Fehler beim Nachtragen der Verlaufsauswertung: {e}") from e
+        finally:
+            if verbindung:
+                verbindung.close() # Ohne COMMIT wird die Transaktion verworfen
+        self.ist_neu = False
+        return anzahl
+
+
+    def _rechne_ein(self, zeiger: sqlite3.Cursor, metriken: Dict[str, Union[int, float, str]], dateiname_datei1: str,
+                    dateiname_datei2: str, vergleichszeitpunkt: datetime.datetime) -> Optional[Dict]:
+        """
+        Rechnet einen Lauf innerhalb der laufenden Transaktion ein (siehe aktualisiere).
+
+        Returns:
+            Optional[Dict]: Die erkannte Auffälligkeit oder None.
+        """
+        anteil, basis = self.ueberlappungs_anteil(metriken)
+        gleiche = self._zahl(metriken, METRIK_GLEICHE_NAMEN, METRIK_GLEICHE_NAMEN_SCHAETZUNG)
+        alter1 = self._zahl(metriken, METRIK_DURCHSCHNITTSALTER_DATEI1)
+        alter2 = self._zahl(metriken, METRIK_DURCHSCHNITTSALTER_DATEI2)
+        zeitpunkt_text = vergleichszeitpunkt.strftime('%Y-%m-%d %H:%M:%S')
+        paar = (dateiname_datei1, dateiname_datei2, basis) # Anteile mit verschiedenen Nennern bilden getrennte Reihen
+        sql_rollup = """
+            INSERT INTO verlauf_rollup VALUES (?, ?, ?, ?, ?, 1, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (zeitraum, periode, datei1_name, datei2_name, anteil_basis) DO UPDATE SET
+                laeufe = laeufe + 1,
+                summe_gleiche = summe_gleiche + excluded.summe_gleiche, anzahl_gleiche = anzahl_gleiche + excluded.anzahl_gleiche,
+                summe_anteil = summe_anteil + excluded.summe_anteil, anzahl_anteil = anzahl_anteil + excluded.anzahl_anteil,
+                min_anteil = MIN(COALESCE(min_anteil, excluded.min_anteil), COALESCE(excluded.min_anteil, min_anteil)),
+                max_anteil = MAX(COALESCE(max_anteil, excluded.max_anteil), COALESCE(excluded.max_anteil, max_anteil)),
+                summe_alter1 = summe_alter1 + excluded.summe_alter1, anzahl_alter1 = anzahl_alter1 + excluded.anzahl_alter1,
+                summe_alter2 = summe_alter2 + excluded.summe_alter2, anzahl_alter2 = anzahl_alter2 + excluded.anzahl_alter2
+        """ # Fehlende Werte zählen mit Summe 0 und Anzahl 0, damit die Mittelwerte nur vorhandene Werte berücksichtigen
+        werte = (gleiche or 0.0, int(gleiche is not None), anteil or 0.0, int(anteil is not None), anteil, anteil,
+                 alter1 or 0.0, int(alter1 is not None), alter2 or 0.0, int(alter2 is not None))
+        anomalie = None
+        for zeitraum in VERLAUF_ROLLUP_ZEITRAEUME:
+            zeiger.execute(sql_rollup, (zeitraum, vergleichszeitpunkt.strftime(VERLAUF_ZEITRAEUME[zeitraum])) + paar + werte)
+
+        zustand = zeiger.execute("SELECT anzahl_anteil, mittel_anteil, m2_anteil FROM verlauf_paar WHERE datei1_name = ? AND datei2_name = ? AND anteil_basis = ?",
+                                 paar).fetchone()
+        anzahl, mittel, m2 = zustand if zustand else (0, 0.0, 0.0)
+        if anteil is not None:
+            if anzahl >= VERLAUF_ANOMALIE_MIN_LAEUFE: # Gegen den bisherigen Verlauf prüfen, bevor der Lauf eingerechnet wird
+                streuung = max((m2 / (anzahl - 1)) ** 0.5, VERLAUF_ANOMALIE_MIN_STREUUNG)
+                z_wert = (anteil - mittel) / streuung
+                if abs(z_wert) >= VERLAUF_ANOMALIE_Z:
+                    anomalie = {"vergleichszeitpunkt": zeitpunkt_text, "datei1_name": dateiname_datei1, "datei2_name": dateiname_datei2,
+                                "anteil": anteil, "erwartet": mittel, "streuung": streuung, "z_wert": z_wert}
+                    zeiger.execute("""
+                        INSERT INTO verlauf_anomalie (vergleichszeitpunkt, datei1_name, datei2_name, anteil, erwartet, streuung, z_wert)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """, (zeitpunkt_text, dateiname_datei1, dateiname_datei2, anteil, mittel, streuung, z_wert))
+            anzahl += 1
+            delta = anteil - mittel
+            mittel += delta / anzahl
+            m2 += delta * (anteil - mittel)
+        zeiger.execute("""
+            INSERT INTO verlauf_paar VALUES (?, ?, ?, 1, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (datei1_name, datei2_name, anteil_basis) DO UPDATE SET
+                laeufe = laeufe + 1, letzter_zeitpunkt = excluded.letzter_zeitpunkt,
+                letzter_anteil = COALESCE(excluded.letzter_anteil, letzter_anteil),
+                anzahl_anteil = excluded.anzahl_anteil, mittel_anteil = excluded.mittel_anteil, m2_anteil = excluded.m2_anteil
+        """, paar + (zeitpunkt_text, zeitpunkt_text, anteil, anzahl, mittel, m2))
+        return anomalie
+
+
+    def _abfrage(self, sql: str, parameter: Tuple = ()) -> List[Dict]:
+        """
+        Interne Hilfsfunktion: führt eine Abfrage auf den Zusammenfassungstabellen aus und liefert die Zeilen als Dictionaries.
+
+        Raises:
+            CipherCoreDatenbankLadeFehler: Bei Datenbankfehlern.
+        """
+        verbindung = None
+        try:
+            verbindung = sqlite3.connect(self.datenbank_pfad)
+            zeiger = verbindung.execute(sql, parameter)
+            spalten_namen = [beschreibung[0] for beschreibung in zeiger.description]
+            return [dict(zip(spalten_namen, zeile)) for zeile in zeiger.fetchall()]
+        except sqlite3.Error as e:
+            logger.error(f"Fehler beim Abfragen der Verlaufsauswertung: {e}")
+            raise CipherCoreDatenbankLadeFehler(f"Fehler beim Abfragen der Verlaufsauswertung: {e}") from e
+        finally:
+            if verbindung:
+                verbindung.close()
+
+
+    @staticmethod
+    def _pruefe_zeitraum(zeitraum: str) -> None:
+        """
+        Prüft einen Rollup-Zeitraum gegen VERLAUF_ROLLUP_ZEITRAEUME.
+
+        Raises:
+            ValueError: Wenn der Zeitraum nicht unterstützt wird.
+        """
+        if zeitraum not in VERLAUF_ROLLUP_ZEITRAEUME:
+            raise ValueError(f"Ungültiger Zeitraum: '{zeitraum}'. Erlaubt: {', '.join(VERLAUF_ROLLUP_ZEITRAEUME)}.")
+
+
+    def rollups(self, zeitraum: str = 'tag', datei1_name: Optional[str] = None, datei2_name: Optional[str] = None,
+                von_periode: Optional[str] = None) -> List[Dict]:
+        """
+        Liefert die Rollups eines Zeitraums, sortiert nach Periode und Dateipaar.
+
+        Args:
+            zeitraum (str): 'tag', 'woche' oder 'monat'.
+            datei1_name (Optional[str]): Nur dieses Dateipaar-Mitglied Datei 1 (optional).
+            datei2_name (Optional[str]): Nur diese Hauptliste (optional).
+            von_periode (Optional[str]): Erste Periode, z.B. '2026-10' oder '2026-W40' (optional).
+
+        Returns:
+            List[Dict]: Je Periode, Dateipaar und Nenner des Anteils 'periode', 'datei1_name', 'datei2_name', 'anteil_basis',
+                        'laeufe', 'mittel_gleiche', 'mittel_anteil', 'min_anteil', 'max_anteil', 'mittel_alter_datei1' und
+                        'mittel_alter_datei2' (None ohne Werte).
+        """
+        self._pruefe_zeitraum(zeitraum)
+        bedingungen, parameter = ["zeitraum = ?"], [zeitraum]
+        for spalte, wert, vergleich in (("datei1_name", datei1_name, "="), ("datei2_name", datei2_name, "="), ("periode", von_periode, ">=")):
+            if wert is not None:
+                bedingungen.append(f"{spalte} {vergleich} ?")
+                parameter.append(wert)
+        return self._abfrage(f"""
+            SELECT periode, datei1_name, datei2_name, anteil_basis, laeufe,
+                   summe_gleiche / NULLIF(anzahl_gleiche, 0) AS mittel_gleiche,
+                   summe_anteil / NULLIF(anzahl_anteil, 0) AS mittel_anteil, min_anteil, max_anteil,
+                   summe_alter1 / NULLIF(anzahl_alter1, 0) AS mittel_alter_datei1,
+                   summe_alter2 / NULLIF(anzahl_alter2, 0) AS mittel_alter_datei2
+            FROM verlauf_rollup WHERE {' AND '.join(bedingungen)}
+            ORDER BY periode, datei1_name, datei2_name, anteil_basis
+        """, tuple(parameter)) # Spalten und Vergleiche sind fest, Werte werden als Parameter übergeben
+
+
+    def top_aenderungen(self, anzahl: int = VERLAUF_TOP_STANDARD, zeitraum: str = 'woche') -> List[Dict]:
+        """
+        Liefert die Dateipaare mit der größten Änderung des mittleren Überlappungsanteils zwischen ihrer jüngsten
+        und vorherigen Periode (Betrag, absteigend). Verglichen werden nur Perioden mit demselben Nenner des Anteils;
+        Paare mit nur einer solchen Periode entfallen.
+
+        Args:
+            anzahl (int): Maximale Anzahl der Dateipaare.
+            zeitraum (str): 'tag', 'woche' oder 'monat'.
+
+        Returns:
+            List[Dict]: 'datei1_name', 'datei2_name', 'anteil_basis', 'vorherige_periode', 'periode', 'vorheriger_anteil',
+                        'anteil', 'aenderung', 'vorherige_gleiche' und 'gleiche'.
+        """
+        self._pruefe_zeitraum(zeitraum)
+        return self._abfrage("""
+            WITH perioden AS (
+                SELECT datei1_name, datei2_name, anteil_basis, periode,
+                       summe_anteil / NULLIF(anzahl_anteil, 0) AS anteil,
+                       summe_gleiche / NULLIF(anzahl_gleiche, 0) AS gleiche,
+                       ROW_NUMBER() OVER (PARTITION BY datei1_name, datei2_name, anteil_basis ORDER BY periode DESC) AS rang
+                FROM verlauf_rollup WHERE zeitraum = ? AND anzahl_anteil > 0
+            )
+            SELECT jetzt.datei1_name, jetzt.datei2_name, jetzt.anteil_basis, vorher.periode AS vorherige_periode, jetzt.periode,
+                   vorher.anteil AS vorheriger_anteil, jetzt.anteil, jetzt.anteil - vorher.anteil AS aenderung,
+                   vorher.gleiche AS vorherige_gleiche, jetzt.gleiche
+            FROM perioden AS jetzt
+            JOIN perioden AS vorher
+              ON vorher.datei1_name = jetzt.datei1_name AND vorher.datei2_name = jetzt.datei2_name
+             AND vorher.anteil_basis = jetzt.anteil_basis AND vorher.rang = 2
+            WHERE jetzt.rang = 1
+            ORDER BY ABS(jetzt.anteil - vorher.anteil) DESC, jetzt.datei1_name, jetzt.datei2_name
+            LIMIT ?
+        """, (zeitraum, anzahl))
+
+
+    def anomalien(self, anzahl: int = VERLAUF_SEITEN_GROESSE) -> List[Dict]:
+        """
+        Liefert die zuletzt erkannten Auffälligkeiten im Überlappungsanteil (neueste zuerst).
+
+        Args:
+            anzahl (int): Maximale Anzahl der Einträge.
+
+        Returns:
+            List[Dict]: 'vergleichszeitpunkt', 'datei1_name', 'datei2_name', 'anteil', 'erwartet' (bisheriges Mittel),
+                        'streuung' und 'z_wert'.
+        """
+        return self._abfrage("""
+            SELECT vergleichszeitpunkt, datei1_name, datei2_name, anteil, erwartet, streuung, z_wert
+            FROM verlauf_anomalie ORDER BY vergleichszeitpunkt DESC, anomalie_id DESC LIMIT ?
+        """, (anzahl,))
+
+
+# --- Abstrakte Basisklasse für DatenManager (CipherCore Standard: Erweiterbarkeit) ---
+class AbstractDataManager(ABC):
+    """
+    Abstrakte Basisklasse für Daten-Manager-Implementierungen.
+    Definiert die Schnittstelle für Daten-Manager-Operationen zur Persistierung von Vergleichsergebnissen.
+    Ermöglicht verschiedene Persistenzmechanismen (Datei, Datenbank, etc.).
+    """
+
+    @abstractmethod
+    def erstelle_schema(self) -> None:
+        """Erstellt das Daten-Schema (Datenbanktabellen, Verzeichnisstruktur etc.)."""
+        pass
+
+    @abstractmethod
+    def speichere_ergebnisse(self, vergleichs_ergebnisse: VergleichsErgebnis, dateiname_datei1: str, dateiname_datei2: str, ist_pro_version: bool = False) -> None:
+        """Speichert die Vergleichsergebnisse (Rohwerte und Metadaten)."""
+        pass
+
+    @abstractmethod
+    def lade_alle_ergebnisse(self) -> List[Dict]:
+        """Lädt alle Vergleichsergebnisse."""
+        pass
+
+    def lade_ergebnisse_seite(self, versatz: int = 0, anzahl: int = VERLAUF_SEITEN_GROESSE, sortier_spalte: str = 'vergleichszeitpunkt',
+                              absteigend: bool = True, suchbegriff: Optional[str] = None) -> List[Dict]:
+        """
+        Lädt eine Seite von Vergleichsläufen. Jeder Eintrag enthält 'vergleichszeitpunkt', 'datei1_name', 'datei2_name' und 'metriken'.
+        Die Standardimplementierung sortiert und filtert `lade_alle_ergebnisse()` im Speicher; die mitgelieferten DataManager
+        überschreiben sie, damit Sortierung, Suche und Paging im Backend erfolgen.
+        """
+        _pruefe_sortier_spalte(sortier_spalte)
+        ergebnisse = self._filtere_ergebnisse(self.lade_alle_ergebnisse(), suchbegriff)
+        ergebnisse.sort(key=lambda eintrag: str(eintrag.get(sortier_spalte, '')).lower(), reverse=absteigend)
+        return ergebnisse[versatz:versatz + anzahl]
+
+    def zaehle_ergebnisse(self, suchbegriff: Optional[str] = None) -> int:
+        """Zählt die Vergleichsläufe, die zum Suchbegriff passen (Standardimplementierung über `lade_alle_ergebnisse()`)."""
+        return len(self._filtere_ergebnisse(self.lade_alle_ergebnisse(), suchbegriff))
+
+    @staticmethod
+    def _filtere_ergebnisse(ergebnisse: List[Dict], suchbegriff: Optional[str]) -> List[Dict]:
+        """Filtert Läufe nach einem Suchbegriff in den Dateinamen (ohne Beachtung der Groß-/Kleinschreibung)."""
+        if not suchbegriff:
+            return list(ergebnisse)
+        muster = suchbegriff.lower()
+        return [eintrag for eintrag in ergebnisse
+                if muster in str(eintrag.get('datei1_name', '')).lower() or muster in str(eintrag.get('datei2_name', '')).lower()]
+
+    @abstractmethod
+    def zustands_verzeichnis(self) -> str:
+        """Liefert das Verzeichnis für den Vergleichszustand des inkrementellen Vergleichs (neben dem Speicherort des Managers)."""
+        pass
+
+    _naive_zeitpunkte_lokal = False # True, wenn Zeitpunkte ohne Zeitzone im Verlauf Ortszeit statt UTC sind
+
+    def _auswertungs_pfad(self) -> Optional[str]:
+        """Liefert den Pfad der Datenbank mit den Zusammenfassungstabellen (None: keine Trendauswertung)."""
+        return None
+
+    def _utc_zeitpunkt(self, vergleichszeitpunkt: str) -> datetime.datetime:
+        """
+        Wandelt einen gespeicherten Vergleichszeitpunkt in UTC ohne Zeitzone um (Perioden der Auswertung sind UTC).
+
+        Args:
+            vergleichszeitpunkt (str): Zeitpunkt im ISO-Format, mit oder ohne Zeitzone.
+
+        Returns:
+            datetime.datetime: Zeitpunkt in UTC ohne Zeitzone.
+        """
+        zeitpunkt = datetime.datetime.fromisoformat(vergleichszeitpunkt)
+        if zeitpunkt.tzinfo is None:
+            if not self._naive_zeitpunkte_lokal:
+                return zeitpunkt
+            zeitpunkt = zeitpunkt.astimezone() # Ältere Einträge: Ortszeit des Rechners
+        return zeitpunkt.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+
+    def verlaufs_auswertung(self) -> Optional[VerlaufsAuswertung]:
+        """
+        Liefert die Trendauswertung des Managers. Solange die Zusammenfassungstabellen nicht als nachgetragen markiert sind,
+        wird der vorhandene Verlauf (chronologisch, seitenweise) in einer Transaktion nachgetragen; ein abgebrochenes Nachtragen
+        wird beim nächsten Zugriff wiederholt. Danach hält `speichere_ergebnisse` die Tabellen aktuell.
+
+        Returns:
+            Optional[VerlaufsAuswertung]: Die Auswertung oder None, wenn der Manager keine unterstützt.
+        """
+        if getattr(self, '_verlaufs_auswertung', None) is None:
+            pfad = self._auswertungs_pfad()
+            if pfad is None:
+                return None
+            auswertung = VerlaufsAuswertung(pfad)
+            if auswertung.ist_neu:
+                gesamt = self.zaehle_ergebnisse()
+                eintraege = ((eintrag['metriken'], eintrag['datei1_name'], eintrag['datei2_name'], self._utc_zeitpunkt(eintrag['vergleichszeitpunkt']))
+                             for versatz in range(0, gesamt, VERLAUF_SEITEN_GROESSE)
+                             for eintrag in self.lade_ergebnisse_seite(versatz, VERLAUF_SEITEN_GROESSE, 'vergleichszeitpunkt', absteigend=False))
+                anzahl = auswertung.trage_nach(eintraege)
+                if anzahl:
+                    logger.info(f"{anzahl} Läufe des bestehenden Verlaufs in die Verlaufsauswertung '{pfad}' übernommen.")
+            self._verlaufs_auswertung = auswertung
+        return self._verlaufs_auswertung
+
+
+def _pruefe_sortier_spalte(sortier_spalte: str) -> None:
+    """
+    Prüft eine Sortierspalte gegen die Whitelist VERLAUF_SORTIER_SPALTEN.
+
+    Raises:
+        ValueError: Wenn die Sortierspalte nicht erlaubt ist.
+    """
+    if sortier_spalte not in VERLAUF_SORTIER_SPALTEN:
+        raise ValueError(f"Ungültige Sortierspalte: '{sortier_spalte}'. Erlaubt: {', '.join(VERLAUF_SORTIER_SPALTEN)}.")
+
+
+# --- SQLiteDataManager Klasse (CipherCore Standard: Sichere Datenbankinteraktion) ---
+class SQLiteDataManager(AbstractDataManager):
+    """
+    DataManager-Implementierung für SQLite-Datenbank.
+    Implementiert sicheren Datenbankzugriff und Fehlerbehandlung.
+    Nutzt Prepared Statements zum Schutz vor SQL-Injection (Best Practice).
+    """
+
+    def __init__(self, datenbank_pfad: str = DATENBANK_DATEINAME_STANDARD):
+        """
+        Initialisiert den SQLiteDataManager.
+
+        Args:
+            datenbank_pfad (str): Der Pfad zur SQLite-Datenbankdatei.
+        """
+        if not datenbank_pfad or not isinstance(datenbank_pfad, str):
+            raise ValueError("Datenbankpfad muss ein gültiger Pfad sein.")
+        self.datenbank_pfad = datenbank_pfad
+        self.erstelle_schema()
+        logger.debug(f"SQLiteDataManager initialisiert mit Datenbankpfad: {self.datenbank_pfad}")
+
+
+    def erstelle_schema(self) -> None:
+        """
+        Erstellt das Datenbank-Schema (Tabellen), falls nicht vorhanden.
+        Nutzt IF NOT EXISTS Klausel für sichere Schemaerstellung.
+        """
+        verbindung = None # Verbindung außerhalb des try-Blocks definieren für finally-Zugriff
+        try:
+            verbindung = sqlite3.connect(self.datenbank_pfad)
+            zeiger = verbindung.cursor()
+            zeiger.execute("""
+                CREATE TABLE IF NOT EXISTS vergleichsergebnisse (
+                    vergleich_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    datei1_name TEXT NOT NULL,
+                    datei2_name TEXT NOT NULL,
+                    vergleichszeitpunkt DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    metrik_name TEXT NOT NULL,
+                    metrik_wert TEXT,
+                    metrik_zahl REAL
+                )
+            """)
+            spalten = [spalte[1] for spalte in zeiger.execute("PRAGMA table_info(vergleichsergebnisse)")]
+            if "metrik_zahl" not in spalten:
+                zeiger.execute("ALTER TABLE vergleichsergebnisse ADD COLUMN metrik_zahl REAL") # Migration älterer Datenbanken (nur Textwerte)
+            if "lauf_id" not in spalten:
+                zeiger.execute("ALTER TABLE vergleichsergebnisse ADD COLUMN lauf_id TEXT") # Ältere Läufe ohne Kennung werden über Zeitpunkt und Dateinamen gruppiert
+            zeiger.execute("DROP INDEX IF EXISTS idx_vergleichsergebnisse_lauf") # Ersetzt durch den Index mit Laufkennung
+            zeiger.execute("""
+                CREATE INDEX IF NOT EXISTS idx_vergleichsergebnisse_lauf_id
+                ON vergleichsergebnisse (vergleichszeitpunkt, datei1_name, datei2_name, lauf_id)
+            """) # Index für das seitenweise Laden des Verlaufs
+            verbindung.commit()
+            logger.info(f"Datenbank-Schema in '{self.datenbank_pfad}' erstellt oder geprüft.")
+        except sqlite3.Error as e:
+            logger.error(f"Fehler beim Erstellen des Datenbank-Schemas: {e}")
+            raise CipherCoreDatenbankSchemaFehler(f"Fehler beim Erstellen des Datenbank-Schemas: {e}") from e
+        finally:
+            if verbindung:
+                verbindung.close()
+
+
+    def speichere_ergebnisse(self, vergleichs_ergebnisse: VergleichsErgebnis, dateiname_datei1: str, dateiname_datei2: str, ist_pro_version: bool = False) -> None:
+        """
+        Speichert die Vergleichsergebnisse in der SQLite-Datenbank.
+        Je Metrik werden der Rohwert (metrik_zahl, REAL) und der Anzeigetext (metrik_wert) abgelegt.
+        Verwendet Prepared Statements zum Schutz vor SQL-Injection.
+        Speichern erfolgt nur in der Pro Version.
+
+        Args:
+            vergleichs_ergebnisse (VergleichsErgebnis): Die Vergleichsergebnisse.
+            dateiname_datei1 (str): Der Dateiname der ersten Datei.
+            dateiname_datei2 (str): Der Dateiname der zweiten Datei.
+            ist_pro_version (bool): Gibt an, ob die Pro-Version aktiv ist.
+        """
+        if not ist_pro_version: # Speichern nur in Pro Version
+            logger.info("Testversion: Vergleichsergebnisse werden nicht in der Datenbank gespeichert.")
+            return
+
+        auswertung = self.verlaufs_auswertung() # Vor dem Speichern, damit ein Nachtragen den neuen Lauf nicht doppelt zählt
+        jetzt = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        verbindung = None
+        try:
+            verbindung = sqlite3.connect(self.datenbank_pfad)
+            zeiger = verbindung.cursor()
+            sql_einfuegen = """
+                INSERT INTO vergleichsergebnisse (datei1_name, datei2_name, vergleichszeitpunkt, metrik_name, metrik_wert, metrik_zahl, lauf_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """
+            # Ein gemeinsamer Zeitpunkt (UTC wie CURRENT_TIMESTAMP) und eine Laufkennung für alle Metriken eines Laufs,
+            # damit Läufe derselben Dateien in derselben Sekunde getrennt bleiben
+            vergleichszeitpunkt = jetzt.strftime('%Y-%m-%d %H:%M:%S')
+            lauf_id = secrets.token_hex(16)
+            for metrik_name, metrik_wert in vergleichs_ergebnisse.metriken().items():
+                zeiger.execute(sql_einfuegen, (dateiname_datei1, dateiname_datei2, vergleichszeitpunkt, metrik_name,
+                                               formatiere_metrik(metrik_name, metrik_wert), float(metrik_wert), lauf_id)) # Prepared Statement
+            # Zusammenfassungstabellen liegen in derselben Datenbank: Verlaufseintrag und Rollup gemeinsam festschreiben
+            auswertung.aktualisiere(vergleichs_ergebnisse.metriken(), dateiname_datei1, dateiname_datei2, jetzt, verbindung=verbindung)
+            verbindung.commit()
+            logger.info(f"Vergleichsergebnisse in Datenbank '{self.datenbank_pfad}' gespeichert.")
+        except sqlite3.Error as e:
+            logger.error(f"Fehler beim Speichern der Vergleichsergebnisse in der Datenbank: {e}")
+            raise CipherCoreDatenbankSpeicherFehler(f"Fehler beim Speichern der Vergleichsergebnisse in der Datenbank: {e}") from e
+        finally:
+            if verbindung:
+                verbindung.close()
+
+
+    def lade_alle_ergebnisse(self) -> List[Dict]:
+        """
+        Lädt alle Vergleichsergebnisse aus der Datenbank.
+
+        Returns:
+            List[Dict]: Eine Liste von Dictionaries, wobei jedes Dictionary ein Vergleichsergebnis darstellt.
+        """
+        ergebnisse: List[Dict] = []
+        verbindung = None
+        try:
+            verbindung = sqlite3.connect(self.datenbank_pfad)
+            zeiger = verbindung.cursor()
+            zeiger.execute("SELECT * FROM vergleichsergebnisse ORDER BY vergleichszeitpunkt DESC, vergleich_id ASC") # Keine Benutzereingaben, daher kein Prepared Statement nötig
+            spalten_namen = [beschreibung[0] for beschreibung in zeiger.description]
+            daten_saetze = zeiger.fetchall()
+            for daten_satz in daten_saetze:
+                ergebnis_dict = dict(zip(spalten_namen, daten_satz))
+                ergebnisse.append(ergebnis_dict)
+            logger.info(f"Alle Vergleichsergebnisse aus Datenbank '{self.datenbank_pfad}' geladen.")
+        except sqlite3.Error as e:
+            logger.error(f"Fehler beim Laden der Vergleichsergebnisse aus der Datenbank: {e}")
+            raise CipherCoreDatenbankLadeFehler(f"Fehler beim Laden der Vergleichsergebnisse aus der Datenbank: {e}") from e
+        finally:
+            if verbindung:
+                verbindung.close()
+        return ergebnisse
+
+
+    @staticmethod
+    def _such_bedingung(suchbegriff: Optional[str]) -> Tuple[str, Tuple]:
+        """
+        Interne Hilfsfunktion zum Erstellen der WHERE-Bedingung für die Verlaufssuche (Prepared Statement).
+
+        Args:
+            suchbegriff (Optional[str]): Suchbegriff für die Dateinamen (optional).
+
+        Returns:
+            Tuple[str, Tuple]: SQL-Bedingung und zugehörige Parameter.
+        """
+        if not suchbegriff:
+            return "", ()
+        muster = "%" + suchbegriff.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%" # LIKE-Sonderzeichen maskieren
+        return "WHERE datei1_name LIKE ? ESCAPE '\\' OR datei2_name LIKE ? ESCAPE '\\'", (muster, muster)
+
+
+    def lade_ergebnisse_seite(self, versatz: int = 0, anzahl: int = VERLAUF_SEITEN_GROESSE, sortier_spalte: str = 'vergleichszeitpunkt',
+                              absteigend: bool = True, suchbegriff: Optional[str] = None) -> List[Dict]:
+        """
+        Lädt eine Seite von Vergleichsläufen aus der Datenbank.
+        Die Metrik-Zeilen eines Laufs werden über Laufkennung, Zeitpunkt und Dateinamen gruppiert; Sortierung, Suche und Paging erfolgen in SQL.
+
+        Args:
+            versatz (int): Anzahl der zu überspringenden Läufe.
+            anzahl (int): Maximale Anzahl der zu ladenden Läufe.
+            sortier_spalte (str): Sortierspalte (siehe VERLAUF_SORTIER_SPALTEN).
+            absteigend (bool): Absteigend sortieren.
+            suchbegriff (Optional[str]): Suchbegriff für die Dateinamen (optional).
+
+        Returns:
+            List[Dict]: Die Läufe der Seite mit 'vergleichszeitpunkt', 'datei1_name', 'datei2_name', 'lauf_id' (None für ältere Läufe)
+                        und 'metriken' (Rohwerte; Textwerte nur für Läufe aus Datenbanken vor Einführung von metrik_zahl).
+        """
+        _pruefe_sortier_spalte(sortier_spalte)
+        bedingung, parameter = self._such_bedingung(suchbegriff)
+        richtung = "DESC" if absteigend else "ASC"
+        sql_seite = f"""
+            SELECT vergleichszeitpunkt, datei1_name, datei2_name, lauf_id FROM vergleichsergebnisse {bedingung}
+            GROUP BY vergleichszeitpunkt, datei1_name, datei2_name, lauf_id
+            ORDER BY {sortier_spalte} {richtung}, vergleichszeitpunkt DESC, MIN(vergleich_id) DESC
+            LIMIT ? OFFSET ?
+        """ # Spaltenname stammt aus der Whitelist, Werte werden als Parameter übergeben
+        seiten_parameter = parameter + (anzahl, versatz)
+        verbindung = None
+        try:
+            verbindung = sqlite3.connect(self.datenbank_pfad)
+            zeiger = verbindung.cursor()
+            zeiger.execute(sql_seite, seiten_parameter)
+            ergebnisse: List[Dict] = []
+            laeufe: Dict[Tuple, Dict] = {}
+            for vergleichszeitpunkt, datei1_name, datei2_name, lauf_id in zeiger.fetchall():
+                eintrag = {"vergleichszeitpunkt": vergleichszeitpunkt, "datei1_name": datei1_name, "datei2_name": datei2_name,
+                           "lauf_id": lauf_id, "metriken": {}}
+                laeufe[(vergleichszeitpunkt, datei1_name, datei2_name, lauf_id)] = eintrag
+                ergebnisse.append(eintrag)
+            if laeufe:
+                zeiger.execute(f"""
+                    SELECT v.vergleichszeitpunkt, v.datei1_name, v.datei2_name, v.lauf_id, v.metrik_name, COALESCE(v.metrik_zahl, v.metrik_wert)
+                    FROM ({sql_seite}) AS seite
+                    JOIN vergleichsergebnisse AS v
+                      ON v.vergleichszeitpunkt = seite.vergleichszeitpunkt
+                     AND v.datei1_name = seite.datei1_name
+                     AND v.datei2_name = seite.datei2_name
+                     AND v.lauf_id IS seite.lauf_id
+                """, seiten_parameter) # IS: ältere Läufe ohne Kennung (NULL) gehören ebenfalls zusammen
+                for vergleichszeitpunkt, datei1_name, datei2_name, lauf_id, metrik_name, metrik_wert in zeiger.fetchall():
+                    laeufe[(vergleichszeitpunkt, datei1_name, datei2_name, lauf_id)]["metriken"][metrik_name] = metrik_wert
+            logger.debug(f"Verlaufsseite (Versatz {versatz}, Anzahl {anzahl}) aus Datenbank '{self.datenbank_pfad}' geladen.")
+            return ergebnisse
+        except sqlite3.Error as e:
+            logger.error(f"Fehler beim seitenweisen Laden der Vergleichsergebnisse aus der Datenbank: {e}")
+            raise CipherCoreDatenbankLadeFehler(f"Fehler beim Laden der Vergleichsergebnisse aus der Datenbank: {e}") from e
+        finally:
+            if verbindung:
+                verbindung.close()
+
+
+    def zaehle_ergebnisse(self, suchbegriff: Optional[str] = None) -> int:
+        """
+        Zählt die Vergleichsläufe in der Datenbank, die zum Suchbegriff passen.
+
+        Args:
+            suchbegriff (Optional[str]): Suchbegriff für die Dateinamen (optional).
+
+        Returns:
+            int: Anzahl der Läufe.
+        """
+        bedingung, parameter = self._such_bedingung(suchbegriff)
+        verbindung = None
+        try:
+            verbindung = sqlite3.connect(self.datenbank_pfad)
+            zeiger = verbindung.cursor()
+            zeiger.execute(f"""
+                SELECT COUNT(*) FROM (
+                    SELECT 1 FROM vergleichsergebnisse {bedingung}
+                    GROUP BY vergleichszeitpunkt, datei1_name, datei2_name, lauf_id
+                )
+            """, parameter)
+            return zeiger.fetchone()[0]
+        except sqlite3.Error as e:
+            logger.error(f"Fehler beim Zählen der Vergleichsergebnisse in der Datenbank: {e}")
+            raise CipherCoreDatenbankLadeFehler(f"Fehler beim Zählen der Vergleichsergebnisse in der Datenbank: {e}") from e
+        finally:
+            if verbindung:
+                verbindung.close()
+
+
+
+    def zustands_verzeichnis(self) -> str:
+        """
+        Liefert das Verzeichnis für den Vergleichszustand neben der Datenbankdatei.
+
+        Returns:
+            str: Pfad des Zustandsverzeichnisses.
+        """
+        return os.path.join(os.path.dirname(os.path.abspath(self.datenbank_pfad)), ZUSTANDS_VERZEICHNIS_NAME)
+
+
+    def _auswertungs_pfad(self) -> str:
+        """Die Zusammenfassungstabellen liegen in derselben Datenbank wie der Verlauf."""
+        return self.datenbank_pfad
+
+
+# --- FileDataManager Klasse (CipherCore Standard: Sichere Dateiverarbeitung) ---
+class FileDataManager(AbstractDataManager):
+    """
+    DataManager-Implementierung, die Vergleichsergebnisse in JSON-Dateien in einem dedizierten Verzeichnis speichert.
+    Implementiert sichere Dateiverarbeitung und Fehlerbehandlung.
+    Vergleichszeitpunkte werden in UTC mit Zeitzone gespeichert; ältere Einträge ohne Zeitzone gelten als Ortszeit.
+    Sichere Dateinamensgenerierung und Pfadkonstruktion.
+    """
+
+    _naive_zeitpunkte_lokal = True # Einträge vor der Umstellung auf UTC enthalten die Ortszeit ohne Zeitzone
+
+    def __init__(self, daten_verzeichnis: str = DATEN_VERZEICHNIS_STANDARD):
+        """
+        Initialisiert den FileDataManager.
+
+        Args:
+            daten_verzeichnis (str): Das Verzeichnis, in dem JSON-Dateien gespeichert werden.
+        """
+        if not daten_verzeichnis or not isinstance(daten_verzeichnis, str):
+            raise ValueError("Datenverzeichnis muss ein gültiger Pfad sein.")
+
+        self.daten_verzeichnis = daten_verzeichnis
+        self._index_sperre = threading.Lock() # GUI lädt Verlaufsseiten im Hintergrund-Thread
+        self._index_eintraege: Dict[str, Optional[Tuple[str, str, str, str]]] = {} # JSON-Dateiname -> Indexeintrag (None: unlesbar)
+        self._index_stand: Optional[int] = None # st_mtime_ns des Datenverzeichnisses bei der letzten Auflistung
+        self.erstelle_schema()
+        logger.debug(f"FileDataManager initialisiert mit Datenverzeichnis: {self.daten_verzeichnis}")
+
+
+    def erstelle_schema(self) -> None:
+        """
+        Erstellt das Datenverzeichnis, falls es nicht existiert.
+        Verwendet exist_ok=True für sichere Verzeichniserstellung.
+        """
+        try:
+            os.makedirs(self.daten_verzeichnis, exist_ok=True)
+            logger.info(f"Datenverzeichnis '{self.daten_verzeichnis}' erstellt oder geprüft.")
+        except OSError as e:
+            logger.error(f"Fehler beim Erstellen des Datenverzeichnisses '{self.daten_verzeichnis}': {e}")
+            raise CipherCoreDateiSchemaFehler(f"Fehler beim Erstellen des Datenverzeichnisses: {e}") from e
+
+
+    def _generiere_dateinamen(self, dateiname_datei1: str, dateiname_datei2: str) -> str:
+        """
+        Generiert einen eindeutigen und sicheren Dateinamen für die JSON-Datei.
+        Sanitized Dateinamen, um Dateisystem- und Sicherheitsprobleme zu vermeiden.
+
+        Args:
+            dateiname_datei1 (str): Der Dateiname der ersten Datei.
+            dateiname_datei2 (str): Der Dateiname der zweiten Datei.
+
+        Returns:
+            str: Der generierte Dateipfad für die JSON-Datei.
+        """
+        zeitstempel = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        datei_sicher_datei1 = "".join(x if x.isalnum() else "_" for x in dateiname_datei1) # Dateinamen "sanitieren"
+        datei_sicher_datei2 = "".join(x if x.isalnum() else "_" for x in dateiname_datei2) # Dateinamen "sanitieren"
+        dateiname = f"vergleichsergebnis_{datei_sicher_datei1}_vs_{datei_sicher_datei2}_{zeitstempel}.json"
+        return os.path.join(self.daten_verzeichnis, dateiname) # Sichere Pfadkonstruktion
+
+
+    def speichere_ergebnisse(self, vergleichs_ergebnisse: VergleichsErgebnis, dateiname_datei1: str, dateiname_datei2: str, ist_pro_version: bool = False) -> None:
+        """
+        Speichert die Vergleichsergebnisse (Rohwerte, Verfahren und Laufzeiten) in einer JSON-Datei im Datenverzeichnis.
+        Verwendet sichere Dateiverarbeitung mit 'with open' Kontextmanager.
+        Speichern erfolgt nur in der Pro Version.
+
+        Args:
+            vergleichs_ergebnisse (VergleichsErgebnis): Die Vergleichsergebnisse.
+            dateiname_datei1 (str): Der Dateiname der ersten Datei.
+            dateiname_datei2 (str): Der Dateiname der zweiten Datei.
+            ist_pro_version (bool): Gibt an, ob die Pro-Version aktiv ist.
+        """
+        if not ist_pro_version: # Speichern nur in Pro Version
+            logger.info("Testversion: Vergleichsergebnisse werden nicht in Dateien gespeichert.")
+            return
+
+        try:
+            auswertung = self.verlaufs_auswertung() # Vor dem Speichern, damit ein Nachtragen den neuen Lauf nicht doppelt zählt
+        except CipherCoreDatenbankFehler as e: # Z.B. schreibgeschütztes Datenverzeichnis
+            raise CipherCoreDateiSpeicherFehler(f"Fehler beim Öffnen der Verlaufsauswertung im Datenverzeichnis: {e}") from e
+        jetzt = datetime.datetime.now(datetime.timezone.utc)
+        datei_pfad = self._generiere_dateinamen(dateiname_datei1, dateiname_datei2)
+        daten_zum_speichern = {
+            "datei1_name": dateiname_datei1,
+            "datei2_name": dateiname_datei2,
+            "vergleichszeitpunkt": jetzt.isoformat(),
+            "metriken": vergleichs_ergebnisse.metriken(),
+            "verfahren": vergleichs_ergebnisse.verfahren,
+            "abkuerzung": vergleichs_ergebnisse.abkuerzung,
+            "laufzeiten": vergleichs_ergebnisse.laufzeiten
+        }
+        try:
+            with open(datei_pfad, 'w', encoding='utf-8') as json_datei: # Sichere Dateiverarbeitung mit 'with open' und Encoding
+                json.dump(daten_zum_speichern, json_datei, indent=4, ensure_ascii=False) # Konfiguration als JSON speichern, ensure_ascii=False für korrekte Zeichenkodierung
+            logger.info(f"Vergleichsergebnisse in Datei '{datei_pfad}' gespeichert.")
+        except OSError as e:
+            logger.error(f"Fehler beim Speichern der Vergleichsergebnisse in Datei '{datei_pfad}': {e}")
+            raise CipherCoreDateiSpeicherFehler(f"Fehler beim Speichern der Vergleichsergebnisse in Datei: {e}") from e
+        with self._index_sperre: # Eigene Läufe sofort indizieren (mtime des Verzeichnisses kann innerhalb eines Takts gleich bleiben)
+            datei_name = os.path.basename(datei_pfad)
+            self._index_eintraege[datei_name] = self._index_eintrag(daten_zum_speichern, datei_name)
+        auswertung.aktualisiere(vergleichs_ergebnisse.metriken(), dateiname_datei1, dateiname_datei2, jetzt.replace(tzinfo=None))
+
+
+    def lade_alle_ergebnisse(self) -> List[Dict]:
+        """
+        Lädt alle Vergleichsergebnisse aus den JSON-Dateien im Datenverzeichnis.
+        Behandelt Fehler beim Lesen einzelner Dateien robust und setzt den Ladevorgang fort.
+
+        Returns:
+            List[Dict]: Eine Liste von Dictionaries, wobei jedes Dictionary ein Vergleichsergebnis darstellt.
+        """
+        ergebnisse: List[Dict] = []
+        try:
+            dateien = [f for f in os.listdir(self.daten_verzeichnis) if f.endswith('.json') and f.startswith('vergleichsergebnis_')]
+            for datei_name in dateien:
+                datei_pfad = os.path.join(self.daten_verzeichnis, datei_name) # Sichere Pfadkonstruktion
+                try:
+                    with open(datei_pfad, 'r', encoding='utf-8') as json_datei: # Sichere Dateiverarbeitung mit 'with open' und Encoding
+                        daten = json.load(json_datei)
+                        ergebnisse.append(daten)
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Fehler beim Lesen der JSON-Datei '{datei_pfad}'. Datei wird übersprungen. Fehler: {e}")
+                except OSError as e:
+                    logger.warning(f"Fehler beim Zugriff auf JSON-Datei '{datei_pfad}'. Datei wird übersprungen. Fehler: {e}")
+            logger.info(f"Alle Vergleichsergebnisse aus Datenverzeichnis '{self.daten_verzeichnis}' geladen.")
+        except OSError as e:
+            logger.error(f"Fehler beim Zugriff auf das Datenverzeichnis '{self.daten_verzeichnis}': {e}")
+            raise CipherCoreDateiLadeFehler(f"Fehler beim Laden der Vergleichsergebnisse aus dem Datenverzeichnis: {e}") from e
+
+        ergebnisse.sort(key=lambda x: x.get('vergleichszeitpunkt', '1970-01-01T00:00:00'), reverse=True) # Sortierung beibehalten
+        return ergebnisse
+
+
+    def _verlauf_index(self, suchbegriff: Optional[str] = None) -> List[Tuple[str, str, str, str]]:
+        """
+        Interne Hilfsfunktion, die den Verlauf indiziert. Dateinamen und Zeitpunkt stammen aus den JSON-Dateien selbst
+        (die bereinigten Dateinamen der JSON-Dateien sind nicht eindeutig umkehrbar). Jede Datei wird nur einmal gelesen;
+        die Auflistung wird zwischengespeichert und nur erneuert, wenn sich das Datenverzeichnis geändert hat.
+
+        Args:
+            suchbegriff (Optional[str]): Suchbegriff für die Dateinamen (optional, ohne Beachtung der Groß-/Kleinschreibung).
+
+        Returns:
+            List[Tuple[str, str, str, str]]: Tupel aus (Zeitpunkt in UTC als ISO-Text, Datei 1, Datei 2, JSON-Dateiname).
+        """
+        praefix, suffix = 'vergleichsergebnis_', '.json'
+        try:
+            with self._index_sperre:
+                stand = os.stat(self.daten_verzeichnis).st_mtime_ns
+                if stand != self._index_stand:
+                    eintraege = {}
+                    for datei_name in os.listdir(self.daten_verzeichnis):
+                        if datei_name.startswith(praefix) and datei_name.endswith(suffix):
+                            eintraege[datei_name] = self._index_eintraege.get(datei_name) or self._lese_index_eintrag(datei_name) # Unlesbare erneut versuchen
+                    self._index_eintraege, self._index_stand = eintraege, stand
+                index = [eintrag for eintrag in self._index_eintraege.values() if eintrag is not None]
+        except OSError as e:
+            logger.error(f"Fehler beim Zugriff auf das Datenverzeichnis '{self.daten_verzeichnis}': {e}")
+            raise CipherCoreDateiLadeFehler(f"Fehler beim Laden der Vergleichsergebnisse aus dem Datenverzeichnis: {e}") from e
+        if suchbegriff:
+            such_muster = suchbegriff.lower()
+            index = [eintrag for eintrag in index if such_muster in eintrag[1].lower() or such_muster in eintrag[2].lower()]
+        return index
+
+
+    def _lese_index_eintrag(self, datei_name: str) -> Optional[Tuple[str, str, str, str]]:
+        """
+        Interne Hilfsfunktion, die den Indexeintrag einer JSON-Datei liest.
+
+        Returns:
+            Optional[Tuple[str, str, str, str]]: Der Indexeintrag oder None, wenn die Datei nicht lesbar ist.
+        """
+        datei_pfad = os.path.join(self.daten_verzeichnis, datei_name) # Sichere Pfadkonstruktion
+        try:
+            with open(datei_pfad, 'r', encoding='utf-8') as json_datei:
+                return self._index_eintrag(json.load(json_datei), datei_name)
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"JSON-Datei '{datei_pfad}' enthält keinen gültigen Vergleichslauf und wird im Verlauf übersprungen. Fehler: {e}")
+        except OSError as e:
+            logger.warning(f"Fehler beim Zugriff auf JSON-Datei '{datei_pfad}'. Datei wird übersprungen. Fehler: {e}")
+        return None
+
+
+    def _index_eintrag(self, daten: Dict, datei_name: str) -> Tuple[str, str, str, str]:
+        """
+        Interne Hilfsfunktion, die aus einem gespeicherten Lauf den Indexeintrag bildet (Zeitpunkt in UTC, damit ältere
+        Einträge in Ortszeit und neuere in UTC gemeinsam sortiert werden).
+
+        Returns:
+            Tuple[str, str, str, str]: (Zeitpunkt in UTC als ISO-Text, Datei 1, Datei 2, JSON-Dateiname).
+        """
+        zeitpunkt = self._utc_zeitpunkt(daten['vergleichszeitpunkt']).isoformat()
+        return zeitpunkt, str(daten['datei1_name']), str(daten['datei2_name']), datei_name
+
+
+    def lade_ergebnisse_seite(self, versatz: int = 0, anzahl: int = VERLAUF_SEITEN_GROESSE, sortier_spalte: str = 'vergleichszeitpunkt',
+                              absteigend: bool = True, suchbegriff: Optional[str] = None) -> List[Dict]:
+        """
+        Lädt eine Seite von Vergleichsläufen aus dem Datenverzeichnis.
+        Sortierung und Suche erfolgen auf dem zwischengespeicherten Verlaufsindex; nur die JSON-Dateien der angeforderten Seite werden gelesen.
+
+        Args:
+            versatz (int): Anzahl der zu überspringenden Läufe.
+            anzahl (int): Maximale Anzahl der zu ladenden Läufe.
+            sortier_spalte (str): Sortierspalte (siehe VERLAUF_SORTIER_SPALTEN).
+            absteigend (bool): Absteigend sortieren.
+            suchbegriff (Optional[str]): Suchbegriff für die Dateinamen (optional).
+
+        Returns:
+            List[Dict]: Die Läufe der Seite mit 'vergleichszeitpunkt', 'datei1_name', 'datei2_name' und 'metriken'.
+        """
+        _pruefe_sortier_spalte(sortier_spalte)
+        index = self._verlauf_index(suchbegriff)
+        schluessel_position = VERLAUF_SORTIER_SPALTEN.index(sortier_spalte) # Reihenfolge entspricht den Index-Tupeln
+        index.sort(key=lambda eintrag: eintrag[0], reverse=True) # Sekundärsortierung: neueste zuerst
+        index.sort(key=lambda eintrag: eintrag[schluessel_position].lower(), reverse=absteigend) # Stabile Sortierung
+        ergebnisse: List[Dict] = []
+        for _, _, _, datei_name in index[versatz:versatz + anzahl]:
+            datei_pfad = os.path.join(self.daten_verzeichnis, datei_name) # Sichere Pfadkonstruktion
+            try:
+                with open(datei_pfad, 'r', encoding='utf-8') as json_datei:
+                    ergebnisse.append(json.load(json_datei))
+            except json.JSONDecodeError as e:
+                logger.warning(f"Fehler beim Lesen der JSON-Datei '{datei_pfad}'. Datei wird übersprungen. Fehler: {e}")
+            except OSError as e:
+                logger.warning(f"Fehler beim Zugriff auf JSON-Datei '{datei_pfad}'. Datei wird übersprungen. Fehler: {e}")
+        logger.debug(f"Verlaufsseite (Versatz {versatz}, Anzahl {anzahl}) aus Datenverzeichnis '{self.daten_verzeichnis}' geladen.")
+        return ergebnisse
+
+
+    def zaehle_ergebnisse(self, suchbegriff: Optional[str] = None) -> int:
+        """
+        Zählt die Vergleichsläufe im Datenverzeichnis, die zum Suchbegriff passen.
+
+        Args:
+            suchbegriff (Optional[str]): Suchbegriff für die Dateinamen (optional).
+
+        Returns:
+            int: Anzahl der Läufe.
+        """
+        return len(self._verlauf_index(suchbegriff))
+
+
+
+    def zustands_verzeichnis(self) -> str:
+        """
+        Liefert das Verzeichnis für den Vergleichszustand innerhalb des Datenverzeichnisses.
+
+        Returns:
+            str: Pfad des Zustandsverzeichnisses.
+        """
+        return os.path.join(self.daten_verzeichnis, ZUSTANDS_VERZEICHNIS_NAME)
+
+
+    def _auswertungs_pfad(self) -> str:
+        """Die Zusammenfassungstabellen liegen als SQLite-Datenbank im Datenverzeichnis."""
+        return os.path.join(self.daten_verzeichnis, VERLAUF_AUSWERTUNG_DATEINAME)
+
+
+# --- ParquetDataManager Klasse (CipherCore Standard: Spaltenorientierter Verlauf für Auswertungen) ---
+class ParquetDataManager(AbstractDataManager):
+    """
+    DataManager-Implementierung, die den Verlauf spaltenorientiert als Parquet-Dateien speichert (eine Zeile je Lauf, eine Spalte je Metrik).
+    Neue Läufe werden in einem kleinen Anhänge-Puffer (JSON-Zeilen) gesammelt und gebündelt als Parquet-Datei geschrieben;
+    die Dateien sind nach Monat partitioniert, sodass Trendabfragen über Zeiträume nur die betroffenen Partitionen und Spalten lesen.
+    Zum Schreiben wird der Puffer zuerst atomar unter einem eigenen Namen übernommen, sodass gleichzeitig angehängte
+    Läufe in einem neuen Puffer landen. Benötigt pyarrow.
+    """
+
+    def __init__(self, verzeichnis: str = PARQUET_VERZEICHNIS_STANDARD, puffer_laeufe: int = VERLAUF_PUFFER_LAEUFE):
+        """
+        Initialisiert den ParquetDataManager.
+
+        Args:
+            verzeichnis (str): Das Verzeichnis für Parquet-Dateien, Anhänge-Puffer und Vergleichszustand.
+            puffer_laeufe (int): Anzahl gepufferter Läufe, ab der der Puffer als Parquet-Datei geschrieben wird.
+
+        Raises:
+            ValueError: Wenn Verzeichnis oder Puffergröße ungültig sind oder pyarrow fehlt.
+        """
+        if not verzeichnis or not isinstance(verzeichnis, str):
+            raise ValueError("Parquet-Verzeichnis muss ein gültiger Pfad sein.")
+        if not isinstance(puffer_laeufe, int) or puffer_laeufe < 1:
+            raise ValueError("Die Puffergröße muss mindestens 1 Lauf betragen.")
+        if pa is None:
+            raise ValueError("Für den ParquetDataManager wird das Paket 'pyarrow' benötigt.")
+        self.verzeichnis = verzeichnis
+        self.puffer_laeufe = puffer_laeufe
+        self.laeufe_verzeichnis = os.path.join(verzeichnis, VERLAUF_LAEUFE_VERZEICHNIS)
+        self.puffer_pfad = os.path.join(verzeichnis, VERLAUF_PUFFER_DATEINAME)
+        self.erstelle_schema()
+        logger.debug(f"ParquetDataManager initialisiert mit Verzeichnis: {self.verzeichnis}")
+
+
+    @staticmethod
+    def _schema() -> 'pa.Schema':
+        """
+        Liefert das Arrow-Schema einer Verlaufszeile (Zeitpunkt in UTC, Dateinamen, Verfahren, Laufzeiten als JSON, eine Spalte je Metrik).
+
+        Returns:
+            pa.Schema: Das Schema inklusive der Partitionsspalte 'monat'.
+        """
+        return pa.schema([
+            ('vergleichszeitpunkt', pa.timestamp('us', tz='UTC')),
+            ('datei1_name', pa.string()),
+            ('datei2_name', pa.string()),
+            ('verfahren', pa.string()),
+            ('abkuerzung', pa.string()),
+            ('laufzeiten', pa.string()),
+        ] + [(spalte, pa.float64()) for spalte in VERLAUF_METRIK_SPALTEN.values()] + [('monat', pa.string())])
+
+
+    def erstelle_schema(self) -> None:
+        """
+        Erstellt das Verzeichnis der Parquet-Dateien, falls es nicht existiert.
+
+        Raises:
+            CipherCoreDateiSchemaFehler: Wenn das Verzeichnis nicht erstellt werden kann.
+        """
+        try:
+            os.makedirs(self.laeufe_verzeichnis, exist_ok=True)
+            logger.info(f"Parquet-Verzeichnis '{self.verzeichnis}' erstellt oder geprüft.")
+        except OSError as e:
+            logger.error(f"Fehler beim Erstellen des Parquet-Verzeichnisses '{self.verzeichnis}': {e}")
+            raise CipherCoreDateiSchemaFehler(f"Fehler beim Erstellen des Parquet-Verzeichnisses: {e}") from e
+
+
+    def speichere_ergebnisse(self, vergleichs_ergebnisse: VergleichsErgebnis, dateiname_datei1: str, dateiname_datei2: str, ist_pro_version: bool = False) -> None:
+        """
+        Hängt einen Lauf an den Anhänge-Puffer an und schreibt den Puffer als Parquet-Datei, sobald er `puffer_laeufe` Läufe enthält.
+        Speichern erfolgt nur in der Pro Version.
+
+        Args:
+            vergleichs_ergebnisse (VergleichsErgebnis): Die Vergleichsergebnisse.
+            dateiname_datei1 (str): Der Dateiname der ersten Datei.
+            dateiname_datei2 (str): Der Dateiname der zweiten Datei.
+            ist_pro_version (bool): Gibt an, ob die Pro-Version aktiv ist.
+
+        Raises:
+            CipherCoreDateiSpeicherFehler: Wenn Puffer oder Parquet-Datei nicht geschrieben werden können.
+        """
+        if not ist_pro_version: # Speichern nur in Pro Version
+            logger.info("Testversion: Vergleichsergebnisse werden nicht im Parquet-Verlauf gespeichert.")
+            return
+
+        try:
+            auswertung = self.verlaufs_auswertung() # Vor dem Speichern, damit ein Nachtragen den neuen Lauf nicht doppelt zählt
+        except CipherCoreDatenbankFehler as e: # Z.B. schreibgeschütztes Verzeichnis
+            raise CipherCoreDateiSpeicherFehler(f"Fehler beim Öffnen der Verlaufsauswertung im Parquet-Verzeichnis: {e}") from e
+        jetzt = datetime.datetime.now(datetime.timezone.utc)
+        eintrag = {
+            "vergleichszeitpunkt": jetzt.isoformat(),
+            "datei1_name": dateiname_datei1,
+            "datei2_name": dateiname_datei2,
+            "verfahren": vergleichs_ergebnisse.verfahren,
+            "abkuerzung": vergleichs_ergebnisse.abkuerzung,
+            "laufzeiten": json.dumps(vergleichs_ergebnisse.laufzeiten, ensure_ascii=False),
+            "metriken": {VERLAUF_METRIK_SPALTEN[metrik]: float(wert) for metrik, wert in vergleichs_ergebnisse.metriken().items()}
+        }
+        try:
+            while True:
+                with open(self.puffer_pfad, 'a', encoding='utf-8') as puffer_datei: # Anhängen statt eine Parquet-Datei je Lauf
+                    if fcntl is not None:
+                        fcntl.flock(puffer_datei.fileno(), fcntl.LOCK_EX) # Bis zum Schließen; schreibe_puffer wartet darauf
+                        if not self._ist_aktueller_puffer(puffer_datei):
+                            continue # Puffer wurde zwischen Öffnen und Sperren übernommen: neuen Puffer öffnen
+                    puffer_datei.write(json.dumps(eintrag, ensure_ascii=False) + "\n")
+                    break
+            logger.info(f"Vergleichsergebnisse im Anhänge-Puffer '{self.puffer_pfad}' gespeichert.")
+        except OSError as e:
+            logger.error(f"Fehler beim Speichern der Vergleichsergebnisse im Anhänge-Puffer '{self.puffer_pfad}': {e}")
+            raise CipherCoreDateiSpeicherFehler(f"Fehler beim Speichern der Vergleichsergebnisse im Anhänge-Puffer: {e}") from e
+        auswertung.aktualisiere(vergleichs_ergebnisse.metriken(), dateiname_datei1, dateiname_datei2, jetzt.replace(tzinfo=None))
+        if len(self._lade_puffer()) >= self.puffer_laeufe:
+            self.schreibe_puffer()
+
+
+    def schreibe_puffer(self) -> None:
+        """
+        Schreibt alle gepufferten Läufe als Parquet-Datei(en) in die Monatspartitionen und leert den Puffer.
+        Der Puffer wird zuerst per os.replace unter einem eigenen Namen übernommen; danach angehängte Läufe landen
+        in einem neuen Puffer. Übernommene Puffer abgebrochener Schreibvorgänge werden mitgeschrieben. Der
+        Dateiname wird aus dem Pufferinhalt abgeleitet: Bricht das Schreiben vor dem Löschen ab oder schreiben zwei
+        Prozesse denselben Puffer, entstehen dieselben Dateien, statt Läufe doppelt abzulegen.
+
+        Raises:
+            CipherCoreDateiSpeicherFehler: Wenn die Parquet-Datei nicht geschrieben werden kann.
+        """
+        try:
+            uebernommen = [pfad for pfad in [self.puffer_pfad, *self._uebernommene_puffer()] if os.path.exists(pfad)]
+            uebernommen = [ziel for ziel in map(self._uebernehme, uebernommen) if ziel]
+            for pfad in uebernommen:
+                with open(pfad, 'rb') as puffer_datei:
+                    if fcntl is not None:
+                        fcntl.flock(puffer_datei.fileno(), fcntl.LOCK_EX) # Wartet auf ein vor der Übernahme begonnenes Anhängen
+                    inhalt = puffer_datei.read()
+                    tabelle = self._puffer_tabelle(self._zeilen_als_eintraege(inhalt.decode('utf-8').splitlines(), pfad))
+                    if tabelle.num_rows:
+                        pa_dataset.write_dataset(tabelle, self.laeufe_verzeichnis, format='parquet', partitioning=self._partitionierung(),
+                                                 basename_template=f"teil-{hashlib.sha256(inhalt).hexdigest()[:16]}-{{i}}.parquet",
+                                                 existing_data_behavior='overwrite_or_ignore')
+                    try:
+                        os.remove(pfad)
+                    except FileNotFoundError:
+                        pass # Von einem anderen Prozess übernommen, der dieselben Dateien schreibt
+                logger.info(f"{tabelle.num_rows} gepufferte Läufe als Parquet in '{self.laeufe_verzeichnis}' geschrieben.")
+        except (OSError, UnicodeDecodeError, pa.ArrowException) as e:
+            logger.error(f"Fehler beim Schreiben des Parquet-Verlaufs in '{self.laeufe_verzeichnis}': {e}")
+            raise CipherCoreDateiSpeicherFehler(f"Fehler beim Schreiben des Parquet-Verlaufs: {e}") from e
+
+
+    def _partitionierung(self):
+        """Liefert die Hive-Partitionierung nach Monat ('monat=JJJJ-MM')."""
+        return pa_dataset.partitioning(pa.schema([('monat', pa.string())]), flavor='hive')
+
+
+    def _ist_aktueller_puffer(self, puffer_datei) -> bool:
+        """
+        Prüft, ob die geöffnete Datei noch der aktuelle Anhänge-Puffer ist (nicht zwischenzeitlich übernommen).
+        """
+        try:
+            return os.path.samestat(os.fstat(puffer_datei.fileno()), os.stat(self.puffer_pfad))
+        except FileNotFoundError:
+            return False
+
+
+    def _uebernommene_puffer(self) -> List[str]:
+        """
+        Liefert die zum Schreiben übernommenen Puffer (laufende oder abgebrochene Schreibvorgänge).
+        """
+        praefix = VERLAUF_PUFFER_DATEINAME + '.'
+        try:
+            return sorted(os.path.join(self.verzeichnis, name) for name in os.listdir(self.verzeichnis)
+                          if name.startswith(praefix) and name.endswith(VERLAUF_PUFFER_UEBERNAHME_ENDUNG))
+        except FileNotFoundError:
+            return []
+
+
+    def _uebernehme(self, pfad: str) -> Optional[str]:
+        """
+        Benennt einen Puffer atomar in eine eigene Übernahmedatei um.
+
+        Args:
+            pfad (str): Der Anhänge-Puffer oder ein übernommener Puffer.
+
+        Returns:
+            Optional[str]: Pfad der Übernahmedatei oder None, wenn der Puffer bereits von einem anderen Prozess
+                           übernommen wurde oder (unter Windows) gerade geöffnet ist.
+        """
+        datei_deskriptor, ziel = tempfile.mkstemp(prefix=VERLAUF_PUFFER_DATEINAME + '.', suffix=VERLAUF_PUFFER_UEBERNAHME_ENDUNG, dir=self.verzeichnis)
+        os.close(datei_deskriptor)
+        try:
+            os.replace(pfad, ziel)
+        except (FileNotFoundError, PermissionError):
+            os.remove(ziel)
+            return None
+        return ziel
+
+
+    @staticmethod
+    def _zeilen_als_eintraege(zeilen, pfad: str) -> List[Dict]:
+        """
+        Wandelt die JSON-Zeilen eines Puffers in Läufe um. Unlesbare Zeilen werden mit Warnung übersprungen.
+        """
+        eintraege: List[Dict] = []
+        for zeilen_nummer, zeile in enumerate(zeilen, start=1):
+            if not zeile.strip():
+                continue
+            try:
+                eintraege.append(json.loads(zeile))
+            except json.JSONDecodeError as e:
+                logger.warning(f"Zeile {zeilen_nummer} im Anhänge-Puffer '{pfad}' ist unlesbar und wird übersprungen: {e}")
+        return eintraege
+
+
+    def _lade_puffer(self) -> List[Dict]:
+        """
+        Interne Hilfsfunktion zum Lesen des Anhänge-Puffers und der gerade geschriebenen (übernommenen) Puffer.
+
+        Returns:
+            List[Dict]: Die gepufferten Läufe.
+        """
+        eintraege: List[Dict] = []
+        for pfad in [*self._uebernommene_puffer(), self.puffer_pfad]:
+            try:
+                with open(pfad, 'r', encoding='utf-8') as puffer_datei:
+                    eintraege.extend(self._zeilen_als_eintraege(puffer_datei, pfad))
+            except FileNotFoundError:
+                continue # Inzwischen geschrieben oder noch nicht angelegt
+        return eintraege
+
+
+    def _puffer_tabelle(self, eintraege: Optional[List[Dict]] = None) -> 'pa.Table':
+        """
+        Interne Hilfsfunktion, die gepufferte Läufe in eine Arrow-Tabelle mit dem Verlaufsschema umwandelt.
+
+        Args:
+            eintraege (Optional[List[Dict]]): Die umzuwandelnden Läufe (optional, Standard: alle gepufferten Läufe).
+
+        Returns:
+            pa.Table: Die gepufferten Läufe (ggf. leer).
+        """
+        if eintraege is None:
+            eintraege = self._lade_puffer()
+        zeitpunkte = [datetime.datetime.fromisoformat(eintrag["vergleichszeitpunkt"]) for eintrag in eintraege]
+        spalten = {
+            'vergleichszeitpunkt': zeitpunkte,
+            'datei1_name': [eintrag["datei1_name"] for eintrag in eintraege],
+            'datei2_name': [eintrag["datei2_name"] for eintrag in eintraege],
+            'verfahren': [eintrag.get("verfahren") for eintrag in eintraege],
+            'abkuerzung': [eintrag.get("abkuerzung") for eintrag in eintraege],
+            'laufzeiten': [eintrag.get("laufzeiten") for eintrag in eintraege],
+        }
+        for spalte in VERLAUF_METRIK_SPALTEN.values():
+            spalten[spalte] = [eintrag["metriken"].get(spalte) for eintrag in eintraege]
+        spalten['monat'] = [zeitpunkt.astimezone(datetime.timezone.utc).strftime('%Y-%m') for zeitpunkt in zeitpunkte]
+        return pa.table(spalten, schema=self._schema())
+
+
+    def _tabelle(self, filter_ausdruck=None, spalten: Optional[List[str]] = None) -> 'pa.Table':
+        """
+        Liest den Verlauf aus Parquet-Dateien und Anhänge-Puffer. Filter und Spaltenauswahl werden an die Parquet-Dateien
+        durchgereicht (Partitionen, Row Groups und Spalten, die nicht benötigt werden, werden nicht gelesen).
+
+        Args:
+            filter_ausdruck: Arrow-Filterausdruck (optional).
+            spalten (Optional[List[str]]): Zu lesende Spalten (optional, Standard: alle).
+
+        Returns:
+            pa.Table: Die passenden Läufe.
+
+        Raises:
+            CipherCoreDateiLadeFehler: Wenn der Verlauf nicht gelesen werden kann.
+        """
+        try:
+            datensatz = pa_dataset.dataset(self.laeufe_verzeichnis, schema=self._schema(), format='parquet', partitioning=self._partitionierung())
+            tabelle = datensatz.to_table(columns=spalten, filter=filter_ausdruck)
+            puffer = self._puffer_tabelle()
+            if filter_ausdruck is not None:
+                puffer = puffer.filter(filter_ausdruck)
+            return pa.concat_tables([tabelle, puffer.select(spalten) if spalten else puffer])
+        except (OSError, pa.ArrowException) as e:
+            logger.error(f"Fehler beim Lesen des Parquet-Verlaufs aus '{self.verzeichnis}': {e}")
+            raise CipherCoreDateiLadeFehler(f"Fehler beim Laden der Vergleichsergebnisse aus dem Parquet-Verlauf: {e}") from e
+
+
+    @staticmethod
+    def _als_eintrag(zeile: Dict) -> Dict:
+        """
+        Interne Hilfsfunktion, die eine Verlaufszeile in das Format der anderen DataManager umwandelt.
+
+        Args:
+            zeile (Dict): Zeile der Arrow-Tabelle.
+
+        Returns:
+            Dict: Lauf mit 'vergleichszeitpunkt' (UTC), 'datei1_name', 'datei2_name', 'metriken', 'verfahren', 'abkuerzung' und 'laufzeiten'.
+        """
+        return {
+            "vergleichszeitpunkt": zeile["vergleichszeitpunkt"].strftime('%Y-%m-%d %H:%M:%S'),
+            "datei1_name": zeile["datei1_name"],
+            "datei2_name": zeile["datei2_name"],
+            "metriken": {metrik: zeile[spalte] for metrik, spalte in VERLAUF_METRIK_SPALTEN.items() if zeile[spalte] is not None},
+            "verfahren": zeile["verfahren"],
+            "abkuerzung": zeile["abkuerzung"],
+            "laufzeiten": json.loads(zeile["laufzeiten"]) if zeile["laufzeiten"] else {}
+        }
+
+
+    @staticmethod
+    def _such_filter(suchbegriff: Optional[str]):
+        """
+        Interne Hilfsfunktion zum Erstellen des Filterausdrucks für die Verlaufssuche (Teilstring, ohne Groß-/Kleinschreibung).
+
+        Args:
+            suchbegriff (Optional[str]): Suchbegriff für die Dateinamen (optional).
+
+        Returns:
+            Arrow-Filterausdruck oder None.
+        """
+        if not suchbegriff:
+            return None
+        return (pa_compute.match_substring(pa_dataset.field('datei1_name'), suchbegriff, ignore_case=True)
+                | pa_compute.match_substring(pa_dataset.field('datei2_name'), suchbegriff, ignore_case=True))
+
+
+    def lade_alle_ergebnisse(self) -> List[Dict]:
+        """
+        Lädt alle Vergleichsergebnisse aus dem Parquet-Verlauf (neueste zuerst).
+
+        Returns:
+            List[Dict]: Eine Liste von Dictionaries, wobei jedes Dictionary ein Vergleichsergebnis darstellt.
+        """
+        tabelle = self._tabelle().sort_by([('vergleichszeitpunkt', 'descending')])
+        logger.info(f"Alle Vergleichsergebnisse aus Parquet-Verlauf '{self.verzeichnis}' geladen.")
+        return [self._als_eintrag(zeile) for zeile in tabelle.to_pylist()]
+
+
+    def lade_ergebnisse_seite(self, versatz: int = 0, anzahl: int = VERLAUF_SEITEN_GROESSE, sortier_spalte: str = 'vergleichszeitpunkt',
+                              absteigend: bool = True, suchbegriff: Optional[str] = None) -> List[Dict]:
+        """
+        Lädt eine Seite von Vergleichsläufen aus dem Parquet-Verlauf.
+        Sortiert und gefiltert wird auf den Index-Spalten; nur die Zeilen der angeforderten Seite werden vollständig gelesen.
+
+        Args:
+            versatz (int): Anzahl der zu überspringenden Läufe.
+            anzahl (int): Maximale Anzahl der zu ladenden Läufe.
+            sortier_spalte (str): Sortierspalte (siehe VERLAUF_SORTIER_SPALTEN).
+            absteigend (bool): Absteigend sortieren.
+            suchbegriff (Optional[str]): Suchbegriff für die Dateinamen (optional).
+
+        Returns:
+            List[Dict]: Die Läufe der Seite mit 'vergleichszeitpunkt', 'datei1_name', 'datei2_name' und 'metriken'.
+        """
+        _pruefe_sortier_spalte(sortier_spalte)
+        such_filter = self._such_filter(suchbegriff)
+        index = self._tabelle(such_filter, list(VERLAUF_SORTIER_SPALTEN))
+        index = index.sort_by([(sortier_spalte, 'descending' if absteigend else 'ascending'), ('vergleichszeitpunkt', 'descending')])
+        seite = index.slice(versatz, anzahl)
+        if not seite.num_rows:
+            return []
+        # Zweiter Lesevorgang nur für die Zeilen der Seite (Zeitpunkt und Dateinamen identifizieren einen Lauf)
+        schluessel = [(zeile['vergleichszeitpunkt'], zeile['datei1_name'], zeile['datei2_name']) for zeile in seite.to_pylist()]
+        seiten_filter = pa_compute.is_in(pa_dataset.field('vergleichszeitpunkt'), value_set=seite.column('vergleichszeitpunkt').combine_chunks())
+        zeilen = {(zeile['vergleichszeitpunkt'], zeile['datei1_name'], zeile['datei2_name']): zeile
+                  for zeile in self._tabelle(seiten_filter).to_pylist()}
+        logger.debug(f"Verlaufsseite (Versatz {versatz}, Anzahl {anzahl}) aus Parquet-Verlauf '{self.verzeichnis}' geladen.")
+        return [self._als_eintrag(zeilen[lauf]) for lauf in schluessel]
+
+
+    def zaehle_ergebnisse(self, suchbegriff: Optional[str] = None) -> int:
+        """
+        Zählt die Vergleichsläufe im Parquet-Verlauf, die zum Suchbegriff passen (ohne Metrikspalten zu lesen).
+
+        Args:
+            suchbegriff (Optional[str]): Suchbegriff für die Dateinamen (optional).
+
+        Returns:
+            int: Anzahl der Läufe.
+        """
+        return self._tabelle(self._such_filter(suchbegriff), ['datei1_name']).num_rows
+
+
+    def aggregiere_metrik(self, metrik: str, zeitraum: str = 'monat', gruppierung: Optional[str] = None,
+                          von: Optional[datetime.datetime] = None, bis: Optional[datetime.datetime] = None) -> List[Dict]:
+        """
+        Aggregiert eine Metrik je Zeitraum und optional je Datei, z.B. die mittlere Übereinstimmung je Hauptliste und Monat.
+        Gelesen werden nur die Spalten Zeitpunkt, Metrik und Gruppierung; Monatspartitionen außerhalb von [von, bis) werden übersprungen.
+
+        Args:
+            metrik (str): Metrikname (z.B. METRIK_GLEICHE_NAMEN) oder Spaltenname (siehe VERLAUF_METRIK_SPALTEN).
+            zeitraum (str): 'tag', 'woche', 'monat' oder 'jahr' (UTC, Wochen nach ISO 8601).
+            gruppierung (Optional[str]): 'datei1_name' oder 'datei2_name' (optional, Standard: alle Läufe gemeinsam).
+            von (Optional[datetime.datetime]): Beginn des Auswertungszeitraums, einschließlich (naive Zeitpunkte gelten als UTC).
+            bis (Optional[datetime.datetime]): Ende des Auswertungszeitraums, ausschließlich.
+
+        Returns:
+            List[Dict]: Je Periode (und Gruppe) 'periode', ggf. die Gruppierungsspalte, 'anzahl', 'mittelwert', 'minimum' und 'maximum',
+                        sortiert nach Periode und Gruppe. Läufe ohne Wert für die Metrik werden nicht gezählt.
+
+        Raises:
+            ValueError: Bei unbekannter Metrik, unbekanntem Zeitraum oder unzulässiger Gruppierung.
+        """
+        spalte = VERLAUF_METRIK_SPALTEN.get(metrik, metrik)
+        if spalte not in VERLAUF_METRIK_SPALTEN.values():
+            raise ValueError(f"Unbekannte Metrik: '{metrik}'.")
+        if zeitraum not in VERLAUF_ZEITRAEUME:
+            raise ValueError(f"Ungültiger Zeitraum: '{zeitraum}'. Erlaubt: {', '.join(VERLAUF_ZEITRAEUME)}.")
+        if gruppierung is not None and gruppierung not in VERLAUF_GRUPPIER_SPALTEN:
+            raise ValueError(f"Ungültige Gruppierung: '{gruppierung}'. Erlaubt: {', '.join(VERLAUF_GRUPPIER_SPALTEN)}.")
+
+        filter_ausdruck = pa_dataset.field(spalte).is_valid()
+        for grenze, vergleich in ((von, 'von'), (bis, 'bis')):
+            if grenze is None:
+                continue
+            grenze = grenze if grenze.tzinfo else grenze.replace(tzinfo=datetime.timezone.utc)
+            zeitpunkt = pa.scalar(grenze, pa.timestamp('us', tz='UTC'))
+            monat = grenze.astimezone(datetime.timezone.utc).strftime('%Y-%m')
+            if vergleich == 'von': # Partitionsfilter zusätzlich zum Zeitfilter, damit ganze Monatsverzeichnisse übersprungen werden
+                filter_ausdruck &= (pa_dataset.field('vergleichszeitpunkt') >= zeitpunkt) & (pa_dataset.field('monat') >= monat)
+            else:
+                filter_ausdruck &= (pa_dataset.field('vergleichszeitpunkt') < zeitpunkt) & (pa_dataset.field('monat') <= monat)
+
+        gruppen = [gruppierung] if gruppierung else []
+        tabelle = self._tabelle(filter_ausdruck, ['vergleichszeitpunkt', spalte] + gruppen)
+        tabelle = tabelle.append_column('periode', pa_compute.strftime(tabelle.column('vergleichszeitpunkt'), format=VERLAUF_ZEITRAEUME[zeitraum]))
+        aggregat = tabelle.group_by(['periode'] + gruppen).aggregate([(spalte, 'count'), (spalte, 'mean'), (spalte, 'min'), (spalte, 'max')])
+        aggregat = aggregat.sort_by([(schluessel, 'ascending') for schluessel in ['periode'] + gruppen])
+        return [dict({schluessel: zeile[schluessel] for schluessel in ['periode'] + gruppen},
+                     anzahl=zeile[f"{spalte}_count"], mittelwert=zeile[f"{spalte}_mean"],
+                     minimum=zeile[f"{spalte}_min"], maximum=zeile[f"{spalte}_max"])
+                for zeile in aggregat.to_pylist()]
+
+
+    def zustands_verzeichnis(self) -> str:
+        """
+        Liefert das Verzeichnis für den Vergleichszustand innerhalb des Parquet-Verzeichnisses (neben den Partitionen).
+
+        Returns:
+            str: Pfad des Zustandsverzeichnisses.
+        """
+        return os.path.join(self.verzeichnis, ZUSTANDS_VERZEICHNIS_NAME)
+
+
+    def _auswertungs_pfad(self) -> str:
+        """Die Zusammenfassungstabellen liegen als SQLite-Datenbank neben den Partitionen."""
+        return os.path.join(self.verzeichnis, VERLAUF_AUSWERTUNG_DATEINAME)
+
+
+# --- BerichtsGenerator Klasse (CipherCore Standard: Professionelle Berichterstellung) ---
+class BerichtsGenerator:
+    """
+    Modul zum Erstellen von Berichten im PDF-Format.
+    Integriert Logo, Statistiken, Diagramm und CipherCore Firmendetails in professionelle Berichte.
+    Sichere Einbindung von Ressourcen (Logo) und robuste Dateispeicherung.
+    """
+
+    def __init__(self, logo_pfad: str = LOGO_DATEIPFAD_STANDARD, ausgabe_pfad: str = AUSGABE_DATEIPFAD, daten_manager: Optional[AbstractDataManager] = None):
+        """
+        Initialisiert den Berichtsgenerator.
+
+        Args:
+            logo_pfad (str): Der Pfad zum Logo für den Bericht.
+            ausgabe_pfad (str): Der Pfad, in dem der PDF-Bericht gespeichert wird.
+            daten_manager (Optional[AbstractDataManager]): Der Daten-Manager für die Speicherung der Ergebnisse (optional).
+        """
+        if logo_pfad and not isinstance(logo_pfad, str):
+            raise ValueError("Logo-Pfad muss ein gültiger Pfad sein.")
+        if ausgabe_pfad and not isinstance(ausgabe_pfad, str):
+            raise ValueError("Ausgabe-Pfad muss ein gültiger Pfad sein.")
+
+        self.logo_pfad = logo_pfad
+        self.ausgabe_pfad = ausgabe_pfad
+        self.daten_manager = daten_manager
+        logger.debug(f"BerichtsGenerator initialisiert. Logo-Pfad: '{self.logo_pfad}', Ausgabe-Pfad: '{self.ausgabe_pfad}', Daten-Manager: {daten_manager.__class__.__name__ if daten_manager else 'Kein'}")
+
+
+    def erstelle_pdf_bericht(self, vergleichs_ergebnisse: VergleichsErgebnis, diagramm_bild_daten: str, dateiname_datei1: str, dateiname_datei2: str, ist_pro_version: bool = False) -> str:
+        """
+        Erstellt einen PDF-Bericht mit Statistiken, Diagramm und CipherCore Firmendetails.
+
+        Args:
+            vergleichs_ergebnisse (VergleichsErgebnis): Die Vergleichsergebnisse.
+            diagramm_bild_daten (str): Base64-kodierte PNG-Bilddaten des Diagramms.
+            dateiname_datei1 (str): Der Dateiname der ersten Datei.
+            dateiname_datei2 (str): Der Dateiname der zweiten Datei.
+            ist_pro_version (bool): Gibt an, ob die Pro-Version aktiv ist.
+
+        Returns:
+            str: Der Pfad zum erstellten PDF-Bericht.
+        """
+        logger.info(f"Starte PDF-Berichterstellung: '{self.ausgabe_pfad}'...")
+
+        if self.daten_manager: # Speichern der Ergebnisse, Datenmanager entscheidet ob Pro Version benötigt wird
+            try:
+                self.daten_manager.speichere_ergebnisse(vergleichs_ergebnisse, dateiname_datei1, dateiname_datei2, ist_pro_version) # Pro Version Status übergeben
+            except CipherCoreDatenbankFehler as e:
+                logger.error(f"Fehler beim Speichern der Ergebnisse über den Daten-Manager: {e}")
+                raise e # Fehler weiterleiten
+            except CipherCoreDateiFehler as e:
+                logger.error(f"Fehler beim Speichern der Ergebnisse über den Daten-Manager: {e}")
+                raise e # Fehler weiterleiten
+            except Exception as e:
+                logger.exception(f"Unerwarteter Fehler beim Speichern der Ergebnisse über den Daten-Manager: {e}")
+                raise CipherCoreDatenFehler(f"Unerwarteter Fehler beim Speichern der Ergebnisse: {e}") from e
+        elif not self.daten_manager:
+            logger.warning("Kein DatenManager konfiguriert. Vergleichsergebnisse werden nicht persistent gespeichert.")
+
+
+        pdf = FPDF()
+        pdf.add_page()
+
+        self._pdf_kopfzeile_erstellen(pdf, "Datei-Vergleichsbericht") # Kopfzeile erstellen
+
+        pdf.set_font("Arial", "I", 10)
+        pdf.cell(0, 6, f"Verglichene Dateien: {dateiname_datei1}, {dateiname_datei2}", ln=1, align='C')
+        pdf.cell(0, 6, f"Vergleichszeitpunkt: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", ln=1, align='C')
+        pdf.ln(5)
+
+        self._pdf_statistik_tabelle_erstellen(pdf, vergleichs_ergebnisse) # Statistik Tabelle erstellen
+
+        pdf.ln(5)
+
+        self._pdf_diagramm_einbetten(pdf, diagramm_bild_daten)
+
+        self._pdf_fusszeile_erstellen(pdf, "CipherCore GmbH") # Fußzeile erstellen
+        self._pdf_copyright_erstellen(pdf)
+        self._pdf_speichern(pdf)
+        return self.ausgabe_pfad
+
+
+    def erstelle_mehrfach_bericht(self, mehrfach_ergebnis: MehrfachVergleichsErgebnis, diagramm_bild_daten: str) -> str:
+        """
+        Erstellt den PDF-Bericht eines N-Wege-Vergleichs: Dateiübersicht, Überlappungsmatrix aller Dateipaare,
+        Anzahl der Schlüssel in genau k Dateien und UpSet-Diagramm.
+
+        Args:
+            mehrfach_ergebnis (MehrfachVergleichsErgebnis): Das Ergebnis des N-Wege-Vergleichs.
+            diagramm_bild_daten (str): Base64-kodierte PNG-Bilddaten des UpSet-Diagramms.
+
+        Returns:
+            str: Der Pfad zum erstellten PDF-Bericht.
+
+        Raises:
+            CipherCoreDateiSpeicherFehler: Wenn der Bericht nicht gespeichert werden kann.
+        """
+        logger.info(f"Starte PDF-Berichterstellung (N-Wege-Vergleich): '{self.ausgabe_pfad}'...")
+        anzahl_dateien = len(mehrfach_ergebnis.dateinamen)
+        pdf = FPDF()
+        pdf.add_page()
+        self._pdf_kopfzeile_erstellen(pdf, "N-Wege-Vergleichsbericht")
+        pdf.set_font("Arial", "I", 10)
+        pdf.cell(0, 6, f"{anzahl_dateien} Dateien, {mehrfach_ergebnis.eindeutige_werte} eindeutige Werte insgesamt", ln=1, align='C')
+        pdf.cell(0, 6, f"Vergleichszeitpunkt: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", ln=1, align='C')
+        pdf.ln(5)
+
+        pdf.set_fill_color(240, 240, 240)
+        pdf.set_draw_color(200, 200, 200)
+        pdf.set_line_width(0.1)
+        pdf.set_font("Arial", "B", 12)
+        pdf.cell(0, 10, "Dateien", ln=1)
+        pdf.set_font("Arial", "", 9)
+        for breite, titel, ausrichtung in ((12, "Nr.", 'R'), (88, "Datei", 'L'), (30, "Einträge", 'R'), (30, "Eindeutig", 'R'), (30, "Ø Alter", 'R')):
+            pdf.cell(breite, 7, titel, 1, 0, ausrichtung, 1)
+        pdf.ln()
+        for nummer, dateiname in enumerate(mehrfach_ergebnis.dateinamen):
+            alter = mehrfach_ergebnis.durchschnittsalter[nummer]
+            pdf.cell(12, 6, str(nummer + 1), 1, 0, 'R')
+            pdf.cell(88, 6, dateiname[:50], 1, 0, 'L')
+            pdf.cell(30, 6, str(mehrfach_ergebnis.anzahl_zeilen[nummer]), 1, 0, 'R')
+            pdf.cell(30, 6, str(mehrfach_ergebnis.ueberlappung[nummer][nummer]), 1, 0, 'R')
+            pdf.cell(30, 6, formatiere_metrik(METRIK_DURCHSCHNITTSALTER_DATEI1, alter), 1, 0, 'R')
+            pdf.ln()
+        pdf.ln(3)
+
+        pdf.set_font("Arial", "B", 12)
+        pdf.cell(0, 10, "Überlappung der Dateipaare (gemeinsame eindeutige Werte)", ln=1)
+        if anzahl_dateien <= MEHRFACH_PDF_MATRIX_MAX_DATEIEN:
+            zellen_breite = min(22.0, 180.0 / (anzahl_dateien + 1))
+            pdf.set_font("Arial", "B", 8)
+            pdf.cell(zellen_breite, 6, "", 1, 0, 'C', 1)
+            for nummer in range(anzahl_dateien):
+                pdf.cell(zellen_breite, 6, str(nummer + 1), 1, 0, 'C', 1)
+            pdf.ln()
+            pdf.set_font("Arial", "", 8 if anzahl_dateien <= 8 else 6)
+            for nummer, zeile in enumerate(mehrfach_ergebnis.ueberlappung):
+                pdf.cell(zellen_breite, 6, str(nummer + 1), 1, 0, 'C', 1)
+                for wert in zeile:
+                    pdf.cell(zellen_breite, 6, str(wert), 1, 0, 'R')
+                pdf.ln()
+        else:
+            pdf.set_font("Arial", "I", 8)
+            pdf.multi_cell(0, 5, f"Die Matrix mit {anzahl_dateien} x {anzahl_dateien} Einträgen ist in der JSON-Datei '*{MEHRFACH_DATEI_ENDUNG}' enthalten.")
+        pdf.ln(3)
+
+        pdf.set_font("Arial", "B", 12)
+        pdf.cell(0, 10, "Werte in genau k Dateien", ln=1)
+        pdf.set_font("Arial", "", 9)
+        for anzahl_k, anzahl in enumerate(mehrfach_ergebnis.in_genau_k_dateien(), start=1):
+            if anzahl:
+                pdf.cell(40, 6, f"k = {anzahl_k}", 1, 0, 'L')
+                pdf.cell(40, 6, str(anzahl), 1, 0, 'R')
+                pdf.ln()
+
+        pdf.add_page()
+        self._pdf_diagramm_einbetten(pdf, diagramm_bild_daten, diagramm_breite=180)
+        self._pdf_fusszeile_erstellen(pdf, "CipherCore GmbH")
+        self._pdf_copyright_erstellen(pdf)
+        self._pdf_speichern(pdf)
+        return self.ausgabe_pfad
+
+
+    @staticmethod
+    def _pdf_copyright_erstellen(pdf: FPDF) -> None:
+        """
+        Interne Hilfsfunktion für den Copyright- und Lizenzhinweis über der Fußzeile der letzten Seite.
+        """
+        pdf.set_y(-25)
+        pdf.set_font("Arial", "I", 8)
+        pdf.cell(0, 10, f"{__copyright__} - {__license__}", 0, 0, 'C')
+
+
+    def _pdf_diagramm_einbetten(self, pdf: FPDF, diagramm_bild_daten: str, diagramm_breite: int = 140) -> None:
+        """
+        Interne Hilfsfunktion zum Einbetten des Diagramms (Base64-PNG) unter der Überschrift 'Grafische Darstellung'.
+
+        Raises:
+            CipherCoreDatenFehler: Wenn das Diagramm nicht eingebettet werden kann.
+        """
+        pdf.set_font("Arial", "B", 12)
+        pdf.cell(0, 10, "Grafische Darstellung", ln=1)
+        pdf.set_font("Arial", "", 10)
+        seiten_breite = 210
+        x_position_diagramm = (seiten_breite - diagramm_breite) / 2
+        try:
+            # Korrigierter Code für pdf.image() mit PIL
+            bild_bytes = base64.b64decode(diagramm_bild_daten)
+            bild = Image.open(BytesIO(bild_bytes))
+            temp_handle, temp_datei = tempfile.mkstemp(prefix="ciphercore_diagramm_", suffix=".png") # Eindeutige temporäre Datei je Bericht (keine Kollision paralleler Läufe)
+            os.close(temp_handle)
+            try:
+                bild.save(temp_datei, format="PNG")
+                pdf.image(temp_datei, x=x_position_diagramm, y=pdf.get_y(), w=diagramm_breite)
+            finally:
+                os.remove(temp_datei) # Temporäre Datei löschen
+        except Exception as e:
+            logger.error(f"Fehler beim Einbetten des Diagrammbildes in den PDF-Bericht: {e}")
+            raise CipherCoreDatenFehler(f"Fehler beim Einbetten des Diagrammbildes in den PDF-Bericht: {e}") from e
+
+
+    def _pdf_speichern(self, pdf: FPDF) -> None:
+        """
+        Interne Hilfsfunktion zum Speichern des PDF-Berichts unter dem Ausgabepfad.
+
+        Raises:
+            CipherCoreDateiSpeicherFehler: Wenn der Bericht nicht gespeichert werden kann.
+        """
+        try:
+            os.makedirs(os.path.dirname(self.ausgabe_pfad), exist_ok=True) # Ausgabe-Verzeichnis erstellen falls nicht existent
+            pdf.output(self.ausgabe_pfad, "F") # PDF-Datei speichern
+            logger.info(f"PDF-Bericht erfolgreich gespeichert: '{self.ausgabe_pfad}'")
+        except OSError as e:
+            logger.error(f"Fehler beim Speichern des PDF-Berichts unter '{self.ausgabe_pfad}': {e}")
+            raise CipherCoreDateiSpeicherFehler(f"Fehler beim Speichern des PDF-Berichts: {e}") from e
+
+
+    def _pdf_kopfzeile_erstellen(self, pdf: FPDF, titel: str) -> None:
+        """
+        Interne Hilfsfunktion zum Erstellen der PDF-Kopfzeile (Logo und Titel).
+        Sichere Logo-Einbindung mit Pfadsicherheitsprüfung.
+
+        Args:
+            pdf (FPDF): Das FPDF-Objekt.
+            titel (str): Der Titel der Kopfzeile.
+        """
+        if self.logo_pfad and os.path.exists(self.logo_pfad):
+            basis_verzeichnis = os.path.dirname(os.path.abspath(__file__))
+            if not _ist_pfad_sicher_static(self.logo_pfad, BASIS_VERZEICHNIS):
+                logger.warning(f"Unsicherer Logo-Dateipfad: '{self.logo_pfad}'. Logo wird nicht eingebunden.")
+            else:
+                try:
+                    pdf.image(self.logo_pfad, x=10, y=8, w=25) # Logo einbinden
+                    logger.debug(f"Logo in Kopfzeile eingebunden: '{self.logo_pfad}'")
+                except Exception as e:
+                    logger.warning(f"Fehler beim Laden des Logos für Kopfzeile: {e}")
+        else:
+            logger.warning(f"Logo-Datei nicht gefunden oder Pfad nicht angegeben: '{self.logo_pfad}'. Kopfzeile ohne Logo.")
+
+        pdf.set_font("Arial", "B", 15)
+        pdf.cell(0, 10, titel, 0, 1, 'C')
+        pdf.ln(5)
+
+
+    def _pdf_statistik_tabelle_erstellen(self, pdf: FPDF, vergleichs_ergebnisse: VergleichsErgebnis) -> None:
+        """
+        Interne Hilfsfunktion zum Erstellen der tabellarischen Statistik im PDF.
+        Generiert eine übersichtliche Tabelle der Vergleichsergebnisse (Formatierung erst hier).
+
+        Args:
+            pdf (FPDF): Das FPDF-Objekt.
+            vergleichs_ergebnisse (VergleichsErgebnis): Die Vergleichsergebnisse.
+        """
+        anzeige_werte = vergleichs_ergebnisse.formatiert()
+        pdf.set_font("Arial", "B", 12)
+        pdf.cell(0, 10, "Statistische Auswertung", ln=1)
+        pdf.set_font("Arial", "", 10)
+
+        pdf.set_fill_color(240, 240, 240)
+        pdf.set_draw_color(200, 200, 200)
+        pdf.set_line_width(0.1)
+        pdf.cell(90, 8, "Metrik", 1, 0, 'L', 1) # Breite der Metrik-Spalte angepasst
+        pdf.cell(50, 8, "Wert", 1, 0, 'R', 1) # Breite der Wert-Spalte angepasst
+        pdf.ln()
+
+        pdf.set_fill_color(255, 255, 255)
+        pdf.set_font("Arial", "", 10)
+
+        for metrik in METRIK_REIHENFOLGE + METRIK_SCHAETZUNGEN:
+            if metrik in anzeige_werte:
+                pdf.cell(90, 7, metrik, 1, 0, 'L', 1) # Breite der Metrik-Spalte angepasst
+                pdf.cell(50, 7, anzeige_werte[metrik], 1, 0, 'R', 1) # Breite der Wert-Spalte angepasst
+                pdf.ln()
+
+        for dateinummer, duplikate in ((1, vergleichs_ergebnisse.duplikate_datei1), (2, vergleichs_ergebnisse.duplikate_datei2)):
+            if duplikate and duplikate.haeufigste: # Häufigste mehrfach vorkommende Werte mit Zeilennummern
+                pdf.ln(3)
+                pdf.set_font("Arial", "B", 10)
+                pdf.cell(0, 7, f"Häufigste mehrfach vorkommende Werte Datei {dateinummer} (zusätzliche Zeilen: {duplikate.doppelte_zeilen})", ln=1)
+                pdf.set_font("Arial", "", 8)
+                for eintrag in duplikate.haeufigste[:5]:
+                    zeilen = ', '.join(str(zeile) for zeile in eintrag["zeilen"][:10]) + (' ...' if eintrag["anzahl"] > 10 else '')
+                    pdf.cell(60, 6, eintrag["wert"][:40], 1, 0, 'L')
+                    pdf.cell(20, 6, str(eintrag["anzahl"]), 1, 0, 'R')
+                    pdf.cell(100, 6, f"Zeilen {zeilen}", 1, 0, 'L')
+                    pdf.ln()
+
+        if vergleichs_ergebnisse.verfahren == VERFAHREN_APPROXIMATIV: # Approximativer Vergleich: Schätzwerte kennzeichnen
+            pdf.set_font("Arial", "I", 8)
+            pdf.multi_cell(0, 5, "Hinweis: Werte mit dem Zusatz (Schätzung) sind Näherungswerte aus HyperLogLog- und "
+                                 "MinHash-Skizzen und keine exakten Zählungen. Zeilenanzahl und Durchschnittsalter sind exakt.")
+        elif vergleichs_ergebnisse.verfahren == VERFAHREN_DIGEST and vergleichs_ergebnisse.gleiche_werte is None: # Digest ohne Bucket-Schlüssel
+            pdf.set_font("Arial", "I", 8)
+            pdf.multi_cell(0, 5, "Hinweis: Vergleich über Merkle-Digests ohne Bucket-Schlüssel. Die Anzahl übereinstimmender "
+                                 "Namen wird erst mit den Bucket-Schlüsseln beider Standorte ermittelt.")
+
+
+    def _pdf_fusszeile_erstellen(self, pdf: FPDF, firmenname: str) -> None:
+        """
+        Interne Hilfsfunktion zum Erstellen der PDF-Fußzeile (Seitenzahl und Firmenname).
+        Standardisierte Fußzeile für professionelles Erscheinungsbild.
+
+        Args:
+            pdf (FPDF): Das FPDF-Objekt.
+            firmenname (str): Der Firmenname für die Fußzeile.
+        """
+        pdf.set_y(-15)
+        pdf.set_font("Arial", "I", 8)
+        pdf.cell(0, 10, f"Seite {pdf.page_no()}", 0, 0, 'C')
+        pdf.cell(0, 10, firmenname, 0, 0, 'R')
+
+
+
+# --- StufenProfiler Klasse (CipherCore Standard: Nachvollziehbare Performance) ---
+class StufenProfiler:
+    """
+    Misst einzelne Pipeline-Stufen eines Vergleichslaufs: Laufzeit, optional tracemalloc-Spitzenspeicher
+    (für DatenLader und DateiVergleicher) und optional cProfile-Profile je Stufe.
+    Ohne Profiler (None) entsteht kein Mehraufwand, da `_profil_stufe` dann einen leeren Kontext liefert.
+    """
+
+    PROFIL_ZEILEN = 25 # Anzahl der Funktionen je Stufe in der Zusammenfassung
+
+    def __init__(self, profilieren: bool = False, stufen_verfolgen: bool = True):
+        """
+        Initialisiert den StufenProfiler.
+
+        Args:
+            profilieren (bool): cProfile-Profil je Stufe aufzeichnen (--profile).
+            stufen_verfolgen (bool): Spitzenspeicher per tracemalloc für Lade- und Vergleichsstufen messen (--trace_stages).
+        """
+        self.profilieren = profilieren
+        self.stufen_verfolgen = stufen_verfolgen
+        self.stufen: List[Dict] = []
+        self.bericht_pfad: Optional[str] = None
+
+
+    @contextlib.contextmanager
+    def stufe(self, name: str, speicher_messen: bool = False):
+        """
+        Kontextmanager, der eine Pipeline-Stufe misst.
+
+        Args:
+            name (str): Name der Stufe (wird auch für Dateinamen der Profile verwendet).
+            speicher_messen (bool): Spitzenspeicher per tracemalloc messen (nur wirksam mit stufen_verfolgen).
+        """
+        eintrag: Dict = {"name": name}
+        speicher_messen = speicher_messen and self.stufen_verfolgen
+        tracemalloc_gestartet = False
+        if speicher_messen:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                tracemalloc_gestartet = True
+        profil = cProfile.Profile() if self.profilieren else None
+        start = time.perf_counter()
+        if profil:
+            profil.enable()
+        try:
+            yield
+        finally:
+            if profil:
+                profil.disable()
+                eintrag["profil"] = profil
+            eintrag["sekunden"] = time.perf_counter() - start
+            if speicher_messen:
+                eintrag["speicher_spitze_bytes"] = tracemalloc.get_traced_memory()[1]
+                if tracemalloc_gestartet:
+                    tracemalloc.stop()
+            self.stufen.append(eintrag)
+            logger.debug(f"Stufe '{name}' gemessen: {eintrag['sekunden']:.3f}s")
+
+
+    def schreibe_bericht(self, pdf_pfad: str) -> str:
+        """
+        Schreibt die Zusammenfassung ('<bericht>_profil.txt') und bei --profile je Stufe eine
+        cProfile-Datei ('<bericht>_profil_<stufe>.prof', auswertbar mit pstats oder snakeviz) neben den PDF-Bericht.
+
+        Args:
+            pdf_pfad (str): Pfad des PDF-Berichts.
+
+        Returns:
+            str: Pfad der Zusammenfassung.
+        """
+        basis_pfad = os.path.splitext(pdf_pfad)[0]
+        verzeichnis = os.path.dirname(basis_pfad)
+        if verzeichnis:
+            os.makedirs(verzeichnis, exist_ok=True)
+        zeilen = [f"CipherCore Stufenprofil - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                  f"Bericht: {pdf_pfad}", "",
+                  f"{'Stufe':<20}{'Laufzeit (s)':>14}{'Speicherspitze (MiB)':>24}"]
+        for eintrag in self.stufen:
+            speicher = eintrag.get("speicher_spitze_bytes")
+            speicher_text = f"{speicher / (1024 * 1024):.1f}" if speicher is not None else "-"
+            zeilen.append(f"{eintrag['name']:<20}{eintrag['sekunden']:>14.3f}{speicher_text:>24}")
+        zeilen.append(f"{'Gesamt':<20}{sum(e['sekunden'] for e in self.stufen):>14.3f}")
+        if self.stufen_verfolgen:
+            zeilen += ["", "Hinweis: Laufzeiten der Stufen mit Speichermessung enthalten den tracemalloc-Mehraufwand."]
+        for eintrag in self.stufen:
+            profil = eintrag.get("profil")
+            if not profil:
+                continue
+            profil_pfad = f"{basis_pfad}_profil_{eintrag['name']}.prof"
+            profil.dump_stats(profil_pfad)
+            ausgabe = StringIO()
+            pstats.Stats(profil, stream=ausgabe).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.PROFIL_ZEILEN)
+            zeilen += ["", f"=== cProfile Stufe '{eintrag['name']}' ({profil_pfad}) ===", ausgabe.getvalue().strip()]
+        self.bericht_pfad = f"{basis_pfad}_profil.txt"
+        with open(self.bericht_pfad, 'w', encoding='utf-8') as bericht_datei:
+            bericht_datei.write("\n".join(zeilen) + "\n")
+        logger.info(f"Stufenprofil gespeichert: '{self.bericht_pfad}'")
+        return self.bericht_pfad
+
+
+def _profil_stufe(profiler: Optional[StufenProfiler], name: str, speicher_messen: bool = False):
+    """
+    Liefert den Mess-Kontext einer Stufe oder einen leeren Kontext, wenn kein Profiler aktiv ist (kein Mehraufwand).
+
+    Args:
+        profiler (Optional[StufenProfiler]): Der aktive Profiler oder None.
+        name (str): Name der Stufe.
+        speicher_messen (bool): Spitzenspeicher per tracemalloc messen.
+    """
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.stufe(name, speicher_messen)
+
+
+
+# --- LaufCache Klasse (CipherCore Standard: Wiederverwendung unveränderter Läufe) ---
+class LaufCache:
+    """
+    Inhaltsadressierter Cache der Vergleichsergebnisse. Der Schlüssel besteht aus den Prüfsummen der Eingabedateien,
+    den Dateinamen, Vergleichsspalten, Arbeitsblättern und den Verfahrensoptionen. Ein Eintrag enthält das
+    Vergleichsergebnis und ggf. die Spaltenstatistik; Diagramm und PDF-Bericht werden bei jedem Treffer neu erstellt
+    (aktueller Vergleichszeitpunkt, aktuelles Logo). Einträge verfallen nach der TTL; überschreitet der Cache die
+    Maximalgröße, werden die am längsten nicht genutzten Einträge entfernt.
+    """
+
+    PRUEFSUMMEN_DATEI = 'pruefsummen.json' # Prüfsummen je Pfad, gültig solange Größe und Änderungszeit gleich bleiben
+    EINTRAG_DATEI = 'eintrag.json'
+    STATISTIK_DATEI = 'statistik.json'
+
+    def __init__(self, verzeichnis: str, ttl_stunden: float = LAUF_CACHE_TTL_STUNDEN_STANDARD, max_mb: float = LAUF_CACHE_MAX_MB_STANDARD):
+        """
+        Initialisiert den Cache.
+
+        Args:
+            verzeichnis (str): Verzeichnis der Cache-Einträge.
+            ttl_stunden (float): Lebensdauer eines Eintrags in Stunden.
+            max_mb (float): Maximale Gesamtgröße des Caches in MB.
+        """
+        self.verzeichnis = verzeichnis
+        self.ttl_sekunden = ttl_stunden * 3600
+        self.max_bytes = int(max_mb * 1024 * 1024)
+
+
+    def datei_pruefsumme(self, datei_pfad: str, abbruch_token: Optional[VergleichsAbbruchToken] = None) -> str:
+        """
+        Liefert die BLAKE2b-Prüfsumme des Dateiinhalts. Die Prüfsumme wird je Pfad mit Größe und Änderungszeit
+        gespeichert und nur neu berechnet, wenn sich eines davon geändert hat.
+
+        Args:
+            datei_pfad (str): Pfad der Datei.
+            abbruch_token (Optional[VergleichsAbbruchToken]): Wird je gelesenem Block geprüft (optional).
+
+        Returns:
+            str: Hex-Prüfsumme des Inhalts.
+        """
+        datei_status = os.stat(datei_pfad)
+        merkmal = [datei_status.st_size, datei_status.st_mtime_ns]
+        pruefsummen_pfad = os.path.join(self.verzeichnis, self.PRUEFSUMMEN_DATEI)
+        try:
+            with open(pruefsummen_pfad, 'r', encoding='utf-8') as pruefsummen_datei:
+                pruefsummen = json.load(pruefsummen_datei)
+        except (OSError, ValueError):
+            pruefsummen = {}
+        schluessel = os.path.abspath(datei_pfad)
+        eintrag = pruefsummen.get(schluessel)
+        if eintrag and eintrag[:2] == merkmal:
+            return eintrag[2]
+        with open(datei_pfad, 'rb') as datei:
+            pruefsumme = _praefix_pruefsumme(datei, None, None, abbruch_token)[1]
+        pruefsummen[schluessel] = merkmal + [pruefsumme]
+        try:
+            os.makedirs(self.verzeichnis, exist_ok=True)
+            with open(pruefsummen_pfad + f'.{os.getpid()}.tmp', 'w', encoding='utf-8') as pruefsummen_datei:
+                json.dump(pruefsummen, pruefsummen_datei)
+            os.replace(pruefsummen_pfad + f'.{os.getpid()}.tmp', pruefsummen_pfad)
+        except OSError as e:
+            logger.warning(f"Prüfsummen des Lauf-Caches konnten nicht gespeichert werden: {e}")
+        return pruefsumme
+
+
+    def schluessel(self, datei_pfade: Tuple[str, ...], optionen: Dict, abbruch_token: Optional[VergleichsAbbruchToken] = None) -> str:
+        """
+        Bildet den Cache-Schlüssel aus den Inhalten der Dateien und den Optionen des Laufs.
+
+        Args:
+            datei_pfade (Tuple[str, ...]): Eingabedateien (nicht vorhandene Dateien, z.B. ein fehlendes Schema, gehen als None ein).
+            optionen (Dict): JSON-serialisierbare Optionen, die das Vergleichsergebnis beeinflussen.
+            abbruch_token (Optional[VergleichsAbbruchToken]): Token für den Abbruch während der Prüfsummenberechnung (optional).
+
+        Returns:
+            str: Der Schlüssel (Hex).
+
+        Raises:
+            CipherCoreAbbruchFehler: Wenn der Lauf während der Prüfsummenberechnung abgebrochen wurde.
+        """
+        inhalte = [self.datei_pruefsumme(pfad, abbruch_token) if pfad and os.path.isfile(pfad) else None for pfad in datei_pfade]
+        schluessel_text = json.dumps({"version": LAUF_CACHE_VERSION, "dateien": inhalte, "optionen": optionen}, sort_keys=True, default=str)
+        return hashlib.sha256(schluessel_text.encode('utf-8')).hexdigest()[:32]
+
+
+    def lade(self, schluessel: str, statistik_pfad: Optional[str] = None) -> Optional[Tuple[VergleichsErgebnis, str, str]]:
+        """
+        Liefert einen gültigen Eintrag und stellt ggf. die Spaltenstatistik unter ihrem Ausgabepfad bereit.
+
+        Args:
+            schluessel (str): Der Cache-Schlüssel.
+            statistik_pfad (Optional[str]): Pfad der Spaltenstatistik (optional).
+
+        Returns:
+            Optional[Tuple[VergleichsErgebnis, str, str]]: Ergebnis und Dateinamen oder None (kein gültiger Eintrag).
+        """
+        eintrag_verzeichnis = os.path.join(self.verzeichnis, schluessel)
+        eintrag_pfad = os.path.join(eintrag_verzeichnis, self.EINTRAG_DATEI)
+        try:
+            with open(eintrag_pfad, 'r', encoding='utf-8') as eintrag_datei:
+                eintrag = json.load(eintrag_datei)
+            if time.time() - eintrag["erstellt"] > self.ttl_sekunden:
+                logger.info(f"Lauf-Cache-Eintrag {schluessel} abgelaufen.")
+                shutil.rmtree(eintrag_verzeichnis, ignore_errors=True)
+                return None
+            if statistik_pfad and not os.path.exists(os.path.join(eintrag_verzeichnis, self.STATISTIK_DATEI)):
+                raise ValueError("Spaltenstatistik fehlt")
+            ergebnis = VergleichsErgebnis.aus_dict(eintrag["ergebnis"])
+            if statistik_pfad:
+                shutil.copyfile(os.path.join(eintrag_verzeichnis, self.STATISTIK_DATEI), statistik_pfad)
+            os.utime(eintrag_pfad) # Letzte Nutzung für die Verdrängung
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Lauf-Cache-Eintrag {schluessel} unbrauchbar, wird verworfen: {e}")
+            shutil.rmtree(eintrag_verzeichnis, ignore_errors=True)
+            return None
+        logger.info(f"Lauf-Cache-Treffer {schluessel}: Vergleichsergebnis übernommen.")
+        return ergebnis, eintrag["dateiname_datei1"], eintrag["dateiname_datei2"]
+
+
+    def speichere(self, schluessel: str, ergebnis: VergleichsErgebnis, dateiname_datei1: str, dateiname_datei2: str,
+                  statistik_pfad: Optional[str] = None) -> None:
+        """
+        Legt einen Eintrag an (atomar über ein temporäres Verzeichnis) und räumt den Cache danach auf.
+        Fehler werden nur protokolliert.
+
+        Args:
+            schluessel (str): Der Cache-Schlüssel.
+            ergebnis (VergleichsErgebnis): Das Vergleichsergebnis.
+            dateiname_datei1 (str): Dateiname der ersten Datei.
+            dateiname_datei2 (str): Dateiname der zweiten Datei.
+            statistik_pfad (Optional[str]): Die erstellte Spaltenstatistik (optional).
+        """
+        eintrag_verzeichnis = os.path.join(self.verzeichnis, schluessel)
+        temp_verzeichnis = f"{eintrag_verzeichnis}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(temp_verzeichnis, exist_ok=True)
+            if statistik_pfad:
+                shutil.copyfile(statistik_pfad, os.path.join(temp_verzeichnis, self.STATISTIK_DATEI))
+            with open(os.path.join(temp_verzeichnis, self.EINTRAG_DATEI), 'w', encoding='utf-8') as eintrag_datei:
+                json.dump({"erstellt": time.time(), "ergebnis": asdict(ergebnis), "dateiname_datei1": dateiname_datei1,
+                           "dateiname_datei2": dateiname_datei2}, eintrag_datei, ensure_ascii=False)
+            shutil.rmtree(eintrag_verzeichnis, ignore_errors=True)
+            os.replace(temp_verzeichnis, eintrag_verzeichnis)
+            logger.debug(f"Lauf-Cache-Eintrag {schluessel} gespeichert.")
+        except OSError as e:
+            logger.warning(f"Lauf-Cache-Eintrag konnte nicht gespeichert werden: {e}")
+            shutil.rmtree(temp_verzeichnis, ignore_errors=True)
+            return
+        self.raeume_auf()
+
+
+    def raeume_auf(self) -> None:
+        """
+        Entfernt abgelaufene Einträge und danach die am längsten nicht genutzten, bis die Maximalgröße eingehalten ist.
+        """
+        eintraege = []
+        jetzt = time.time()
+        try:
+            namen = os.listdir(self.verzeichnis)
+        except OSError:
+            return
+        for name in namen:
+            eintrag_verzeichnis = os.path.join(self.verzeichnis, name)
+            if not os.path.isdir(eintrag_verzeichnis) or name.endswith('.tmp'):
+                continue
+            try:
+                with open(os.path.join(eintrag_verzeichnis, self.EINTRAG_DATEI), 'r', encoding='utf-8') as eintrag_datei:
+                    erstellt = json.load(eintrag_datei)["erstellt"]
+                genutzt = os.stat(os.path.join(eintrag_verzeichnis, self.EINTRAG_DATEI)).st_mtime
+                groesse = sum(eintrag.stat().st_size for eintrag in os.scandir(eintrag_verzeichnis))
+            except (OSError, ValueError, KeyError):
+                continue # Eintrag wird gerade geschrieben oder entfernt
+            if jetzt - erstellt > self.ttl_sekunden:
+                shutil.rmtree(eintrag_verzeichnis, ignore_errors=True)
+                continue
+            eintraege.append((genutzt, groesse, eintrag_verzeichnis))
+        gesamt = sum(groesse for _, groesse, _ in eintraege)
+        for _, groesse, eintrag_verzeichnis in sorted(eintraege):
+            if gesamt <= self.max_bytes:
+                break
+            shutil.rmtree(eintrag_verzeichnis, ignore_errors=True)
+            gesamt -= groesse
+            logger.debug(f"Lauf-Cache-Eintrag verdrängt: {eintrag_verzeichnis}")
+
+
+
+# --- Verfahrenswahl (CipherCore Standard: Speicherbudget statt Speicherüberlauf) ---
+@dataclass(**DATACLASS_SLOTS)
+class EingabeSchaetzung:
+    """
+    Geschätzter Umfang einer Eingabedatei (DatenLader.schaetze_eingabe), Grundlage der automatischen Verfahrenswahl.
+    """
+    datei_pfad: str
+    zeilen: int
+    zeilen_bytes: float # Mittlere Länge der beim Standardvergleich geladenen Daten je Zeile (CSV/TXT: gesamte Zeile)
+    schluessel_bytes: float # Mittlere Länge des Vergleichsschlüssels
+    exakt: bool = False # Zeilenanzahl aus Metadaten oder aus einer Stichprobe über die gesamte Datei
+
+    def speicher_standard_mb(self) -> float:
+        """
+        Geschätzter Speicherbedarf dieser Datei im Standardvergleich (vollständig geladen) in MB.
+        """
+        return self.zeilen * (SPEICHER_BYTES_JE_ZEILE + self.zeilen_bytes) / (1024 * 1024)
+
+
+@dataclass(**DATACLASS_SLOTS)
+class VerfahrensWahl:
+    """
+    Ergebnis der automatischen Verfahrenswahl mit Begründung für Log und Statusanzeige.
+    """
+    verfahren: str # VERFAHREN_STANDARD, VERFAHREN_SORTIERT oder VERFAHREN_SQL (mit Duplikatdatei)
+    begruendung: str
+    bedarf_mb: float # Geschätzter Bedarf des Standardvergleichs
+    sortier_speicher_mb: Optional[float] = None # Nur beim externen Sortieren bzw. SQL-Vergleich
+
+
+def ermittle_speicher_budget(vorgabe_mb: Optional[float] = None) -> float:
+    """
+    Ermittelt das Speicherbudget in MB: Vorgabe (--memory-budget), sonst 'speicher_budget_mb' aus config.json,
+    sonst SPEICHER_BUDGET_ANTEIL des verfügbaren Arbeitsspeichers (Linux: MemAvailable, sonst physischer Speicher),
+    in Containern höchstens der in der cgroup noch freie Speicher (Grenze abzüglich Verbrauch, v2 und v1).
+    Ist der Arbeitsspeicher nicht ermittelbar (z.B. unter Windows), gilt SPEICHER_BUDGET_MB_STANDARD.
+
+    Args:
+        vorgabe_mb (Optional[float]): Budget des Aufrufers (optional).
+
+    Returns:
+        float: Das Speicherbudget in MB.
+    """
+    if vorgabe_mb:
+        return float(vorgabe_mb)
+    if SPEICHER_BUDGET_MB:
+        return float(SPEICHER_BUDGET_MB)
+    verfuegbar_mb = None
+    try:
+        with open('/proc/meminfo', encoding='ascii') as meminfo:
+            for zeile in meminfo:
+                if zeile.startswith('MemAvailable:'):
+                    verfuegbar_mb = int(zeile.split()[1]) / 1024 # Angabe in kB
+                    break
+    except (OSError, ValueError, IndexError):
+        pass
+    if verfuegbar_mb is None:
+        try:
+            verfuegbar_mb = os.sysconf('SC_PHYS_PAGES') * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+        except (AttributeError, ValueError, OSError):
+            verfuegbar_mb = None
+    cgroup_mb = _cgroup_verfuegbar_mb()
+    if cgroup_mb is not None:
+        verfuegbar_mb = cgroup_mb if verfuegbar_mb is None else min(verfuegbar_mb, cgroup_mb)
+    if verfuegbar_mb is None:
+        return float(SPEICHER_BUDGET_MB_STANDARD)
+    return verfuegbar_mb * SPEICHER_BUDGET_ANTEIL
+
+
+def _cgroup_verfuegbar_mb() -> Optional[float]:
+    """
+    Liest den in der cgroup des Prozesses noch freien Arbeitsspeicher (Grenze abzüglich Verbrauch) in MB.
+    MemAvailable berücksichtigt Container-Grenzen nicht.
+
+    Returns:
+        Optional[float]: Freier Speicher in MB oder None ohne cgroup-Grenze (z.B. 'max' oder außerhalb von Linux).
+    """
+    for grenze_datei, verbrauch_datei in CGROUP_SPEICHER_DATEIEN:
+        try:
+            with open(grenze_datei, encoding='ascii') as datei:
+                grenze = datei.read().strip()
+            if grenze == 'max' or int(grenze) >= 2 ** 60: # Keine Grenze (v1 meldet einen sehr großen Wert)
+                return None
+            with open(verbrauch_datei, encoding='ascii') as datei:
+                verbrauch = int(datei.read().strip())
+            return max(int(grenze) - verbrauch, 0) / (1024 * 1024)
+        except (OSError, ValueError):
+            continue
+    return None
+
+
+def waehle_vergleichsverfahren(schaetzungen: List[EingabeSchaetzung], budget_mb: float, duplikat_datei: bool = False) -> VerfahrensWahl:
+    """
+    Wählt Lader und Vergleich für die geschätzten Eingaben: Passt der Standardvergleich (beide Dateien vollständig
+    geladen) in das Budget, wird er verwendet, sonst das externe Sortieren (blockweises Lesen, sortierte Läufe auf
+    der Festplatte). Dessen Budget je Lauf ist das Budget abzüglich SPEICHER_LESE_RESERVE_MB, halbiert für die
+    Kopien beim Sortieren, höchstens 'sortier_speicher_mb' aus config.json. Wird die Duplikatdatei verlangt, die das
+    externe Sortieren nicht schreibt, wird statt dessen der SQL-Vergleich gewählt (ebenfalls mit Auslagerung auf die
+    Festplatte). Solange AUTOMATISCHER_VERFAHRENSWECHSEL nicht gesetzt ist, ist die Wahl nur eine Empfehlung: der
+    Vergleich bleibt beim Standardvergleich, externes Sortieren und SQL werden nur ausdrücklich gewählt.
+
+    Args:
+        schaetzungen (List[EingabeSchaetzung]): Schätzungen der Eingabedateien.
+        budget_mb (float): Das Speicherbudget in MB.
+        duplikat_datei (bool): Ob die Duplikatdatei (--duplikat_bericht) geschrieben werden soll (optional).
+
+    Returns:
+        VerfahrensWahl: Gewähltes Verfahren mit Begründung.
+    """
+    bedarf_mb = sum(schaetzung.speicher_standard_mb() for schaetzung in schaetzungen)
+    zeilen = sum(schaetzung.zeilen for schaetzung in schaetzungen)
+    umfang = f"geschätzt {zeilen} Zeilen, {bedarf_mb:.0f} MB im Arbeitsspeicher"
+    if bedarf_mb <= budget_mb:
+        return VerfahrensWahl(VERFAHREN_STANDARD, f"{umfang}, Speicherbudget {budget_mb:.0f} MB", bedarf_mb)
+    sortier_speicher_mb = min(SORTIER_SPEICHER_MB, (budget_mb - SPEICHER_LESE_RESERVE_MB) / 2)
+    begruendung = f"{umfang} übersteigt das Speicherbudget von {budget_mb:.0f} MB"
+    if sortier_speicher_mb < 1:
+        sortier_speicher_mb = 1.0
+        begruendung += f" (Budget unter dem Mindestbedarf des blockweisen Lesens von {SPEICHER_LESE_RESERVE_MB} MB)"
+    if duplikat_datei:
+        return VerfahrensWahl(VERFAHREN_SQL, f"{begruendung}; SQL-Vergleich mit {sortier_speicher_mb:.0f} MB für die Duplikatdatei",
+                              bedarf_mb, sortier_speicher_mb)
+    return VerfahrensWahl(VERFAHREN_SORTIERT, f"{begruendung}; externes Sortieren mit {sortier_speicher_mb:.0f} MB je Lauf",
+                          bedarf_mb, sortier_speicher_mb)
+
+
+# --- Hilfsfunktionen (CipherCore Standard: Wiederverwendbarkeit und Sicherheit) ---
+
+def _ist_pfad_sicher_static(datei_pfad: str, basis_verzeichnis: str) -> bool:
+    """
+    Statische Hilfsfunktion zur Sicherheitsprüfung eines Dateipfads.
+    Überprüft, ob ein Dateipfad innerhalb des Basisverzeichnisses liegt, um Path-Traversal-Angriffe zu verhindern.
+    Wiederverwendbare Funktion für Pfadsicherheitsprüfungen.
+
+    Args:
+        datei_pfad (str): Der zu überprüfende Dateipfad.
+        basis_verzeichnis (str): Das Basisverzeichnis.
+
+    Returns:
+        bool: True, wenn der Pfad sicher ist, False sonst.
+    """
+    absoluter_pfad = os.path.abspath(datei_pfad)
+    basis_verzeichnis_absolut = os.path.abspath(basis_verzeichnis)
+    ist_sicher = absoluter_pfad.startswith(basis_verzeichnis_absolut)
+    logger.debug(f"Statische Pfadsicherheitsprüfung: Pfad '{datei_pfad}' (absolut: '{absoluter_pfad}') ist sicher im Basisverzeichnis '{basis_verzeichnis}': {ist_sicher}")
+    return ist_sicher
+
+
+def _parse_schaetz_fehler(text: str) -> float:
+    """
+    Parst den relativen Standardfehler des approximativen Vergleichs für argparse.
+
+    Args:
+        text (str): Die Fehlerangabe (z.B. '0.01').
+
+    Returns:
+        float: Der Schätzfehler.
+
+    Raises:
+        argparse.ArgumentTypeError: Bei ungültigen Angaben oder Werten außerhalb von SCHAETZ_FEHLER_MIN bis SCHAETZ_FEHLER_MAX.
+    """
+    try:
+        schaetz_fehler = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Ungültiger Schätzfehler: '{text}'.")
+    if not SCHAETZ_FEHLER_MIN <= schaetz_fehler <= SCHAETZ_FEHLER_MAX: # Schließt auch NaN aus
+        raise argparse.ArgumentTypeError(f"Schätzfehler {text} liegt außerhalb von {SCHAETZ_FEHLER_MIN}-{SCHAETZ_FEHLER_MAX}.")
+    return schaetz_fehler
+
+
+def _parse_benchmark_groessen(text: str) -> List[int]:
+    """
+    Parst eine kommagetrennte Liste von Benchmark-Größen (z.B. '10k,1M,50M') für argparse.
+
+    Args:
+        text (str): Die Größenangabe.
+
+    Returns:
+        List[int]: Die Zeilenanzahlen.
+
+    Raises:
+        argparse.ArgumentTypeError: Bei ungültigen Angaben oder Größen außerhalb des unterstützten Bereichs.
+    """
+    faktoren = {'k': 1_000, 'm': 1_000_000}
+    groessen: List[int] = []
+    for teil in (t.strip().lower() for t in text.split(',') if t.strip()):
+        try:
+            groesse = int(float(teil[:-1]) * faktoren[teil[-1]]) if teil[-1] in faktoren else int(teil)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Ungültige Benchmark-Größe: '{teil}'.")
+        if not BENCHMARK_MIN_ZEILEN <= groesse <= BENCHMARK_MAX_ZEILEN:
+            raise argparse.ArgumentTypeError(f"Benchmark-Größe {groesse} liegt außerhalb von {BENCHMARK_MIN_ZEILEN}-{BENCHMARK_MAX_ZEILEN} Zeilen.")
+        groessen.append(groesse)
+    return groessen
+
+
+def formatiere_trend_bericht(auswertung: VerlaufsAuswertung, zeitraum: str = 'woche', anzahl: int = VERLAUF_TOP_STANDARD) -> str:
+    """
+    Formatiert die Trendauswertung als Text (CLI): Rollups des Zeitraums, größte Änderungen und letzte Auffälligkeiten.
+
+    Args:
+        auswertung (VerlaufsAuswertung): Die Verlaufsauswertung des DatenManagers.
+        zeitraum (str): 'tag', 'woche' oder 'monat'.
+        anzahl (int): Anzahl der Dateipaare in der Rangliste und der angezeigten Auffälligkeiten.
+
+    Returns:
+        str: Der mehrzeilige Bericht.
+    """
+    def prozent(wert: Optional[float]) -> str:
+        return '' if wert is None else f"{wert:.2%}"
+
+    def zahl(wert: Optional[float], stellen: int) -> str:
+        return '' if wert is None else f"{wert:.{stellen}f}"
+
+    zeilen = [f"Rollups je {zeitraum.capitalize()}:",
+              f"  {'Periode':<11} {'Datei 1':<25} {'Datei 2':<25} {'Läufe':>6} {'Gleiche':>10} {'Anteil':>8} {'Basis':<20} {'Alter 1':>8} {'Alter 2':>8}"]
+    for rollup in auswertung.rollups(zeitraum):
+        zeilen.append(f"  {rollup['periode']:<11} {rollup['datei1_name']:<25} {rollup['datei2_name']:<25} {rollup['laeufe']:>6} "
+                      f"{zahl(rollup['mittel_gleiche'], 0):>10} {prozent(rollup['mittel_anteil']):>8} {rollup['anteil_basis']:<20} "
+                      f"{zahl(rollup['mittel_alter_datei1'], 1):>8} {zahl(rollup['mittel_alter_datei2'], 1):>8}")
+    zeilen.append(f"Größte Änderungen des Überlappungsanteils (Top {anzahl}, {zeitraum} zu Vorperiode, gleiche Basis):")
+    for aenderung in auswertung.top_aenderungen(anzahl, zeitraum):
+        zeilen.append(f"  {aenderung['datei1_name']} / {aenderung['datei2_name']}: {prozent(aenderung['vorheriger_anteil'])} ({aenderung['vorherige_periode']}) "
+                      f"-> {prozent(aenderung['anteil'])} ({aenderung['periode']}), {aenderung['aenderung'] * 100:+.2f} Prozentpunkte "
+                      f"[{aenderung['anteil_basis']}]")
+    zeilen.append("Auffälligkeiten im Überlappungsanteil:")
+    for anomalie in auswertung.anomalien(anzahl):
+        zeilen.append(f"  {anomalie['vergleichszeitpunkt']} {anomalie['datei1_name']} / {anomalie['datei2_name']}: {prozent(anomalie['anteil'])} "
+                      f"(bisher {prozent(anomalie['erwartet'])}, z = {anomalie['z_wert']:+.1f})")
+    return "\n".join(zeilen)
+
+
+# --- Hauptfunktion (CipherCore Standard: Robuste Ausführung und Fehlerbehandlung) ---
+
+def _berechne_spalten_statistiken(dateien: Tuple[Tuple[str, Optional[str]], ...], daten_frames: Optional[Tuple[pd.DataFrame, ...]],
+                                  daten_lader: DatenLader, abbruch_token: Optional[VergleichsAbbruchToken] = None) -> Dict[str, Dict]:
+    """
+    Berechnet die Spaltenstatistik beider Dateien in einem Durchlauf je Datei: aus den bereits geladenen DataFrames
+    oder, bei Verfahren ohne vollständiges Laden, blockweise über DatenLader.lade_bloecke.
+
+    Args:
+        dateien (Tuple[Tuple[str, Optional[str]], ...]): (Dateipfad, Arbeitsblatt) je Datei.
+        daten_frames (Optional[Tuple[pd.DataFrame, ...]]): Bereits geladene Daten (optional).
+        daten_lader (DatenLader): Lader für das blockweise Lesen.
+        abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch (optional).
+
+    Returns:
+        Dict[str, Dict]: 'datei1'/'datei2' -> Dateiname, Zeilenanzahl und Kennzahlen je Spalte.
+    """
+    spalten_statistiken: Dict[str, Dict] = {}
+    for nummer, (datei_pfad, blatt_name) in enumerate(dateien, 1):
+        statistik_engine = StatistikEngine()
+        bloecke = [daten_frames[nummer - 1]] if daten_frames else daten_lader.lade_bloecke(datei_pfad, abbruch_token, blatt_name=blatt_name)
+        for block in bloecke:
+            statistik_engine.aktualisiere(block)
+        spalten_statistiken[f"datei{nummer}"] = {"datei": os.path.basename(datei_pfad), "zeilen": statistik_engine.zeilen,
+                                                 "spalten": statistik_engine.ergebnis()}
+    return spalten_statistiken
+
+
+def dateien_vergleichen_und_bericht_erstellen(datei_pfad1: str, datei_pfad2: str, logo_pfad: str = LOGO_DATEIPFAD, ausgabe_pfad: str = AUSGABE_DATEIPFAD,
+                                              diagramm_typ: str = DIAGRAMM_TYP_BALKEN, daten_manager: Optional[AbstractDataManager] = None,
+                                              ui_status_rueckruf: Optional[Callable[[str], None]] = None,
+                                              spalte_datei1: str = 'Name', spalte_datei2: str = 'Name', lizenzschluessel: Optional[str] = None,
+                                              abbruch_token: Optional[VergleichsAbbruchToken] = None,
+                                              fortschritt_rueckruf: Optional[Callable[[float], None]] = None,
+                                              profiler: Optional[StufenProfiler] = None,
+                                              blatt_datei1: Optional[str] = None, blatt_datei2: Optional[str] = None,
+                                              inkrementell: bool = False, shards: int = 0,
+                                              approximativ: bool = False, schaetz_fehler: Optional[float] = None,
+                                              spalten_statistik: bool = False, lauf_cache: bool = True,
+                                              duplikat_bericht: bool = False, extern_sortieren: bool = False,
+                                              speicher_budget_mb: Optional[float] = None, sql_engine: Optional[str] = None,
+                                              diff_bericht: bool = False) -> Tuple[str, Optional[VergleichsErgebnis]]:
+    """
+    Hauptfunktion: Vergleicht zwei Dateien, erstellt Statistiken, Diagramm und PDF-Bericht.
+    Implementiert umfassende Fehlerbehandlung und Logging für robuste Ausführung.
+    Klare Schnittstelle mit Rückgabewerten und optionalem UI-Status-Rückruf.
+
+    Pro Version Funktionalität:
+        - Kreisdiagramm ist nur in der Pro Version verfügbar.
+        - Speichern der Vergleichsergebnisse im DatenManager ist nur in der Pro Version aktiv.
+
+    Args:
+        datei_pfad1 (str): Der Pfad zur ersten Datei (Benutzereingabe).
+        datei_pfad2 (str): Der Pfad zur zweiten Datei (Hauptliste).
+        logo_pfad (str): Der Pfad zum Logo für den Bericht (optional).
+        ausgabe_pfad (str): Der Pfad für den PDF-Bericht (optional).
+        diagramm_typ (str): Der Diagrammtyp ('balken' oder 'kreis', optional).
+        daten_manager (Optional[AbstractDataManager]): Der Daten-Manager für die Speicherung der Ergebnisse (optional).
+        ui_status_rueckruf (Optional[Callable[[str], None]]): Eine Rückruffunktion zur Aktualisierung des UI-Status (optional).
+        spalte_datei1 (str, optional): Spalte für Vergleich aus Datei 1. Standard 'Name'.
+        spalte_datei2 (str, optional): Spalte für Vergleich aus Datei 2. Standard 'Name'.
+        lizenzschluessel (Optional[str]): Der Lizenzschlüssel zur Validierung (optional).
+        abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch des Laufs (optional).
+        fortschritt_rueckruf (Optional[Callable[[float], None]]): Rückruffunktion für den Fortschritt in Prozent (0-100, optional).
+        profiler (Optional[StufenProfiler]): Misst die Pipeline-Stufen und schreibt ein Profil neben den PDF-Bericht (optional).
+        blatt_datei1 (Optional[str]): Arbeitsblatt, falls Datei 1 eine Excel-Datei ist (optional, Standard: erstes Blatt).
+        blatt_datei2 (Optional[str]): Arbeitsblatt, falls Datei 2 eine Excel-Datei ist (optional, Standard: erstes Blatt).
+        inkrementell (bool): Vergleichszustand je Datei nutzen und nur angehängte Zeilen neu verarbeiten (optional).
+                             Der Zustand liegt neben dem Speicherort des Daten-Managers, ohne Manager im Arbeitsverzeichnis.
+        shards (int): Anzahl der Partitionen für den partitionierten Vergleich in mehreren Prozessen (optional,
+                      0 oder 1: ohne Partitionierung). Hat Vorrang vor dem inkrementellen Vergleich.
+        approximativ (bool): Übereinstimmungen über HyperLogLog-/MinHash-Skizzen schätzen (optional). Die Skizzen werden
+                             wie der inkrementelle Zustand gespeichert. Hat Vorrang vor allen anderen Verfahren.
+        schaetz_fehler (Optional[float]): Relativer Standardfehler der Skizzen (optional, Standard: aus config.json).
+        spalten_statistik (bool): Kennzahlen aller Spalten beider Dateien berechnen und als '<bericht>_statistik.json'
+                                  neben den PDF-Bericht schreiben (optional).
+        lauf_cache (bool): Das Vergleichsergebnis unveränderter Läufe (gleiche Dateiinhalte und Optionen) aus dem
+                           Lauf-Cache übernehmen, ohne Laden und Vergleich; Diagramm und PDF-Bericht werden neu erstellt
+                           (optional, Standard: aktiv). Mit Profiler nicht verwendet.
+        duplikat_bericht (bool): Alle Zeilen mehrfach vorkommender Werte beider Dateien als '<bericht>_duplikate.csv'
+                                 neben den PDF-Bericht schreiben (optional, nur beim Standardvergleich; ohne Lauf-Cache).
+        extern_sortieren (bool): Schlüssel beider Dateien extern in sortierten Läufen auf der Festplatte sortieren und
+                                 mischen, für Eingaben größer als der Arbeitsspeicher (optional, Speicherbudget und
+                                 Arbeitsverzeichnis aus config.json). Hat Vorrang vor dem inkrementellen Vergleich.
+        speicher_budget_mb (Optional[float]): Speicherbudget in MB für die automatische Verfahrenswahl (optional,
+                                              Standard: aus config.json bzw. automatisch). Ist kein Verfahren
+                                              vorgegeben, wird der Umfang beider Dateien geschätzt; übersteigt der
+                                              Standardvergleich das Budget, wird das externe Sortieren bzw. der
+                                              SQL-Vergleich empfohlen (gewechselt nur mit AUTOMATISCHER_VERFAHRENSWECHSEL).
+        sql_engine (Optional[str]): Beide Dateien in eine eingebettete Datenbank laden und mit SQL vergleichen
+                                    ('duckdb', 'sqlite' oder 'auto', optional; Speicherbudget und Arbeitsverzeichnis
+                                    wie beim externen Sortieren). Hat Vorrang vor externem Sortieren und inkrementellem Vergleich.
+        diff_bericht (bool): Alle Werte, die nur in einer Datei vorkommen, als '<bericht>_diff.csv' neben den
+                             PDF-Bericht schreiben (optional, nur mit sql_engine; ohne Lauf-Cache).
+
+    Returns:
+        Tuple[str, Optional[VergleichsErgebnis]]: Ein Tuple mit dem Pfad zum PDF-Bericht und den Vergleichsergebnissen
+               (inklusive Laufzeiten je Stufe). Im Fehlerfall wird ein Fehlerstring und None zurückgegeben.
+    """
+    logger.info(f"Starte Dateivergleich: Datei 1='{datei_pfad1}', Datei 2='{datei_pfad2}'")
+    if ui_status_rueckruf:
+        ui_status_rueckruf("Vergleich gestartet...")
+
+    ist_pro = ist_pro_version(lizenzschluessel) # Prüfen ob Pro Version aktiv ist
+
+    if lizenzschluessel and not ist_pro:
+        fehler_meldung = "Ungültiger Lizenzschlüssel. Bitte überprüfen Sie Ihren Lizenzschlüssel."
+        logger.error(fehler_meldung)
+        if ui_status_rueckruf:
+            ui_status_rueckruf(fehler_meldung)
+        return fehler_meldung, None # Abbruch, da Lizenz ungültig
+
+    def _fortschritt(prozent: float) -> None:
+        if abbruch_token:
+            abbruch_token.pruefe() # Abbruchprüfung an jeder Stufengrenze
+        if fortschritt_rueckruf:
+            fortschritt_rueckruf(prozent)
+
+    if schaetz_fehler is None: # Ein expliziter Wert (auch 0) wird nicht durch den Standard ersetzt
+        schaetz_fehler = SCHAETZ_FEHLER
+
+    try:
+        _fortschritt(0)
+        daten_lader = DatenLader(BASIS_VERZEICHNIS)
+        datei_vergleicher = DateiVergleicher()
+        cache, cache_schluessel, treffer = None, None, None
+        dateien_lesbar = all(daten_lader._ist_pfad_sicher(pfad) and os.path.isfile(pfad) for pfad in (datei_pfad1, datei_pfad2))
+        sortier_speicher_mb = SORTIER_SPEICHER_MB
+        if dateien_lesbar and not (approximativ or shards > 1 or sql_engine or extern_sortieren or inkrementell): # Vorgegebene Verfahren bleiben unverändert
+            budget_mb = ermittle_speicher_budget(speicher_budget_mb)
+            try:
+                schaetzungen = [daten_lader.schaetze_eingabe(datei_pfad1, spalte_datei1, blatt_datei1),
+                                daten_lader.schaetze_eingabe(datei_pfad2, spalte_datei2, blatt_datei2)]
+            except (OSError, ValueError, CipherCoreDatenFehler) as e:
+                logger.warning(f"Umfang der Eingaben nicht schätzbar, Standardvergleich wird verwendet: {e}")
+            else:
+                wahl = waehle_vergleichsverfahren(schaetzungen, budget_mb, duplikat_bericht)
+                logger.info(f"Verfahrenswahl: {wahl.verfahren} ({wahl.begruendung})")
+                if wahl.verfahren != VERFAHREN_STANDARD and not AUTOMATISCHER_VERFAHRENSWECHSEL:
+                    logger.warning(f"Automatischer Wechsel zu '{wahl.verfahren}' ist deaktiviert, Standardvergleich wird verwendet "
+                                   f"(--extern_sortieren bzw. --sql wählen das Verfahren ausdrücklich).")
+                    if ui_status_rueckruf:
+                        ui_status_rueckruf(f"Große Eingaben, Standardvergleich (empfohlen: {wahl.verfahren}): {wahl.begruendung}")
+                elif wahl.verfahren == VERFAHREN_SORTIERT:
+                    extern_sortieren, sortier_speicher_mb = True, wahl.sortier_speicher_mb
+                    if ui_status_rueckruf:
+                        ui_status_rueckruf(f"Große Eingaben, Vergleich mit externem Sortieren: {wahl.begruendung}")
+                elif wahl.verfahren == VERFAHREN_SQL:
+                    sql_engine, sortier_speicher_mb = SQL_ENGINE_AUTO, wahl.sortier_speicher_mb
+                    if ui_status_rueckruf:
+                        ui_status_rueckruf(f"Große Eingaben mit Duplikatdatei, Vergleich mit SQL: {wahl.begruendung}")
+        statistik_pfad = os.path.splitext(ausgabe_pfad)[0] + STATISTIK_DATEI_ENDUNG if spalten_statistik else None
+        duplikat_pfad = os.path.splitext(ausgabe_pfad)[0] + DUPLIKAT_DATEI_ENDUNG if duplikat_bericht else None
+        diff_pfad = os.path.splitext(ausgabe_pfad)[0] + DIFF_DATEI_ENDUNG if diff_bericht else None
+        if duplikat_pfad and (approximativ or shards > 1 or (not sql_engine and (extern_sortieren or inkrementell))):
+            logger.warning("Die Duplikatdatei wird nur beim Standard- und beim SQL-Vergleich geschrieben.")
+        if diff_pfad and (approximativ or shards > 1 or not sql_engine):
+            logger.warning("Die Differenzdatei wird nur beim SQL-Vergleich geschrieben.")
+        if lauf_cache and profiler is None and duplikat_pfad is None and diff_pfad is None and dateien_lesbar:
+            stufen_start = time.perf_counter()
+            zustands_verzeichnis = daten_manager.zustands_verzeichnis() if daten_manager else ZUSTANDS_VERZEICHNIS_NAME
+            cache = LaufCache(os.path.join(zustands_verzeichnis, LAUF_CACHE_VERZEICHNIS_NAME), LAUF_CACHE_TTL_STUNDEN, LAUF_CACHE_MAX_MB)
+            verfahren = (VERFAHREN_APPROXIMATIV if approximativ else VERFAHREN_PARTITIONIERT if shards > 1 else VERFAHREN_SQL if sql_engine
+                         else VERFAHREN_SORTIERT if extern_sortieren else VERFAHREN_INKREMENTELL if inkrementell else VERFAHREN_STANDARD)
+            optionen = {"dateinamen": [os.path.basename(datei_pfad1), os.path.basename(datei_pfad2)], "spalten": [spalte_datei1, spalte_datei2],
+                        "blaetter": [blatt_datei1, blatt_datei2], "verfahren": verfahren,
+                        "schaetz_fehler": schaetz_fehler if approximativ else None,
+                        "statistiken": STATISTIKEN if spalten_statistik else None, "validierungs_schema": VALIDIERUNGS_SCHEMA}
+            try:
+                cache_schluessel = cache.schluessel((datei_pfad1, datei_pfad2, datei_pfad1 + SCHEMA_DATEI_ENDUNG,
+                                                     datei_pfad2 + SCHEMA_DATEI_ENDUNG), optionen, abbruch_token)
+                treffer = cache.lade(cache_schluessel, statistik_pfad)
+            except OSError as e:
+                logger.warning(f"Lauf-Cache nicht verfügbar, Vergleich wird vollständig ausgeführt: {e}")
+                cache, treffer = None, None
+            if treffer:
+                treffer[0].laufzeiten['cache'] = time.perf_counter() - stufen_start
+        daten_frames: Optional[Tuple[pd.DataFrame, pd.DataFrame]] = None # Nur beim Standardvergleich vollständig geladen
+        stufen_start = time.perf_counter()
+        if treffer: # Unveränderter Lauf: nur Diagramm und Bericht werden neu erstellt (aktueller Vergleichszeitpunkt)
+            vergleichs_ergebnisse, dateiname_datei1, dateiname_datei2 = treffer
+            _fortschritt(75)
+            if ui_status_rueckruf:
+                ui_status_rueckruf("Unveränderter Lauf, Vergleichsergebnis aus dem Cache übernommen...")
+        elif approximativ:
+            skizzen_verzeichnis = daten_manager.zustands_verzeichnis() if daten_manager else ZUSTANDS_VERZEICHNIS_NAME
+            with _profil_stufe(profiler, "approximativ", speicher_messen=True):
+                vergleichs_ergebnisse, dateiname_datei1, dateiname_datei2 = datei_vergleicher.vergleiche_dateien_approximativ(
+                    datei_pfad1, datei_pfad2, daten_lader, skizzen_verzeichnis, spalte_datei1, spalte_datei2, abbruch_token,
+                    blatt_datei1, blatt_datei2, schaetz_fehler)
+            _fortschritt(75)
+            if ui_status_rueckruf:
+                ui_status_rueckruf("Approximativer Datenvergleich abgeschlossen...")
+        elif shards > 1:
+            with _profil_stufe(profiler, "partitioniert", speicher_messen=True):
+                vergleichs_ergebnisse, dateiname_datei1, dateiname_datei2 = ShardVergleicher(shards).vergleiche_dateien(
+                    datei_pfad1, datei_pfad2, daten_lader, spalte_datei1, spalte_datei2, abbruch_token, blatt_datei1, blatt_datei2)
+            _fortschritt(75)
+            if ui_status_rueckruf:
+                ui_status_rueckruf("Partitionierter Datenvergleich abgeschlossen...")
+        elif sql_engine:
+            with _profil_stufe(profiler, "sql", speicher_messen=True):
+                vergleichs_ergebnisse, dateiname_datei1, dateiname_datei2 = SqlVergleicher(sql_engine, sortier_speicher_mb, SORTIER_VERZEICHNIS).vergleiche_dateien(
+                    datei_pfad1, datei_pfad2, daten_lader, spalte_datei1, spalte_datei2, abbruch_token, blatt_datei1, blatt_datei2,
+                    diff_pfad, duplikat_pfad)
+            _fortschritt(75)
+            if ui_status_rueckruf:
+                ui_status_rueckruf("SQL-Datenvergleich abgeschlossen...")
+        elif extern_sortieren:
+            with _profil_stufe(profiler, "sortiert", speicher_messen=True):
+                vergleichs_ergebnisse, dateiname_datei1, dateiname_datei2 = ExternerSortierVergleicher(sortier_speicher_mb, SORTIER_VERZEICHNIS).vergleiche_dateien(
+                    datei_pfad1, datei_pfad2, daten_lader, spalte_datei1, spalte_datei2, abbruch_token, blatt_datei1, blatt_datei2)
+            _fortschritt(75)
+            if ui_status_rueckruf:
+                ui_status_rueckruf("Datenvergleich mit externem Sortieren abgeschlossen...")
+        elif inkrementell:
+            zustands_verzeichnis = daten_manager.zustands_verzeichnis() if daten_manager else ZUSTANDS_VERZEICHNIS_NAME
+            with _profil_stufe(profiler, "inkrementell", speicher_messen=True):
+                vergleichs_ergebnisse, dateiname_datei1, dateiname_datei2 = datei_vergleicher.vergleiche_dateien_inkrementell(
+                    datei_pfad1, datei_pfad2, daten_lader, zustands_verzeichnis, spalte_datei1, spalte_datei2, abbruch_token, blatt_datei1, blatt_datei2)
+            _fortschritt(75)
+            if ui_status_rueckruf:
+                ui_status_rueckruf("Inkrementeller Datenvergleich abgeschlossen...")
+        else:
+            byte_identisch = (spalte_datei1 == spalte_datei2 and blatt_datei1 == blatt_datei2
+                              and daten_lader.ist_byte_identisch(datei_pfad1, datei_pfad2))
+            with _profil_stufe(profiler, "laden_datei1", speicher_messen=True):
+                daten_frame1, dateiname_datei1 = daten_lader.lade_daten(datei_pfad1, abbruch_token, [spalte_datei1, *VERGLEICH_ZUSATZ_SPALTEN], blatt_datei1)
+            _fortschritt(30)
+            if byte_identisch: # Zweite Datei nicht erneut parsen, vergleiche_daten erkennt dasselbe DataFrame
+                logger.info(f"Dateien '{os.path.basename(datei_pfad1)}' und '{os.path.basename(datei_pfad2)}' sind byte-identisch.")
+                daten_frame2, dateiname_datei2 = daten_frame1, os.path.basename(datei_pfad2)
+            else:
+                with _profil_stufe(profiler, "laden_datei2", speicher_messen=True):
+                    daten_frame2, dateiname_datei2 = daten_lader.lade_daten(datei_pfad2, abbruch_token, [spalte_datei2, *VERGLEICH_ZUSATZ_SPALTEN], blatt_datei2)
+            _fortschritt(60)
+            if ui_status_rueckruf:
+                ui_status_rueckruf("Daten erfolgreich geladen...")
+
+            with _profil_stufe(profiler, "vergleichen", speicher_messen=True):
+                vergleichs_ergebnisse = datei_vergleicher.vergleiche_daten(daten_frame1, daten_frame2, spalte_datei1, spalte_datei2, abbruch_token,
+                                                                           duplikat_pfad) # Spalten für Vergleich übergeben
+            daten_frames = (daten_frame1, daten_frame2)
+            _fortschritt(75)
+        if not treffer:
+            vergleichs_ergebnisse.laufzeiten['vergleichen'] = time.perf_counter() - stufen_start # Inklusive Laden der Daten
+
+        spalten_statistiken = None
+        if spalten_statistik and not treffer: # Bei einem Treffer stellt der Cache die Spaltenstatistik bereit
+            stufen_start = time.perf_counter()
+            with _profil_stufe(profiler, "statistik", speicher_messen=True):
+                spalten_statistiken = _berechne_spalten_statistiken(((datei_pfad1, blatt_datei1), (datei_pfad2, blatt_datei2)),
+                                                                    daten_frames, daten_lader, abbruch_token)
+            vergleichs_ergebnisse.laufzeiten['statistik'] = time.perf_counter() - stufen_start
+        if ui_status_rueckruf:
+            ui_status_rueckruf("Datenvergleich abgeschlossen...")
+
+        diagramm_generator = DiagrammGenerator()
+        stufen_start = time.perf_counter()
+        with _profil_stufe(profiler, "diagramm"):
+            diagramm_bild_daten = diagramm_generator.erstelle_diagramm(vergleichs_ergebnisse, diagramm_typ, ist_pro) # Pro Version Status übergeben
+        vergleichs_ergebnisse.laufzeiten['diagramm'] = time.perf_counter() - stufen_start
+        _fortschritt(85)
+        if ui_status_rueckruf:
+            ui_status_rueckruf("Diagramm erstellt...")
+
+        berichts_generator = BerichtsGenerator(logo_pfad, ausgabe_pfad, daten_manager)
+        with _profil_stufe(profiler, "bericht"):
+            pdf_pfad = berichts_generator.erstelle_pdf_bericht(vergleichs_ergebnisse, diagramm_bild_daten,
+                                                                dateiname_datei1, dateiname_datei2, ist_pro) # Pro Version Status übergeben
+        if spalten_statistiken is not None:
+            with open(statistik_pfad, 'w', encoding='utf-8') as statistik_datei:
+                json.dump(spalten_statistiken, statistik_datei, indent=4, ensure_ascii=False)
+            logger.info(f"Spaltenstatistik gespeichert: '{statistik_pfad}'")
+        if cache and cache_schluessel and not treffer:
+            cache.speichere(cache_schluessel, vergleichs_ergebnisse, dateiname_datei1, dateiname_datei2, statistik_pfad)
+        if fortschritt_rueckruf:
+            fortschritt_rueckruf(100) # Bericht ist geschrieben, ein Abbruch greift hier nicht mehr
+        if ui_status_rueckruf:
+            ui_status_rueckruf(f"PDF-Bericht erfolgreich erstellt: {pdf_pfad}")
+
+        logger.info(f"PDF-Bericht erfolgreich erstellt: '{pdf_pfad}'")
+        return pdf_pfad, vergleichs_ergebnisse
+
+    except CipherCoreAbbruchFehler as e: # Kooperativer Abbruch durch den Benutzer
+        fehler_meldung = f"Vergleich abgebrochen: {e}"
+        logger.info(fehler_meldung)
+        if ui_status_rueckruf:
+            ui_status_rueckruf(fehler_meldung)
+        return fehler_meldung, None
+    except CipherCoreDateiLadeFehler as e: # Spezifische Fehlerbehandlung für Dateiladefehler
+        fehler_meldung = f"Fehler beim Laden der Datei: {e}"
+        logger.error(fehler_meldung)
+        if ui_status_rueckruf:
+            ui_status_rueckruf(fehler_meldung)
+        return fehler_meldung, None
+    except CipherCoreDatenValidierungsFehler as e: # Spezifische Fehlerbehandlung für Datenvalidierungsfehler
+        fehler_meldung = f"Datenvalidierungsfehler: {e}"
+        logger.error(fehler_meldung)
+        if ui_status_rueckruf:
+            ui_status_rueckruf(fehler_meldung)
+        return fehler_meldung, None
+    except CipherCoreDatenbankFehler as e: # Spezifische Fehlerbehandlung für Datenbankfehler
+        fehler_meldung = f"Datenbankfehler: {e}"
+        logger.error(fehler_meldung)
+        if ui_status_rueckruf:
+            ui_status_rueckruf(fehler_meldung)
+        return fehler_meldung, None
+    except CipherCoreDateiFehler as e: # Generische Fehlerbehandlung für Dateifehler
+        fehler_meldung = f"Dateifehler: {e}"
+        logger.error(fehler_meldung)
+        if ui_status_rueckruf:
+            ui_status_rueckruf(fehler_meldung)
+        return fehler_meldung, None
+    except CipherCoreUngültigerDiagrammTypFehler as e: # Spezifische Fehlerbehandlung für ungültigen Diagrammtyp
+        fehler_meldung = f"Ungültiger Diagrammtyp: {e}"
+        logger.error(fehler_meldung)
+        if ui_status_rueckruf:
+            ui_status_rueckruf(fehler_meldung)
+        return fehler_meldung, None
+    except CipherCoreLizenzFehler as e: # Spezifische Fehlerbehandlung für Lizenzfehler
+        fehler_meldung = f"Lizenzfehler: {e}"
+        logger.error(fehler_meldung)
+        if ui_status_rueckruf:
+            ui_status_rueckruf(fehler_meldung)
+        return fehler_meldung, None
+    except Exception as e: # Unerwartete Fehlerbehandlung (Generischer Catch-All)
+        logger.exception(f"Unerwarteter Fehler: {e}")
+        if ui_status_rueckruf:
+            ui_status_rueckruf(f"Unerwarteter Fehler: {e}")
+        return f"Unerwarteter Fehler: {e}", None
+    finally:
+        if profiler and profiler.stufen: # Profil auch bei Fehlern schreiben (enthält dann die bis dahin gemessenen Stufen)
+            try:
+                profiler.schreibe_bericht(ausgabe_pfad)
+            except OSError as e:
+                logger.error(f"Fehler beim Schreiben des Stufenprofils: {e}")
+
+
+
+def dateien_mehrfach_vergleichen_und_bericht_erstellen(datei_pfade: List[str], logo_pfad: str = LOGO_DATEIPFAD, ausgabe_pfad: str = AUSGABE_DATEIPFAD,
+                                                       spalte: str = 'Name', abbruch_token: Optional[VergleichsAbbruchToken] = None
+                                                       ) -> Tuple[str, Optional[MehrfachVergleichsErgebnis]]:
+    """
+    N-Wege-Vergleich: Vergleicht mehrere Dateien in einem Durchlauf und erstellt UpSet-Diagramm, PDF-Bericht mit
+    Überlappungsmatrix sowie die Ergebnisse als JSON neben dem Bericht ('<bericht>_mehrfach.json').
+
+    Args:
+        datei_pfade (List[str]): Pfade der Dateien (2 bis MEHRFACH_MAX_DATEIEN).
+        logo_pfad (str): Der Pfad zum Logo für den Bericht (optional).
+        ausgabe_pfad (str): Der Pfad für den PDF-Bericht (optional).
+        spalte (str, optional): Vergleichsspalte in allen Dateien. Standard 'Name'.
+        abbruch_token (Optional[VergleichsAbbruchToken]): Token für den kooperativen Abbruch des Laufs (optional).
+
+    Returns:
+        Tuple[str, Optional[MehrfachVergleichsErgebnis]]: Der Pfad zum PDF-Bericht und das Ergebnis oder eine
+        Fehlermeldung und None.
+    """
+    try:
+        stufen_start = time.perf_counter()
+        mehrfach_ergebnis = DateiVergleicher().vergleiche_mehrfach(datei_pfade, DatenLader(BASIS_VERZEICHNIS), [spalte] * len(datei_pfade), abbruch_token)
+        mehrfach_ergebnis.laufzeiten['vergleichen'] = time.perf_counter() - stufen_start
+        stufen_start = time.perf_counter()
+        diagramm_bild_daten = DiagrammGenerator().erstelle_upset_diagramm(mehrfach_ergebnis)
+        mehrfach_ergebnis.laufzeiten['diagramm'] = time.perf_counter() - stufen_start
+        pdf_pfad = BerichtsGenerator(logo_pfad, ausgabe_pfad).erstelle_mehrfach_bericht(mehrfach_ergebnis, diagramm_bild_daten)
+        json_pfad = os.path.splitext(ausgabe_pfad)[0] + MEHRFACH_DATEI_ENDUNG
+        with open(json_pfad, 'w', encoding='utf-8') as json_datei:
+            json.dump(mehrfach_ergebnis.als_dict(), json_datei, indent=4, ensure_ascii=False, allow_nan=False)
+        logger.info(f"N-Wege-Vergleich gespeichert: '{pdf_pfad}', '{json_pfad}'")
+        return pdf_pfad, mehrfach_ergebnis
+    except CipherCoreAbbruchFehler as e:
+        logger.info(f"Vergleich abgebrochen: {e}")
+        return f"Vergleich abgebrochen: {e}", None
+    except (CipherCoreDatenFehler, ValueError, OSError) as e:
+        logger.error(f"Fehler beim N-Wege-Vergleich: {e}")
+        return f"Fehler beim N-Wege-Vergleich: {e}", None
+
+
+
+# --- SynthetischerDatensatzGenerator Klasse (CipherCore Standard: Reproduzierbare Testdaten) ---
+class SynthetischerDatensatzGenerator:
+    """
+    Erzeugt reproduzierbare synthetische Name/Alter/Stadt-Datensatzpaare für Benchmarks.
+    Überlappung und Tippfehlerrate zwischen Datei 1 und Datei 2 sind steuerbar; große CSV-Dateien werden blockweise geschrieben.
+    """
+
+    VORNAMEN = ('Alice', 'Bob', 'Charlie', 'David', 'Eve', 'Franz', 'Greta', 'Hans', 'Ingrid', 'Julia', 'Kurt', 'Lena',
+                'Max', 'Mia', 'Noah', 'Olga', 'Paul', 'Rita', 'Sven', 'Tina', 'Uwe', 'Vera', 'Willi', 'Zoe')
+    NACHNAMEN = ('Müller', 'Schmidt', 'Schneider', 'Fischer', 'Weber', 'Meyer', 'Wagner', 'Becker', 'Schulz', 'Hoffmann',
+                 'Koch', 'Richter', 'Klein', 'Wolf', 'Neumann', 'Schwarz', 'Braun', 'Zimmermann', 'Krüger', 'Hartmann')
+    STAEDTE = ('Berlin', 'Hamburg', 'München', 'Köln', 'Frankfurt', 'Stuttgart', 'Düsseldorf', 'Leipzig', 'Dresden',
+               'Nürnberg', 'Hannover', 'Bremen', 'Dortmund', 'Essen', 'Bonn', 'Mannheim', 'Kiel', 'Rostock')
+
+    def __init__(self, zufalls_seed: int = 42):
+        """
+        Initialisiert den Generator.
+
+        Args:
+            zufalls_seed (int): Seed für reproduzierbare Datensätze.
+        """
+        self.zufalls_seed = zufalls_seed
+
+
+    def erzeuge_paar(self, verzeichnis: str, zeilen: int, datei_format: str = DATEIFORMAT_CSV, ueberlappung: float = 0.5,
+                     tippfehler_rate: float = 0.0) -> Tuple[str, str]:
+        """
+        Erzeugt ein Datensatzpaar (Datei 1 und Datei 2 mit je `zeilen` Zeilen), sofern es noch nicht existiert.
+
+        Args:
+            verzeichnis (str): Zielverzeichnis.
+            zeilen (int): Anzahl Zeilen je Datei.
+            datei_format (str): DATEIFORMAT_CSV oder DATEIFORMAT_EXCEL_XLSX.
+            ueberlappung (float): Anteil der Schlüssel aus Datei 1, die auch in Datei 2 vorkommen (0-1).
+            tippfehler_rate (float): Anteil der überlappenden Namen in Datei 2, die einen Tippfehler erhalten (0-1).
+
+        Returns:
+            Tuple[str, str]: Pfade zu Datei 1 und Datei 2.
+
+        Raises:
+            ValueError: Bei ungültigen Parametern.
+        """
+        if zeilen <= 0:
+            raise ValueError("Die Zeilenanzahl muss positiv sein.")
+        if not 0 <= ueberlappung <= 1 or not 0 <= tippfehler_rate <= 1:
+            raise ValueError("Überlappung und Tippfehlerrate müssen zwischen 0 und 1 liegen.")
+        if datei_format not in (DATEIFORMAT_CSV, DATEIFORMAT_EXCEL_XLSX):
+            raise ValueError(f"Nicht unterstütztes Benchmark-Format: '{datei_format}'.")
+        if datei_format == DATEIFORMAT_EXCEL_XLSX and zeilen > EXCEL_MAX_ZEILEN:
+            raise ValueError(f"Excel-Arbeitsblätter fassen höchstens {EXCEL_MAX_ZEILEN} Datenzeilen.")
+
+        os.makedirs(verzeichnis, exist_ok=True)
+        kennung = f"{zeilen}_{ueberlappung:g}_{tippfehler_rate:g}_{self.zufalls_seed}"
+        pfad1 = os.path.join(verzeichnis, f"synthetisch_{kennung}_datei1{datei_format}")
+        pfad2 = os.path.join(verzeichnis, f"synthetisch_{kennung}_datei2{datei_format}")
+        if os.path.exists(pfad1) and os.path.exists(pfad2):
+            logger.info(f"Synthetisches Datensatzpaar '{kennung}' ({datei_format}) bereits vorhanden, wird wiederverwendet.")
+            return pfad1, pfad2
+
+        anzahl_ueberlappend = int(round(zeilen * ueberlappung))
+        ids_datei1 = np.arange(zeilen, dtype=np.int64)
+        ids_datei2 = np.concatenate([np.arange(anzahl_ueberlappend, dtype=np.int64),
+                                     np.arange(zeilen, 2 * zeilen - anzahl_ueberlappend, dtype=np.int64)]) # Nicht überlappende Schlüssel sind neu
+        zufall = np.random.default_rng(self.zufalls_seed)
+        tippfehler_maske = np.zeros(zeilen, dtype=bool)
+        tippfehler_maske[:anzahl_ueberlappend] = zufall.random(anzahl_ueberlappend) < tippfehler_rate
+
+        logger.info(f"Erzeuge synthetisches Datensatzpaar '{kennung}' ({datei_format})...")
+        for pfad, ids, maske in ((pfad1, ids_datei1, None), (pfad2, ids_datei2, tippfehler_maske)):
+            if datei_format == DATEIFORMAT_CSV:
+                for start in range(0, zeilen, CSV_BLOCK_GROESSE): # Blockweise schreiben, damit auch 50 Mio. Zeilen in den Speicher passen
+                    block_maske = maske[start:start + CSV_BLOCK_GROESSE] if maske is not None else None
+                    block = self._erzeuge_block(ids[start:start + CSV_BLOCK_GROESSE], block_maske, zufall)
+                    block.to_csv(pfad, mode='w' if start == 0 else 'a', header=start == 0, index=False, encoding='utf-8')
+            else:
+                self._erzeuge_block(ids, maske, zufall).to_excel(pfad, index=False)
+        return pfad1, pfad2
+
+
+    def _erzeuge_block(self, ids: np.ndarray, tippfehler_maske: Optional[np.ndarray], zufall: np.random.Generator) -> pd.DataFrame:
+        """
+        Interne Hilfsfunktion zum Erzeugen eines Datenblocks aus Schlüssel-IDs.
+
+        Args:
+            ids (np.ndarray): Schlüssel-IDs des Blocks.
+            tippfehler_maske (Optional[np.ndarray]): Zeilen, deren Name einen Tippfehler erhält (optional).
+            zufall (np.random.Generator): Zufallsgenerator.
+
+        Returns:
+            pd.DataFrame: Block mit den Spalten Name, Alter und Stadt.
+        """
+        vornamen = np.array(self.VORNAMEN, dtype=object)[ids % len(self.VORNAMEN)]
+        nachnamen = np.array(self.NACHNAMEN, dtype=object)[(ids // len(self.VORNAMEN)) % len(self.NACHNAMEN)]
+        namen = vornamen + " " + nachnamen + " " + ids.astype(str).astype(object) # ID-Suffix macht jeden Schlüssel eindeutig
+        if tippfehler_maske is not None and tippfehler_maske.any():
+            namen[tippfehler_maske] = [self._tippfehler(name) for name in namen[tippfehler_maske]]
+        return pd.DataFrame({
+            'Name': namen,
+            'Alter': zufall.integers(18, 90, size=len(ids)),
+            'Stadt': np.array(self.STAEDTE, dtype=object)[zufall.integers(0, len(self.STAEDTE), size=len(ids))]
+        })
+
+
+    @staticmethod
+    def _tippfehler(name: str) -> str:
+        """
+        Interne Hilfsfunktion, die zwei benachbarte Buchstaben des Vornamens vertauscht (deterministisch).
+
+        Args:
+            name (str): Der Originalname.
+
+        Returns:
+            str: Der Name mit Tippfehler.
+        """
+        return name[1] + name[0] + name[2:] if len(name) > 1 and name[0] != name[1] else name + "x"
+
+
+
+# --- BenchmarkRunner Klasse (CipherCore Standard: Messbare Performance) ---
+class BenchmarkRunner:
+    """
+    Misst die Laufzeit jeder Pipeline-Stufe (Laden, Validieren, Vergleichen, Diagramm, PDF, Speichern)
+    auf synthetischen Datensätzen und liefert die Ergebnisse als maschinenlesbares Dictionary (JSON-serialisierbar).
+    """
+
+    STUFEN = ('generieren', 'laden', 'validieren', 'vergleichen', 'diagramm', 'pdf', 'speichern_sqlite', 'speichern_file')
+
+    def __init__(self, basis_verzeichnis: str = BASIS_VERZEICHNIS, arbeits_verzeichnis: str = BENCHMARK_VERZEICHNIS_STANDARD,
+                 generator: Optional[SynthetischerDatensatzGenerator] = None):
+        """
+        Initialisiert den BenchmarkRunner.
+
+        Args:
+            basis_verzeichnis (str): Basisverzeichnis für die Pfadsicherheitsprüfung des DatenLaders.
+            arbeits_verzeichnis (str): Verzeichnis für Datensätze, PDF und Persistenz (muss im Basisverzeichnis liegen).
+            generator (Optional[SynthetischerDatensatzGenerator]): Datensatzgenerator (optional).
+        """
+        if not _ist_pfad_sicher_static(arbeits_verzeichnis, basis_verzeichnis):
+            raise ValueError("Das Benchmark-Verzeichnis muss innerhalb des Basisverzeichnisses liegen.")
+        self.basis_verzeichnis = basis_verzeichnis
+        self.arbeits_verzeichnis = arbeits_verzeichnis
+        self.generator = generator or SynthetischerDatensatzGenerator()
+
+
+    def fuehre_aus(self, groessen: List[int], formate: List[str], ueberlappung: float = 0.5, tippfehler_rate: float = 0.01,
+                   bezeichnung: Optional[str] = None) -> Dict:
+        """
+        Führt den Benchmark für alle Kombinationen aus Größe und Format aus.
+        Nicht ausführbare Kombinationen (z.B. XLSX mit mehr Zeilen als ein Arbeitsblatt fasst) werden mit Grund protokolliert.
+
+        Args:
+            groessen (List[int]): Zeilenanzahlen je Datei.
+            formate (List[str]): Dateiformate (DATEIFORMAT_CSV, DATEIFORMAT_EXCEL_XLSX).
+            ueberlappung (float): Überlappung der Schlüssel (0-1).
+            tippfehler_rate (float): Tippfehlerrate der überlappenden Schlüssel (0-1).
+            bezeichnung (Optional[str]): Freie Bezeichnung des Laufs, z.B. Versions- oder Commit-Kennung (optional).
+
+        Returns:
+            Dict: Benchmark-Ergebnisse inkl. Umgebungsinformationen.
+        """
+        ergebnisse: List[Dict] = []
+        for datei_format in formate:
+            for zeilen in groessen:
+                eintrag = {"zeilen": zeilen, "format": datei_format, "ueberlappung": ueberlappung, "tippfehler_rate": tippfehler_rate}
+                try:
+                    eintrag.update(self._messe_kombination(zeilen, datei_format, ueberlappung, tippfehler_rate))
+                except (ValueError, CipherCoreDatenFehler) as e:
+                    logger.warning(f"Benchmark für {zeilen} Zeilen ({datei_format}) übersprungen: {e}")
+                    eintrag["uebersprungen"] = str(e)
+                ergebnisse.append(eintrag)
+        return {
+            "bezeichnung": bezeichnung,
+            "zeitpunkt": datetime.datetime.now().isoformat(),
+            "umgebung": {"python": platform.python_version(), "pandas": pd.__version__, "plattform": platform.platform()},
+            "ergebnisse": ergebnisse
+        }
+
+
+    def _messe_kombination(self, zeilen: int, datei_format: str, ueberlappung: float, tippfehler_rate: float) -> Dict:
+        """
+        Interne Hilfsfunktion, die alle Pipeline-Stufen für ein Datensatzpaar misst.
+
+        Returns:
+            Dict: Stufenzeiten in Sekunden, Dateigrößen und Vergleichsmetriken.
+        """
+        stufen: Dict[str, float] = {}
+        start = time.perf_counter()
+        pfad1, pfad2 = self.generator.erzeuge_paar(self.arbeits_verzeichnis, zeilen, datei_format, ueberlappung, tippfehler_rate)
+        stufen['generieren'] = time.perf_counter() - start
+
+        daten_lader = DatenLader(self.basis_verzeichnis)
+        for pfad in (pfad1, pfad2):
+            if not daten_lader._ist_pfad_sicher(pfad):
+                raise CipherCoreDateiFehler(f"Ungültiger Dateipfad für Benchmark: '{pfad}'.")
+        start = time.perf_counter()
+        daten_frame1 = daten_lader._datei_laden(pfad1)
+        daten_frame2 = daten_lader._datei_laden(pfad2)
+        stufen['laden'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        daten_lader._validiere_daten(daten_frame1, os.path.basename(pfad1))
+        daten_lader._validiere_daten(daten_frame2, os.path.basename(pfad2))
+        stufen['validieren'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        vergleichs_ergebnisse = DateiVergleicher().vergleiche_daten(daten_frame1, daten_frame2)
+        stufen['vergleichen'] = time.perf_counter() - start
+        del daten_frame1, daten_frame2 # Speicher vor den nachgelagerten Stufen freigeben
+
+        start = time.perf_counter()
+        diagramm_bild_daten = DiagrammGenerator().erstelle_diagramm(vergleichs_ergebnisse)
+        stufen['diagramm'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        pdf_pfad = os.path.join(self.arbeits_verzeichnis, f"benchmark_bericht_{zeilen}{datei_format.replace('.', '_')}.pdf")
+        BerichtsGenerator(LOGO_DATEIPFAD, pdf_pfad, None).erstelle_pdf_bericht(
+            vergleichs_ergebnisse, diagramm_bild_daten, os.path.basename(pfad1), os.path.basename(pfad2))
+        stufen['pdf'] = time.perf_counter() - start
+
+        with tempfile.TemporaryDirectory(dir=self.arbeits_verzeichnis) as persistenz_verzeichnis: # Frische Persistenz je Messung
+            daten_manager_stufen = [('speichern_sqlite', SQLiteDataManager(os.path.join(persistenz_verzeichnis, 'benchmark.db'))),
+                                    ('speichern_file', FileDataManager(os.path.join(persistenz_verzeichnis, 'json')))]
+            if pa is not None:
+                daten_manager_stufen.append(('speichern_parquet', ParquetDataManager(os.path.join(persistenz_verzeichnis, 'parquet'))))
+            for stufe, daten_manager in daten_manager_stufen:
+                start = time.perf_counter()
+                daten_manager.speichere_ergebnisse(vergleichs_ergebnisse, os.path.basename(pfad1), os.path.basename(pfad2), ist_pro_version=True)
+                stufen[stufe] = time.perf_counter() - start
+
+        logger.info(f"Benchmark {zeilen} Zeilen ({datei_format}): " + ", ".join(f"{stufe}={dauer:.3f}s" for stufe, dauer in stufen.items()))
+        return {
+            "dateigroessen_bytes": [os.path.getsize(pfad1), os.path.getsize(pfad2)],
+            "stufen_sekunden": stufen,
+            "gesamt_sekunden": sum(dauer for stufe, dauer in stufen.items() if stufe != 'generieren'),
+            "metriken": vergleichs_ergebnisse.metriken()
+        }
+
+
+
+# --- VergleichsAuftrag Klasse (CipherCore Standard: Serialisierte Hintergrundverarbeitung) ---
+class VergleichsAuftrag:
+    """
+    Beschreibt einen Vergleichsauftrag der GUI-Warteschlange samt eigenem Abbruch-Token.
+    Aufträge werden von genau einem Hintergrund-Worker nacheinander abgearbeitet.
+    """
+
+    def __init__(self, datei_pfad1: str, datei_pfad2: str, diagramm_typ: str, spalte_datei1: str, spalte_datei2: str, lizenzschluessel: str,
+                 lauf_cache: bool = True):
+        """
+        Initialisiert den Vergleichsauftrag.
+
+        Args:
+            datei_pfad1 (str): Pfad zur ersten Datei.
+            datei_pfad2 (str): Pfad zur zweiten Datei.
+            diagramm_typ (str): Diagrammtyp.
+            spalte_datei1 (str): Spalte für Vergleich aus Datei 1.
+            spalte_datei2 (str): Spalte für Vergleich aus Datei 2.
+            lizenzschluessel (str): Der zu verwendende Lizenzschlüssel.
+            lauf_cache (bool): Vergleichsergebnis unveränderter Läufe aus dem Lauf-Cache übernehmen (optional).
+        """
+        self.datei_pfad1 = datei_pfad1
+        self.datei_pfad2 = datei_pfad2
+        self.diagramm_typ = diagramm_typ
+        self.spalte_datei1 = spalte_datei1
+        self.spalte_datei2 = spalte_datei2
+        self.lizenzschluessel = lizenzschluessel
+        self.lauf_cache = lauf_cache
+        self.abbruch_token = VergleichsAbbruchToken()
+
+
+# --- UI-Teil mit Tkinter (CipherCore Standard: Benutzerfreundlichkeit und Robustheit) ---
+class DateiVergleichsApp:
+    """
+    Tkinter-Anwendung für das CipherCore Datei-Vergleichs-Tool.
+    Bietet eine benutzerfreundliche Oberfläche mit klarer Statusanzeige und Fehlerbehandlung.
+    Thread-sichere UI-Updates für reaktionsschnelle Anwendung.
+
+    Pro Version Funktionalität in der UI:
+        - Kreisdiagramm Option ist nur in der Pro Version aktiv.
+        - Verlauf anzeigen Button ist nur in der Pro Version aktiv.
+    """
+    def __init__(self, root: tk.Tk, daten_manager: AbstractDataManager):
+        """
+        Initialisiert die DateiVergleichsApp.
+
+        Args:
+            root (tk.Tk): Das Hauptfenster der Tkinter-Anwendung.
+            daten_manager (AbstractDataManager): Der Daten-Manager für die Ergebnispersistenz.
+        """
+        self.root = root
+        root.title("CipherCore Datei Vergleichs Tool Pro") # Firmenname im Fenstertitel - Pro Version
+        self.daten_manager = daten_manager
+        self.datei_pfad1 = tk.StringVar()
+        self.datei_pfad2 = tk.StringVar()
+        self.diagramm_typ = tk.StringVar(value=DIAGRAMM_TYP_BALKEN)
+        self.lauf_cache_aktiv = tk.BooleanVar(value=True) # Abwählen erzwingt einen vollständigen Vergleich
+        self.status_meldung = tk.StringVar()
+        self.ergebnis_text = None
+        self.lizenz_akzeptiert = tk.BooleanVar(value=konfiguration.get(CONFIG_SCHLUESSEL_LIZENZ_AKZEPTIERT, False))
+        self.verlauf_tabelle = None
+        self.verlauf_suchbegriff = tk.StringVar() # Suchbegriff für die Verlaufssuche (wird im Backend ausgewertet)
+        self._verlauf_sortierung = ('vergleichszeitpunkt', True) # Sortierspalte und absteigend-Flag
+        self._verlauf_versatz = 0 # Anzahl bereits geladener Verlaufseinträge
+        self._verlauf_gesamt = 0 # Gesamtzahl passender Verlaufseinträge im Backend
+        self._verlauf_laedt = False # Verhindert parallele Seitenabfragen
+        self._verlauf_generation = 0 # Verwirft veraltete Seiten nach Sortier- oder Suchwechsel
+        self.fortschritt = tk.DoubleVar(value=0) # Fortschritt des laufenden Vergleichs in Prozent
+        self.vergleichs_warteschlange: queue.Queue = queue.Queue() # Warteschlange der Vergleichsaufträge
+        self._offene_auftraege: List[VergleichsAuftrag] = [] # Laufende und wartende Aufträge (für Abbruch)
+        self._auftraege_sperre = threading.Lock()
+        self._vergleichs_worker: Optional[threading.Thread] = None
+        self._wird_beendet = False # Schließen angefordert: Fenster wird nach dem Ende des Workers zerstört
+        self._schliessen_frist = 0.0
+        self.spalte_datei1 = tk.StringVar(value='Name') # Standardspalte für Datei 1
+        self.spalte_datei2 = tk.StringVar(value='Name') # Standardspalte für Datei 2
+        self.lizenzschluessel_var = tk.StringVar(value=LIZENZSCHLUESSEL if LIZENZSCHLUESSEL else "") # Lizenzschlüssel Variable
+        self.pro_version_aktiv = tk.BooleanVar(value=ist_pro_version(self.lizenzschluessel_var.get())) # Pro Version Status Variable
+
+        self._check_lizenz_und_testphase() # Lizenzprüfung vor UI-Erstellung
+        if not self.lizenz_akzeptiert.get():
+            return # UI nicht erstellen, wenn Lizenz nicht akzeptiert
+
+        self._create_widgets() # UI-Elemente erstellen
+        self._starte_vergleichs_worker() # Einzelnen Hintergrund-Worker für Vergleichsaufträge starten
+        self.root.protocol("WM_DELETE_WINDOW", self._beim_schliessen) # Laufende Aufträge beim Schließen abbrechen
+        self._lade_verlauf_beim_start() # Verlauf beim Start laden und anzeigen
+        self._aktualisiere_lizenz_status_anzeige() # Lizenzstatus beim Start anzeigen
+        self._aktualisiere_pro_version_features() # Pro Version Features initialisieren
+        logger.info("DateiVergleichsApp UI initialisiert.")
+
+    def _aktualisiere_pro_version_features(self):
+        """Aktualisiert die UI Elemente basierend auf dem Pro Version Status."""
+        is_pro = ist_pro_version(self.lizenzschluessel_var.get())
+        self.pro_version_aktiv.set(is_pro) # Pro Version Status aktualisieren
+        if is_pro:
+            self.diagramm_dropdown['menu'].entryconfig(DIAGRAMM_TYP_KREIS, state=tk.NORMAL) # Kreisdiagramm aktivieren
+            self.verlauf_button.config(state=tk.NORMAL) # Verlauf Button aktivieren
+            self.trends_button.config(state=tk.NORMAL) # Trends Button aktivieren
+        else:
+            self.diagramm_dropdown['menu'].entryconfig(DIAGRAMM_TYP_KREIS, state=tk.DISABLED) # Kreisdiagramm deaktivieren
+            self.verlauf_button.config(state=tk.DISABLED) # Verlauf Button deaktivieren
+            self.trends_button.config(state=tk.DISABLED) # Trends Button deaktivieren
+
+
+    def _aktualisiere_lizenz_status_anzeige(self):
+        """Aktualisiert die Lizenzstatusanzeige in der UI."""
+        if ist_pro_version(self.lizenzschluessel_var.get()):
+            self.lizenz_status_label.config(text="Lizenzstatus: Pro Version", fg="green")
+        else:
+            self.lizenz_status_label.config(text="Lizenzstatus: Test Version", fg="red")
+
+
+    def _check_lizenz_und_testphase(self) -> None:
+        """
+        Prüft Lizenzvereinbarung und Testphase vor dem Start der Haupt-UI.
+        Stellt sicher, dass die Lizenzbedingungen akzeptiert wurden und die Testphase gültig ist.
+        """
+        if not konfiguration.get(CONFIG_SCHLUESSEL_LIZENZ_AKZEPTIERT, False):
+            self._zeige_lizenz_dialog() # Lizenzdialog anzeigen, falls nicht akzeptiert
+            if not self.lizenz_akzeptiert.get():
+                logger.warning("Lizenz nicht akzeptiert. Anwendung wird beendet.")
+                self.root.destroy() # Anwendung beenden, wenn Lizenz abgelehnt
+                return
+        logger.debug("Lizenzprüfung bestanden.")
+
+        erster_start_datum_str = konfiguration.get(CONFIG_SCHLUESSEL_ERSTES_STARTDATUM)
+        if erster_start_datum_str is None:
+            konfiguration[CONFIG_SCHLUESSEL_ERSTES_STARTDATUM] = datetime.date.today().isoformat()
+            self._speichere_konfiguration() # Konfiguration speichern
+            logger.info("Erster Start der Anwendung. Testphase beginnt.")
+        else:
+            erster_start_datum = datetime.date.fromisoformat(erster_start_datum_str)
+            heute = datetime.date.today()
+            testende_datum = erster_start_datum + datetime.timedelta(14) # 14-Tage Testphase
+            if heute > testende_datum and not ist_pro_version(self.lizenzschluessel_var.get()): # Testphase abgelaufen und keine Pro Version
+                logger.warning("Testphase abgelaufen. Anwendung im Testphasen-Ende-Modus.")
+                messagebox.showwarning("Testphase beendet",
+                                     "Ihre 14-tägige Testphase ist abgelaufen. Bitte kontaktieren Sie unser Vertriebsteam von CipherCore, um eine Vollversion zu erwerben.") # Hinweis zur Testphasenende
+
+
+    def _zeige_lizenz_dialog(self) -> None:
+        """
+        Zeigt das Lizenzdialogfenster an.
+        Dialog ist modal und blockiert die Hauptanwendung, bis eine Entscheidung getroffen wurde.
+        """
+        lizenz_fenster = tk.Toplevel(self.root)
+        lizenz_fenster.title("CipherCore Lizenzvereinbarung") # Firmenname im Lizenzdialog-Titel
+
+        lizenz_text_widget = scrolledtext.ScrolledText(lizenz_fenster, wrap=tk.WORD, height=15, width=70)
+        lizenz_text_widget.insert(tk.END, LIZENZBEDINGUNGEN_TEXT) # Lizenztext einfügen
+        lizenz_text_widget.config(state='disabled') # Textfeld schreibgeschützt machen
+        lizenz_text_widget.pack(padx=10, pady=10)
+
+        akzeptanz_var = tk.BooleanVar()
+        check_button = Checkbutton(lizenz_fenster, text="Ich akzeptiere die CipherCore Lizenzbedingungen", variable=akzeptanz_var) # Firmenname im Checkbutton-Text
+        check_button.pack(pady=(0, 10))
+
+        def akzeptieren_und_schliessen():
+            if akzeptanz_var.get():
+                konfiguration[CONFIG_SCHLUESSEL_LIZENZ_AKZEPTIERT] = True # Lizenzakzeptanz in Konfiguration speichern
+                self._speichere_konfiguration() # Konfiguration persistent speichern
+                self.lizenz_akzeptiert.set(True) # Lizenzakzeptanzstatus im UI setzen
+                lizenz_fenster.destroy() # Lizenzfenster schließen
+                logger.info("Lizenzbedingungen akzeptiert.")
+            else:
+                messagebox.showerror("Lizenz ablehnen", "Bitte akzeptieren Sie die Lizenzbedingungen von CipherCore, um fortzufahren.") # Firmenname in Fehlermeldung
+                logger.warning("Lizenzbedingungen abgelehnt.")
+
+        akzeptieren_button = Button(lizenz_fenster, text="Akzeptieren", command=akzeptieren_und_schliessen)
+        akzeptieren_button.pack(pady=(0, 10))
+
+        ablehnen_button = Button(lizenz_fenster, text="Ablehnen & Beenden", command=self.root.destroy)
+        ablehnen_button.pack(pady=(0, 10))
+
+        lizenz_fenster.transient(self.root) # Dialog wird zum transienten Fenster des Hauptfensters
+        lizenz_fenster.grab_set() # Dialog modal machen
+        self.root.wait_window(lizenz_fenster) # Warten, bis Lizenzdialog geschlossen wird
+
+
+    def _create_widgets(self) -> None:
+        """
+        Erstellt die UI-Elemente im Hauptfenster.
+        Layout mit Grid-Manager für flexible und responsive Oberfläche.
+        Klare Beschriftungen und Benutzerführung.
+        """
+        # Lizenzschlüssel Eingabe
+        tk.Label(self.root, text="Lizenzschlüssel (Pro Version):").grid(row=0, column=0, padx=5, pady=5, sticky="w")
+        Entry(self.root, textvariable=self.lizenzschluessel_var, width=50).grid(row=0, column=1, padx=5, pady=5)
+        Button(self.root, text="Schlüssel aktivieren", command=self.aktiviere_lizenzschluessel).grid(row=0, column=2, padx=5, pady=5)
+
+        # Lizenzstatus Anzeige
+        self.lizenz_status_label = Label(self.root, textvariable=self.status_meldung)
+        self.lizenz_status_label.grid(row=1, column=1, pady=2, sticky="w")
+
+
+        # Datei 1 Auswahl
+        tk.Label(self.root, text="Datei 1 (Benutzereingaben):").grid(row=2, column=0, padx=5, pady=5, sticky="w")
+        tk.Entry(self.root, textvariable=self.datei_pfad1, width=50, state='disabled').grid(row=2, column=1, padx=5, pady=5) # Eingabefeld für Datei 1 (deaktiviert)
+        tk.Button(self.root, text="Datei 1 auswählen", command=self.datei_auswaehlen_datei1).grid(row=2, column=2, padx=5, pady=5) # Button zum Auswählen von Datei 1
+
+        # Datei 2 Auswahl
+        tk.Label(self.root, text="Datei 2 (Hauptliste):").grid(row=3, column=0, padx=5, pady=5, sticky="w")
+        tk.Entry(self.root, textvariable=self.datei_pfad2, width=50, state='disabled').grid(row=3, column=1, padx=5, pady=5) # Eingabefeld für Datei 2 (deaktiviert)
+        tk.Button(self.root, text="Datei 2 auswählen", command=self.datei_auswaehlen_datei2).grid(row=3, column=2, padx=5, pady=5) # Button zum Auswählen von Datei 2
+
+        # Spaltenauswahl für Datei 1
+        tk.Label(self.root, text="Vergleichsspalte Datei 1:").grid(row=4, column=0, padx=5, pady=5, sticky="w")
+        tk.Entry(self.root, textvariable=self.spalte_datei1, width=20).grid(row=4, column=1, padx=5, pady=5, sticky="w") # Eingabefeld für Spalte Datei 1
+
+        # Spaltenauswahl für Datei 2
+        tk.Label(self.root, text="Vergleichsspalte Datei 2:").grid(row=5, column=0, padx=5, pady=5, sticky="w")
+        tk.Entry(self.root, textvariable=self.spalte_datei2, width=20).grid(row=5, column=1, padx=5, pady=5, sticky="w") # Eingabefeld für Spalte Datei 2
+
+        # Diagrammtyp Auswahl
+        tk.Label(self.root, text="Diagrammtyp:").grid(row=6, column=0, padx=5, pady=5, sticky="w")
+        diagramm_optionen = [DIAGRAMM_TYP_BALKEN, DIAGRAMM_TYP_KREIS] # Verfügbare Diagrammtypen
+        self.diagramm_dropdown = tk.OptionMenu(self.root, self.diagramm_typ, *diagramm_optionen) # Dropdown-Menü für Diagrammtyp
+        self.diagramm_dropdown.grid(row=6, column=1, padx=5, pady=5, sticky="w")
+        Checkbutton(self.root, text="Ergebnis unveränderter Läufe wiederverwenden", variable=self.lauf_cache_aktiv).grid(row=6, column=2, padx=5, pady=5, sticky="w") # Lauf-Cache umgehen
+
+        # Start Button, Abbrechen Button und Fortschrittsbalken
+        aktions_rahmen = tk.Frame(self.root)
+        aktions_rahmen.grid(row=7, column=0, columnspan=3, pady=10)
+        tk.Button(aktions_rahmen, text="Vergleich starten & PDF-Bericht erstellen", command=self.starte_vergleich, width=30).pack(side=tk.LEFT, padx=5) # Button zum Starten des Vergleichs
+        self.abbrechen_button = tk.Button(aktions_rahmen, text="Abbrechen", command=self.abbreche_vergleich, width=12, state=tk.DISABLED) # Button zum Abbrechen laufender/wartender Vergleiche
+        self.abbrechen_button.pack(side=tk.LEFT, padx=5)
+        ttk.Progressbar(aktions_rahmen, variable=self.fortschritt, maximum=100, mode='determinate', length=200).pack(side=tk.LEFT, padx=5) # Fortschrittsbalken
+
+        # Statusmeldung
+        tk.Label(self.root, textvariable=self.status_meldung).grid(row=8, column=0, columnspan=3, pady=5) # Label für Statusmeldungen
+
+        # Ergebnis-Textfeld
+        tk.Label(self.root, text="Vergleichsergebnisse:").grid(row=9, column=0, padx=5, pady=5, sticky="nw")
+        self.ergebnis_text = scrolledtext.ScrolledText(self.root, height=10, width=60) # Textfeld für Vergleichsergebnisse
+        self.ergebnis_text.grid(row=9, column=1, columnspan=2, padx=5, pady=5, sticky="nsew")
+        self.ergebnis_text.config(state='disabled') # Textfeld schreibgeschützt
+        self.root.grid_rowconfigure(9, weight=1) # Zeile für Ergebnis-Textfeld soll expandieren
+        self.root.grid_columnconfigure(1, weight=1) # Spalte für Ergebnis-Textfeld soll expandieren
+
+        # Verlauf anzeigen Button und Suche
+        verlauf_rahmen = tk.Frame(self.root)
+        verlauf_rahmen.grid(row=10, column=0, columnspan=3, pady=10)
+        self.verlauf_button = tk.Button(verlauf_rahmen, text="Verlauf anzeigen", command=self.zeige_verlauf, width=20)
+        self.verlauf_button.pack(side=tk.LEFT, padx=5) # Button zum Anzeigen des Verlaufs
+        self.trends_button = tk.Button(verlauf_rahmen, text="Trends anzeigen", command=self.zeige_trends, width=16)
+        self.trends_button.pack(side=tk.LEFT, padx=5) # Trendauswertung in eigenem Fenster
+        tk.Label(verlauf_rahmen, text="Suche (Dateiname):").pack(side=tk.LEFT, padx=5)
+        such_eingabe = tk.Entry(verlauf_rahmen, textvariable=self.verlauf_suchbegriff, width=25)
+        such_eingabe.pack(side=tk.LEFT, padx=5)
+        such_eingabe.bind('<Return>', lambda _ereignis: self.zeige_verlauf()) # Suche mit Enter starten
+
+        # Verlauf-Tabelle (seitenweise nachgeladen)
+        tk.Label(self.root, text="Vergleichsverlauf:").grid(row=11, column=0, padx=5, pady=5, sticky="nw")
+        tabellen_rahmen = tk.Frame(self.root)
+        tabellen_rahmen.grid(row=11, column=1, columnspan=2, padx=5, pady=5, sticky="nsew")
+        spalten = list(VERLAUF_SORTIER_SPALTEN) + [f"metrik_{i}" for i in range(len(METRIK_REIHENFOLGE))]
+        self.verlauf_tabelle = ttk.Treeview(tabellen_rahmen, columns=spalten, show='headings', height=10)
+        for spalte, ueberschrift in zip(VERLAUF_SORTIER_SPALTEN, ("Zeitpunkt", "Datei 1", "Datei 2")):
+            self.verlauf_tabelle.heading(spalte, text=ueberschrift, command=lambda s=spalte: self._sortiere_verlauf(s)) # Klick sortiert im Backend
+            self.verlauf_tabelle.column(spalte, width=140, stretch=True)
+        for i, metrik in enumerate(METRIK_REIHENFOLGE):
+            self.verlauf_tabelle.heading(f"metrik_{i}", text=metrik.split(' (')[0]) # Kurze Spaltenüberschrift ohne Klammerzusatz
+            self.verlauf_tabelle.column(f"metrik_{i}", width=90, anchor='e', stretch=False)
+        verlauf_scrollbar = ttk.Scrollbar(tabellen_rahmen, orient=tk.VERTICAL, command=self.verlauf_tabelle.yview)
+        self.verlauf_tabelle.configure(yscrollcommand=lambda erster, letzter: self._verlauf_gescrollt(verlauf_scrollbar, erster, letzter))
+        self.verlauf_tabelle.grid(row=0, column=0, sticky="nsew")
+        verlauf_scrollbar.grid(row=0, column=1, sticky="ns")
+        tabellen_rahmen.grid_rowconfigure(0, weight=1)
+        tabellen_rahmen.grid_columnconfigure(0, weight=1)
+        self.root.grid_rowconfigure(11, weight=1) # Zeile für Verlauf-Tabelle soll expandieren
+
+
+    def datei_auswaehlen_datei1(self) -> None:
+        """
+        Öffnet einen Dateiauswahldialog für Datei 1.
+        Beschränkt die Dateiauswahl auf unterstützte Dateiformate und das Basisverzeichnis (Sicherheit).
+        """
+        datei_pfad = filedialog.askopenfilename(initialdir=BASIS_VERZEICHNIS, title="Datei 1 auswählen (Benutzereingabe)", filetypes=[('Unterstützte Dateien', UNTERSTUETZTE_DATEIFORMATE + UNTERSTUETZTE_KOMPRESSIONEN)]) # Dateifilter für unterstützte Formate
+        if datei_pfad:
+            self.datei_pfad1.set(datei_pfad) # Pfad in UI speichern
+            logger.debug(f"Datei 1 ausgewählt: {datei_pfad}")
+
+
+    def datei_auswaehlen_datei2(self) -> None:
+        """
+        Öffnet einen Dateiauswahldialog für Datei 2.
+        Beschränkt die Dateiauswahl auf unterstützte Dateiformate und das Basisverzeichnis (Sicherheit).
+        """
+        datei_pfad = filedialog.askopenfilename(initialdir=BASIS_VERZEICHNIS, title="Datei 2 auswählen (Hauptliste)", filetypes=[('Unterstützte Dateien', UNTERSTUETZTE_DATEIFORMATE + UNTERSTUETZTE_KOMPRESSIONEN)]) # Dateifilter für unterstützte Formate
+        if datei_pfad:
+            self.datei_pfad2.set(datei_pfad) # Pfad in UI speichern
+            logger.debug(f"Datei 2 ausgewählt: {datei_pfad}")
+
+    def aktiviere_lizenzschluessel(self):
+        """
+        Aktiviert den eingegebenen Lizenzschlüssel und speichert ihn in der Konfiguration.
+        """
+        lizenzschluessel = self.lizenzschluessel_var.get()
+        try:
+            oeffentlicher_schluessel = lade_oeffentlichen_schluessel(OEFFENTLICHER_SCHLUESSEL_PFAD) # Öffentlichen Schlüssel laden
+            ist_pro, _ = validiere_lizenzschluessel_pro(lizenzschluessel, oeffentlicher_schluessel) # Lizenz validieren
+            if ist_pro:
+                konfiguration[CONFIG_SCHLUESSEL_LIZENZSCHLUESSEL] = lizenzschluessel
+                self._speichere_konfiguration()
+                self._aktualisiere_lizenz_status_anzeige()
+                self._aktualisiere_pro_version_features() # Pro Version Features aktivieren
+                messagebox.showinfo("Lizenzschlüssel aktiviert", "Ihr Lizenzschlüssel wurde erfolgreich aktiviert. Sie nutzen nun die Pro Version.")
+                logger.info("Lizenzschlüssel erfolgreich aktiviert.")
+            else:
+                messagebox.showerror("Ungültiger Lizenzschlüssel", "Der eingegebene Lizenzschlüssel ist ungültig. Bitte überprüfen Sie ihn.")
+                logger.warning("Ungültiger Lizenzschlüssel eingegeben.")
+                konfiguration[CONFIG_SCHLUESSEL_LIZENZSCHLUESSEL] = None # Ungültigen Schlüssel entfernen
+                self._speichere_konfiguration()
+                self._aktualisiere_lizenz_status_anzeige()
+                self._aktualisiere_pro_version_features() # Pro Version Features deaktivieren
+        except CipherCoreLizenzFehler as e:
+             messagebox.showerror("Fehler beim Aktivieren des Lizenzschlüssels", f"Fehler bei der Lizenzschlüsselvalidierung: {e}")
+             logger.error(f"Fehler bei der Lizenzschlüsselvalidierung: {e}")
+
+
+    def starte_vergleich(self) -> None:
+        """
+        Reiht einen Dateivergleich in die Warteschlange des Hintergrund-Workers ein.
+        Aufträge werden nacheinander abgearbeitet, sodass sich Läufe nicht gegenseitig Ausgabedateien überschreiben.
+        Verhindert Blockieren der UI während der Verarbeitung (Responsivität).
+        """
+        datei_pfad1 = self.datei_pfad1.get()
+        datei_pfad2 = self.datei_pfad2.get()
+        diagramm_typ = self.diagramm_typ.get()
+        spalte_datei1 = self.spalte_datei1.get() # Spalte für Datei 1 aus UI holen
+        spalte_datei2 = self.spalte_datei2.get() # Spalte für Datei 2 aus UI holen
+        lizenzschluessel = self.lizenzschluessel_var.get() # Lizenzschlüssel aus UI holen
+        lauf_cache = self.lauf_cache_aktiv.get()
+
+        if not datei_pfad1 or not datei_pfad2:
+            messagebox.showerror("Fehler", "Bitte wählen Sie beide Dateien aus.") # Fehlermeldung, wenn Dateien fehlen
+            logger.warning("Vergleichsstart abgebrochen: Beide Dateien müssen ausgewählt sein.")
+            return
+
+        self.ergebnis_text.config(state='normal') # Ergebnis-Textfeld editierbar machen
+        self.ergebnis_text.delete('1.0', tk.END) # Textfeld leeren
+        self.ergebnis_text.config(state='disabled') # Textfeld wieder schreibgeschützt machen
+
+        auftrag = VergleichsAuftrag(datei_pfad1, datei_pfad2, diagramm_typ, spalte_datei1, spalte_datei2, lizenzschluessel, lauf_cache)
+        with self._auftraege_sperre:
+            self._offene_auftraege.append(auftrag)
+            position = len(self._offene_auftraege)
+        self.vergleichs_warteschlange.put(auftrag) # Auftrag an den Hintergrund-Worker übergeben
+        self.abbrechen_button.config(state=tk.NORMAL)
+        if position > 1:
+            self.status_meldung.set(f"Vergleich in Warteschlange eingereiht (Position {position}).")
+        else:
+            self.status_meldung.set("Vergleich wird gestartet...") # Statusmeldung setzen
+        logger.info(f"Vergleichsauftrag eingereiht (Position {position}).")
+
+
+    def abbreche_vergleich(self) -> None:
+        """
+        Bricht den laufenden sowie alle wartenden Vergleichsaufträge kooperativ ab.
+        Der Worker beendet den laufenden Auftrag an der nächsten Abbruchprüfung.
+        """
+        with self._auftraege_sperre:
+            auftraege = list(self._offene_auftraege)
+        for auftrag in auftraege:
+            auftrag.abbruch_token.abbrechen()
+        if auftraege:
+            self.status_meldung.set("Vergleich wird abgebrochen...")
+            logger.info(f"Abbruch für {len(auftraege)} Vergleichsauftrag/-aufträge angefordert.")
+
+
+    def _starte_vergleichs_worker(self) -> None:
+        """
+        Startet den einzigen Hintergrund-Worker, der Vergleichsaufträge aus der Warteschlange abarbeitet.
+        Der Worker ist ein Daemon-Thread und blockiert das Beenden der Anwendung nicht.
+        """
+        self._vergleichs_worker = threading.Thread(target=self._vergleichs_worker_schleife, name="CipherCoreVergleichsWorker", daemon=True)
+        self._vergleichs_worker.start()
+        logger.info("Vergleichs-Worker gestartet.")
+
+
+    def _vergleichs_worker_schleife(self) -> None:
+        """
+        Arbeitsschleife des Hintergrund-Workers. Ein `None`-Eintrag in der Warteschlange beendet die Schleife.
+        """
+        while True:
+            auftrag = self.vergleichs_warteschlange.get()
+            if auftrag is None:
+                break
+            try:
+                if auftrag.abbruch_token.ist_abgebrochen:
+                    logger.info("Wartender Vergleichsauftrag wurde vor dem Start abgebrochen.")
+                    self.update_status_meldung_ui("Vergleich abgebrochen.")
+                else:
+                    self._starte_vergleich_hintergrund(auftrag)
+            except Exception as e: # Worker darf durch einzelne Aufträge nicht beendet werden
+                logger.exception(f"Unerwarteter Fehler im Vergleichs-Worker: {e}")
+                self.update_status_meldung_ui(f"Unerwarteter Fehler: {e}")
+            finally:
+                with self._auftraege_sperre:
+                    if auftrag in self._offene_auftraege:
+                        self._offene_auftraege.remove(auftrag)
+                    keine_auftraege_offen = not self._offene_auftraege
+                if keine_auftraege_offen:
+                    self._im_hauptthread(self.abbrechen_button.config, {'state': tk.DISABLED})
+
+
+    def _starte_vergleich_hintergrund(self, auftrag: VergleichsAuftrag) -> None:
+        """
+        Führt den Dateivergleich und die Berichterstellung im Hintergrund aus.
+        Ruft die Hauptfunktion `dateien_vergleichen_und_bericht_erstellen` auf.
+        Behandelt Fehler und aktualisiert die UI ausschließlich über `root.after` (_im_hauptthread) mit Ergebnissen und Statusmeldungen.
+
+        Args:
+            auftrag (VergleichsAuftrag): Der auszuführende Vergleichsauftrag.
+        """
+        self.update_fortschritt_ui(0)
+        pdf_pfad, vergleichs_ergebnisse = dateien_vergleichen_und_bericht_erstellen(auftrag.datei_pfad1, auftrag.datei_pfad2,
+                                                                                     diagramm_typ=auftrag.diagramm_typ,
+                                                                                     daten_manager=self.daten_manager,
+                                                                                     ui_status_rueckruf=self.update_status_meldung_ui,
+                                                                                     spalte_datei1=auftrag.spalte_datei1, # Spalten für Vergleich übergeben
+                                                                                     spalte_datei2=auftrag.spalte_datei2, # Spalten für Vergleich übergeben
+                                                                                     lizenzschluessel=auftrag.lizenzschluessel,
+                                                                                     abbruch_token=auftrag.abbruch_token,
+                                                                                     fortschritt_rueckruf=self.update_fortschritt_ui,
+                                                                                     lauf_cache=auftrag.lauf_cache)
+        if isinstance(pdf_pfad, str) and pdf_pfad.endswith('.pdf'):
+            self.update_status_meldung_ui(f"PDF-Bericht erfolgreich erstellt: {pdf_pfad}") # Erfolgsmeldung in UI
+            logger.info(f"PDF-Bericht erfolgreich erstellt: {pdf_pfad}")
+            if self.pro_version_aktiv.get():
+                self._im_hauptthread(self.zeige_verlauf) # Erste Verlaufsseite mit dem neuen Lauf neu laden
+        elif auftrag.abbruch_token.ist_abgebrochen:
+            self.update_fortschritt_ui(0)
+            self.update_status_meldung_ui("Vergleich abgebrochen.") # Abbruch ist kein Fehler, daher keine MessageBox
+            logger.info("Vergleich durch den Benutzer abgebrochen.")
+        else:
+            self.update_fortschritt_ui(0)
+            self.update_status_meldung_ui(f"Fehler beim Erstellen des Berichts: {pdf_pfad}") # Fehlermeldung in UI
+            self._im_hauptthread(messagebox.showerror, "Fehler beim Bericht", f"Fehler beim Erstellen des PDF-Berichts:\n{pdf_pfad}") # Fehlermeldung als MessageBox im Hauptthread
+            logger.error(f"Fehler beim Erstellen des Berichts: {pdf_pfad}")
+
+
+        if vergleichs_ergebnisse:
+            self.zeige_vergleichs_ergebnisse_ui(vergleichs_ergebnisse) # Vergleichsergebnisse in UI anzeigen
+
+
+    def update_fortschritt_ui(self, prozent: float) -> None:
+        """
+        Aktualisiert den Fortschrittsbalken in der UI (thread-sicher über `root.after`).
+
+        Args:
+            prozent (float): Fortschritt in Prozent (0-100).
+        """
+        self._im_hauptthread(self.fortschritt.set, prozent) # Fortschritt im Hauptthread aktualisieren
+
+
+    def _beim_schliessen(self) -> None:
+        """
+        Bricht beim Schließen des Fensters alle Aufträge ab, beendet den Worker und schließt die Anwendung, sobald der
+        Worker beendet ist. Das Warten geschieht über root.after statt join, da der Worker seine letzten UI-Updates
+        über die Ereignisschleife des Hauptthreads ausführt.
+        """
+        if self._wird_beendet:
+            return
+        self._wird_beendet = True
+        self.abbreche_vergleich()
+        self.vergleichs_warteschlange.put(None) # Worker-Schleife beenden
+        logger.info("Anwendung wird beendet.")
+        self._schliessen_frist = time.monotonic() + SCHLIESSEN_MAX_WARTEZEIT_S
+        self._schliesse_nach_worker()
+
+
+    def _schliesse_nach_worker(self) -> None:
+        """
+        Zerstört das Fenster, sobald der Vergleichs-Worker beendet ist (oder die Wartezeit abgelaufen ist); prüft sonst
+        nach SCHLIESSEN_PRUEF_MS erneut.
+        """
+        worker = self._vergleichs_worker
+        if worker is not None and worker.is_alive():
+            if time.monotonic() < self._schliessen_frist:
+                self.root.after(SCHLIESSEN_PRUEF_MS, self._schliesse_nach_worker)
+                return
+            logger.warning(f"Vergleichs-Worker nach {SCHLIESSEN_MAX_WARTEZEIT_S} s noch aktiv, Anwendung wird trotzdem beendet.")
+        self.root.destroy()
+
+
+    def _im_hauptthread(self, funktion: Callable, *argumente) -> None:
+        """
+        Übergibt einen UI-Aufruf aus einem Hintergrund-Thread an die Ereignisschleife des Hauptthreads (root.after).
+        Ist das Fenster bereits zerstört, wird der Aufruf verworfen statt einen TclError auszulösen.
+
+        Args:
+            funktion (Callable): Die im Hauptthread auszuführende Funktion.
+            *argumente: Argumente der Funktion.
+        """
+        try:
+            self.root.after(0, funktion, *argumente)
+        except (tk.TclError, RuntimeError) as e: # Fenster geschlossen oder Hauptschleife beendet
+            logger.debug(f"UI-Aktualisierung nach dem Schließen verworfen: {e}")
+
+
+    def update_status_meldung_ui(self, meldung: str) -> None:
+        """
+        Aktualisiert die Statusmeldung in der UI (thread-sicher).
+        Verwendet `root.after` um UI-Updates im Hauptthread auszuführen (Tkinter Thread-Sicherheit).
+
+        Args:
+            meldung (str): Die anzuzeigende Statusmeldung.
+        """
+        self._im_hauptthread(self.status_meldung.set, meldung) # Statusmeldung im Hauptthread aktualisieren
+
+
+    def zeige_vergleichs_ergebnisse_ui(self, vergleichs_ergebnisse: VergleichsErgebnis) -> None:
+        """
+        Zeigt die Vergleichsergebnisse im Textfeld der UI an (thread-sicher).
+        Formatiert die Ergebnisse als String und aktualisiert das Textfeld im Hauptthread.
+
+        Args:
+            vergleichs_ergebnisse (VergleichsErgebnis): Die Vergleichsergebnisse.
+        """
+        ergebnis_text_string = "Vergleichsergebnisse:\n"
+        ergebnis_text_string += "-------------------------\n"
+        for metrik, wert in vergleichs_ergebnisse.formatiert().items():
+            ergebnis_text_string += f"  {metrik}: {wert}\n" # Metrik und Wert formatieren
+        ergebnis_text_string += "-------------------------\n"
+
+        self._im_hauptthread(self._update_ergebnis_text_widget, ergebnis_text_string) # Ergebnis-Textfeld im Hauptthread aktualisieren
+
+
+    def _update_ergebnis_text_widget(self, text: str) -> None:
+        """
+        Hilfsfunktion zum thread-sicheren Aktualisieren des Ergebnis-Text-Widgets.
+        Direkter Zugriff auf UI-Elemente nur im Hauptthread erlaubt (Tkinter Einschränkung).
+
+        Args:
+            text (str): Der anzuzeigende Text.
+        """
+        self.ergebnis_text.config(state='normal') # Textfeld editierbar machen
+        self.ergebnis_text.delete('1.0', tk.END) # Textfeld leeren
+        self.ergebnis_text.insert(tk.END, text) # Neuen Text einfügen
+        self.ergebnis_text.config(state='disabled') # Textfeld wieder schreibgeschützt machen
+
+
+    def zeige_verlauf(self) -> None:
+        """
+        Zeigt den Vergleichsverlauf aus dem DatenManager in der Verlauf-Tabelle an.
+        Setzt die Tabelle zurück und lädt nur die erste Seite; weitere Seiten werden beim Scrollen nachgeladen.
+        Sortierung und Suche werden an `daten_manager.lade_ergebnisse_seite()` durchgereicht.
+        """
+        self._verlauf_generation += 1 # Noch laufende Seitenabfragen verwerfen
+        self._verlauf_versatz = 0
+        self._verlauf_gesamt = 0
+        self._verlauf_laedt = False
+        self.verlauf_tabelle.delete(*self.verlauf_tabelle.get_children()) # Tabelle leeren
+        self.status_meldung.set("Lade Vergleichsverlauf...") # Statusmeldung setzen
+        self._lade_naechste_verlauf_seite(mit_zaehlung=True)
+
+
+    def _sortiere_verlauf(self, spalte: str) -> None:
+        """
+        Sortiert den Verlauf nach der angeklickten Spalte (erneuter Klick kehrt die Richtung um).
+
+        Args:
+            spalte (str): Die Sortierspalte (siehe VERLAUF_SORTIER_SPALTEN).
+        """
+        aktuelle_spalte, absteigend = self._verlauf_sortierung
+        self._verlauf_sortierung = (spalte, not absteigend if spalte == aktuelle_spalte else spalte == 'vergleichszeitpunkt')
+        self.zeige_verlauf()
+
+
+    def _verlauf_gescrollt(self, scrollbar: ttk.Scrollbar, erster: str, letzter: str) -> None:
+        """
+        Scroll-Rückruf der Verlauf-Tabelle. Lädt die nächste Seite, sobald das Ende der geladenen Einträge sichtbar wird.
+
+        Args:
+            scrollbar (ttk.Scrollbar): Die Scrollbar der Tabelle.
+            erster (str): Oberer sichtbarer Anteil (0-1).
+            letzter (str): Unterer sichtbarer Anteil (0-1).
+        """
+        scrollbar.set(erster, letzter)
+        if float(letzter) >= 0.9 and self._verlauf_versatz < self._verlauf_gesamt:
+            self._lade_naechste_verlauf_seite()
+
+
+    def _lade_naechste_verlauf_seite(self, mit_zaehlung: bool = False) -> None:
+        """
+        Startet das Laden der nächsten Verlaufsseite im Hintergrund (höchstens eine Abfrage gleichzeitig).
+
+        Args:
+            mit_zaehlung (bool): Gesamtzahl der passenden Einträge ebenfalls ermitteln (bei neuer Abfrage).
+        """
+        if self._verlauf_laedt:
+            return
+        self._verlauf_laedt = True
+        sortier_spalte, absteigend = self._verlauf_sortierung
+        abfrage = (self._verlauf_generation, self._verlauf_versatz, sortier_spalte, absteigend, self.verlauf_suchbegriff.get().strip() or None)
+        threading.Thread(target=self._lade_verlauf_hintergrund, args=(abfrage, mit_zaehlung), daemon=True).start() # Seite in Thread laden
+        logger.debug(f"Verlaufsseite wird geladen (Versatz {self._verlauf_versatz}).")
+
+
+    def _lade_verlauf_hintergrund(self, abfrage: Tuple, mit_zaehlung: bool) -> None:
+        """
+        Lädt eine Verlaufsseite im Hintergrund und übergibt sie über `root.after` an die UI.
+
+        Args:
+            abfrage (Tuple): Generation, Versatz, Sortierspalte, absteigend-Flag und Suchbegriff der Abfrage.
+            mit_zaehlung (bool): Gesamtzahl der passenden Einträge ebenfalls ermitteln.
+        """
+        generation, versatz, sortier_spalte, absteigend, suchbegriff = abfrage
+        try:
+            gesamt = self.daten_manager.zaehle_ergebnisse(suchbegriff) if mit_zaehlung else None
+            seite = self.daten_manager.lade_ergebnisse_seite(versatz, VERLAUF_SEITEN_GROESSE, sortier_spalte, absteigend, suchbegriff) # Nur eine Seite laden
+            self._im_hauptthread(self._fuege_verlauf_seite_ein, generation, seite, gesamt) # Seite im Hauptthread einfügen
+
+        except CipherCoreDateiLadeFehler as e: # Spezifische Fehlerbehandlung für Dateiladefehler
+            logger.error(f"Fehler beim Laden des Vergleichsverlaufs aus Dateien: {e}")
+            fehlermeldung = f"Dateifehler beim Laden des Verlaufs:\n{e}\nBitte überprüfen Sie das Datenverzeichnis und die Dateiberechtigungen."
+            self._im_hauptthread(self._zeige_verlauf_fehler, fehlermeldung) # Fehlermeldung in UI anzeigen
+
+        except CipherCoreDatenbankLadeFehler as e: # Spezifische Fehlerbehandlung für Datenbankladefehler
+            logger.error(f"Fehler beim Laden des Vergleichsverlaufs aus der Datenbank: {e}")
+            fehlermeldung = f"Datenbankfehler beim Laden des Verlaufs:\n{e}\nBitte überprüfen Sie die Logdatei und die Datenbankverbindung."
+            self._im_hauptthread(self._zeige_verlauf_fehler, fehlermeldung) # Fehlermeldung in UI anzeigen
+
+        except CipherCoreDatenFehler as e: # Generische Fehlerbehandlung für Datenfehler
+            logger.error(f"Generischer Datenquellen-Fehler beim Laden des Vergleichsverlaufs: {e}")
+            fehlermeldung = f"Allgemeiner Datenquellen-Fehler beim Laden des Verlaufs:\n{e}\nBitte überprüfen Sie die Logdatei und die Datenquelle."
+            self._im_hauptthread(self._zeige_verlauf_fehler, fehlermeldung) # Fehlermeldung in UI anzeigen
+
+        except Exception as e: # Unerwartete Fehlerbehandlung (Generischer Catch-All)
+            logger.exception(f"Unerwarteter Fehler beim Laden des Vergleichsverlaufs: {e}")
+            fehlermeldung = f"Unerwarteter Fehler beim Laden des Verlaufs:\n{e}\nBitte überprüfen Sie die Logdatei für Details."
+            self._im_hauptthread(self._zeige_verlauf_fehler, fehlermeldung) # Fehlermeldung in UI anzeigen
+
+
+    def _fuege_verlauf_seite_ein(self, generation: int, seite: List[Dict], gesamt: Optional[int]) -> None:
+        """
+        Fügt eine geladene Verlaufsseite in die Tabelle ein (nur im Hauptthread aufrufen).
+        Seiten einer veralteten Abfrage (nach Sortier- oder Suchwechsel) werden verworfen.
+
+        Args:
+            generation (int): Generation der Abfrage.
+            seite (List[Dict]): Die geladenen Verlaufseinträge.
+            gesamt (Optional[int]): Gesamtzahl passender Einträge (nur bei neuer Abfrage).
+        """
+        if generation != self._verlauf_generation:
+            return # Veraltete Seite
+        self._verlauf_laedt = False
+        if gesamt is not None:
+            self._verlauf_gesamt = gesamt
+        for eintrag in seite:
+            metriken_eintrag = eintrag.get('metriken', {})
+            werte = [eintrag.get('vergleichszeitpunkt', 'N/A'), eintrag.get('datei1_name', 'N/A'), eintrag.get('datei2_name', 'N/A')]
+            werte += [formatiere_metrik(metrik, metriken_eintrag.get(metrik)) for metrik in METRIK_REIHENFOLGE]
+            self.verlauf_tabelle.insert('', tk.END, values=werte)
+        # Versatz um die volle Seite erhöhen: vom Backend übersprungene (ungültige) Einträge dürfen nicht erneut angefragt werden
+        self._verlauf_versatz = min(self._verlauf_versatz + VERLAUF_SEITEN_GROESSE, self._verlauf_gesamt) if seite else self._verlauf_gesamt
+        if self._verlauf_gesamt:
+            self.status_meldung.set(f"Vergleichsverlauf geladen ({self._verlauf_versatz} von {self._verlauf_gesamt} Einträgen).")
+        else:
+            self.status_meldung.set("Keine Verlaufsdaten gefunden.")
+
+
+    def _zeige_verlauf_fehler(self, fehlermeldung: str) -> None:
+        """
+        Zeigt eine Fehlermeldung als MessageBox an und setzt den Ladezustand der Verlauf-Tabelle zurück.
+        """
+        self._verlauf_laedt = False
+        messagebox.showerror("Fehler beim Verlauf", fehlermeldung) # Fehlermeldung als MessageBox
+        self.status_meldung.set("Fehler beim Laden des Vergleichsverlaufs.") # Statusmeldung aktualisieren
+
+
+    def zeige_trends(self) -> None:
+        """
+        Öffnet ein Fenster mit der Trendauswertung des DatenManagers: Rollups je Zeitraum, Dateipaare mit den größten
+        Änderungen und Auffälligkeiten im Überlappungsanteil. Die Daten stammen aus den Zusammenfassungstabellen.
+        """
+        if self.daten_manager is None:
+            messagebox.showinfo("Trends", "Kein DatenManager konfiguriert.")
+            return
+        trend_fenster = tk.Toplevel(self.root)
+        trend_fenster.title("Trendauswertung des Vergleichsverlaufs")
+        zeitraum = tk.StringVar(trend_fenster, value='woche')
+        steuer_rahmen = tk.Frame(trend_fenster)
+        steuer_rahmen.pack(fill=tk.X, padx=5, pady=5)
+        tk.Label(steuer_rahmen, text="Zeitraum:").pack(side=tk.LEFT, padx=5)
+        tk.OptionMenu(steuer_rahmen, zeitraum, *VERLAUF_ROLLUP_ZEITRAEUME).pack(side=tk.LEFT, padx=5)
+
+        reiter = ttk.Notebook(trend_fenster)
+        reiter.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        tabellen: Dict[str, ttk.Treeview] = {}
+        for name, titel, ueberschriften in (
+                ('rollups', "Rollups", ("Periode", "Datei 1", "Datei 2", "Läufe", "Gleiche", "Anteil", "Min. Anteil", "Max. Anteil", "Basis", "Alter 1", "Alter 2")),
+                ('aenderungen', "Größte Änderungen", ("Datei 1", "Datei 2", "Vorperiode", "Periode", "Anteil vorher", "Anteil", "Änderung", "Basis")),
+                ('anomalien', "Auffälligkeiten", ("Zeitpunkt", "Datei 1", "Datei 2", "Anteil", "Bisher", "z-Wert"))):
+            rahmen = tk.Frame(reiter)
+            tabelle = ttk.Treeview(rahmen, columns=ueberschriften, show='headings', height=15)
+            for ueberschrift in ueberschriften:
+                tabelle.heading(ueberschrift, text=ueberschrift)
+                tabelle.column(ueberschrift, width=140 if ueberschrift.startswith("Datei") else 90, stretch=True)
+            scrollbar = ttk.Scrollbar(rahmen, orient=tk.VERTICAL, command=tabelle.yview)
+            tabelle.configure(yscrollcommand=scrollbar.set)
+            tabelle.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            reiter.add(rahmen, text=titel)
+            tabellen[name] = tabelle
+
+        def laden() -> None:
+            threading.Thread(target=self._lade_trends_hintergrund, args=(zeitraum.get(), tabellen), daemon=True).start() # Abfragen im Thread
+        zeitraum.trace_add('write', lambda *_: laden())
+        laden()
+
+
+    def _lade_trends_hintergrund(self, zeitraum: str, tabellen: Dict[str, ttk.Treeview]) -> None:
+        """
+        Fragt die Trendauswertung im Hintergrund ab und übergibt die Zeilen über `root.after` an das Trendfenster.
+
+        Args:
+            zeitraum (str): 'tag', 'woche' oder 'monat'.
+            tabellen (Dict[str, ttk.Treeview]): Die Tabellen des Trendfensters ('rollups', 'aenderungen', 'anomalien').
+        """
+        def prozent(wert: Optional[float]) -> str:
+            return '' if wert is None else f"{wert:.2%}"
+
+        def zahl(wert: Optional[float], stellen: int) -> str:
+            return '' if wert is None else f"{wert:.{stellen}f}"
+
+        try:
+            auswertung = self.daten_manager.verlaufs_auswertung()
+            if auswertung is None:
+                self._im_hauptthread(messagebox.showinfo, "Trends", "Der gewählte DatenManager unterstützt keine Trendauswertung.")
+                return
+            zeilen = {
+                'rollups': [(r['periode'], r['datei1_name'], r['datei2_name'], r['laeufe'], zahl(r['mittel_gleiche'], 0), prozent(r['mittel_anteil']),
+                             prozent(r['min_anteil']), prozent(r['max_anteil']), r['anteil_basis'], zahl(r['mittel_alter_datei1'], 1), zahl(r['mittel_alter_datei2'], 1))
+                            for r in auswertung.rollups(zeitraum)],
+                'aenderungen': [(a['datei1_name'], a['datei2_name'], a['vorherige_periode'], a['periode'], prozent(a['vorheriger_anteil']),
+                                 prozent(a['anteil']), f"{a['aenderung'] * 100:+.2f} Pp.", a['anteil_basis']) for a in auswertung.top_aenderungen(VERLAUF_TOP_STANDARD, zeitraum)],
+                'anomalien': [(a['vergleichszeitpunkt'], a['datei1_name'], a['datei2_name'], prozent(a['anteil']), prozent(a['erwartet']),
+                               f"{a['z_wert']:+.1f}") for a in auswertung.anomalien()]
+            }
+            self._im_hauptthread(self._zeige_trend_zeilen, tabellen, zeilen)
+        except CipherCoreDatenFehler as e:
+            logger.error(f"Fehler beim Laden der Trendauswertung: {e}")
+            self._im_hauptthread(messagebox.showerror, "Fehler bei der Trendauswertung", f"Fehler beim Laden der Trendauswertung:\n{e}")
+        except Exception as e: # Unerwartete Fehlerbehandlung (Generischer Catch-All)
+            logger.exception(f"Unerwarteter Fehler beim Laden der Trendauswertung: {e}")
+            self._im_hauptthread(messagebox.showerror, "Fehler bei der Trendauswertung", f"Unerwarteter Fehler:\n{e}\nBitte überprüfen Sie die Logdatei für Details.")
+
+
+    def _zeige_trend_zeilen(self, tabellen: Dict[str, ttk.Treeview], zeilen: Dict[str, List[Tuple]]) -> None:
+        """
+        Füllt die Tabellen des Trendfensters (nur im Hauptthread aufrufen). Ein inzwischen geschlossenes Fenster wird ignoriert.
+
+        Args:
+            tabellen (Dict[str, ttk.Treeview]): Die Tabellen des Trendfensters.
+            zeilen (Dict[str, List[Tuple]]): Anzeigezeilen je Tabelle.
+        """
+        for name, tabelle in tabellen.items():
+            if not tabelle.winfo_exists():
+                return
+            tabelle.delete(*tabelle.get_children())
+            for werte in zeilen[name]:
+                tabelle.insert('', tk.END, values=werte)
+
+
+    def _lade_verlauf_beim_start(self) -> None:
+        """
+        Lädt und zeigt den Vergleichsverlauf beim Start der Anwendung.
+        """
+        self.zeige_verlauf() # Verlauf laden und anzeigen
+
+
+    def _speichere_konfiguration(self) -> None:
+        """
+        Speichert die aktuelle Konfiguration in die config.json-Datei.
+        Sichere Dateiverarbeitung mit try-except-Block zur Fehlerbehandlung.
+        """
+        try:
+            with open(CONFIG_DATEI, 'w', encoding='utf-8') as konfig_datei: # Sichere Dateiverarbeitung mit 'with open' und Encoding
+                json.dump(konfiguration, konfig_datei, indent=4, ensure_ascii=False) # Konfiguration als JSON speichern, ensure_ascii=False für korrekte Zeichenkodierung
+            logger.info(f"Konfiguration in '{CONFIG_DATEI}' gespeichert.")
+        except Exception as e:
+            logger.error(f"Fehler beim Speichern der Konfiguration in '{CONFIG_DATEI}': {e}")
+
+
+
+# --- Unit-Tests (CipherCore Standard: Qualitätssicherung) ---
+import unittest
+import unittest.mock
+import tempfile
+
+class TestKonfiguration(unittest.TestCase):
+    """
+    Unit-Test Klasse für das Laden und Validieren der config.json.
+    """
+
+    def test_ungueltige_eintraege_einzeln_zurueckgesetzt(self):
+        """
+        Testet, dass nur ungültige Einträge mit je einer Warnung auf den Standardwert zurückgesetzt werden und gültige
+        Einträge wie die Lizenzakzeptanz erhalten bleiben.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            konfig_pfad = os.path.join(verzeichnis, 'config.json')
+            with open(konfig_pfad, 'w', encoding='utf-8') as datei:
+                json.dump({CONFIG_SCHLUESSEL_LIZENZ_AKZEPTIERT: True, "ausgabe_pfad": "bericht.pdf", "schaetz_fehler": 5,
+                           "sortier_speicher_mb": -1, "statistiken": ["mittelwert"]}, datei)
+            with self.assertLogs(logger, level='WARNING') as protokoll:
+                geladen = _lade_konfiguration(konfig_pfad)
+            self.assertEqual((geladen[CONFIG_SCHLUESSEL_LIZENZ_AKZEPTIERT], geladen["ausgabe_pfad"], geladen["statistiken"]),
+                             (True, "bericht.pdf", ["mittelwert"]))
+            self.assertEqual((geladen["schaetz_fehler"], geladen["sortier_speicher_mb"]),
+                             (STANDARD_KONFIGURATION["schaetz_fehler"], STANDARD_KONFIGURATION["sortier_speicher_mb"]))
+            self.assertEqual(len([zeile for zeile in protokoll.output if 'Standardwert wird verwendet' in zeile]), 2)
+            with open(konfig_pfad, 'w', encoding='utf-8') as datei:
+                json.dump([1, 2], datei)
+            self.assertEqual(_lade_konfiguration(konfig_pfad), STANDARD_KONFIGURATION)
+
+
+class TestDataManager(unittest.TestCase):
+    """
+    Unit-Test Klasse für die DataManager-Implementierungen (SQLite und File).
+    Stellt die korrekte Funktion der Datenpersistenz sicher.
+    Umfasst Tests für Speichern, Laden und Fehlerfälle.
+    """
+
+    def setUp(self):
+        """
+        Setzt die Testumgebung vor jedem Testfall auf.
+        Erstellt Test-Datenbank und temporäres Datenverzeichnis.
+        """
+        self.test_db_pfad_sqlite = 'test_ciphercore_datei_vergleich.db' # Test-Datenbankpfad für SQLite
+        self.daten_manager_sqlite = SQLiteDataManager(datenbank_pfad=self.test_db_pfad_sqlite) # SQLiteDataManager für Tests
+
+        self.temp_daten_verzeichnis = tempfile.TemporaryDirectory() # Temporäres Verzeichnis für FileDataManager
+        self.test_daten_verzeichnis_file = self.temp_daten_verzeichnis.name # Pfad zum temporären Verzeichnis
+        self.daten_manager_file = FileDataManager(daten_verzeichnis=self.test_daten_verzeichnis_file) # FileDataManager für Tests
+        self.temp_parquet_verzeichnis = tempfile.TemporaryDirectory() # Eigenes Verzeichnis, damit das JSON-Datenverzeichnis leer bleibt
+        self.daten_managers_parquet = [ParquetDataManager(self.temp_parquet_verzeichnis.name, puffer_laeufe=2)] if pa is not None else []
+
+
+    def tearDown(self):
+        """
+        Räumt die Testumgebung nach jedem Testfall auf.
+        Löscht Test-Datenbank und temporäres Datenverzeichnis.
+        """
+        if os.path.exists(self.test_db_pfad_sqlite):
+            os.remove(self.test_db_pfad_sqlite) # Test-Datenbank löschen
+
+        self.temp_daten_verzeichnis.cleanup() # Temporäres Verzeichnis löschen
+        self.temp_parquet_verzeichnis.cleanup()
+
+
+    def test_speichere_lade_ergebnisse_sqlite(self):
+        """
+        Testet das Speichern und Laden von Vergleichsergebnissen mit SQLiteDataManager.
+        Prüft, ob die Daten korrekt gespeichert und wieder geladen werden können.
+        """
+        vergleichs_ergebnisse = VergleichsErgebnis(100, 120, 50) # Beispiel Vergleichsergebnisse
+        datei1_name = "datei1.csv" # Beispiel Dateiname 1
+        datei2_name = "datei2.xlsx" # Beispiel Dateiname 2
+
+        self.daten_manager_sqlite.speichere_ergebnisse(vergleichs_ergebnisse, datei1_name, datei2_name, ist_pro_version=True) # Ergebnisse speichern - Pro Version aktiviert für Test
+        geladene_ergebnisse_liste = self.daten_manager_sqlite.lade_alle_ergebnisse() # Alle Ergebnisse laden
+
+        self.assertIsNotNone(geladene_ergebnisse_liste) # Prüfen, ob Ergebnisse geladen wurden
+        self.assertTrue(len(geladene_ergebnisse_liste) > 0) # Prüfen, ob mindestens ein Ergebnis geladen wurde
+
+        letzter_eintrag = geladene_ergebnisse_liste[0] # Letzten Eintrag aus der Liste holen (neuester Eintrag)
+
+        self.assertEqual(letzter_eintrag['datei1_name'], datei1_name) # Dateiname 1 vergleichen
+        self.assertEqual(letzter_eintrag['datei2_name'], datei2_name) # Dateiname 2 vergleichen
+        self.assertEqual(letzter_eintrag['metrik_wert'], '100') # Anzeigetext vergleichen
+        self.assertEqual(letzter_eintrag['metrik_zahl'], 100.0) # Rohwert als Zahl gespeichert
+        seite = self.daten_manager_sqlite.lade_ergebnisse_seite()
+        self.assertEqual(seite[0]['metriken'][METRIK_PROZENTUALER_UNTERSCHIED_ANZAHL], 20 / 120) # Anteil ohne Rundung
+
+
+    def test_speichere_lade_ergebnisse_file(self):
+        """
+        Testet das Speichern und Laden von Vergleichsergebnissen mit FileDataManager.
+        Prüft, ob die Daten korrekt als JSON-Dateien gespeichert und wieder geladen werden können.
+        """
+        vergleichs_ergebnisse = VergleichsErgebnis(150, 180, 75, 35.5, 40.25, laufzeiten={'vergleichen': 0.5}) # Beispiel Vergleichsergebnisse
+        datei1_name = "testdatei1.csv" # Beispiel Dateiname 1
+        datei2_name = "testdatei2.xlsx" # Beispiel Dateiname 2
+
+        self.daten_manager_file.speichere_ergebnisse(vergleichs_ergebnisse, datei1_name, datei2_name, ist_pro_version=True) # Ergebnisse speichern - Pro Version aktiviert für Test
+        geladene_ergebnisse_liste = self.daten_manager_file.lade_alle_ergebnisse() # Alle Ergebnisse laden
+
+        self.assertIsNotNone(geladene_ergebnisse_liste) # Prüfen, ob Ergebnisse geladen wurden
+        self.assertTrue(len(geladene_ergebnisse_liste) > 0) # Prüfen, ob mindestens ein Ergebnis geladen wurde
 
-        self._check_lizenz_und_testphase() # Lizenzprüfung vor UI-Erstellung
-        if not self.lizenz_akzeptiert.get():
-            return # UI nicht erstellen, wenn Lizenz nicht akzeptiert
+        letzter_eintrag = geladene_ergebnisse_liste[0] # Letzten Eintrag aus der Liste holen (neuester Eintrag)
 
-        self._create_widgets() # UI-Elemente erstellen
-        self._lade_verlauf_beim_start() # Verlauf beim Start laden und anzeigen
-        self._aktualisiere_lizenz_status_anzeige() # Lizenzstatus beim Start anzeigen
-        self._aktualisiere_pro_version_features() # Pro Version Features initialisieren
-        logger.info("DateiVergleichsApp UI initialisiert.")
+        self.assertEqual(letzter_eintrag['datei1_name'], datei1_name) # Dateiname 1 vergleichen
+        self.assertEqual(letzter_eintrag['datei2_name'], datei2_name) # Dateiname 2 vergleichen
+        self.assertEqual(letzter_eintrag['metriken'][METRIK_ANZAHL_DATEI1], 150) # Metrikwert 1 vergleichen
+        self.assertEqual(letzter_eintrag['metriken'][METRIK_DURCHSCHNITTSALTER_DATEI1], 35.5) # Metrikwert 2 vergleichen
+        self.assertEqual(letzter_eintrag['laufzeiten'], {'vergleichen': 0.5}) # Metadaten werden mitgespeichert
 
-    def _aktualisiere_pro_version_features(self):
-        """Aktualisiert die UI Elemente basierend auf dem Pro Version Status."""
-        is_pro = ist_pro_version(self.lizenzschluessel_var.get())
-        self.pro_version_aktiv.set(is_pro) # Pro Version Status aktualisieren
-        if is_pro:
-            self.diagramm_dropdown['menu'].entryconfig(DIAGRAMM_TYP_KREIS, state=tk.NORMAL) # Kreisdiagramm aktivieren
-            self.verlauf_button.config(state=tk.NORMAL) # Verlauf Button aktivieren
-        else:
-            self.diagramm_dropdown['menu'].entryconfig(DIAGRAMM_TYP_KREIS, state=tk.DISABLED) # Kreisdiagramm deaktivieren
-            self.verlauf_button.config(state=tk.DISABLED) # Verlauf Button deaktivieren
 
+    def test_lade_alle_ergebnisse_leeres_verzeichnis_file(self):
+        """
+        Testet das Laden von Ergebnissen aus einem leeren Verzeichnis mit FileDataManager.
+        Erwartet, dass eine leere Liste zurückgegeben wird, wenn keine JSON-Dateien vorhanden sind.
+        """
+        self.assertTrue(not os.listdir(self.test_daten_verzeichnis_file)) # Prüfen, ob Verzeichnis leer ist
 
-    def _aktualisiere_lizenz_status_anzeige(self):
-        """Aktualisiert die Lizenzstatusanzeige in der UI."""
-        if ist_pro_version(self.lizenzschluessel_var.get()):
-            self.lizenz_status_label.config(text="Lizenzstatus: Pro Version", fg="green")
-        else:
-            self.lizenz_status_label.config(text="Lizenzstatus: Test Version", fg="red")
+        geladene_ergebnisse_liste = self.daten_manager_file.lade_alle_ergebnisse() # Ergebnisse laden
+        self.assertEqual(geladene_ergebnisse_liste, []) # Erwartet leere Liste
 
 
-    def _check_lizenz_und_testphase(self) -> None:
+    def test_erstelle_schema_file_existiert_bereits(self):
         """
-        Prüft Lizenzvereinbarung und Testphase vor dem Start der Haupt-UI.
-        Stellt sicher, dass die Lizenzbedingungen akzeptiert wurden und die Testphase gültig ist.
+        Testet die Schemaerstellung mit FileDataManager, wenn das Verzeichnis bereits existiert.
+        Erwartet keinen Fehler, da die Schemaerstellung idempotent sein sollte.
         """
-        if not konfiguration.get(CONFIG_SCHLUESSEL_LIZENZ_AKZEPTIERT, False):
-            self._zeige_lizenz_dialog() # Lizenzdialog anzeigen, falls nicht akzeptiert
-            if not self.lizenz_akzeptiert.get():
-                logger.warning("Lizenz nicht akzeptiert. Anwendung wird beendet.")
-                self.root.destroy() # Anwendung beenden, wenn Lizenz abgelehnt
-                return
-        logger.debug("Lizenzprüfung bestanden.")
-
-        erster_start_datum_str = konfiguration.get(CONFIG_SCHLUESSEL_ERSTES_STARTDATUM)
-        if erster_start_datum_str is None:
-            konfiguration[CONFIG_SCHLUESSEL_ERSTES_STARTDATUM] = datetime.date.today().isoformat()
-            self._speichere_konfiguration() # Konfiguration speichern
-            logger.info("Erster Start der Anwendung. Testphase beginnt.")
-        else:
-            erster_start_datum = datetime.date.fromisoformat(erster_start_datum_str)
-            heute = datetime.date.today()
-            testende_datum = erster_start_datum + datetime.timedelta(14) # 14-Tage Testphase
-            if heute > testende_datum and not ist_pro_version(self.lizenzschluessel_var.get()): # Testphase abgelaufen und keine Pro Version
-                logger.warning("Testphase abgelaufen. Anwendung im Testphasen-Ende-Modus.")
-                messagebox.showwarning("Testphase beendet",
-                                     "Ihre 14-tägige Testphase ist abgelaufen. Bitte kontaktieren Sie unser Vertriebsteam von CipherCore, um eine Vollversion zu erwerben.") # Hinweis zur Testphasenende
+        try:
+            self.daten_manager_file.erstelle_schema() # Schema erstellen (Verzeichnis sollte bereits existieren)
+        except CipherCoreDateiSchemaFehler:
+            self.fail("erstelle_schema() hat einen Fehler verursacht, obwohl das Verzeichnis existieren sollte.") # Test fehlschlagen, wenn Fehler auftritt
 
 
-    def _zeige_lizenz_dialog(self) -> None:
+    def test_speichere_ergebnisse_datei_schreibgeschuetzt_file(self):
         """
-        Zeigt das Lizenzdialogfenster an.
-        Dialog ist modal und blockiert die Hauptanwendung, bis eine Entscheidung getroffen wurde.
+        Testet das Speichern von Ergebnissen mit FileDataManager in ein schreibgeschütztes Verzeichnis.
+        Erwartet einen CipherCoreDateiSpeicherFehler, da das Speichern in ein schreibgeschütztes Verzeichnis fehlschlagen sollte.
         """
-        lizenz_fenster = tk.Toplevel(self.root)
-        lizenz_fenster.title("CipherCore Lizenzvereinbarung") # Firmenname im Lizenzdialog-Titel
+        os.chmod(self.test_daten_verzeichnis_file, 0o555) # Verzeichnis schreibgeschützt machen
+        vergleichs_ergebnisse = VergleichsErgebnis(200, 200) # Beispiel Vergleichsergebnisse
+        datei1_name = "datei1.csv" # Beispiel Dateiname 1
+        datei2_name = "datei2.xlsx" # Beispiel Dateiname 2
 
-        lizenz_text_widget = scrolledtext.ScrolledText(lizenz_fenster, wrap=tk.WORD, height=15, width=70)
-        lizenz_text_widget.insert(tk.END, LIZENZBEDINGUNGEN_TEXT) # Lizenztext einfügen
-        lizenz_text_widget.config(state='disabled') # Textfeld schreibgeschützt machen
-        lizenz_text_widget.pack(padx=10, pady=10)
+        with self.assertRaises(CipherCoreDateiSpeicherFehler): # Erwartet CipherCoreDateiSpeicherFehler
+            self.daten_manager_file.speichere_ergebnisse(vergleichs_ergebnisse, datei1_name, datei2_name, ist_pro_version=True) # Ergebnisse speichern (sollte fehlschlagen) - Pro Version aktiviert für Test
 
-        akzeptanz_var = tk.BooleanVar()
-        check_button = Checkbutton(lizenz_fenster, text="Ich akzeptiere die CipherCore Lizenzbedingungen", variable=akzeptanz_var) # Firmenname im Checkbutton-Text
-        check_button.pack(pady=(0, 10))
+        os.chmod(self.test_daten_verzeichnis_file, 0o777) # Verzeichnis wieder beschreibbar machen
 
-        def akzeptieren_und_schliessen():
-            if akzeptanz_var.get():
-                konfiguration[CONFIG_SCHLUESSEL_LIZENZ_AKZEPTIERT] = True # Lizenzakzeptanz in Konfiguration speichern
-                self._speichere_konfiguration() # Konfiguration persistent speichern
-                self.lizenz_akzeptiert.set(True) # Lizenzakzeptanzstatus im UI setzen
-                lizenz_fenster.destroy() # Lizenzfenster schließen
-                logger.info("Lizenzbedingungen akzeptiert.")
-            else:
-                messagebox.showerror("Lizenz ablehnen", "Bitte akzeptieren Sie die Lizenzbedingungen von CipherCore, um fortzufahren.") # Firmenname in Fehlermeldung
-                logger.warning("Lizenzbedingungen abgelehnt.")
 
-        akzeptieren_button = Button(lizenz_fenster, text="Akzeptieren", command=akzeptieren_und_schliessen)
-        akzeptieren_button.pack(pady=(0, 10))
+    def test_lade_ergebnisse_ungueltige_json_file(self):
+        """
+        Testet das Laden von Ergebnissen mit FileDataManager, wenn ungültige JSON-Dateien im Verzeichnis vorhanden sind.
+        Erwartet, dass ungültige JSON-Dateien ignoriert werden und keine Fehler geworfen werden.
+        """
+        ungueltige_json_datei_pfad = os.path.join(self.test_daten_verzeichnis_file, "ungueltige_datei.json") # Pfad zur ungültigen JSON-Datei
+        with open(ungueltige_json_datei_pfad, 'w') as f: # Ungültige JSON-Datei erstellen
+            f.write("Dies ist keine gültige JSON-Datei") # Ungültigen JSON-Inhalt schreiben
 
-        ablehnen_button = Button(lizenz_fenster, text="Ablehnen & Beenden", command=self.root.destroy)
-        ablehnen_button.pack(pady=(0, 10))
+        try:
+            ergebnisse = self.daten_manager_file.lade_alle_ergebnisse() # Ergebnisse laden (sollte ungültige Datei ignorieren)
+            self.assertEqual(ergebnisse, []) # Erwartet leere Liste, da ungültige Datei ignoriert werden soll
+        except CipherCoreDateiLadeFehler:
+            self.fail("lade_alle_ergebnisse() sollte ungültige JSON-Dateien ignorieren und keinen Fehler werfen.") # Test fehlschlagen, wenn Fehler auftritt
 
-        lizenz_fenster.transient(self.root) # Dialog wird zum transienten Fenster des Hauptfensters
-        lizenz_fenster.grab_set() # Dialog modal machen
-        self.root.wait_window(lizenz_fenster) # Warten, bis Lizenzdialog geschlossen wird
 
+    def test_verlauf_laeufe_eindeutig(self):
+        """
+        Testet, dass Läufe derselben Dateien in derselben Sekunde getrennt bleiben (SQLite-Laufkennung) und Dateinamen mit
+        '_vs_' im JSON-Verlauf unverändert aus der Datei gelesen werden.
+        """
+        with unittest.mock.patch('datetime.datetime', wraps=datetime.datetime) as uhr:
+            uhr.now.return_value = datetime.datetime(2026, 5, 1, 12, 0, 0, tzinfo=datetime.timezone.utc) # Gleiche Sekunde
+            for gleiche in (3, 4):
+                self.daten_manager_sqlite.speichere_ergebnisse(VergleichsErgebnis(10, 10, gleiche), "a.csv", "b.csv", ist_pro_version=True)
+        self.assertEqual(self.daten_manager_sqlite.zaehle_ergebnisse(), 2)
+        self.assertEqual(sorted(eintrag['metriken'][METRIK_GLEICHE_NAMEN] for eintrag in self.daten_manager_sqlite.lade_ergebnisse_seite()), [3, 4])
 
-    def _create_widgets(self) -> None:
+        self.daten_manager_file.speichere_ergebnisse(VergleichsErgebnis(10, 10, 5), "kunden_vs_alt.csv", "neu_vs_x.csv", ist_pro_version=True)
+        frische_instanz = FileDataManager(self.daten_manager_file.daten_verzeichnis) # Index aus den JSON-Dateien aufbauen
+        seite = frische_instanz.lade_ergebnisse_seite(suchbegriff="KUNDEN_VS")
+        self.assertEqual((seite[0]['datei1_name'], seite[0]['datei2_name']), ("kunden_vs_alt.csv", "neu_vs_x.csv"))
+        self.assertEqual(frische_instanz.zaehle_ergebnisse("neu_vs_x"), 1)
+
+
+    def test_lade_ergebnisse_seite_standardimplementierung(self):
         """
-        Erstellt die UI-Elemente im Hauptfenster.
-        Layout mit Grid-Manager für flexible und responsive Oberfläche.
-        Klare Beschriftungen und Benutzerführung.
+        Testet, dass DataManager ohne eigenes Paging (nur lade_alle_ergebnisse) instanziierbar bleiben und die
+        Standardimplementierung sortiert, filtert und Seiten bildet.
         """
-        # Lizenzschlüssel Eingabe
-        tk.Label(self.root, text="Lizenzschlüssel (Pro Version):").grid(row=0, column=0, padx=5, pady=5, sticky="w")
-        Entry(self.root, textvariable=self.lizenzschluessel_var, width=50).grid(row=0, column=1, padx=5, pady=5)
-        Button(self.root, text="Schlüssel aktivieren", command=self.aktiviere_lizenzschluessel).grid(row=0, column=2, padx=5, pady=5)
+        class MinimalerManager(AbstractDataManager):
+            def erstelle_schema(self): pass
+            def speichere_ergebnisse(self, *args, **kwargs): pass
+            def lade_alle_ergebnisse(self):
+                return [{"vergleichszeitpunkt": f"2026-01-0{tag}", "datei1_name": name, "datei2_name": "h.csv", "metriken": {}}
+                        for tag, name in ((1, "b.csv"), (2, "a.csv"), (3, "c.csv"))]
+            def zustands_verzeichnis(self): return ""
 
-        # Lizenzstatus Anzeige
-        self.lizenz_status_label = Label(self.root, textvariable=self.status_meldung)
-        self.lizenz_status_label.grid(row=1, column=1, pady=2, sticky="w")
+        daten_manager = MinimalerManager()
+        self.assertEqual([e['datei1_name'] for e in daten_manager.lade_ergebnisse_seite(0, 2, 'datei1_name', absteigend=False)], ["a.csv", "b.csv"])
+        self.assertEqual(daten_manager.lade_ergebnisse_seite(0, 1)[0]['datei1_name'], "c.csv") # Neueste zuerst
+        self.assertEqual(daten_manager.zaehle_ergebnisse("B.CSV"), 1)
 
 
-        # Datei 1 Auswahl
-        tk.Label(self.root, text="Datei 1 (Benutzereingaben):").grid(row=2, column=0, padx=5, pady=5, sticky="w")
-        tk.Entry(self.root, textvariable=self.datei_pfad1, width=50, state='disabled').grid(row=2, column=1, padx=5, pady=5) # Eingabefeld für Datei 1 (deaktiviert)
-        tk.Button(self.root, text="Datei 1 auswählen", command=self.datei_auswaehlen_datei1).grid(row=2, column=2, padx=5, pady=5) # Button zum Auswählen von Datei 1
+    def test_lade_ergebnisse_seite_sortierung_und_suche(self):
+        """
+        Testet das seitenweise Laden des Verlaufs mit Sortierung und Suche für beide DataManager.
+        Erwartet gruppierte Läufe mit Metriken, korrekte Seitengröße und im Backend gefilterte Treffer.
+        """
+        for daten_manager in [self.daten_manager_sqlite, self.daten_manager_file] + self.daten_managers_parquet:
+            for datei1_name in ("c_liste.csv", "a_liste.csv", "b_liste.csv"):
+                daten_manager.speichere_ergebnisse(VergleichsErgebnis(10, 10, 5), datei1_name, "haupt.xlsx", ist_pro_version=True)
+
+            self.assertEqual(daten_manager.zaehle_ergebnisse(), 3)
+            seite = daten_manager.lade_ergebnisse_seite(0, 2, 'datei1_name', absteigend=False)
+            self.assertEqual(len(seite), 2) # Seitengröße wird eingehalten
+            self.assertEqual(seite[0]['metriken'][METRIK_GLEICHE_NAMEN], 5) # Rohwert in beiden Backends
+            zweite_seite = daten_manager.lade_ergebnisse_seite(2, 2, 'datei1_name', absteigend=False)
+            self.assertEqual(len(zweite_seite), 1)
+            self.assertTrue(seite[0]['datei1_name'] < seite[1]['datei1_name'] < zweite_seite[0]['datei1_name']) # Aufsteigend sortiert
+
+            self.assertEqual(daten_manager.zaehle_ergebnisse("b_liste"), 1) # Suche im Backend
+            self.assertEqual(daten_manager.lade_ergebnisse_seite(suchbegriff="b_liste")[0]['datei1_name'], "b_liste.csv")
+            with self.assertRaises(ValueError): # Sortierspalten außerhalb der Whitelist werden abgelehnt
+                daten_manager.lade_ergebnisse_seite(sortier_spalte="metrik_wert; DROP TABLE vergleichsergebnisse")
+
+
+    @unittest.skipIf(pa is None, "pyarrow ist nicht installiert")
+    def test_parquet_puffer_und_trend(self):
+        """
+        Testet den ParquetDataManager: gebündeltes Schreiben des Anhänge-Puffers in Monatspartitionen
+        und die Trendabfrage je Hauptliste, die Parquet-Dateien und Puffer gemeinsam auswertet.
+        """
+        daten_manager = ParquetDataManager(os.path.join(self.temp_parquet_verzeichnis.name, 'trend'), puffer_laeufe=3)
+        for gleiche, datei2_name in ((4, "haupt_a.csv"), (8, "haupt_a.csv"), (5, "haupt_b.csv"), (6, "haupt_b.csv")):
+            ergebnis = VergleichsErgebnis(10, 10, gleiche, laufzeiten={'vergleichen': 0.5})
+            daten_manager.speichere_ergebnisse(ergebnis, "eingabe.csv", datei2_name, ist_pro_version=True)
+
+        parquet_dateien = [datei for _, _, dateien in os.walk(daten_manager.laeufe_verzeichnis) for datei in dateien]
+        self.assertEqual(len(parquet_dateien), 1) # Die ersten drei Läufe wurden gemeinsam geschrieben
+        self.assertEqual(len(daten_manager._lade_puffer()), 1) # Der vierte Lauf liegt noch im Puffer
+        self.assertEqual(daten_manager.lade_alle_ergebnisse()[0]['laufzeiten'], {'vergleichen': 0.5})
+
+        trend = daten_manager.aggregiere_metrik(METRIK_GLEICHE_NAMEN, 'monat', 'datei2_name')
+        monat = datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m')
+        self.assertEqual(trend, [
+            {'periode': monat, 'datei2_name': "haupt_a.csv", 'anzahl': 2, 'mittelwert': 6.0, 'minimum': 4.0, 'maximum': 8.0},
+            {'periode': monat, 'datei2_name': "haupt_b.csv", 'anzahl': 2, 'mittelwert': 5.5, 'minimum': 5.0, 'maximum': 6.0}])
+        self.assertEqual(daten_manager.aggregiere_metrik('gleiche_werte', 'jahr', bis=datetime.datetime(2000, 1, 1)), []) # Zeitfilter
+        with self.assertRaises(ValueError):
+            daten_manager.aggregiere_metrik(METRIK_GLEICHE_NAMEN, gruppierung="metrik_wert")
+
+
+    @unittest.skipIf(pa is None, "pyarrow ist nicht installiert")
+    def test_parquet_anhaengen_waehrend_schreiben(self):
+        """
+        Testet, dass ein während des Schreibens angehängter Lauf im neuen Puffer landet und ein übernommener Puffer
+        eines abgebrochenen Schreibvorgangs beim nächsten Schreiben mitgeschrieben wird.
+        """
+        daten_manager = ParquetDataManager(os.path.join(self.temp_parquet_verzeichnis.name, 'gleichzeitig'), puffer_laeufe=100)
+        for gleiche in (1, 2):
+            daten_manager.speichere_ergebnisse(VergleichsErgebnis(10, 10, gleiche), "eingabe.csv", "haupt.csv", ist_pro_version=True)
+        uebernehme = daten_manager._uebernehme
 
-        # Datei 2 Auswahl
-        tk.Label(self.root, text="Datei 2 (Hauptliste):").grid(row=3, column=0, padx=5, pady=5, sticky="w")
-        tk.Entry(self.root, textvariable=self.datei_pfad2, width=50, state='disabled').grid(row=3, column=1, padx=5, pady=5) # Eingabefeld für Datei 2 (deaktiviert)
-        tk.Button(self.root, text="Datei 2 auswählen", command=self.datei_auswaehlen_datei2).grid(row=3, column=2, padx=5, pady=5) # Button zum Auswählen von Datei 2
+        def _uebernehme_mit_anhaengen(pfad):
+            ziel = uebernehme(pfad)
+            if pfad == daten_manager.puffer_pfad: # Anhängen eines anderen Laufs direkt nach der Übernahme
+                daten_manager.speichere_ergebnisse(VergleichsErgebnis(10, 10, 3), "eingabe.csv", "haupt.csv", ist_pro_version=True)
+            return ziel
 
-        # Spaltenauswahl für Datei 1
-        tk.Label(self.root, text="Vergleichsspalte Datei 1:").grid(row=4, column=0, padx=5, pady=5, sticky="w")
-        tk.Entry(self.root, textvariable=self.spalte_datei1, width=20).grid(row=4, column=1, padx=5, pady=5, sticky="w") # Eingabefeld für Spalte Datei 1
+        with unittest.mock.patch.object(daten_manager, '_uebernehme', side_effect=_uebernehme_mit_anhaengen):
+            daten_manager.schreibe_puffer()
+        self.assertEqual([eintrag["metriken"]["gleiche_werte"] for eintrag in daten_manager._lade_puffer()], [3.0])
 
-        # Spaltenauswahl für Datei 2
-        tk.Label(self.root, text="Vergleichsspalte Datei 2:").grid(row=5, column=0, padx=5, pady=5, sticky="w")
-        tk.Entry(self.root, textvariable=self.spalte_datei2, width=20).grid(row=5, column=1, padx=5, pady=5, sticky="w") # Eingabefeld für Spalte Datei 2
+        daten_manager._uebernehme(daten_manager.puffer_pfad) # Übernommen, Schreiben abgebrochen
+        self.assertEqual(len(daten_manager._lade_puffer()), 1) # Weiterhin im Verlauf sichtbar
+        daten_manager.schreibe_puffer()
+        self.assertEqual((daten_manager._lade_puffer(), daten_manager._uebernommene_puffer()), ([], []))
+        self.assertEqual(sorted(eintrag['metriken'][METRIK_GLEICHE_NAMEN] for eintrag in daten_manager.lade_alle_ergebnisse()), [1.0, 2.0, 3.0])
 
-        # Diagrammtyp Auswahl
-        tk.Label(self.root, text="Diagrammtyp:").grid(row=6, column=0, padx=5, pady=5, sticky="w")
-        diagramm_optionen = [DIAGRAMM_TYP_BALKEN, DIAGRAMM_TYP_KREIS] # Verfügbare Diagrammtypen
-        self.diagramm_dropdown = tk.OptionMenu(self.root, self.diagramm_typ, *diagramm_optionen) # Dropdown-Menü für Diagrammtyp
-        self.diagramm_dropdown.grid(row=6, column=1, padx=5, pady=5, sticky="w")
 
-        # Start Button
-        tk.Button(self.root, text="Vergleich starten & PDF-Bericht erstellen", command=self.starte_vergleich, width=30).grid(
-            row=7, column=0, columnspan=3, pady=10) # Button zum Starten des Vergleichs
 
-        # Statusmeldung
-        tk.Label(self.root, textvariable=self.status_meldung).grid(row=8, column=0, columnspan=3, pady=5) # Label für Statusmeldungen
+class TestVerlaufsAuswertung(unittest.TestCase):
+    """
+    Unit-Test Klasse für die inkrementell gepflegten Rollups, die Rangliste der Änderungen und die Auffälligkeiten.
+    """
 
-        # Ergebnis-Textfeld
-        tk.Label(self.root, text="Vergleichsergebnisse:").grid(row=9, column=0, padx=5, pady=5, sticky="nw")
-        self.ergebnis_text = scrolledtext.ScrolledText(self.root, height=10, width=60) # Textfeld für Vergleichsergebnisse
-        self.ergebnis_text.grid(row=9, column=1, columnspan=2, padx=5, pady=5, sticky="nsew")
-        self.ergebnis_text.config(state='disabled') # Textfeld schreibgeschützt
-        self.root.grid_rowconfigure(9, weight=1) # Zeile für Ergebnis-Textfeld soll expandieren
-        self.root.grid_columnconfigure(1, weight=1) # Spalte für Ergebnis-Textfeld soll expandieren
+    def setUp(self):
+        self.temp_verzeichnis = tempfile.TemporaryDirectory()
+        self.auswertung = VerlaufsAuswertung(os.path.join(self.temp_verzeichnis.name, VERLAUF_AUSWERTUNG_DATEINAME))
 
-        # Verlauf anzeigen Button
-        self.verlauf_button = tk.Button(self.root, text="Verlauf anzeigen", command=self.zeige_verlauf, width=20)
-        self.verlauf_button.grid(row=10, column=0, columnspan=3, pady=10) # Button zum Anzeigen des Verlaufs
 
-        # Verlauf-Textfeld
-        tk.Label(self.root, text="Vergleichsverlauf:").grid(row=11, column=0, padx=5, pady=5, sticky="nw")
-        self.verlauf_text = scrolledtext.ScrolledText(self.root, height=10, width=60) # Textfeld für Vergleichsverlauf
-        self.verlauf_text.grid(row=11, column=1, columnspan=2, padx=5, pady=5, sticky="nsew")
-        self.verlauf_text.config(state='disabled') # Textfeld schreibgeschützt
-        self.root.grid_rowconfigure(11, weight=1) # Zeile für Verlauf-Textfeld soll expandieren
+    def tearDown(self):
+        self.temp_verzeichnis.cleanup()
 
 
-    def datei_auswaehlen_datei1(self) -> None:
+    def test_rollups_und_aenderungen(self):
         """
-        Öffnet einen Dateiauswahldialog für Datei 1.
-        Beschränkt die Dateiauswahl auf unterstützte Dateiformate und das Basisverzeichnis (Sicherheit).
+        Testet die Rollups je Monat (Mittelwerte nur aus vorhandenen Werten) und die Änderung zur Vorperiode je Dateipaar.
         """
-        datei_pfad = filedialog.askopenfilename(initialdir=BASIS_VERZEICHNIS, title="Datei 1 auswählen (Benutzereingabe)", filetypes=[('Unterstützte Dateien', UNTERSTUETZTE_DATEIFORMATE)]) # Dateifilter für unterstützte Formate
-        if datei_pfad:
-            self.datei_pfad1.set(datei_pfad) # Pfad in UI speichern
-            logger.debug(f"Datei 1 ausgewählt: {datei_pfad}")
-
-
-    def datei_auswaehlen_datei2(self) -> None:
+        for zeitpunkt, datei1_name, gleiche, alter in ((datetime.datetime(2026, 1, 5), "a.csv", 40, 30.0), (datetime.datetime(2026, 1, 20), "a.csv", 60, None),
+                                                       (datetime.datetime(2026, 2, 3), "a.csv", 90, 32.0), (datetime.datetime(2026, 1, 9), "b.csv", 50, None),
+                                                       (datetime.datetime(2026, 2, 9), "b.csv", 45, None)):
+            ergebnis = VergleichsErgebnis(100, 100, gleiche, durchschnittsalter_datei1=alter)
+            self.assertIsNone(self.auswertung.aktualisiere(ergebnis.metriken(), datei1_name, "haupt.csv", zeitpunkt))
+
+        januar = self.auswertung.rollups('monat', datei1_name="a.csv")[0]
+        self.assertEqual((januar['periode'], januar['laeufe'], januar['mittel_gleiche']), ('2026-01', 2, 50.0))
+        self.assertAlmostEqual(januar['mittel_anteil'], 0.5)
+        self.assertEqual((januar['min_anteil'], januar['max_anteil'], januar['mittel_alter_datei1']), (0.4, 0.6, 30.0))
+        self.assertEqual([r['periode'] for r in self.auswertung.rollups('monat', von_periode='2026-02')], ['2026-02', '2026-02'])
+        self.assertEqual(len(self.auswertung.rollups('tag')), 5)
+
+        aenderungen = self.auswertung.top_aenderungen(zeitraum='monat')
+        self.assertEqual([a['datei1_name'] for a in aenderungen], ["a.csv", "b.csv"]) # Größte Änderung zuerst
+        self.assertAlmostEqual(aenderungen[0]['aenderung'], 0.4)
+        self.assertEqual((aenderungen[0]['vorherige_periode'], aenderungen[0]['periode']), ('2026-01', '2026-02'))
+        self.assertEqual(len(self.auswertung.top_aenderungen(1, 'monat')), 1)
+        with self.assertRaises(ValueError):
+            self.auswertung.rollups('quartal')
+
+
+    def test_auffaelligkeit_und_nachtragen(self):
         """
-        Öffnet einen Dateiauswahldialog für Datei 2.
-        Beschränkt die Dateiauswahl auf unterstützte Dateiformate und das Basisverzeichnis (Sicherheit).
+        Testet die Erkennung eines Einbruchs im Überlappungsanteil erst nach VERLAUF_ANOMALIE_MIN_LAEUFE Läufen und das
+        einmalige Nachtragen eines bestehenden Verlaufs, ohne den nächsten Lauf doppelt zu zählen.
         """
-        datei_pfad = filedialog.askopenfilename(initialdir=BASIS_VERZEICHNIS, title="Datei 2 auswählen (Hauptliste)", filetypes=[('Unterstützte Dateien', UNTERSTUETZTE_DATEIFORMATE)]) # Dateifilter für unterstützte Formate
-        if datei_pfad:
-            self.datei_pfad2.set(datei_pfad) # Pfad in UI speichern
-            logger.debug(f"Datei 2 ausgewählt: {datei_pfad}")
-
-    def aktiviere_lizenzschluessel(self):
+        daten_manager = FileDataManager(os.path.join(self.temp_verzeichnis.name, "json"))
+        daten_manager._verlaufs_auswertung = self.auswertung # Zunächst in eine separate Auswertung schreiben
+        for gleiche in (50, 51, 49, 50, 52):
+            daten_manager.speichere_ergebnisse(VergleichsErgebnis(100, 100, gleiche), "e.csv", "h.csv", ist_pro_version=True)
+        self.assertEqual(self.auswertung.anomalien(), [])
+
+        nachgetragen = FileDataManager(daten_manager.daten_verzeichnis) # Neue Instanz: Tabellen im Datenverzeichnis fehlen noch
+        nachgetragen.speichere_ergebnisse(VergleichsErgebnis(100, 100, 20), "e.csv", "h.csv", ist_pro_version=True)
+        auswertung = nachgetragen.verlaufs_auswertung()
+        self.assertEqual(auswertung.rollups('monat')[0]['laeufe'], 6) # Fünf nachgetragene Läufe und der neue Lauf
+        anomalien = auswertung.anomalien()
+        self.assertEqual(len(anomalien), 1)
+        self.assertAlmostEqual(anomalien[0]['anteil'], 0.2)
+        self.assertAlmostEqual(anomalien[0]['erwartet'], 0.504)
+        self.assertLess(anomalien[0]['z_wert'], -VERLAUF_ANOMALIE_Z)
+        self.assertFalse(VerlaufsAuswertung(auswertung.datenbank_pfad).ist_neu) # Markierung gesetzt: kein zweites Nachtragen
+
+
+    def test_anteile_verschiedener_basis_getrennt(self):
         """
-        Aktiviert den eingegebenen Lizenzschlüssel und speichert ihn in der Konfiguration.
+        Testet, dass Anteile mit verschiedenen Nennern (eindeutige Werte bzw. Zeilenanzahl) getrennte Reihen bilden
+        und nicht miteinander verglichen werden.
         """
-        lizenzschluessel = self.lizenzschluessel_var.get()
-        try:
-            oeffentlicher_schluessel = lade_oeffentlichen_schluessel(OEFFENTLICHER_SCHLUESSEL_PFAD) # Öffentlichen Schlüssel laden
-            ist_pro, _ = validiere_lizenzschluessel_pro(lizenzschluessel, oeffentlicher_schluessel) # Lizenz validieren
-            if ist_pro:
-                konfiguration[CONFIG_SCHLUESSEL_LIZENZSCHLUESSEL] = lizenzschluessel
-                self._speichere_konfiguration()
-                self._aktualisiere_lizenz_status_anzeige()
-                self._aktualisiere_pro_version_features() # Pro Version Features aktivieren
-                messagebox.showinfo("Lizenzschlüssel aktiviert", "Ihr Lizenzschlüssel wurde erfolgreich aktiviert. Sie nutzen nun die Pro Version.")
-                logger.info("Lizenzschlüssel erfolgreich aktiviert.")
-            else:
-                messagebox.showerror("Ungültiger Lizenzschlüssel", "Der eingegebene Lizenzschlüssel ist ungültig. Bitte überprüfen Sie ihn.")
-                logger.warning("Ungültiger Lizenzschlüssel eingegeben.")
-                konfiguration[CONFIG_SCHLUESSEL_LIZENZSCHLUESSEL] = None # Ungültigen Schlüssel entfernen
-                self._speichere_konfiguration()
-                self._aktualisiere_lizenz_status_anzeige()
-                self._aktualisiere_pro_version_features() # Pro Version Features deaktivieren
-        except CipherCoreLizenzFehler as e:
-             messagebox.showerror("Fehler beim Aktivieren des Lizenzschlüssels", f"Fehler bei der Lizenzschlüsselvalidierung: {e}")
-             logger.error(f"Fehler bei der Lizenzschlüsselvalidierung: {e}")
+        mit_eindeutigen = dict(VergleichsErgebnis(100, 100, 40).metriken(), **{METRIK_EINDEUTIGE_DATEI1: 50})
+        self.auswertung.aktualisiere(mit_eindeutigen, "a.csv", "haupt.csv", datetime.datetime(2026, 1, 5))
+        self.auswertung.aktualisiere(VergleichsErgebnis(100, 100, 40).metriken(), "a.csv", "haupt.csv", datetime.datetime(2026, 2, 5))
+        self.assertEqual([(r['periode'], r['anteil_basis'], r['mittel_anteil']) for r in self.auswertung.rollups('monat')],
+                         [('2026-01', 'eindeutig', 0.8), ('2026-02', 'zeilen', 0.4)])
+        self.assertEqual(self.auswertung.top_aenderungen(zeitraum='monat'), []) # 80 % -> 40 % ist keine Änderung derselben Reihe
 
 
-    def starte_vergleich(self) -> None:
+    def test_nachtragen_abgebrochen_wird_wiederholt(self):
         """
-        Startet den Dateivergleich und die Berichterstellung in einem Hintergrundthread.
-        Verhindert Blockieren der UI während der Verarbeitung (Responsivität).
-        Fehlerbehandlung und Anzeige von Statusmeldungen in der UI.
+        Testet, dass ein abgebrochenes Nachtragen keine Teilergebnisse und keine Markierung hinterlässt und vollständig wiederholt wird.
         """
-        datei_pfad1 = self.datei_pfad1.get()
-        datei_pfad2 = self.datei_pfad2.get()
-        diagramm_typ = self.diagramm_typ.get()
-        spalte_datei1 = self.spalte_datei1.get() # Spalte für Datei 1 aus UI holen
-        spalte_datei2 = self.spalte_datei2.get() # Spalte für Datei 2 aus UI holen
-        lizenzschluessel = self.lizenzschluessel_var.get() # Lizenzschlüssel aus UI holen
-
-        if not datei_pfad1 or not datei_pfad2:
-            messagebox.showerror("Fehler", "Bitte wählen Sie beide Dateien aus.") # Fehlermeldung, wenn Dateien fehlen
-            logger.warning("Vergleichsstart abgebrochen: Beide Dateien müssen ausgewählt sein.")
-            return
+        zeitpunkt = datetime.datetime(2026, 3, 1)
+        laeufe = [(VergleichsErgebnis(100, 100, 50).metriken(), "a.csv", "haupt.csv", zeitpunkt)] * 3
 
-        self.ergebnis_text.config(state='normal') # Ergebnis-Textfeld editierbar machen
-        self.ergebnis_text.delete('1.0', tk.END) # Textfeld leeren
-        self.ergebnis_text.config(state='disabled') # Textfeld wieder schreibgeschützt machen
-        self.verlauf_text.config(state='normal') # Verlauf-Textfeld editierbar machen
-        self.verlauf_text.delete('1.0', tk.END) # Textfeld leeren
-        self.verlauf_text.config(state='disabled') # Verlauf-Textfeld wieder schreibgeschützt machen
-        self.status_meldung.set("Vergleich wird gestartet...") # Statusmeldung setzen
+        def abbrechend():
+            yield laeufe[0]
+            raise sqlite3.OperationalError("Verlauf nicht lesbar")
 
-        threading.Thread(target=self._starte_vergleich_hintergrund, args=(datei_pfad1, datei_pfad2, diagramm_typ, spalte_datei1, spalte_datei2, lizenzschluessel)).start() # Vergleich in Thread starten
-        logger.info("Vergleichs-Thread gestartet.")
+        with self.assertRaises(CipherCoreDatenbankSpeicherFehler):
+            self.auswertung.trage_nach(abbrechend())
+        self.assertTrue(VerlaufsAuswertung(self.auswertung.datenbank_pfad).ist_neu)
+        self.assertEqual(self.auswertung.rollups('monat'), [])
+        self.assertEqual(self.auswertung.trage_nach(iter(laeufe)), 3)
+        self.assertEqual(self.auswertung.trage_nach(iter(laeufe)), 0) # Bereits nachgetragen
+        self.assertEqual(self.auswertung.rollups('monat')[0]['laeufe'], 3)
 
 
-    def _starte_vergleich_hintergrund(self, datei_pfad1: str, datei_pfad2: str, diagramm_typ: str, spalte_datei1: str, spalte_datei2: str, lizenzschluessel: str) -> None:
+    def test_json_verlauf_in_utc(self):
         """
-        Führt den Dateivergleich und die Berichterstellung im Hintergrund aus.
-        Ruft die Hauptfunktion `dateien_vergleichen_und_bericht_erstellen` auf.
-        Behandelt Fehler und aktualisiert die UI mit Ergebnissen und Statusmeldungen.
-
-        Args:
-            datei_pfad1 (str): Pfad zur ersten Datei.
-            datei_pfad2 (str): Pfad zur zweiten Datei.
-            diagramm_typ (str): Diagrammtyp.
-            spalte_datei1 (str): Spalte für Vergleich aus Datei 1.
-            spalte_datei2 (str): Spalte für Vergleich aus Datei 2.
-            lizenzschluessel (str): Der zu verwendende Lizenzschlüssel.
+        Testet, dass der JSON-Verlauf Zeitpunkte in UTC speichert und ältere Einträge in Ortszeit beim Nachtragen nach UTC umgerechnet werden.
         """
-        pdf_pfad, vergleichs_ergebnisse = dateien_vergleichen_und_bericht_erstellen(datei_pfad1, datei_pfad2,
-                                                                                     diagramm_typ=diagramm_typ,
-                                                                                     daten_manager=self.daten_manager,
-                                                                                     ui_status_rueckruf=self.update_status_meldung_ui,
-                                                                                     spalte_datei1=spalte_datei1, # Spalten für Vergleich übergeben
-                                                                                     spalte_datei2=spalte_datei2, # Spalten für Vergleich übergeben
-                                                                                     lizenzschluessel=lizenzschluessel)
-        if isinstance(pdf_pfad, str) and pdf_pfad.endswith('.pdf'):
-            self.update_status_meldung_ui(f"PDF-Bericht erfolgreich erstellt: {pdf_pfad}") # Erfolgsmeldung in UI
-            logger.info(f"PDF-Bericht erfolgreich erstellt: {pdf_pfad}")
-        else:
-            self.update_status_meldung_ui(f"Fehler beim Erstellen des Berichts: {pdf_pfad}") # Fehlermeldung in UI
-            messagebox.showerror("Fehler beim Bericht", f"Fehler beim Erstellen des PDF-Berichts:\n{pdf_pfad}") # Fehlermeldung als MessageBox
-            logger.error(f"Fehler beim Erstellen des Berichts: {pdf_pfad}")
+        daten_manager = FileDataManager(os.path.join(self.temp_verzeichnis.name, "json"))
+        daten_manager.speichere_ergebnisse(VergleichsErgebnis(100, 100, 50), "a.csv", "haupt.csv", ist_pro_version=True)
+        gespeichert = datetime.datetime.fromisoformat(daten_manager.lade_alle_ergebnisse()[0]['vergleichszeitpunkt'])
+        self.assertEqual(gespeichert.utcoffset(), datetime.timedelta(0))
+        lokal = datetime.datetime(2026, 1, 1, 0, 30)
+        self.assertEqual(daten_manager._utc_zeitpunkt(lokal.isoformat()),
+                         lokal.astimezone(datetime.timezone.utc).replace(tzinfo=None))
+        self.assertEqual(daten_manager._utc_zeitpunkt("2026-01-01T00:30:00+02:00"), datetime.datetime(2025, 12, 31, 22, 30))
 
 
-        if vergleichs_ergebnisse:
-            self.zeige_vergleichs_ergebnisse_ui(vergleichs_ergebnisse) # Vergleichsergebnisse in UI anzeigen
 
+class TestVergleichsAbbruch(unittest.TestCase):
+    """
+    Unit-Test Klasse für den kooperativen Abbruch von Lade- und Vergleichsvorgängen.
+    """
 
-    def update_status_meldung_ui(self, meldung: str) -> None:
-        """
-        Aktualisiert die Statusmeldung in der UI (thread-sicher).
-        Verwendet `root.after` um UI-Updates im Hauptthread auszuführen (Tkinter Thread-Sicherheit).
+    def setUp(self):
+        """Erstellt ein temporäres Basisverzeichnis mit einer CSV-Testdatei."""
+        self.temp_verzeichnis = tempfile.TemporaryDirectory()
+        self.csv_pfad = os.path.join(self.temp_verzeichnis.name, "abbruch_test.csv")
+        pd.DataFrame({'Name': ['Alice', 'Bob'], 'Alter': [30, 25]}).to_csv(self.csv_pfad, index=False, encoding='utf-8')
+        self.daten_lader = DatenLader(self.temp_verzeichnis.name)
 
-        Args:
-            meldung (str): Die anzuzeigende Statusmeldung.
-        """
-        self.root.after(0, self.status_meldung.set, meldung) # Statusmeldung im Hauptthread aktualisieren
+
+    def tearDown(self):
+        """Löscht das temporäre Basisverzeichnis."""
+        self.temp_verzeichnis.cleanup()
 
 
-    def zeige_vergleichs_ergebnisse_ui(self, vergleichs_ergebnisse: Dict[str, str]) -> None:
+    def test_lade_daten_mit_aktivem_token(self):
         """
-        Zeigt die Vergleichsergebnisse im Textfeld der UI an (thread-sicher).
-        Formatiert die Ergebnisse als String und aktualisiert das Textfeld im Hauptthread.
-
-        Args:
-            vergleichs_ergebnisse (Dict[str, str]): Die Vergleichsergebnisse.
+        Testet das blockweise Laden mit nicht ausgelöstem Token.
+        Erwartet dasselbe Ergebnis wie beim Laden ohne Token.
         """
-        ergebnis_text_string = "Vergleichsergebnisse:\n"
-        ergebnis_text_string += "-------------------------\n"
-        for metrik, wert in vergleichs_ergebnisse.items():
-            ergebnis_text_string += f"  {metrik}: {wert}\n" # Metrik und Wert formatieren
-        ergebnis_text_string += "-------------------------\n"
-
-        self.root.after(0, self._update_ergebnis_text_widget, ergebnis_text_string) # Ergebnis-Textfeld im Hauptthread aktualisieren
+        daten_frame, _ = self.daten_lader.lade_daten(self.csv_pfad, VergleichsAbbruchToken())
+        self.assertEqual(daten_frame['Name'].tolist(), ['Alice', 'Bob'])
 
 
-    def _update_ergebnis_text_widget(self, text: str) -> None:
+    def test_lade_daten_abgebrochen(self):
         """
-        Hilfsfunktion zum thread-sicheren Aktualisieren des Ergebnis-Text-Widgets.
-        Direkter Zugriff auf UI-Elemente nur im Hauptthread erlaubt (Tkinter Einschränkung).
-
-        Args:
-            text (str): Der anzuzeigende Text.
+        Testet das Laden mit ausgelöstem Abbruch-Token.
+        Erwartet einen CipherCoreAbbruchFehler anstelle eines Ladefehlers.
         """
-        self.ergebnis_text.config(state='normal') # Textfeld editierbar machen
-        self.ergebnis_text.delete('1.0', tk.END) # Textfeld leeren
-        self.ergebnis_text.insert(tk.END, text) # Neuen Text einfügen
-        self.ergebnis_text.config(state='disabled') # Textfeld wieder schreibgeschützt machen
+        abbruch_token = VergleichsAbbruchToken()
+        abbruch_token.abbrechen()
+        with self.assertRaises(CipherCoreAbbruchFehler):
+            self.daten_lader.lade_daten(self.csv_pfad, abbruch_token)
 
 
-    def zeige_verlauf(self) -> None:
+    def test_vergleiche_daten_abgebrochen(self):
         """
-        Zeigt den Vergleichsverlauf aus dem DatenManager im Verlauf-Textfeld an.
-        Ruft `daten_manager.lade_alle_ergebnisse()` auf und formatiert die Daten für die UI-Anzeige.
-        Behandelt verschiedene Fehlerfälle beim Laden des Verlaufs und zeigt Fehlermeldungen in der UI.
+        Testet den Datenvergleich mit ausgelöstem Abbruch-Token.
+        Erwartet einen CipherCoreAbbruchFehler.
         """
-        self.verlauf_text.config(state='normal') # Verlauf-Textfeld editierbar machen
-        self.verlauf_text.delete('1.0', tk.END) # Textfeld leeren
-        self.status_meldung.set("Lade Vergleichsverlauf...") # Statusmeldung setzen
-        threading.Thread(target=self._lade_verlauf_hintergrund).start() # Verlauf laden in Thread starten
-        logger.info("Verlauf laden Thread gestartet.")
+        daten_frame = pd.DataFrame({'Name': ['Alice', 'Bob'], 'Alter': [30, 25]})
+        abbruch_token = VergleichsAbbruchToken()
+        abbruch_token.abbrechen()
+        with self.assertRaises(CipherCoreAbbruchFehler):
+            DateiVergleicher().vergleiche_daten(daten_frame, daten_frame, abbruch_token=abbruch_token)
+
+
 
+class TestSynthetischerDatensatzGenerator(unittest.TestCase):
+    """
+    Unit-Test Klasse für den synthetischen Datensatzgenerator des Benchmarks.
+    """
 
-    def _lade_verlauf_hintergrund(self) -> None:
+    def test_ueberlappung_und_tippfehler(self):
         """
-        Lädt den Vergleichsverlauf im Hintergrund und aktualisiert die UI.
+        Testet, dass Überlappung und Tippfehlerrate die Anzahl übereinstimmender Namen steuern.
+        Erwartet exakt die gewünschte Überlappung ohne Tippfehler und keine Treffer bei 100 % Tippfehlern.
         """
-        try:
-            verlauf_daten = self.daten_manager.lade_alle_ergebnisse() # Verlaufdaten laden
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            generator = SynthetischerDatensatzGenerator(zufalls_seed=7)
+            for tippfehler_rate, erwartete_treffer in ((0.0, 300), (1.0, 0)):
+                pfad1, pfad2 = generator.erzeuge_paar(verzeichnis, 1000, DATEIFORMAT_CSV, ueberlappung=0.3, tippfehler_rate=tippfehler_rate)
+                daten_frame1, daten_frame2 = pd.read_csv(pfad1), pd.read_csv(pfad2)
+                self.assertEqual(len(daten_frame1), 1000)
+                self.assertEqual(list(daten_frame2.columns), ['Name', 'Alter', 'Stadt'])
+                ergebnisse = DateiVergleicher().vergleiche_daten(daten_frame1, daten_frame2)
+                self.assertEqual(ergebnisse.gleiche_werte, erwartete_treffer)
 
-            verlauf_text_string = "Vergleichsverlauf:\n"
-            verlauf_text_string += "-------------------------------------------------------------------\n"
-            if verlauf_daten:
-                for eintrag in verlauf_daten: # Jeden Verlaufseintrag durchgehen
-                    zeitpunkt_str = eintrag.get('vergleichszeitpunkt', 'N/A') # Vergleichszeitpunkt auslesen
-                    datei1_name = eintrag.get('datei1_name', 'N/A') # Dateiname 1 auslesen
-                    datei2_name = eintrag.get('datei2_name', 'N/A') # Dateiname 2 auslesen
-                    verlauf_text_string += f"Zeitpunkt: {zeitpunkt_str}\n" # Zeitpunkt zum Ausgabestring hinzufügen
-                    verlauf_text_string += f"  Dateien: {datei1_name}, {datei2_name}\n" # Dateinamen zum Ausgabestring hinzufügen
 
-                    metriken_eintrag = eintrag.get('metriken', {}) if isinstance(self.daten_manager, FileDataManager) else eintrag # Metriken je nach DataManager-Typ abrufen
-                    for metrik in METRIK_REIHENFOLGE: # Metriken in definierter Reihenfolge durchgehen
-                        wert = metriken_eintrag.get(metrik, 'N/A') if isinstance(self.daten_manager, FileDataManager) else eintrag.get(metrik, 'N/A') # Metrikwert abrufen
-                        if wert != 'N/A':
-                            verlauf_text_string += f"  - {metrik}: {wert}\n" # Metrik und Wert zum Ausgabestring hinzufügen
-                    verlauf_text_string += "-------------------------------------------------------------------\n"
-            else:
-                verlauf_text_string += "Keine Verlaufsdaten gefunden.\n" # Meldung, wenn keine Verlaufsdaten vorhanden
-                verlauf_text_string += "-------------------------------------------------------------------\n"
 
-            self.root.after(0, self._update_verlauf_text_widget, verlauf_text_string) # Verlauftext in Textfeld einfügen
-            self.update_status_meldung_ui("Vergleichsverlauf geladen.") # Statusmeldung aktualisieren
+class TestDatenValidierer(unittest.TestCase):
+    """
+    Unit-Test Klasse für die schemabasierte Datenvalidierung.
+    """
 
-        except CipherCoreDateiLadeFehler as e: # Spezifische Fehlerbehandlung für Dateiladefehler
-            logger.error(f"Fehler beim Laden des Vergleichsverlaufs aus Dateien: {e}")
-            fehlermeldung = f"Dateifehler beim Laden des Verlaufs:\n{e}\nBitte überprüfen Sie das Datenverzeichnis und die Dateiberechtigungen."
-            self.root.after(0, self._zeige_verlauf_fehler, fehlermeldung) # Fehlermeldung in UI anzeigen
+    def test_verstoesse_mit_zeilennummern_blockweise(self):
+        """
+        Testet, dass blockweise und vollständige Prüfung dieselben Verstöße mit Zeilennummern melden,
+        inklusive blockübergreifender Eindeutigkeit und Null-Anteil.
+        """
+        daten_frame = pd.DataFrame({'Name': ['Anna', 'Bob', 'Anna', None], 'Alter': [30, -1, 'x', 200]})
+        schema = {"spalten": {"Name": {"erforderlich": True, "eindeutig": True, "max_null_anteil": 0.0},
+                              "Alter": {"typ": "zahl", "min": 0, "max": 150}}}
+        meldungen = []
+        for block_groesse in (len(daten_frame), 2):
+            validierer = DatenValidierer(schema, 'test.csv')
+            for start in range(0, len(daten_frame), block_groesse):
+                validierer.pruefe_block(daten_frame.iloc[start:start + block_groesse])
+            with self.assertRaises(CipherCoreDatenValidierungsFehler) as kontext:
+                validierer.abschliessen()
+            meldungen.append(sorted(validierer.verstoesse))
+            self.assertIn("Zeile 3, Spalte 'Name': Wert ist nicht eindeutig", str(kontext.exception))
+        self.assertEqual(meldungen[0], meldungen[1])
+        self.assertEqual(len(meldungen[0]), 5)
+
+    def test_dateispezifisches_schema(self):
+        """
+        Testet, dass eine '<datei>.schema.json' neben der Eingabedatei das globale Schema ersetzt
+        und ungültige Schemata als Validierungsfehler gemeldet werden.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            datei_pfad = os.path.join(verzeichnis, 'kunden.csv')
+            pd.DataFrame({'Kunde': ['A1', 'B2']}).to_csv(datei_pfad, index=False)
+            daten_lader = DatenLader(verzeichnis)
+            with self.assertRaises(CipherCoreDatenValidierungsFehler): # Standardschema verlangt Name und Alter
+                daten_lader.lade_daten(datei_pfad)
+            with open(datei_pfad + SCHEMA_DATEI_ENDUNG, 'w', encoding='utf-8') as schema_datei:
+                json.dump({"spalten": {"Kunde": {"erforderlich": True, "regex": "[A-Z][0-9]"}}}, schema_datei)
+            daten_frame, _ = daten_lader.lade_daten(datei_pfad)
+            self.assertEqual(len(daten_frame), 2)
+        with self.assertRaises(CipherCoreDatenValidierungsFehler):
+            DatenValidierer({"spalten": {"Alter": {"typ": "datum"}}}, 'test.csv')
+
+
+class TestCsvFormatErkennung(unittest.TestCase):
+    """
+    Unit-Test Klasse für die Erkennung von Kodierung, Trennzeichen, Quoting und Kopfzeile.
+    """
 
-        except CipherCoreDatenbankLadeFehler as e: # Spezifische Fehlerbehandlung für Datenbankladefehler
-            logger.error(f"Fehler beim Laden des Vergleichsverlaufs aus der Datenbank: {e}")
-            fehlermeldung = f"Datenbankfehler beim Laden des Verlaufs:\n{e}\nBitte überprüfen Sie die Logdatei und die Datenbankverbindung."
-            self.root.after(0, self._zeige_verlauf_fehler, fehlermeldung) # Fehlermeldung in UI anzeigen
+    def test_sniffe_csv_format(self):
+        """
+        Testet die Erkennung an typischen Exporten (Windows cp1252 mit Semikolon, UTF-8 ohne Kopfzeile, Tabulator mit BOM).
+        """
+        erkannt = DatenLader._sniffe_csv_format("Name;Alter\nJürgen;40\n\"Ann;a\";3\n".encode('cp1252'), vollstaendig=True)
+        self.assertEqual(erkannt, {"encoding": 'cp1252', "trennzeichen": ';', "quotechar": '"', "kopfzeile": True})
+        erkannt = DatenLader._sniffe_csv_format(b"Anna,30\nBob,40\n", vollstaendig=True)
+        self.assertEqual((erkannt["encoding"], erkannt["trennzeichen"], erkannt["kopfzeile"]), ('utf-8', ',', False))
+        erkannt = DatenLader._sniffe_csv_format(codecs.BOM_UTF8 + "Name\tAlter\nÄnne\t5\n".encode('utf-8'), vollstaendig=True)
+        self.assertEqual((erkannt["encoding"], erkannt["trennzeichen"], erkannt["kopfzeile"]), ('utf-8-sig', '\t', True))
+
+    def test_windows_export_wird_in_einem_durchlauf_geladen(self):
+        """
+        Testet das Laden eines cp1252-Exports, dessen Sonderzeichen erst nach der Stichprobe auftreten,
+        sowie die Wiederverwendung des erkannten Formats aus dem Cache.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            datei_pfad = os.path.join(verzeichnis, 'export.txt')
+            with open(datei_pfad, 'wb') as datei:
+                datei.write(("Name;Alter\n" + "Anna;30\n" * (CSV_PROBE_BYTES // 8) + "Jürgen;40\n").encode('cp1252'))
+            daten_lader = DatenLader(verzeichnis)
+            daten_frame, _ = daten_lader.lade_daten(datei_pfad)
+            self.assertEqual(daten_frame['Name'].iloc[-1], 'Jürgen')
+            self.assertEqual(daten_lader._erkenne_csv_format(datei_pfad)["encoding"], 'cp1252') # Korrigierte Erkennung im Cache
+
+            zweiter_pfad = os.path.join(verzeichnis, 'export2.txt')
+            shutil.copy(datei_pfad, zweiter_pfad)
+            with unittest.mock.patch.object(DatenLader, '_oeffne_csv', autospec=True, side_effect=DatenLader._oeffne_csv) as oeffnen:
+                namen = pd.concat(list(daten_lader.lade_bloecke(zweiter_pfad)))['Name']
+            self.assertEqual(namen.iloc[-1], 'Jürgen')
+            self.assertEqual(oeffnen.call_count, 1) # Rückfall auf cp1252 ohne erneutes Lesen
+
+
+    def test_kodierungs_rueckfall_strom(self):
+        """
+        Testet den Wechsel der Kodierung am ersten ungültigen Byte, auch wenn ein UTF-8-Zeichen über eine Blockgrenze reicht:
+        Der gültige UTF-8-Anfang bleibt erhalten, der Rest wird als cp1252 bzw. latin-1 gelesen.
+        """
+        inhalt = "Zoë;1\n".encode('utf-8') * 3 + "Jürgen;2\n".encode('cp1252') + b"\x81x\n"
+        kodierungen: List[str] = []
+        strom = KodierungsRueckfallStrom(BytesIO(inhalt), kodierungen.append, block_bytes=3)
+        self.assertEqual(strom.read().decode('utf-8'), "Zoë;1\n" * 3 + "Jürgen;2\n\x81x\n")
+        self.assertEqual(kodierungen, ['cp1252', 'latin-1'])
 
-        except CipherCoreDatenFehler as e: # Generische Fehlerbehandlung für Datenfehler
-            logger.error(f"Generischer Datenquellen-Fehler beim Laden des Vergleichsverlaufs: {e}")
-            fehlermeldung = f"Allgemeiner Datenquellen-Fehler beim Laden des Verlaufs:\n{e}\nBitte überprüfen Sie die Logdatei und die Datenquelle."
-            self.root.after(0, self._zeige_verlauf_fehler, fehlermeldung) # Fehlermeldung in UI anzeigen
 
-        except Exception as e: # Unerwartete Fehlerbehandlung (Generischer Catch-All)
-            logger.exception(f"Unerwarteter Fehler beim Laden des Vergleichsverlaufs: {e}")
-            fehlermeldung = f"Unerwarteter Fehler beim Laden des Verlaufs:\n{e}\nBitte überprüfen Sie die Logdatei für Details."
-            self.root.after(0, self._zeige_verlauf_fehler, fehlermeldung) # Fehlermeldung in UI anzeigen
+    def test_csv_format_cache_begrenzt(self):
+        """
+        Testet, dass der Cache der CSV-Formate auf CSV_FORMAT_CACHE_GROESSE Einträge begrenzt ist und die zuletzt
+        verwendeten Einträge behält.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis, unittest.mock.patch.dict(globals(), {'CSV_FORMAT_CACHE_GROESSE': 2}), \
+                unittest.mock.patch.object(DatenLader, '_csv_format_cache', OrderedDict()):
+            daten_lader = DatenLader(verzeichnis)
+            pfade = []
+            for nummer in range(3):
+                pfade.append(os.path.join(verzeichnis, f'datei{nummer}.csv'))
+                with open(pfade[-1], 'w', encoding='utf-8') as datei:
+                    datei.write("Name\nAnna\n")
+                daten_lader._erkenne_csv_format(pfade[-1])
+                if nummer == 1:
+                    daten_lader._erkenne_csv_format(pfade[0]) # datei0 erneut verwenden: datei1 wird verdrängt
+            self.assertEqual([schluessel[0] for schluessel in DatenLader._csv_format_cache], [os.path.abspath(pfade[0]), os.path.abspath(pfade[2])])
+
+
+class TestKomprimierteEingaben(unittest.TestCase):
+    """
+    Unit-Test Klasse für komprimierte CSV/TXT-Eingaben (.gz, .zip).
+    """
 
+    def test_gzip_und_zip_wie_unkomprimiert(self):
+        """
+        Testet, dass .csv.gz und .zip dieselben Daten liefern wie die unkomprimierte Datei (auch blockweise)
+        und dass Pfadprüfung und Formatprüfung unverändert greifen.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis, tempfile.TemporaryDirectory() as fremdes_verzeichnis:
+            inhalt = "Name;Alter\nJürgen;40\nAnna;30\n".encode('cp1252')
+            gz_pfad, zip_pfad = os.path.join(verzeichnis, 'liste.csv.gz'), os.path.join(verzeichnis, 'liste.zip')
+            with gzip.open(gz_pfad, 'wb') as gz_datei:
+                gz_datei.write(inhalt)
+            with zipfile.ZipFile(zip_pfad, 'w') as archiv:
+                archiv.writestr('export/liste.csv', inhalt)
+            daten_lader = DatenLader(verzeichnis)
+            for pfad in (gz_pfad, zip_pfad):
+                for abbruch_token in (None, VergleichsAbbruchToken()):
+                    daten_frame, _ = daten_lader.lade_daten(pfad, abbruch_token)
+                    self.assertEqual(list(daten_frame['Name']), ['Jürgen', 'Anna'])
+
+            fremder_pfad = os.path.join(fremdes_verzeichnis, 'liste.csv.gz')
+            with gzip.open(fremder_pfad, 'wb') as gz_datei:
+                gz_datei.write(inhalt)
+            with self.assertRaises(CipherCoreDateiFehler): # Pfadsicherheit gilt auch für komprimierte Dateien
+                daten_lader.lade_daten(fremder_pfad)
+            with zipfile.ZipFile(zip_pfad, 'a') as archiv:
+                archiv.writestr('zweite.csv', inhalt)
+            with self.assertRaises(CipherCoreDateiLadeFehler): # Mehrdeutiges Archiv
+                daten_lader.lade_daten(zip_pfad)
+
+
+@unittest.skipIf(pa is None, "pyarrow ist nicht installiert")
+class TestArrowCsvLeser(unittest.TestCase):
+    """
+    Unit-Test Klasse für den pyarrow-basierten CSV-Leser und den Arrow-Vergleich.
+    """
 
-    def _update_verlauf_text_widget(self, text: str) -> None:
+    def test_arrow_und_pandas_liefern_gleiche_metriken(self):
+        """
+        Testet, dass Arrow-Spalten dieselben Metriken liefern wie der pandas-Parser
+        und dass bei ungültigem UTF-8 auf den pandas-Parser zurückgefallen wird.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfad1, pfad2 = SynthetischerDatensatzGenerator(zufalls_seed=3).erzeuge_paar(verzeichnis, 2000, DATEIFORMAT_CSV, 0.4, 0.1)
+            daten_lader = DatenLader(verzeichnis)
+            arrow_frame1, arrow_frame2 = daten_lader._datei_laden(pfad1), daten_lader._datei_laden(pfad2)
+            self.assertIsInstance(arrow_frame1['Name'].dtype, pd.ArrowDtype)
+            arrow_ergebnisse = DateiVergleicher().vergleiche_daten(arrow_frame1, arrow_frame2)
+            pandas_ergebnisse = DateiVergleicher().vergleiche_daten(pd.read_csv(pfad1), pd.read_csv(pfad2))
+            self.assertEqual(arrow_ergebnisse, pandas_ergebnisse)
+
+            latin1_pfad = os.path.join(verzeichnis, 'latin1.csv')
+            with open(latin1_pfad, 'wb') as latin1_datei:
+                latin1_datei.write("Name,Alter\nJürgen,40\n".encode('latin-1'))
+            self.assertEqual(list(daten_lader._csv_arrow_laden(latin1_pfad)['Name']), ['Jürgen']) # Rückfall ohne pandas-Parser
+
+
+    def test_leere_werte_und_bloecke_wie_pandas(self):
         """
-        Hilfsfunktion zum thread-sicheren Aktualisieren des Verlauf-Text-Widgets.
+        Testet, dass pyarrow leere Felder und Null-Texte wie pd.read_csv als leer liest, über mehrere Blöcke
+        dieselben Metriken liefert, jeden Block validiert und zwischen den Blöcken abbricht.
         """
-        self.verlauf_text.config(state='normal') # Textfeld editierbar machen
-        self.verlauf_text.delete('1.0', tk.END) # Textfeld leeren
-        self.verlauf_text.insert(tk.END, text) # Neuen Text einfügen
-        self.verlauf_text.config(state='disabled') # Textfeld wieder schreibgeschützt machen
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfad1, pfad2 = os.path.join(verzeichnis, 'a.csv'), os.path.join(verzeichnis, 'b.csv')
+            with open(pfad1, 'w', encoding='utf-8') as datei:
+                datei.write('Name,Alter\n' + ''.join(f'{wert},{alter}\n' for wert, alter in
+                                                     [('Anna', 30), ('', 31), ('NA', 32), ('""', 33), ('Bert', ''), ('null', 35)] * 200))
+            with open(pfad2, 'w', encoding='utf-8') as datei:
+                datei.write('Name,Alter\nAnna,40\n,41\nCarl,42\n')
+            daten_lader = DatenLader(verzeichnis)
+            with unittest.mock.patch.dict(globals(), {'ARROW_CSV_BLOCK_BYTES': 1024}):
+                arrow_frame = daten_lader._csv_arrow_laden(pfad1)
+                validierer = DatenValidierer({"spalten": {"Name": {"erforderlich": True}}}, 'a.csv')
+                with unittest.mock.patch.object(validierer, 'pruefe_block', wraps=validierer.pruefe_block) as pruefe_block:
+                    daten_lader._csv_arrow_laden(pfad1, validierer=validierer)
+                self.assertGreater(pruefe_block.call_count, 1)
+                abbruch_token = VergleichsAbbruchToken()
+                def _abbrechen(block):
+                    abbruch_token.abbrechen()
+                with unittest.mock.patch.object(validierer, 'pruefe_block', side_effect=_abbrechen):
+                    with self.assertRaises(CipherCoreAbbruchFehler):
+                        daten_lader._csv_arrow_laden(pfad1, abbruch_token, validierer=validierer)
+            pandas_frame = pd.read_csv(pfad1)
+            self.assertEqual(arrow_frame['Name'].isna().tolist(), pandas_frame['Name'].isna().tolist())
+            self.assertEqual(DateiVergleicher().vergleiche_daten(arrow_frame, daten_lader._csv_arrow_laden(pfad2)),
+                             DateiVergleicher().vergleiche_daten(pandas_frame, pd.read_csv(pfad2)))
+
+
+    def test_typwechsel_nach_dem_ersten_block(self):
+        """
+        Testet, dass ein Wert nach dem ersten Block, der nicht zum abgeleiteten Spaltentyp passt ('X123' nach
+        Ganzzahlen), beim blockweisen Lesen mit dem pandas-Parser weitergelesen wird, ohne Zeilen doppelt oder gar
+        nicht auszugeben, und die blockweisen Verfahren dieselben Kennzahlen wie der Standardvergleich liefern.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfad1, pfad2 = os.path.join(verzeichnis, 'a.csv'), os.path.join(verzeichnis, 'b.csv')
+            namen = [str(i) for i in range(3000)] + ['X123', '7']
+            pd.DataFrame({'Name': namen, 'Alter': 40}).to_csv(pfad1, index=False)
+            pd.DataFrame({'Name': ['5', 'X123', 'abc'], 'Alter': 50}).to_csv(pfad2, index=False)
+            daten_lader = DatenLader(verzeichnis)
+            with unittest.mock.patch.dict(globals(), {'ARROW_CSV_BLOCK_BYTES': 1024}):
+                bloecke = list(daten_lader.lade_bloecke(pfad1, block_groesse=700))
+                self.assertGreater(len(bloecke), 2)
+                self.assertEqual(pd.concat([kanonische_schluessel(block['Name']) for block in bloecke]).tolist(), namen)
+                erwartet = DateiVergleicher().vergleiche_daten(daten_lader.lade_daten(pfad1)[0], daten_lader.lade_daten(pfad2)[0])
+                self.assertEqual(erwartet.gleiche_werte, 2)
+                ergebnisse = {
+                    VERFAHREN_SORTIERT: ExternerSortierVergleicher(arbeits_verzeichnis=verzeichnis).vergleiche_dateien(pfad1, pfad2, daten_lader)[0],
+                    VERFAHREN_SQL: SqlVergleicher(SQL_ENGINE_SQLITE, arbeits_verzeichnis=verzeichnis).vergleiche_dateien(pfad1, pfad2, daten_lader)[0]}
+                for verfahren, ergebnis in ergebnisse.items():
+                    with self.subTest(verfahren=verfahren):
+                        self.assertEqual(ergebnis.formatiert(), erwartet.formatiert())
+                approximativ, _, _ = DateiVergleicher().vergleiche_dateien_approximativ(pfad1, pfad2, daten_lader, verzeichnis)
+                self.assertEqual(round(approximativ.gleiche_werte_schaetzung), erwartet.gleiche_werte)
+
+
+class TestExcelLeser(unittest.TestCase):
+    """
+    Unit-Test Klasse für das Streamen von .xlsx-Dateien und den Excel-Cache.
+    """
 
+    def test_streaming_entspricht_read_excel(self):
+        """
+        Testet, dass das read-only Streaming mit Blatt- und Spaltenauswahl dieselben Daten liefert wie pd.read_excel
+        (inklusive leerer Zwischenzeilen) und dass ein zweiter Ladevorgang aus dem Cache bedient wird.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            datei_pfad = os.path.join(verzeichnis, 'liste.xlsx')
+            with pd.ExcelWriter(datei_pfad) as schreiber:
+                pd.DataFrame({'X': [1]}).to_excel(schreiber, sheet_name='Deckblatt', index=False)
+                pd.DataFrame({'Name': ['Anna', None, 'Carl'], 'Alter': [30, None, 50], 'Stadt': ['A', None, 'C']}).to_excel(
+                    schreiber, sheet_name='Daten', index=False)
+            erwartet = pd.read_excel(datei_pfad, sheet_name='Daten', usecols=['Name', 'Alter'])
+            daten_lader = DatenLader(verzeichnis, excel_cache_verzeichnis=os.path.join(verzeichnis, 'cache'))
+            gestreamt = daten_lader._xlsx_blockweise_laden(datei_pfad, spalten=['Name', 'Alter'], blatt_name='Daten')
+            pd.testing.assert_frame_equal(gestreamt, erwartet, check_dtype=False)
+            with self.assertRaises(ValueError):
+                daten_lader._xlsx_blockweise_laden(datei_pfad, blatt_name='Fehlt')
+            if pa is not None:
+                daten_lader.lade_daten(datei_pfad, spalten=['Name'], blatt_name='Daten')
+                self.assertEqual(len(os.listdir(os.path.join(verzeichnis, 'cache'))), 1)
+                aus_cache, _ = daten_lader.lade_daten(datei_pfad, spalten=['Name'], blatt_name='Daten')
+                self.assertIsInstance(aus_cache['Name'].dtype, pd.ArrowDtype)
+                self.assertEqual(list(aus_cache.columns), ['Name', 'Alter']) # Schemaspalten werden mitgelesen
+
+    @unittest.skipIf(pa is None, "pyarrow ist nicht installiert")
+    def test_excel_cache_wird_aufgeraeumt(self):
+        """
+        Testet, dass eine geänderte Excel-Datei ihre veraltete Kopie ersetzt und der Cache bei Überschreiten der
+        Maximalgröße die am längsten nicht genutzte Kopie entfernt.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            datei_pfad = os.path.join(verzeichnis, 'liste.xlsx')
+            pd.DataFrame({'Name': ['Anna', 'Bob'], 'Alter': [30, 40]}).to_excel(datei_pfad, index=False)
+            cache_verzeichnis = os.path.join(verzeichnis, 'cache')
+            daten_lader = DatenLader(verzeichnis, excel_cache_verzeichnis=cache_verzeichnis)
+            daten_lader.lade_daten(datei_pfad)
+            alte_kopie = os.listdir(cache_verzeichnis)
+            datei_status = os.stat(datei_pfad)
+            os.utime(datei_pfad, ns=(datei_status.st_atime_ns, datei_status.st_mtime_ns + 1_000_000_000)) # Neuer Stand, gleiche Größe
+            daten_lader.lade_daten(datei_pfad)
+            neue_kopie = os.listdir(cache_verzeichnis)
+            self.assertEqual(len(neue_kopie), 1)
+            self.assertNotEqual(neue_kopie, alte_kopie)
+
+            daten_lader.excel_cache_max_bytes = os.path.getsize(os.path.join(cache_verzeichnis, neue_kopie[0])) + 1
+            daten_lader.lade_daten(datei_pfad, spalten=['Name']) # Zweite Spaltenauswahl verdrängt die ältere Kopie
+            self.assertEqual(len(os.listdir(cache_verzeichnis)), 1)
+            self.assertNotEqual(os.listdir(cache_verzeichnis), neue_kopie)
+
+
+@unittest.skipIf(pa is None, "pyarrow ist nicht installiert")
+class TestSpaltenFormate(unittest.TestCase):
+    """
+    Unit-Test Klasse für Parquet-, Feather- und Arrow-IPC-Eingaben.
+    """
 
-    def _zeige_verlauf_fehler(self, fehlermeldung: str) -> None:
+    def test_projektion_und_validierung(self):
         """
-        Zeigt eine Fehlermeldung im Verlauf-Textfeld und als MessageBox an.
+        Testet, dass nur die angeforderten Spalten gelesen werden, blockweises und vollständiges Lesen
+        übereinstimmen und die Validierung (negatives Alter) wie bei CSV greift.
         """
-        self.verlauf_text.config(state='normal') # Textfeld editierbar machen
-        self.verlauf_text.delete('1.0', tk.END) # Textfeld leeren
-        self.verlauf_text.insert(tk.END, "Fehler beim Laden des Verlaufs. Siehe Fehlermeldung und Logdatei.") # Kurze Fehlermeldung im Textfeld
-        self.verlauf_text.config(state='disabled') # Textfeld wieder schreibgeschützt machen
-        messagebox.showerror("Fehler beim Verlauf", fehlermeldung) # Fehlermeldung als MessageBox
-        self.update_status_meldung_ui("Fehler beim Laden des Vergleichsverlaufs.") # Statusmeldung aktualisieren
+        tabelle = pa.table({'Name': ['Anna', 'Bob', 'Carl'], 'Alter': [30, 40, 50], 'Stadt': ['A', 'B', 'C']})
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfade = [os.path.join(verzeichnis, 'liste' + endung) for endung in SPALTEN_DATEIFORMATE]
+            pa_parquet.write_table(tabelle, pfade[0], row_group_size=2)
+            pa_feather.write_feather(tabelle, pfade[1], chunksize=2)
+            with pa.OSFile(pfade[2], 'wb') as ziel, pa.ipc.new_stream(ziel, tabelle.schema) as schreiber:
+                schreiber.write_table(tabelle, max_chunksize=2)
+            daten_lader = DatenLader(verzeichnis)
+            for pfad in pfade:
+                for abbruch_token in (None, VergleichsAbbruchToken()):
+                    daten_frame, _ = daten_lader.lade_daten(pfad, abbruch_token, spalten=['Name'])
+                    self.assertEqual(list(daten_frame.columns), ['Name', 'Alter']) # Schemaspalte Alter wird mitgelesen
+                    self.assertEqual(daten_frame['Alter'].tolist(), [30, 40, 50])
+
+            ungueltig_pfad = os.path.join(verzeichnis, 'ungueltig.parquet')
+            pa_parquet.write_table(pa.table({'Name': ['Anna'], 'Alter': [-1]}), ungueltig_pfad)
+            with self.assertRaises(CipherCoreDatenValidierungsFehler):
+                daten_lader.lade_daten(ungueltig_pfad)
+
+
+class TestInkrementellerVergleich(unittest.TestCase):
+    """
+    Unit-Test Klasse für den inkrementellen Vergleich mit gespeichertem Vergleichszustand.
+    """
 
+    def test_angehaengte_zeilen_und_aenderung(self):
+        """
+        Testet, dass nach einem Anhang nur das Delta gelesen wird, die Ergebnisse einem vollständigen Vergleich
+        entsprechen und eine Änderung am Dateianfang zum vollständigen Neuaufbau führt.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfad1, pfad2 = os.path.join(verzeichnis, 'eingabe.csv'), os.path.join(verzeichnis, 'liste.csv')
+            pd.DataFrame({'Name': ['Anna', 'Bob'], 'Alter': [30, 40]}).to_csv(pfad1, index=False)
+            pd.DataFrame({'Name': ['Anna', 'Carl', 'Dora'], 'Alter': [30, 50, 60]}).to_csv(pfad2, index=False)
+            daten_lader = DatenLader(verzeichnis)
+            vergleicher = DateiVergleicher()
+            zustands_verzeichnis = os.path.join(verzeichnis, ZUSTANDS_VERZEICHNIS_NAME)
+
+            def _vollstaendig() -> Dict[str, str]:
+                return vergleicher.vergleiche_daten(daten_lader.lade_daten(pfad1)[0], daten_lader.lade_daten(pfad2)[0]).formatiert()
+
+            ergebnisse, _, _ = vergleicher.vergleiche_dateien_inkrementell(pfad1, pfad2, daten_lader, zustands_verzeichnis)
+            self.assertEqual(ergebnisse.formatiert(), _vollstaendig())
+
+            with open(pfad1, 'a', encoding='utf-8') as datei:
+                datei.write('Carl,70\nEva,20\n')
+            with unittest.mock.patch.object(DatenLader, 'lade_daten', side_effect=AssertionError("vollständiges Laden")):
+                ergebnisse, _, _ = vergleicher.vergleiche_dateien_inkrementell(pfad1, pfad2, daten_lader, zustands_verzeichnis)
+            self.assertEqual(ergebnisse.gleiche_werte, 2)
+            self.assertEqual(ergebnisse.formatiert(), _vollstaendig())
+
+            with open(pfad1, 'a', encoding='utf-8') as datei:
+                datei.write('Fritz,-5\n') # Ungültiges Alter im Delta wird validiert
+            with self.assertRaises(CipherCoreDatenValidierungsFehler):
+                vergleicher.vergleiche_dateien_inkrementell(pfad1, pfad2, daten_lader, zustands_verzeichnis)
+
+            pd.DataFrame({'Name': ['Dora'], 'Alter': [33]}).to_csv(pfad1, index=False)
+            ergebnisse, _, _ = vergleicher.vergleiche_dateien_inkrementell(pfad1, pfad2, daten_lader, zustands_verzeichnis)
+            self.assertEqual(ergebnisse.formatiert(), _vollstaendig())
+
+
+    def test_angehaengte_zeilen_in_cp1252(self):
+        """
+        Testet, dass an eine UTF-8-Datei angehängte cp1252-Zeilen ab dem ersten ungültigen Byte als cp1252 gelesen
+        werden, statt den inkrementellen Vergleich mit einem Ladefehler abzubrechen.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfad1, pfad2 = os.path.join(verzeichnis, 'eingabe.csv'), os.path.join(verzeichnis, 'liste.csv')
+            pd.DataFrame({'Name': ['Jürgen', 'Bob'], 'Alter': [30, 40]}).to_csv(pfad1, index=False, encoding='utf-8')
+            pd.DataFrame({'Name': ['Jürgen', 'Müller'], 'Alter': [30, 50]}).to_csv(pfad2, index=False, encoding='utf-8')
+            daten_lader = DatenLader(verzeichnis)
+            vergleicher = DateiVergleicher()
+            zustands_verzeichnis = os.path.join(verzeichnis, ZUSTANDS_VERZEICHNIS_NAME)
+            ergebnisse, _, _ = vergleicher.vergleiche_dateien_inkrementell(pfad1, pfad2, daten_lader, zustands_verzeichnis)
+            self.assertEqual(ergebnisse.gleiche_werte, 1)
+            with open(pfad1, 'ab') as datei:
+                datei.write('Müller,55\n'.encode('cp1252'))
+            with unittest.mock.patch.object(DatenLader, 'lade_daten', side_effect=AssertionError("vollständiges Laden")):
+                ergebnisse, _, _ = vergleicher.vergleiche_dateien_inkrementell(pfad1, pfad2, daten_lader, zustands_verzeichnis)
+            self.assertEqual((ergebnisse.anzahl_datei1, ergebnisse.gleiche_werte), (3, 2))
+
+
+class TestShardVergleicher(unittest.TestCase):
+    """
+    Unit-Test Klasse für den partitionierten Vergleich in mehreren Prozessen.
+    """
 
-    def _lade_verlauf_beim_start(self) -> None:
+    def test_partitioniert_wie_vollstaendig(self):
         """
-        Lädt und zeigt den Vergleichsverlauf beim Start der Anwendung.
+        Testet, dass der partitionierte Vergleich (auch für komprimierte Eingaben) dieselben Ergebnisse wie
+        vergleiche_daten liefert und eine fehlende Vergleichsspalte gemeldet wird.
         """
-        self.zeige_verlauf() # Verlauf laden und anzeigen
+        zufall = np.random.default_rng(7)
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfad1, pfad2 = os.path.join(verzeichnis, 'eingabe.csv'), os.path.join(verzeichnis, 'liste.csv.gz')
+            pd.DataFrame({'Name': [f'N{i}' for i in zufall.integers(0, 500, 1200)],
+                          'Alter': zufall.integers(18, 90, 1200)}).to_csv(pfad1, index=False)
+            pd.DataFrame({'Name': [f'N{i}' for i in zufall.integers(300, 900, 800)],
+                          'Alter': zufall.integers(18, 90, 800)}).to_csv(pfad2, index=False, compression='gzip')
+            daten_lader = DatenLader(verzeichnis)
+            erwartet = DateiVergleicher().vergleiche_daten(daten_lader.lade_daten(pfad1)[0], daten_lader.lade_daten(pfad2)[0])
+            shard_vergleicher = ShardVergleicher(4, arbeits_verzeichnis=verzeichnis, max_prozesse=2)
+            ergebnisse, _, _ = shard_vergleicher.vergleiche_dateien(pfad1, pfad2, daten_lader)
+            self.assertEqual(ergebnisse.formatiert(), erwartet.formatiert())
+            with self.assertRaises(CipherCoreDatenValidierungsFehler):
+                shard_vergleicher.vergleiche_dateien(pfad1, pfad2, daten_lader, spalte_datei1='Stadt')
+        with self.assertRaises(ValueError):
+            ShardVergleicher(1)
+
+
+    def test_grenze_offener_dateien(self):
+        """
+        Testet, dass Partitionen oberhalb der Grenze offener Dateien je Block geöffnet werden und dieselben Dateien
+        entstehen, und dass Schreibfehler als CipherCoreDateiSpeicherFehler gemeldet werden.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfad = os.path.join(verzeichnis, 'eingabe.csv')
+            pd.DataFrame({'Name': [f'N{i}' for i in range(2000)], 'Alter': 40}).to_csv(pfad, index=False)
+            daten_lader = DatenLader(verzeichnis)
+            shard_vergleicher = ShardVergleicher(50)
+            shard_vergleicher.partitioniere(pfad, 'Name', os.path.join(verzeichnis, 'offen'), daten_lader)
+            with unittest.mock.patch.dict(globals(), {'_max_offene_dateien': lambda: SHARD_DATEI_RESERVE + 10}):
+                shard_vergleicher.partitioniere(pfad, 'Name', os.path.join(verzeichnis, 'begrenzt'), daten_lader)
+            for nummer in range(50):
+                for endung in ('schluessel', 'alter'):
+                    self.assertTrue(filecmp.cmp(os.path.join(verzeichnis, f'offen_{nummer}.{endung}'),
+                                                os.path.join(verzeichnis, f'begrenzt_{nummer}.{endung}'), shallow=False))
+            with self.assertRaises(CipherCoreDateiSpeicherFehler):
+                shard_vergleicher.partitioniere(pfad, 'Name', os.path.join(verzeichnis, 'fehlt', 'datei1'), daten_lader)
+
+
+    def test_typwechsel_nach_dem_ersten_block(self):
+        """
+        Testet, dass eine CSV-Datei, deren Vergleichsspalte nach dem ersten Block Text statt Zahlen enthält, partitioniert
+        verglichen wird und dieselben Ergebnisse wie vergleiche_daten liefert.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfad1, pfad2 = os.path.join(verzeichnis, 'eingabe.csv'), os.path.join(verzeichnis, 'liste.csv')
+            pd.DataFrame({'Name': [str(i) for i in range(3000)] + ['X123', '42'], 'Alter': 40}).to_csv(pfad1, index=False)
+            pd.DataFrame({'Name': ['X123', '42', '2999', 'Y'], 'Alter': 50}).to_csv(pfad2, index=False)
+            daten_lader = DatenLader(verzeichnis)
+            erwartet = DateiVergleicher().vergleiche_daten(daten_lader.lade_daten(pfad1)[0], daten_lader.lade_daten(pfad2)[0])
+            self.assertEqual(erwartet.gleiche_werte, 3)
+            with unittest.mock.patch.dict(globals(), {'ARROW_CSV_BLOCK_BYTES': 1024}):
+                ergebnisse, _, _ = ShardVergleicher(2, arbeits_verzeichnis=verzeichnis, max_prozesse=1).vergleiche_dateien(pfad1, pfad2, daten_lader)
+            self.assertEqual(ergebnisse.formatiert(), erwartet.formatiert())
+
+
+class TestExternerSortierVergleicher(unittest.TestCase):
+    """
+    Unit-Test Klasse für den Vergleich mit externem Sortieren und Mischen.
+    """
 
+    def test_sortiert_wie_vollstaendig(self):
+        """
+        Testet, dass viele kleine Läufe (mit mehrstufigem Mischen) dieselben Ergebnisse und Duplikatzahlen wie
+        vergleiche_daten liefern, auch mit leeren Schlüsseln und teilweise sortierter Eingabe.
+        """
+        zufall = np.random.default_rng(11)
+        namen1 = [f'N{i}' for i in zufall.integers(0, 500, 1200)]
+        namen1[::97] = [None] * len(namen1[::97])
+        namen2 = sorted(f'N{i}' for i in zufall.integers(300, 900, 400)) + [f'N{i}' for i in zufall.integers(300, 900, 400)]
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfad1, pfad2 = os.path.join(verzeichnis, 'eingabe.csv'), os.path.join(verzeichnis, 'liste.csv')
+            pd.DataFrame({'Name': namen1, 'Alter': zufall.integers(18, 90, 1200)}).to_csv(pfad1, index=False)
+            pd.DataFrame({'Name': namen2, 'Alter': zufall.integers(18, 90, 800)}).to_csv(pfad2, index=False)
+            daten_lader = DatenLader(verzeichnis)
+            erwartet = DateiVergleicher().vergleiche_daten(daten_lader.lade_daten(pfad1)[0], daten_lader.lade_daten(pfad2)[0])
+            erwartet.duplikate_datei1.haeufigste = erwartet.duplikate_datei2.haeufigste = []
+            lade_bloecke = daten_lader.lade_bloecke
+            def _kleine_bloecke(*args, **kwargs):
+                for block in lade_bloecke(*args, **kwargs):
+                    yield from (block.iloc[start:start + 50] for start in range(0, len(block), 50))
+            with unittest.mock.patch.object(daten_lader, 'lade_bloecke', side_effect=_kleine_bloecke):
+                sortier_vergleicher = ExternerSortierVergleicher(speicher_mb=0.005, arbeits_verzeichnis=verzeichnis, max_laeufe=3)
+                ergebnisse, _, _ = sortier_vergleicher.vergleiche_dateien(pfad1, pfad2, daten_lader)
+            self.assertEqual(ergebnisse.formatiert(), erwartet.formatiert())
+            self.assertEqual((ergebnisse.duplikate_datei1, ergebnisse.duplikate_datei2), (erwartet.duplikate_datei1, erwartet.duplikate_datei2))
+            self.assertEqual((ergebnisse.verfahren, ergebnisse.abkuerzung), (VERFAHREN_SORTIERT, None))
+            self.assertEqual(sorted(os.listdir(verzeichnis)), ['eingabe.csv', 'liste.csv']) # Sortierläufe entfernt
+            with self.assertRaises(CipherCoreDatenValidierungsFehler):
+                sortier_vergleicher.vergleiche_dateien(pfad1, pfad2, daten_lader, spalte_datei1='Stadt')
+        with self.assertRaises(ValueError):
+            ExternerSortierVergleicher(speicher_mb=0)
+
+
+    def test_vorsortierte_eingaben(self):
+        """
+        Testet, dass nach dem Schlüssel sortierte Eingaben ohne Sortierlauf verglichen werden.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfad1, pfad2 = os.path.join(verzeichnis, 'a.csv'), os.path.join(verzeichnis, 'b.csv')
+            pd.DataFrame({'Name': ['Anna', 'Anna', 'Bert', 'Carl', 'Dora'], 'Alter': [30, 31, 40, 50, 60]}).to_csv(pfad1, index=False)
+            pd.DataFrame({'Name': ['Bert', 'Dora', 'Emil'], 'Alter': [41, 61, 70]}).to_csv(pfad2, index=False)
+            with unittest.mock.patch.object(ExternerSortierVergleicher, '_schreibe_sortierten_lauf', side_effect=AssertionError("Sortierlauf")):
+                ergebnisse, _, _ = ExternerSortierVergleicher().vergleiche_dateien(pfad1, pfad2, DatenLader(verzeichnis))
+            self.assertEqual(ergebnisse.abkuerzung, ABKUERZUNG_VORSORTIERT)
+            self.assertEqual({metrik: ergebnisse.metriken()[metrik] for metrik in (METRIK_GLEICHE_NAMEN, METRIK_NUR_DATEI1, METRIK_NUR_DATEI2,
+                                                                                    METRIK_DOPPELTE_WERTE_DATEI1)},
+                             {METRIK_GLEICHE_NAMEN: 2, METRIK_NUR_DATEI1: 2, METRIK_NUR_DATEI2: 1, METRIK_DOPPELTE_WERTE_DATEI1: 1})
+
+
+    def test_gemischte_datentypen(self):
+        """
+        Testet, dass Gleitkomma- und Ganzzahlschlüssel (1.0 gegenüber 1) mit leeren Werten dieselben Kennzahlen wie
+        vergleiche_daten ergeben.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfad1, pfad2 = os.path.join(verzeichnis, 'a.parquet'), os.path.join(verzeichnis, 'b.parquet')
+            pd.DataFrame({'Name': [1.0, 2.0, np.nan, 4.0, 5.5, 2.0], 'Alter': [30, 31, 32, 33, 34, 35]}).to_parquet(pfad1, index=False)
+            pd.DataFrame({'Name': [1, 2, 3, 4, 6], 'Alter': [40, 41, 42, 43, 44]}).to_parquet(pfad2, index=False)
+            daten_lader = DatenLader(verzeichnis)
+            erwartet = DateiVergleicher().vergleiche_daten(daten_lader.lade_daten(pfad1)[0], daten_lader.lade_daten(pfad2)[0])
+            ergebnisse, _, _ = ExternerSortierVergleicher(arbeits_verzeichnis=verzeichnis).vergleiche_dateien(pfad1, pfad2, daten_lader)
+            self.assertEqual(erwartet.metriken()[METRIK_GLEICHE_NAMEN], 3)
+            self.assertEqual(ergebnisse.formatiert(), erwartet.formatiert())
+        self.assertEqual(kanonische_schluessel(pd.Series([1.0, 2.5, np.nan])).tolist(), ['1', '2.5', pd.NA])
+
+
+class TestSqlVergleicher(unittest.TestCase):
+    """
+    Unit-Test Klasse für den Vergleich in einer eingebetteten Datenbank.
+    """
 
-    def _speichere_konfiguration(self) -> None:
+    def test_wie_vollstaendig(self):
         """
-        Speichert die aktuelle Konfiguration in die config.json-Datei.
-        Sichere Dateiverarbeitung mit try-except-Block zur Fehlerbehandlung.
+        Testet, dass jede installierte Engine dieselben Ergebnisse, häufigsten Duplikate und dieselbe Duplikatdatei wie
+        vergleiche_daten liefert und die Differenz genau die Werte nur einer Datei enthält.
         """
-        try:
-            with open(CONFIG_DATEI, 'w', encoding='utf-8') as konfig_datei: # Sichere Dateiverarbeitung mit 'with open' und Encoding
-                json.dump(konfiguration, konfig_datei, indent=4, ensure_ascii=False) # Konfiguration als JSON speichern, ensure_ascii=False für korrekte Zeichenkodierung
-            logger.info(f"Konfiguration in '{CONFIG_DATEI}' gespeichert.")
-        except Exception as e:
-            logger.error(f"Fehler beim Speichern der Konfiguration in '{CONFIG_DATEI}': {e}")
+        zufall = np.random.default_rng(5)
+        namen1 = [f'N{i}' for i in zufall.integers(0, 400, 900)]
+        namen1[::50] = [None] * len(namen1[::50])
+        namen2 = [f'N{i}' for i in zufall.integers(200, 700, 600)]
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfad1, pfad2 = os.path.join(verzeichnis, 'eingabe.csv'), os.path.join(verzeichnis, 'liste.csv')
+            pd.DataFrame({'Name': namen1, 'Alter': zufall.integers(18, 90, 900)}).to_csv(pfad1, index=False)
+            pd.DataFrame({'Name': namen2, 'Alter': zufall.integers(18, 90, 600)}).to_csv(pfad2, index=False)
+            daten_lader = DatenLader(verzeichnis)
+            erwartet = DateiVergleicher().vergleiche_daten(daten_lader.lade_daten(pfad1)[0], daten_lader.lade_daten(pfad2)[0],
+                                                           duplikat_pfad=os.path.join(verzeichnis, 'erwartet.csv'))
+            with open(os.path.join(verzeichnis, 'erwartet.csv'), encoding='utf-8') as datei:
+                erwartete_duplikate = datei.read()
+            for engine in [SQL_ENGINE_SQLITE] + ([SQL_ENGINE_DUCKDB] if duckdb is not None else []):
+                with self.subTest(engine=engine):
+                    diff_pfad, duplikat_pfad = os.path.join(verzeichnis, f'{engine}_diff.csv'), os.path.join(verzeichnis, f'{engine}_duplikate.csv')
+                    ergebnisse, _, _ = SqlVergleicher(engine, arbeits_verzeichnis=verzeichnis).vergleiche_dateien(
+                        pfad1, pfad2, daten_lader, diff_pfad=diff_pfad, duplikat_pfad=duplikat_pfad)
+                    self.assertEqual(ergebnisse.formatiert(), erwartet.formatiert())
+                    self.assertEqual((ergebnisse.duplikate_datei1, ergebnisse.duplikate_datei2), (erwartet.duplikate_datei1, erwartet.duplikate_datei2))
+                    self.assertEqual(ergebnisse.verfahren, VERFAHREN_SQL)
+                    with open(duplikat_pfad, encoding='utf-8') as datei:
+                        self.assertEqual(datei.read(), erwartete_duplikate)
+                    differenz = pd.read_csv(diff_pfad, keep_default_na=False)
+                    menge1, menge2 = {name or '' for name in namen1}, set(namen2)
+                    self.assertEqual(set(differenz.loc[differenz['datei'] == 1, 'wert']), menge1 - menge2)
+                    self.assertEqual(set(differenz.loc[differenz['datei'] == 2, 'wert']), menge2 - menge1)
+            self.assertFalse([name for name in os.listdir(verzeichnis) if name.startswith('ciphercore_sql_')]) # Datenbank entfernt
+        with self.assertRaises(ValueError):
+            SqlVergleicher('postgres')
+
+
+    def test_gemischte_datentypen_wie_andere_verfahren(self):
+        """
+        Testet, dass Gleitkomma- und Ganzzahlschlüssel mit leeren Werten in SQL, beim externen Sortieren und im
+        Standardvergleich dieselben Kennzahlen ergeben.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfad1, pfad2 = os.path.join(verzeichnis, 'a.parquet'), os.path.join(verzeichnis, 'b.parquet')
+            pd.DataFrame({'Name': [1.0, 2.0, np.nan, 4.0, 5.5, 2.0, np.nan], 'Alter': [30, 31, 32, 33, 34, 35, 36]}).to_parquet(pfad1, index=False)
+            pd.DataFrame({'Name': [1, 2, 3, 4, 6], 'Alter': [40, 41, 42, 43, 44]}).to_parquet(pfad2, index=False)
+            daten_lader = DatenLader(verzeichnis)
+            erwartet = DateiVergleicher().vergleiche_daten(daten_lader.lade_daten(pfad1)[0], daten_lader.lade_daten(pfad2)[0])
+            sortiert, _, _ = ExternerSortierVergleicher(arbeits_verzeichnis=verzeichnis).vergleiche_dateien(pfad1, pfad2, daten_lader)
+            sql, _, _ = SqlVergleicher(SQL_ENGINE_SQLITE, arbeits_verzeichnis=verzeichnis).vergleiche_dateien(pfad1, pfad2, daten_lader)
+            self.assertEqual(erwartet.metriken()[METRIK_GLEICHE_NAMEN], 3)
+            self.assertEqual(sql.formatiert(), erwartet.formatiert())
+            self.assertEqual(sql.formatiert(), sortiert.formatiert())
+            self.assertEqual([(haeufig["anzahl"], haeufig["zeilen"]) for haeufig in sql.duplikate_datei1.haeufigste],
+                             [(haeufig["anzahl"], haeufig["zeilen"]) for haeufig in erwartet.duplikate_datei1.haeufigste])
+
+
+    def test_ganzzahl_und_text_schluessel_in_allen_verfahren(self):
+        """
+        Testet, dass eine als Ganzzahl und eine als Text eingelesene Schlüsselspalte (1 gegenüber '1') in allen
+        Verfahren dieselben Übereinstimmungen ergeben.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfad1, pfad2 = os.path.join(verzeichnis, 'a.csv'), os.path.join(verzeichnis, 'b.csv')
+            pd.DataFrame({'Name': [1, 2, 2], 'Alter': [30, 31, 32]}).to_csv(pfad1, index=False)
+            pd.DataFrame({'Name': ['1', 'x'], 'Alter': [40, 41]}).to_csv(pfad2, index=False)
+            daten_lader = DatenLader(verzeichnis)
+            vergleicher = DateiVergleicher()
+            erwartet = vergleicher.vergleiche_daten(daten_lader.lade_daten(pfad1)[0], daten_lader.lade_daten(pfad2)[0])
+            self.assertEqual(erwartet.gleiche_werte, 1)
+            ergebnisse = {
+                VERFAHREN_SORTIERT: ExternerSortierVergleicher(arbeits_verzeichnis=verzeichnis).vergleiche_dateien(pfad1, pfad2, daten_lader)[0],
+                VERFAHREN_SQL: SqlVergleicher(SQL_ENGINE_SQLITE, arbeits_verzeichnis=verzeichnis).vergleiche_dateien(pfad1, pfad2, daten_lader)[0],
+                VERFAHREN_PARTITIONIERT: ShardVergleicher(2, arbeits_verzeichnis=verzeichnis, max_prozesse=1).vergleiche_dateien(pfad1, pfad2, daten_lader)[0],
+                VERFAHREN_INKREMENTELL: vergleicher.vergleiche_dateien_inkrementell(pfad1, pfad2, daten_lader, verzeichnis)[0]}
+            for verfahren, ergebnis in ergebnisse.items():
+                with self.subTest(verfahren=verfahren):
+                    self.assertEqual(ergebnis.formatiert(), erwartet.formatiert())
+            approximativ, _, _ = vergleicher.vergleiche_dateien_approximativ(pfad1, pfad2, daten_lader, verzeichnis)
+            self.assertEqual(round(approximativ.gleiche_werte_schaetzung), erwartet.gleiche_werte)
+
+
+    def test_abbruch_beim_abrufen(self):
+        """
+        Testet, dass ein Abbruch während des abschnittsweisen Abrufs für die Differenzdatei als Abbruch gemeldet wird.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfad1, pfad2 = os.path.join(verzeichnis, 'a.csv'), os.path.join(verzeichnis, 'b.csv')
+            pd.DataFrame({'Name': [f'A{i}' for i in range(3000)], 'Alter': 30}).to_csv(pfad1, index=False)
+            pd.DataFrame({'Name': [f'B{i}' for i in range(3000)], 'Alter': 40}).to_csv(pfad2, index=False)
+            abbruch_token = VergleichsAbbruchToken()
+            mit_abbruch = SqlVergleicher._mit_abbruch
+            def _abbrechen_beim_abruf(token, aufruf, *argumente):
+                if getattr(aufruf, '__name__', '') == 'fetchmany': # Wie ein über den Fortschritts-Handler unterbrochener Abruf
+                    def aufruf(*_):
+                        token.abbrechen()
+                        raise sqlite3.OperationalError("interrupted")
+                return mit_abbruch(token, aufruf, *argumente)
+            with unittest.mock.patch.object(SqlVergleicher, '_mit_abbruch', side_effect=_abbrechen_beim_abruf):
+                with self.assertRaises(CipherCoreAbbruchFehler):
+                    SqlVergleicher(SQL_ENGINE_SQLITE, arbeits_verzeichnis=verzeichnis).vergleiche_dateien(
+                        pfad1, pfad2, DatenLader(verzeichnis), abbruch_token=abbruch_token, diff_pfad=os.path.join(verzeichnis, 'diff.csv'))
+
+
+    @unittest.skipIf(duckdb is None, "duckdb ist nicht installiert")
+    def test_duckdb_wie_sqlite(self):
+        """
+        Testet, dass DuckDB dieselben Kennzahlen und häufigsten Duplikate wie SQLite liefert.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfad1, pfad2 = os.path.join(verzeichnis, 'a.csv'), os.path.join(verzeichnis, 'b.csv')
+            pd.DataFrame({'Name': ['Anna', 'Anna', None, 'Bert', None, '7'], 'Alter': [30, 31, 32, 33, 34, 35]}).to_csv(pfad1, index=False)
+            pd.DataFrame({'Name': ['Bert', 'Carl', None, '7'], 'Alter': [40, 41, 42, 43]}).to_csv(pfad2, index=False)
+            daten_lader = DatenLader(verzeichnis)
+            ergebnisse = [SqlVergleicher(engine, arbeits_verzeichnis=verzeichnis).vergleiche_dateien(pfad1, pfad2, daten_lader)[0]
+                          for engine in (SQL_ENGINE_SQLITE, SQL_ENGINE_DUCKDB)]
+            self.assertEqual(ergebnisse[0].formatiert(), ergebnisse[1].formatiert())
+            self.assertEqual(ergebnisse[0].duplikate_datei1, ergebnisse[1].duplikate_datei1)
+
+
+class TestVerfahrenswahl(unittest.TestCase):
+    """
+    Unit-Test Klasse für die Schätzung der Eingaben und die automatische Verfahrenswahl.
+    """
 
+    def test_schaetzung_aus_stichprobe(self):
+        """
+        Testet die Schätzung aus einer Stichprobe am Dateianfang (auch gzip-komprimiert) und aus vollständigen Dateien.
+        """
+        namen = [f'Person {i:05d}' for i in range(20_000)]
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfad = os.path.join(verzeichnis, 'eingabe.csv')
+            pd.DataFrame({'Name': namen, 'Alter': 40}).to_csv(pfad, index=False)
+            with open(pfad, 'rb') as quelle, gzip.open(pfad + '.gz', 'wb') as ziel:
+                shutil.copyfileobj(quelle, ziel)
+            daten_lader = DatenLader(verzeichnis)
+            vollstaendig = daten_lader.schaetze_eingabe(pfad)
+            self.assertEqual((vollstaendig.zeilen, vollstaendig.exakt), (20_000, True))
+            self.assertAlmostEqual(vollstaendig.schluessel_bytes, np.mean([len(name) for name in namen]))
+            with unittest.mock.patch.dict(globals(), {'SCHAETZ_PROBE_BYTES': 4096}):
+                for eingabe in (pfad, pfad + '.gz'):
+                    with self.subTest(eingabe=os.path.basename(eingabe)):
+                        schaetzung = daten_lader.schaetze_eingabe(eingabe)
+                        self.assertFalse(schaetzung.exakt)
+                        self.assertLess(abs(schaetzung.zeilen - 20_000), 2_000)
+            with self.assertRaises(CipherCoreDateiFehler):
+                DatenLader(os.path.join(verzeichnis, 'unter')).schaetze_eingabe(pfad)
+
+
+    def test_wahl_nach_budget(self):
+        """
+        Testet, dass der Standardvergleich nur innerhalb des Budgets gewählt wird und das externe Sortieren
+        ein Laufbudget unterhalb des Gesamtbudgets erhält.
+        """
+        schaetzungen = [EingabeSchaetzung('a.csv', 1_000_000, 30.0, 16.0), EingabeSchaetzung('b.csv', 1_000_000, 30.0, 16.0)]
+        bedarf_mb = sum(schaetzung.speicher_standard_mb() for schaetzung in schaetzungen)
+        self.assertEqual(waehle_vergleichsverfahren(schaetzungen, bedarf_mb + 1).verfahren, VERFAHREN_STANDARD)
+        wahl = waehle_vergleichsverfahren(schaetzungen, bedarf_mb - 1)
+        self.assertEqual(wahl.verfahren, VERFAHREN_SORTIERT)
+        self.assertLessEqual(wahl.sortier_speicher_mb, min(SORTIER_SPEICHER_MB, bedarf_mb / 2))
+        self.assertEqual(waehle_vergleichsverfahren(schaetzungen, 10).sortier_speicher_mb, 1.0) # Budget unter der Lesereserve
+        self.assertEqual(ermittle_speicher_budget(123), 123.0)
+        self.assertGreater(ermittle_speicher_budget(), 0)
+        sql_wahl = waehle_vergleichsverfahren(schaetzungen, bedarf_mb - 1, duplikat_datei=True) # Externes Sortieren schreibt keine Duplikatdatei
+        self.assertEqual((sql_wahl.verfahren, sql_wahl.sortier_speicher_mb), (VERFAHREN_SQL, wahl.sortier_speicher_mb))
+
+
+    def test_gewaehlte_verfahren_wie_standard_bei_gemischten_schluesseln(self):
+        """
+        Testet, dass die bei knappem Budget gewählten Verfahren (externes Sortieren, mit Duplikatdatei SQL) bei als Zahl
+        und als Text eingelesenen Schlüsseln dieselben Kennzahlen wie der Standardvergleich liefern und ohne
+        AUTOMATISCHER_VERFAHRENSWECHSEL der Standardvergleich verwendet wird.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfad1, pfad2 = os.path.join(verzeichnis, 'a.csv'), os.path.join(verzeichnis, 'b.csv')
+            pd.DataFrame({'Name': [1, 2, 2, 3, 4.5], 'Alter': [30, 31, 32, 33, 34]}).to_csv(pfad1, index=False)
+            pd.DataFrame({'Name': ['1', 'x', '3', '3', '4.5'], 'Alter': [40, 41, 42, 43, 44]}).to_csv(pfad2, index=False)
+            daten_lader = DatenLader(verzeichnis)
+            erwartet = DateiVergleicher().vergleiche_daten(daten_lader.lade_daten(pfad1)[0], daten_lader.lade_daten(pfad2)[0])
+            self.assertEqual(erwartet.gleiche_werte, 3)
+            schaetzungen = [daten_lader.schaetze_eingabe(pfad1), daten_lader.schaetze_eingabe(pfad2)]
+            for duplikat_datei in (False, True):
+                wahl = waehle_vergleichsverfahren(schaetzungen, 0.001, duplikat_datei)
+                with self.subTest(verfahren=wahl.verfahren):
+                    vergleicher = (SqlVergleicher(SQL_ENGINE_SQLITE, wahl.sortier_speicher_mb, verzeichnis) if wahl.verfahren == VERFAHREN_SQL
+                                   else ExternerSortierVergleicher(wahl.sortier_speicher_mb, verzeichnis))
+                    self.assertEqual(vergleicher.vergleiche_dateien(pfad1, pfad2, daten_lader)[0].formatiert(), erwartet.formatiert())
+            with unittest.mock.patch.dict(globals(), {'BASIS_VERZEICHNIS': verzeichnis}):
+                _, ergebnisse = dateien_vergleichen_und_bericht_erstellen(pfad1, pfad2, ausgabe_pfad=os.path.join(verzeichnis, 'bericht.pdf'),
+                                                                           lauf_cache=False, speicher_budget_mb=0.001)
+            self.assertEqual((ergebnisse.verfahren, ergebnisse.formatiert()), (VERFAHREN_STANDARD, erwartet.formatiert()))
+
+
+    def test_cgroup_grenze(self):
+        """
+        Testet, dass das Budget in einem Container höchstens der in der cgroup noch freie Speicher ist.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            grenze, verbrauch = os.path.join(verzeichnis, 'memory.max'), os.path.join(verzeichnis, 'memory.current')
+            with open(verbrauch, 'w', encoding='ascii') as datei:
+                datei.write(str(100 * 1024 * 1024))
+            with open(grenze, 'w', encoding='ascii') as datei:
+                datei.write(str(300 * 1024 * 1024))
+            with unittest.mock.patch.dict(globals(), {'CGROUP_SPEICHER_DATEIEN': ((grenze, verbrauch),), 'SPEICHER_BUDGET_MB': None}):
+                self.assertEqual(_cgroup_verfuegbar_mb(), 200.0)
+                self.assertLessEqual(ermittle_speicher_budget(), 200.0 * SPEICHER_BUDGET_ANTEIL)
+                with open(grenze, 'w', encoding='ascii') as datei:
+                    datei.write('max')
+                self.assertIsNone(_cgroup_verfuegbar_mb())
+
+
+    def test_schaetzung_excel(self):
+        """
+        Testet, dass Excel-Dateien aus der Bereichsangabe des Arbeitsblatts statt mit der Blattgrenze geschätzt werden.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfad = os.path.join(verzeichnis, 'eingabe.xlsx')
+            try:
+                pd.DataFrame({'Name': [f'N{i}' for i in range(500)], 'Alter': 40}).to_excel(pfad, index=False)
+            except ImportError:
+                self.skipTest("openpyxl ist nicht installiert")
+            schaetzung = DatenLader(verzeichnis).schaetze_eingabe(pfad)
+            self.assertEqual((schaetzung.zeilen, schaetzung.exakt), (500, True))
 
 
-# --- Unit-Tests (CipherCore Standard: Qualitätssicherung) ---
-import unittest
-import tempfile
+class TestMerkleDigest(unittest.TestCase):
+    """
+    Unit-Test Klasse für den Vergleich über Merkle-Digests zwischen zwei Standorten.
+    """
 
-class TestDataManager(unittest.TestCase):
+    def test_digest_vergleich_wie_vollstaendig(self):
+        """
+        Testet mit zwei getrennten Verzeichnissen, dass nur abweichende Buckets angefordert werden und der Vergleich
+        mit deren Bucket-Schlüsseln dieselben Ergebnisse wie vergleiche_daten liefert.
+        """
+        zufall = np.random.default_rng(11)
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            standorte = [os.path.join(verzeichnis, 'standort_a'), os.path.join(verzeichnis, 'standort_b')]
+            pfade = [os.path.join(standort, 'liste.csv') for standort in standorte]
+            namen = [f'N{i}' for i in range(3000)]
+            for standort, pfad, abweichend in zip(standorte, pfade, (['A1', 'A2'], ['B1', 'B2', 'B3'])):
+                os.makedirs(standort)
+                pd.DataFrame({'Name': namen[len(abweichend):] + abweichend + ['N7'], # Doppelte Werte zählen einmal
+                              'Alter': zufall.integers(18, 90, len(namen) + 1)}).to_csv(pfad, index=False)
+            daten_lader = DatenLader(verzeichnis)
+            erwartet = DateiVergleicher().vergleiche_daten(daten_lader.lade_daten(pfade[0])[0], daten_lader.lade_daten(pfade[1])[0])
+
+            geheimnis = 'gemeinsames-geheimnis-a-b'
+            erstellt = [MerkleDigest.aus_datei(pfad, daten_lader, geheimnis, anzahl_buckets=256) for pfad in pfade]
+            for pfad, (digest, _) in zip(pfade, erstellt):
+                digest.speichere(pfad + DIGEST_DATEI_ENDUNG)
+            digest1, digest2 = (MerkleDigest.lade(pfad + DIGEST_DATEI_ENDUNG) for pfad in pfade)
+            ergebnis, unterschiedliche = vergleiche_digests(digest1, digest2)
+            self.assertIsNone(ergebnis.gleiche_werte)
+            self.assertEqual(ergebnis.anzahl_datei1, erwartet.anzahl_datei1)
+            self.assertLessEqual(len(unterschiedliche), 8) # Höchstens die Buckets der 8 abweichenden Werte
+
+            schluessel = []
+            for pfad, (digest, hashes) in zip(pfade, erstellt):
+                MerkleDigest.speichere_bucket_schluessel(pfad + BUCKET_SCHLUESSEL_DATEI_ENDUNG, digest.wurzel,
+                                                         digest.bucket_schluessel(hashes, unterschiedliche))
+                schluessel.append(MerkleDigest.lade_bucket_schluessel(pfad + BUCKET_SCHLUESSEL_DATEI_ENDUNG))
+            ergebnis, _ = vergleiche_digests(digest1, digest2, schluessel[::-1])
+            self.assertEqual(ergebnis.formatiert(), erwartet.formatiert())
+            self.assertEqual(ergebnis.verfahren, VERFAHREN_DIGEST)
+
+            wurzel, bucket_hashes = schluessel[0]
+            bucket_hashes[unterschiedliche[0]] = bucket_hashes[unterschiedliche[0]][1:] # Manipulierter Export
+            with self.assertRaises(CipherCoreDatenValidierungsFehler):
+                vergleiche_digests(digest1, digest2, [(wurzel, bucket_hashes), schluessel[1]])
+            with self.assertRaises(CipherCoreDatenValidierungsFehler):
+                vergleiche_digests(digest1, MerkleDigest.aus_datei(pfade[1], daten_lader, geheimnis, anzahl_buckets=128)[0])
+
+            anderes, anderes_hashes = MerkleDigest.aus_datei(pfade[1], daten_lader, 'anderes-geheimnis-a-b', anzahl_buckets=256)
+            self.assertNotEqual(anderes.wurzel, digest2.wurzel) # Hashes hängen vom Geheimnis ab
+            self.assertEqual(len(np.intersect1d(anderes_hashes, erstellt[1][1])), 0)
+            with self.assertRaises(CipherCoreDatenValidierungsFehler):
+                vergleiche_digests(digest1, anderes)
+            with self.assertRaises(ValueError):
+                MerkleDigest.aus_datei(pfade[0], daten_lader, 'zu-kurz')
+        with self.assertRaises(ValueError):
+            MerkleDigest(1000)
+
+
+class TestMehrfachVergleich(unittest.TestCase):
     """
-    Unit-Test Klasse für die DataManager-Implementierungen (SQLite und File).
-    Stellt die korrekte Funktion der Datenpersistenz sicher.
-    Umfasst Tests für Speichern, Laden und Fehlerfälle.
+    Unit-Test Klasse für den N-Wege-Vergleich mit Zugehörigkeitsmasken.
     """
 
-    def setUp(self):
+    def test_mehrfach_wie_paarweise(self):
         """
-        Setzt die Testumgebung vor jedem Testfall auf.
-        Erstellt Test-Datenbank und temporäres Datenverzeichnis.
+        Testet, dass Überlappungsmatrix und Paarergebnisse den paarweisen Vergleichen entsprechen, die Schnittmengen
+        die Vereinigung zerlegen und Diagramm sowie Bericht erstellt werden.
         """
-        self.test_db_pfad_sqlite = 'test_ciphercore_datei_vergleich.db' # Test-Datenbankpfad für SQLite
-        self.daten_manager_sqlite = SQLiteDataManager(datenbank_pfad=self.test_db_pfad_sqlite) # SQLiteDataManager für Tests
+        zufall = np.random.default_rng(5)
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfade = [os.path.join(verzeichnis, f'region{nummer}.csv') for nummer in range(4)]
+            for nummer, pfad in enumerate(pfade):
+                pd.DataFrame({'Name': [f'N{i}' for i in zufall.integers(nummer * 100, 600 + nummer * 100, 500)],
+                              'Alter': zufall.integers(18, 90, 500)}).to_csv(pfad, index=False)
+            daten_lader = DatenLader(verzeichnis)
+            ergebnis = DateiVergleicher().vergleiche_mehrfach(pfade, daten_lader)
+            daten_frames = [daten_lader.lade_daten(pfad)[0] for pfad in pfade]
+            for nummer1, nummer2 in itertools.combinations(range(len(pfade)), 2):
+                erwartet = DateiVergleicher().vergleiche_daten(daten_frames[nummer1], daten_frames[nummer2])
+                self.assertEqual(ergebnis.paar_ergebnis(nummer1, nummer2).formatiert(), erwartet.formatiert())
+            vereinigung = set().union(*(set(daten_frame['Name']) for daten_frame in daten_frames))
+            self.assertEqual(ergebnis.eindeutige_werte, len(vereinigung))
+            self.assertEqual(sum(ergebnis.in_genau_k_dateien()), len(vereinigung))
+            in_allen = set.intersection(*(set(daten_frame['Name']) for daten_frame in daten_frames))
+            self.assertEqual(ergebnis.in_genau_k_dateien()[-1], len(in_allen))
+            self.assertEqual(ergebnis.schnittmengen.get(0b1111, 0), len(in_allen))
+
+            ausgabe_pfad = os.path.join(verzeichnis, 'berichte', 'mehrfach.pdf')
+            bild_daten = DiagrammGenerator().erstelle_upset_diagramm(ergebnis)
+            self.assertTrue(base64.b64decode(bild_daten).startswith(b'\x89PNG'))
+            self.assertEqual(BerichtsGenerator(None, ausgabe_pfad).erstelle_mehrfach_bericht(ergebnis, bild_daten), ausgabe_pfad)
+            self.assertTrue(os.path.exists(ausgabe_pfad))
+        with self.assertRaises(ValueError):
+            DateiVergleicher().vergleiche_mehrfach(pfade[:1], daten_lader)
+
+    def test_json_und_bericht_ohne_alterswerte(self):
+        """
+        Testet, dass ein Durchschnittsalter ohne Alterswerte (NaN) als null in gültigem JSON erscheint und der
+        Bericht den Copyright-Hinweis enthält.
+        """
+        ergebnis = MehrfachVergleichsErgebnis(dateinamen=['a.csv', 'b.csv'], anzahl_zeilen=[2, 1], ueberlappung=[[2, 1], [1, 1]],
+                                              schnittmengen={0b01: 1, 0b11: 1}, durchschnittsalter=[float('nan'), 40.0], doppelte_werte=[0, 0])
+        self.assertEqual(json.loads(json.dumps(ergebnis.als_dict(), allow_nan=False))["durchschnittsalter"], [None, 40.0])
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            ausgabe_pfad = os.path.join(verzeichnis, 'mehrfach.pdf')
+            with unittest.mock.patch.object(FPDF, 'cell', autospec=True, side_effect=FPDF.cell) as zelle:
+                BerichtsGenerator(None, ausgabe_pfad).erstelle_mehrfach_bericht(ergebnis, DiagrammGenerator().erstelle_upset_diagramm(ergebnis))
+            self.assertIn(f"{__copyright__} - {__license__}", [aufruf.args[3] for aufruf in zelle.call_args_list if len(aufruf.args) > 3])
 
-        self.temp_daten_verzeichnis = tempfile.TemporaryDirectory() # Temporäres Verzeichnis für FileDataManager
-        self.test_daten_verzeichnis_file = self.temp_daten_verzeichnis.name # Pfad zum temporären Verzeichnis
-        self.daten_manager_file = FileDataManager(daten_verzeichnis=self.test_daten_verzeichnis_file) # FileDataManager für Tests
 
+class TestDuplikatStatistik(unittest.TestCase):
+    """
+    Unit-Test Klasse für die Duplikatstatistik innerhalb einer Datei.
+    """
 
-    def tearDown(self):
+    def test_duplikate_und_gruppen(self):
         """
-        Räumt die Testumgebung nach jedem Testfall auf.
-        Löscht Test-Datenbank und temporäres Datenverzeichnis.
+        Testet eindeutige und mehrfach vorkommende Werte, die Zeilennummern der häufigsten Werte und die
+        Duplikatdatei, jeweils für Arrow- und Objektspalten.
         """
-        if os.path.exists(self.test_db_pfad_sqlite):
-            os.remove(self.test_db_pfad_sqlite) # Test-Datenbank löschen
+        daten_frame1 = pd.DataFrame({'Name': ['a', 'b', 'a', None, 'c', 'a', None]})
+        daten_frame2 = pd.DataFrame({'Name': ['b', 'd', 'b']})
+        spalten_typen = [object] + ([pd.ArrowDtype(pa.string())] if pa is not None else [])
+        for spalten_typ in spalten_typen:
+            with self.subTest(spalten_typ=str(spalten_typ)), tempfile.TemporaryDirectory() as verzeichnis:
+                duplikat_pfad = os.path.join(verzeichnis, 'bericht' + DUPLIKAT_DATEI_ENDUNG)
+                ergebnis = DateiVergleicher().vergleiche_daten(daten_frame1.astype(spalten_typ), daten_frame2.astype(spalten_typ),
+                                                               duplikat_pfad=duplikat_pfad)
+                self.assertEqual(ergebnis.gleiche_werte, 1)
+                self.assertEqual((ergebnis.duplikate_datei1.eindeutige_werte, ergebnis.duplikate_datei1.doppelte_werte,
+                                  ergebnis.duplikate_datei1.doppelte_zeilen), (4, 2, 3))
+                self.assertEqual(ergebnis.duplikate_datei1.haeufigste, [{"wert": "a", "anzahl": 3, "zeilen": [1, 3, 6]},
+                                                                        {"wert": "", "anzahl": 2, "zeilen": [4, 7]}])
+                self.assertEqual(ergebnis.metriken()[METRIK_DOPPELTE_WERTE_DATEI2], 1)
+                gruppen = pd.read_csv(duplikat_pfad, keep_default_na=False)
+                self.assertEqual(gruppen.values.tolist(), [[1, 'a', 3, 1], [1, 'a', 3, 3], [1, 'a', 3, 6], [1, '', 2, 4],
+                                                           [1, '', 2, 7], [2, 'b', 2, 1], [2, 'b', 2, 3]])
+
+
+    def test_zeilen_umsortierter_bool_spalte(self):
+        """
+        Testet, dass die Zeilennummern einer umsortierten Bool-Spalte über den Wert False gefunden werden
+        (np.bool_('False') ergäbe True).
+        """
+        daten_frame1 = pd.DataFrame({'Name': [False, True, False, False, True]})
+        daten_frame2 = pd.DataFrame({'Name': [True, False, True, False, False]})
+        ergebnis = DateiVergleicher().vergleiche_daten(daten_frame1, daten_frame2)
+        self.assertEqual(ergebnis.abkuerzung, ABKUERZUNG_SCHLUESSEL_DIGEST)
+        self.assertEqual(ergebnis.duplikate_datei2.haeufigste, [{"wert": "False", "anzahl": 3, "zeilen": [2, 4, 5]},
+                                                                {"wert": "True", "anzahl": 2, "zeilen": [1, 3]}])
 
-        self.temp_daten_verzeichnis.cleanup() # Temporäres Verzeichnis löschen
 
+class TestDatenSkizze(unittest.TestCase):
+    """
+    Unit-Test Klasse für den approximativen Vergleich mit HyperLogLog-/MinHash-Skizzen.
+    """
 
-    def test_speichere_lade_ergebnisse_sqlite(self):
+    def test_schaetzung_im_fehlerrahmen(self):
         """
-        Testet das Speichern und Laden von Vergleichsergebnissen mit SQLiteDataManager.
-        Prüft, ob die Daten korrekt gespeichert und wieder geladen werden können.
+        Testet, dass Kardinalität und Schnittmenge großer Mengen innerhalb des Vielfachen des Standardfehlers liegen
+        und kleine Mengen exakt gezählt werden.
         """
-        vergleichs_ergebnisse = {
-            METRIK_ANZAHL_DATEI1: 100,
-            METRIK_ANZAHL_DATEI2: 120,
-            METRIK_GLEICHE_NAMEN: 50
-        } # Beispiel Vergleichsergebnisse
-        datei1_name = "datei1.csv" # Beispiel Dateiname 1
-        datei2_name = "datei2.xlsx" # Beispiel Dateiname 2
-
-        self.daten_manager_sqlite.speichere_ergebnisse(vergleichs_ergebnisse, datei1_name, datei2_name, ist_pro_version=True) # Ergebnisse speichern - Pro Version aktiviert für Test
-        geladene_ergebnisse_liste = self.daten_manager_sqlite.lade_alle_ergebnisse() # Alle Ergebnisse laden
+        zufall = np.random.default_rng(11)
+        schluessel = zufall.integers(0, 2**63, 300_000, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        skizze1, skizze2 = DatenSkizze(0.02), DatenSkizze(0.02)
+        skizze1.aktualisiere(schluessel[:200_000])
+        skizze2.aktualisiere(schluessel[100_000:])
+        self.assertAlmostEqual(skizze1.kardinalitaet(), 200_000, delta=200_000 * 0.08)
+        jaccard, gemeinsam = skizze1.vergleiche(skizze2)
+        self.assertAlmostEqual(jaccard, 1 / 3, delta=0.04)
+        self.assertAlmostEqual(gemeinsam, 100_000, delta=100_000 * 0.15)
+
+        klein1, klein2 = DatenSkizze(0.02), DatenSkizze(0.02)
+        klein1.aktualisiere(schluessel[:50])
+        klein2.aktualisiere(schluessel[40:60])
+        self.assertEqual(klein1.kardinalitaet(), 50)
+        self.assertEqual(klein1.vergleiche(klein2)[1], 10)
+        with self.assertRaises(ValueError):
+            klein1.vergleiche(DatenSkizze(0.1))
+
+    def test_schaetz_fehler_grenzen(self):
+        """
+        Testet die Bereichsprüfung des Schätzfehlers (argparse und Skizze) und die Begrenzung der HyperLogLog-Präzision.
+        """
+        self.assertEqual(_parse_schaetz_fehler('0.05'), 0.05)
+        for ungueltig in ('0', '0.9', 'nan', 'abc'):
+            with self.assertRaises(argparse.ArgumentTypeError):
+                _parse_schaetz_fehler(ungueltig)
+        with self.assertRaises(ValueError):
+            DatenSkizze(0)
+        skizze = DatenSkizze(SCHAETZ_FEHLER_MIN)
+        self.assertEqual(skizze.praezision, HLL_MAX_PRAEZISION)
+        self.assertGreater(skizze.hll_fehler, SCHAETZ_FEHLER_MIN)
+        self.assertLessEqual(DatenSkizze(0.02).hll_fehler, 0.02)
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfad1, pfad2 = os.path.join(verzeichnis, 'eingabe.csv'), os.path.join(verzeichnis, 'liste.csv')
+            pd.DataFrame({'Name': ['Anna', 'Bob'], 'Alter': [30, 40]}).to_csv(pfad1, index=False)
+            pd.DataFrame({'Name': ['Anna'], 'Alter': [30]}).to_csv(pfad2, index=False)
+            with self.assertLogs(logger, level='WARNING'):
+                ergebnisse, _, _ = DateiVergleicher().vergleiche_dateien_approximativ(pfad1, pfad2, DatenLader(verzeichnis), verzeichnis,
+                                                                                     schaetz_fehler=0.0015)
+            self.assertAlmostEqual(ergebnisse.schaetz_fehler, skizze.hll_fehler)
+
+    def test_skizzen_werden_gespeichert(self):
+        """
+        Testet, dass der zweite approximative Vergleich die gespeicherten Skizzen verwendet und die Metriken als Schätzung gekennzeichnet sind.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfad1, pfad2 = os.path.join(verzeichnis, 'eingabe.csv'), os.path.join(verzeichnis, 'liste.csv')
+            pd.DataFrame({'Name': ['Anna', 'Bob', 'Carl'], 'Alter': [30, 40, 50]}).to_csv(pfad1, index=False)
+            pd.DataFrame({'Name': ['Anna', 'Carl'], 'Alter': [30, 50]}).to_csv(pfad2, index=False)
+            daten_lader = DatenLader(verzeichnis)
+            ergebnisse, _, _ = DateiVergleicher().vergleiche_dateien_approximativ(pfad1, pfad2, daten_lader, verzeichnis)
+            self.assertEqual(round(ergebnisse.gleiche_werte_schaetzung), 2)
+            self.assertEqual(ergebnisse.durchschnittsalter_datei1, 40.0)
+            self.assertNotIn(METRIK_GLEICHE_NAMEN, ergebnisse.metriken())
+            with unittest.mock.patch.object(DatenLader, 'lade_bloecke', side_effect=AssertionError("erneutes Lesen")):
+                erneut, _, _ = DateiVergleicher().vergleiche_dateien_approximativ(pfad1, pfad2, daten_lader, verzeichnis)
+            self.assertEqual(erneut, ergebnisse)
+
+
+class TestVergleichsErgebnis(unittest.TestCase):
+    """
+    Unit-Test Klasse für das typisierte Vergleichsergebnis.
+    """
 
-        self.assertIsNotNone(geladene_ergebnisse_liste) # Prüfen, ob Ergebnisse geladen wurden
-        self.assertTrue(len(geladene_ergebnisse_liste) > 0) # Prüfen, ob mindestens ein Ergebnis geladen wurde
+    def test_rohwerte_und_anzeige(self):
+        """
+        Testet, dass Rohwerte ungerundet bleiben und erst die Anzeige formatiert.
+        """
+        ergebnis = VergleichsErgebnis(3, 4, 2, 30.25, 41.0)
+        self.assertEqual(ergebnis.metriken()[METRIK_PROZENTUALER_UNTERSCHIED_ANZAHL], 0.25)
+        self.assertEqual(ergebnis.formatiert(), {
+            METRIK_ANZAHL_DATEI1: '3', METRIK_ANZAHL_DATEI2: '4', METRIK_PROZENTUALER_UNTERSCHIED_ANZAHL: '25.00%',
+            METRIK_GLEICHE_NAMEN: '2', METRIK_DURCHSCHNITTSALTER_DATEI1: '30.2', METRIK_DURCHSCHNITTSALTER_DATEI2: '41.0'})
+        self.assertEqual(formatiere_metrik(METRIK_GLEICHE_NAMEN, '17'), '17') # Textwerte älterer Verläufe bleiben unverändert
+        if DATACLASS_SLOTS: # __slots__ (ab Python 3.10): keine dynamischen Attribute
+            with self.assertRaises(AttributeError):
+                ergebnis.unbekannt = 1
+
+
+    def test_diagramm_ohne_textumwandlung(self):
+        """
+        Testet, dass das Diagramm die Rohwerte verwendet (Anteile in Prozent).
+        """
+        with unittest.mock.patch.object(plt, 'bar') as balken:
+            DiagrammGenerator().erstelle_diagramm(VergleichsErgebnis(3, 4, 2))
+        self.assertEqual(balken.call_args[0][1], [3.0, 4.0, 25.0, 2.0])
 
-        letzter_eintrag = geladene_ergebnisse_liste[0] # Letzten Eintrag aus der Liste holen (neuester Eintrag)
 
-        self.assertEqual(letzter_eintrag['datei1_name'], datei1_name) # Dateiname 1 vergleichen
-        self.assertEqual(letzter_eintrag['datei2_name'], datei2_name) # Dateiname 2 vergleichen
-        self.assertEqual(letzter_eintrag['metrik_wert'], str(vergleichs_ergebnisse[METRIK_ANZAHL_DATEI1])) # Metrikwert vergleichen
 
+class TestSchnellpfade(unittest.TestCase):
+    """
+    Unit-Test Klasse für die Abkürzungen bei identischen oder nahezu identischen Eingaben.
+    """
 
-    def test_speichere_lade_ergebnisse_file(self):
+    def test_byte_identische_dateien(self):
         """
-        Testet das Speichern und Laden von Vergleichsergebnissen mit FileDataManager.
-        Prüft, ob die Daten korrekt als JSON-Dateien gespeichert und wieder geladen werden können.
+        Testet die Erkennung byte-identischer Dateien und den Vergleich mit nur einmal geladenen Daten.
         """
-        vergleichs_ergebnisse = {
-            METRIK_ANZAHL_DATEI1: 150,
-            METRIK_ANZAHL_DATEI2: 180,
-            METRIK_GLEICHE_NAMEN: 75,
-            METRIK_DURCHSCHNITTSALTER_DATEI1: "35.5"
-        } # Beispiel Vergleichsergebnisse
-        datei1_name = "testdatei1.csv" # Beispiel Dateiname 1
-        datei2_name = "testdatei2.xlsx" # Beispiel Dateiname 2
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            pfade = [os.path.join(verzeichnis, name) for name in ('a.csv', 'b.csv', 'c.csv', 'd.txt')]
+            for pfad, inhalt in zip(pfade, ('Name,Alter\nAnna,30\nBob,40\nAnna,50\n',) * 2 + ('Name,Alter\nAnna,30\nBob,41\nAnna,50\n', 'Name,Alter\nAnna,30\nBob,40\nAnna,50\n')):
+                with open(pfad, 'w', encoding='utf-8') as datei:
+                    datei.write(inhalt)
+            daten_lader = DatenLader(verzeichnis)
+            self.assertTrue(daten_lader.ist_byte_identisch(pfade[0], pfade[1]))
+            self.assertFalse(daten_lader.ist_byte_identisch(pfade[0], pfade[2])) # Gleiche Größe, anderer Inhalt
+            self.assertFalse(daten_lader.ist_byte_identisch(pfade[0], pfade[3])) # Andere Dateiendung
+
+            daten_frame, _ = daten_lader.lade_daten(pfade[0])
+            ergebnis = DateiVergleicher().vergleiche_daten(daten_frame, daten_frame)
+            erwartet = DateiVergleicher().vergleiche_daten(daten_frame, daten_frame.copy())
+            self.assertEqual(ergebnis.abkuerzung, ABKUERZUNG_BYTE_IDENTISCH)
+            self.assertEqual(ergebnis.metriken(), erwartet.metriken())
+            self.assertEqual(ergebnis.gleiche_werte, 2)
+
+
+    def test_schluessel_digest(self):
+        """
+        Testet, dass umsortierte numerische Schlüssel ohne Mengenbildung als gleich erkannt werden und Unterschiede nicht.
+        """
+        vergleicher = DateiVergleicher()
+        daten_frame1 = pd.DataFrame({'Name': np.array([3, 1, 2, 2], dtype='int64')})
+        daten_frame2 = pd.DataFrame({'Name': np.array([2, 3, 2, 1], dtype='int64')})
+        with unittest.mock.patch.object(DateiVergleicher, '_faktorisiere', wraps=vergleicher._faktorisiere) as faktorisiere:
+            ergebnis = vergleicher.vergleiche_daten(daten_frame1, daten_frame2)
+        self.assertEqual((ergebnis.abkuerzung, ergebnis.gleiche_werte, faktorisiere.call_count), (ABKUERZUNG_SCHLUESSEL_DIGEST, 3, 1))
+        self.assertEqual(ergebnis.duplikate_datei2.haeufigste, [{"wert": "2", "anzahl": 2, "zeilen": [1, 3]}]) # Zeilennummern der zweiten Datei
+        ergebnis = vergleicher.vergleiche_daten(daten_frame1, pd.DataFrame({'Name': np.array([2, 3, 3, 1], dtype='int64')}))
+        self.assertEqual((ergebnis.abkuerzung, ergebnis.gleiche_werte), (None, 3)) # Andere Häufigkeiten: regulärer Vergleich
 
-        self.daten_manager_file.speichere_ergebnisse(vergleichs_ergebnisse, datei1_name, datei2_name, ist_pro_version=True) # Ergebnisse speichern - Pro Version aktiviert für Test
-        geladene_ergebnisse_liste = self.daten_manager_file.lade_alle_ergebnisse() # Alle Ergebnisse laden
 
-        self.assertIsNotNone(geladene_ergebnisse_liste) # Prüfen, ob Ergebnisse geladen wurden
-        self.assertTrue(len(geladene_ergebnisse_liste) > 0) # Prüfen, ob mindestens ein Ergebnis geladen wurde
 
-        letzter_eintrag = geladene_ergebnisse_liste[0] # Letzten Eintrag aus der Liste holen (neuester Eintrag)
+class TestLaufCache(unittest.TestCase):
+    """
+    Unit-Test Klasse für den Lauf-Cache.
+    """
 
-        self.assertEqual(letzter_eintrag['datei1_name'], datei1_name) # Dateiname 1 vergleichen
-        self.assertEqual(letzter_eintrag['datei2_name'], datei2_name) # Dateiname 2 vergleichen
-        self.assertEqual(letzter_eintrag['metriken'][METRIK_ANZAHL_DATEI1], vergleichs_ergebnisse[METRIK_ANZAHL_DATEI1]) # Metrikwert 1 vergleichen
-        self.assertEqual(letzter_eintrag['metriken'][METRIK_DURCHSCHNITTSALTER_DATEI1], vergleichs_ergebnisse[METRIK_DURCHSCHNITTSALTER_DATEI1]) # Metrikwert 2 vergleichen
+    def setUp(self):
+        """Erstellt ein temporäres Verzeichnis mit Eingabedatei."""
+        self.temp_verzeichnis = tempfile.TemporaryDirectory()
+        self.verzeichnis = self.temp_verzeichnis.name
+        self.eingabe = os.path.join(self.verzeichnis, 'eingabe.csv')
+        with open(self.eingabe, 'w', encoding='utf-8') as datei:
+            datei.write('Name,Alter\nAnna,30\n')
+        self.cache = LaufCache(os.path.join(self.verzeichnis, 'cache'))
 
 
-    def test_lade_alle_ergebnisse_leeres_verzeichnis_file(self):
+    def tearDown(self):
+        """Löscht das temporäre Verzeichnis."""
+        self.temp_verzeichnis.cleanup()
+
+
+    def test_treffer_nur_bei_gleichem_inhalt(self):
         """
-        Testet das Laden von Ergebnissen aus einem leeren Verzeichnis mit FileDataManager.
-        Erwartet, dass eine leere Liste zurückgegeben wird, wenn keine JSON-Dateien vorhanden sind.
+        Testet Speichern und Laden eines Laufs; eine Inhaltsänderung ergibt einen anderen Schlüssel.
         """
-        self.assertTrue(not os.listdir(self.test_daten_verzeichnis_file)) # Prüfen, ob Verzeichnis leer ist
+        schluessel = self.cache.schluessel((self.eingabe,), {"spalten": ['Name', 'Name']})
+        self.assertIsNone(self.cache.lade(schluessel))
+        self.cache.speichere(schluessel, VergleichsErgebnis(1, 2, 1, laufzeiten={'vergleichen': 0.1}), 'eingabe.csv', 'liste.csv')
 
-        geladene_ergebnisse_liste = self.daten_manager_file.lade_alle_ergebnisse() # Ergebnisse laden
-        self.assertEqual(geladene_ergebnisse_liste, []) # Erwartet leere Liste
+        ergebnis, dateiname1, _ = self.cache.lade(schluessel)
+        self.assertEqual((ergebnis.gleiche_werte, ergebnis.laufzeiten, dateiname1), (1, {'vergleichen': 0.1}, 'eingabe.csv'))
+        self.assertEqual(os.listdir(os.path.join(self.cache.verzeichnis, schluessel)), [LaufCache.EINTRAG_DATEI]) # Kein PDF im Cache
+        self.assertNotEqual(schluessel, self.cache.schluessel((self.eingabe,), {"spalten": ['Name', 'Alter']}))
+        with open(self.eingabe, 'a', encoding='utf-8') as datei:
+            datei.write('Bob,40\n')
+        self.assertNotEqual(schluessel, self.cache.schluessel((self.eingabe,), {"spalten": ['Name', 'Name']}))
 
 
-    def test_erstelle_schema_file_existiert_bereits(self):
+    def test_abbruch_waehrend_pruefsumme(self):
         """
-        Testet die Schemaerstellung mit FileDataManager, wenn das Verzeichnis bereits existiert.
-        Erwartet keinen Fehler, da die Schemaerstellung idempotent sein sollte.
+        Testet, dass die Prüfsummenberechnung großer Eingaben je gelesenem Block abgebrochen werden kann.
         """
-        try:
-            self.daten_manager_file.erstelle_schema() # Schema erstellen (Verzeichnis sollte bereits existieren)
-        except CipherCoreDateiSchemaFehler:
-            self.fail("erstelle_schema() hat einen Fehler verursacht, obwohl das Verzeichnis existieren sollte.") # Test fehlschlagen, wenn Fehler auftritt
+        abbruch_token = VergleichsAbbruchToken()
+        abbruch_token.abbrechen()
+        with self.assertRaises(CipherCoreAbbruchFehler):
+            self.cache.schluessel((self.eingabe,), {}, abbruch_token)
+        self.assertFalse(os.path.exists(os.path.join(self.cache.verzeichnis, LaufCache.PRUEFSUMMEN_DATEI)))
 
 
-    def test_speichere_ergebnisse_datei_schreibgeschuetzt_file(self):
+    def test_ablauf_und_verdraengung(self):
         """
-        Testet das Speichern von Ergebnissen mit FileDataManager in ein schreibgeschütztes Verzeichnis.
-        Erwartet einen CipherCoreDateiSpeicherFehler, da das Speichern in ein schreibgeschütztes Verzeichnis fehlschlagen sollte.
+        Testet, dass abgelaufene Einträge verworfen und bei Überschreiten der Maximalgröße die ältesten verdrängt werden.
         """
-        os.chmod(self.test_daten_verzeichnis_file, 0o555) # Verzeichnis schreibgeschützt machen
-        vergleichs_ergebnisse = {METRIK_ANZAHL_DATEI1: 200} # Beispiel Vergleichsergebnisse
-        datei1_name = "datei1.csv" # Beispiel Dateiname 1
-        datei2_name = "datei2.xlsx" # Beispiel Dateiname 2
+        kurzlebig = LaufCache(self.cache.verzeichnis, ttl_stunden=1)
+        kurzlebig.speichere('a' * 32, VergleichsErgebnis(1, 1), 'a', 'b')
+        with unittest.mock.patch('time.time', return_value=time.time() + 7200):
+            self.assertIsNone(kurzlebig.lade('a' * 32))
+        self.assertFalse(os.path.exists(os.path.join(self.cache.verzeichnis, 'a' * 32)))
 
-        with self.assertRaises(CipherCoreDateiSpeicherFehler): # Erwartet CipherCoreDateiSpeicherFehler
-            self.daten_manager_file.speichere_ergebnisse(vergleichs_ergebnisse, datei1_name, datei2_name, ist_pro_version=True) # Ergebnisse speichern (sollte fehlschlagen) - Pro Version aktiviert für Test
+        klein = LaufCache(self.cache.verzeichnis, max_mb=1 / 1024) # 1 KB: nur ein Eintrag passt
+        laufzeiten = {f'stufe{nummer}': 0.0 for nummer in range(20)} # Etwa 800 Bytes je Eintrag
+        klein.speichere('b' * 32, VergleichsErgebnis(1, 1, laufzeiten=laufzeiten), 'a', 'b')
+        klein.speichere('c' * 32, VergleichsErgebnis(2, 2, laufzeiten=laufzeiten), 'a', 'b')
+        self.assertFalse(os.path.exists(os.path.join(self.cache.verzeichnis, 'b' * 32)))
+        self.assertEqual(klein.lade('c' * 32)[0].anzahl_datei1, 2)
 
-        os.chmod(self.test_daten_verzeichnis_file, 0o777) # Verzeichnis wieder beschreibbar machen
 
 
-    def test_lade_ergebnisse_ungueltige_json_file(self):
+class TestStatistikEngine(unittest.TestCase):
+    """
+    Unit-Test Klasse für die blockweise Spaltenstatistik.
+    """
+
+    def test_blockweise_wie_pandas(self):
         """
-        Testet das Laden von Ergebnissen mit FileDataManager, wenn ungültige JSON-Dateien im Verzeichnis vorhanden sind.
-        Erwartet, dass ungültige JSON-Dateien ignoriert werden und keine Fehler geworfen werden.
+        Testet, dass blockweise berechnete Kennzahlen den pandas-Werten über die gesamte Spalte entsprechen
+        und Quantile oberhalb der Exaktgrenze per t-digest nahe am exakten Wert liegen.
         """
-        ungueltige_json_datei_pfad = os.path.join(self.test_daten_verzeichnis_file, "ungueltige_datei.json") # Pfad zur ungültigen JSON-Datei
-        with open(ungueltige_json_datei_pfad, 'w') as f: # Ungültige JSON-Datei erstellen
-            f.write("Dies ist keine gültige JSON-Datei") # Ungültigen JSON-Inhalt schreiben
+        zufall = np.random.default_rng(3)
+        daten_frame = pd.DataFrame({'Alter': zufall.normal(1e9, 5, 20_000), 'Stadt': zufall.choice(['Bonn', 'Köln', None], 20_000)})
+        statistik_engine = StatistikEngine(['anzahl', 'leer', 'eindeutig', 'min', 'max', 'summe', 'mittelwert', 'std', 'median', 'p95'])
+        for start in range(0, len(daten_frame), 3_000):
+            statistik_engine.aktualisiere(daten_frame.iloc[start:start + 3_000])
+        ergebnis = statistik_engine.ergebnis()
+        alter, stadt = ergebnis['Alter'], ergebnis['Stadt']
+        self.assertAlmostEqual(alter['mittelwert'], daten_frame['Alter'].mean(), places=6)
+        self.assertAlmostEqual(alter['std'], daten_frame['Alter'].std(), places=6) # Große Verschiebung: naive Varianz wäre instabil
+        self.assertAlmostEqual(alter['median'], daten_frame['Alter'].median(), places=6)
+        self.assertTrue(alter['quantile_exakt'])
+        self.assertEqual((stadt['anzahl'], stadt['leer'], stadt['eindeutig'], stadt['min']),
+                         (daten_frame['Stadt'].count(), daten_frame['Stadt'].isna().sum(), 2, 'Bonn'))
+        self.assertIsNone(stadt['mittelwert'])
+
+        digest_engine = StatistikEngine(['p5', 'median', 'p95'], quantile_exakt_bis=5_000)
+        for start in range(0, len(daten_frame), 3_000):
+            digest_engine.aktualisiere(daten_frame.iloc[start:start + 3_000])
+        schaetzung = digest_engine.ergebnis()['Alter']
+        self.assertFalse(schaetzung['quantile_exakt'])
+        for name, anteil in (('p5', 0.05), ('median', 0.5), ('p95', 0.95)):
+            self.assertAlmostEqual(schaetzung[name], daten_frame['Alter'].quantile(anteil), delta=0.2)
+        with self.assertRaises(ValueError):
+            StatistikEngine(['p100'])
+
+
+class TestStufenProfiler(unittest.TestCase):
+    """
+    Unit-Test Klasse für die Stufenmessung (--profile / --trace_stages).
+    """
 
-        try:
-            ergebnisse = self.daten_manager_file.lade_alle_ergebnisse() # Ergebnisse laden (sollte ungültige Datei ignorieren)
-            self.assertEqual(ergebnisse, []) # Erwartet leere Liste, da ungültige Datei ignoriert werden soll
-        except CipherCoreDateiLadeFehler:
-            self.fail("lade_alle_ergebnisse() sollte ungültige JSON-Dateien ignorieren und keinen Fehler werfen.") # Test fehlschlagen, wenn Fehler auftritt
+    def test_stufenprofil_neben_bericht(self):
+        """
+        Testet, dass Laufzeit, Speicherspitze und cProfile-Datei je Stufe neben dem Berichtspfad geschrieben werden.
+        """
+        with tempfile.TemporaryDirectory() as verzeichnis:
+            profiler = StufenProfiler(profilieren=True, stufen_verfolgen=True)
+            with _profil_stufe(profiler, "vergleichen", speicher_messen=True):
+                daten = list(range(100_000))
+            with _profil_stufe(profiler, "bericht"):
+                sum(daten)
+            bericht_pfad = profiler.schreibe_bericht(os.path.join(verzeichnis, "bericht.pdf"))
+            self.assertEqual([e["name"] for e in profiler.stufen], ["vergleichen", "bericht"])
+            self.assertGreater(profiler.stufen[0]["speicher_spitze_bytes"], 0)
+            self.assertNotIn("speicher_spitze_bytes", profiler.stufen[1])
+            self.assertTrue(os.path.exists(os.path.join(verzeichnis, "bericht_profil_vergleichen.prof")))
+            with open(bericht_pfad, encoding='utf-8') as bericht_datei:
+                self.assertIn("vergleichen", bericht_datei.read())
+        self.assertIsInstance(_profil_stufe(None, "laden_datei1"), contextlib.nullcontext)
 
 
 
@@ -1784,14 +10205,82 @@ if __name__ == "__main__":
     parser.add_argument("--ausgabe_pfad", default=AUSGABE_DATEIPFAD, help="Pfad für den PDF-Bericht (optional).") # Argument für Ausgabepfad
     parser.add_argument("--diagramm_typ", default=DIAGRAMM_TYP_BALKEN, choices=UNTERSTUETZTE_DIAGRAMM_TYPEN,
                         help=f"Diagrammtyp ({', '.join(UNTERSTUETZTE_DIAGRAMM_TYPEN)}). Standard: {DIAGRAMM_TYP_BALKEN}") # Argument für Diagrammtyp
-    parser.add_argument("--daten_manager_typ", default="file", choices=["sqlite", "file"],
-                        help="Typ des Datenmanagers ('sqlite' oder 'file'). Standard: 'file'") # Argument für DatenManager-Typ
+    parser.add_argument("--daten_manager_typ", default="file", choices=["sqlite", "file", "parquet"],
+                        help="Typ des Datenmanagers ('sqlite', 'file' oder 'parquet' für den spaltenorientierten Verlauf). Standard: 'file'") # Argument für DatenManager-Typ
     parser.add_argument("--cli", action="store_true", help="Startet das Tool im Kommandozeilenmodus (ohne GUI).") # Flag für CLI-Modus
     parser.add_argument("--spalte_datei1", default="Name", help="Spalte für Vergleich in Datei 1 (CLI Modus). Standard: 'Name'") # Argument für Spalte Datei 1
     parser.add_argument("--spalte_datei2", default="Name", help="Spalte für Vergleich in Datei 2 (CLI Modus). Standard: 'Name'") # Argument für Spalte Datei 2
+    parser.add_argument("--blatt_datei1", default=None, help="Arbeitsblatt, falls Datei 1 eine Excel-Datei ist (CLI Modus). Standard: erstes Blatt") # Argument für Excel-Blatt Datei 1
+    parser.add_argument("--blatt_datei2", default=None, help="Arbeitsblatt, falls Datei 2 eine Excel-Datei ist (CLI Modus). Standard: erstes Blatt") # Argument für Excel-Blatt Datei 2
+    parser.add_argument("--profile", action="store_true", help="Zeichnet je Pipeline-Stufe ein cProfile-Profil auf und schreibt es neben den PDF-Bericht (CLI Modus).") # Flag für Profiling
+    parser.add_argument("--trace_stages", "--trace-stages", dest="trace_stages", action="store_true",
+                        help="Misst Laufzeit je Stufe sowie tracemalloc-Spitzenspeicher für Laden und Vergleich und schreibt eine Zusammenfassung neben den PDF-Bericht (CLI Modus).") # Flag für Stufenmessung
+    parser.add_argument("--inkrementell", action="store_true",
+                        help="Speichert einen Vergleichszustand je Datei und verarbeitet bei angehängten CSV/TXT-Zeilen nur das Delta (CLI Modus).") # Flag für inkrementellen Vergleich
+    parser.add_argument("--shards", type=int, default=0,
+                        help=f"Partitioniert beide Dateien nach Schlüssel-Hash in N Teile (2-{SHARD_MAX_ANZAHL}) und vergleicht sie parallel in mehreren Prozessen (CLI Modus).") # Argument für partitionierten Vergleich
+    parser.add_argument("--extern_sortieren", "--extern-sortieren", dest="extern_sortieren", action="store_true",
+                        help="Sortiert die Schlüssel beider Dateien in Läufen auf der Festplatte und mischt sie (Eingaben größer als der Arbeitsspeicher, CLI Modus).") # Flag für externes Sortieren
+    parser.add_argument("--sql", action="store_true",
+                        help="Lädt beide Dateien in eine eingebettete Datenbank und vergleicht mit SQL-Joins und Aggregaten (CLI Modus).") # SQL-Vergleich
+    parser.add_argument("--sql_engine", "--sql-engine", dest="sql_engine", choices=SQL_ENGINES, default=SQL_ENGINE_AUTO,
+                        help="Datenbank für --sql: duckdb, sqlite oder auto (DuckDB, falls installiert, sonst SQLite).") # SQL-Engine
+    parser.add_argument("--diff_bericht", "--diff-bericht", dest="diff_bericht", action="store_true",
+                        help="Schreibt alle Werte, die nur in einer Datei vorkommen, als '<bericht>_diff.csv' (nur mit --sql, CLI Modus).") # Differenzdatei
+    parser.add_argument("--memory_budget", "--memory-budget", dest="memory_budget", type=float, default=None,
+                        help="Speicherbudget in MB für die automatische Wahl zwischen Standardvergleich und externem Sortieren (Standard: aus config.json bzw. Hälfte des verfügbaren Arbeitsspeichers).") # Speicherbudget
+    parser.add_argument("--approximativ", action="store_true",
+                        help="Schätzt eindeutige Werte und Übereinstimmungen über HyperLogLog-/MinHash-Skizzen, die je Datei gespeichert werden (CLI Modus).") # Flag für approximativen Vergleich
+    parser.add_argument("--schaetz_fehler", type=_parse_schaetz_fehler, default=None,
+                        help=f"Relativer Standardfehler des approximativen Vergleichs ({SCHAETZ_FEHLER_MIN}-{SCHAETZ_FEHLER_MAX}; die Kardinalität "
+                             f"ist auf etwa {1.04 / 2 ** (HLL_MAX_PRAEZISION / 2):.3f} begrenzt). Standard: aus config.json ({SCHAETZ_FEHLER_STANDARD})") # Argument für Schätzfehler
+    parser.add_argument("--spalten_statistik", action="store_true",
+                        help="Berechnet Anzahl, leere/eindeutige Werte, Min/Max, Summe, Mittelwert, Streuung und Quantile aller Spalten und schreibt sie als JSON neben den PDF-Bericht (CLI Modus).") # Flag für Spaltenstatistik
+    parser.add_argument("--duplikat_bericht", action="store_true",
+                        help=f"Schreibt alle Zeilen mehrfach vorkommender Werte beider Dateien gruppiert nach '<bericht>{DUPLIKAT_DATEI_ENDUNG}' (CLI Modus, Standardvergleich).") # Flag für Duplikatdatei
+    parser.add_argument("--no_cache", "--no-cache", dest="no_cache", action="store_true",
+                        help="Führt den Vergleich vollständig aus, auch wenn Dateiinhalte und Optionen einem zwischengespeicherten Lauf entsprechen (CLI Modus).") # Flag zum Umgehen des Lauf-Caches
+    parser.add_argument("--mehrfach", nargs='+', default=None, metavar="DATEI",
+                        help=f"N-Wege-Vergleich von 2 bis {MEHRFACH_MAX_DATEIEN} Dateien in einem Durchlauf (Überlappungsmatrix, UpSet-Diagramm, JSON neben dem PDF-Bericht).") # Argument für N-Wege-Vergleich
+    parser.add_argument("--mehrfach_spalte", default="Name", help="Vergleichsspalte aller Dateien im N-Wege-Vergleich. Standard: 'Name'") # Argument für Spalte im N-Wege-Vergleich
+    parser.add_argument("--digest_erstellen", action="store_true",
+                        help=f"Erstellt für jede angegebene Datei einen Merkle-Digest der Vergleichsspalte ('<datei>{DIGEST_DATEI_ENDUNG}'), der statt der Datei an den anderen Standort gesendet wird.") # Flag für Digest-Erstellung
+    parser.add_argument("--digest_vergleichen", action="store_true",
+                        help="Vergleicht zwei Digest-Dateien (statt Eingabedateien) und schreibt die abweichenden Buckets in die Bucket-Anforderung.") # Flag für Digest-Vergleich
+    parser.add_argument("--digest_buckets", type=int, default=DIGEST_BUCKETS_STANDARD,
+                        help=f"Anzahl der Buckets des Digests (Zweierpotenz, 2-{DIGEST_MAX_BUCKETS}). Standard: {DIGEST_BUCKETS_STANDARD}") # Argument für Bucket-Anzahl
+    parser.add_argument("--bucket_anforderung", default=None,
+                        help=f"Bucket-Anforderung: mit --digest_erstellen werden die Schlüssel-Hashes dieser Buckets exportiert ('<datei>{BUCKET_SCHLUESSEL_DATEI_ENDUNG}'), "
+                             f"mit --digest_vergleichen wird sie geschrieben. Standard beim Vergleich: '{DIGEST_ANFORDERUNG_STANDARD}'") # Argument für Bucket-Anforderung
+    parser.add_argument("--digest_schluessel_datei", default=None,
+                        help=f"Datei mit dem gemeinsamen Geheimnis beider Standorte für --digest_erstellen (sonst Umgebungsvariable {DIGEST_SCHLUESSEL_UMGEBUNG}).") # Argument für das Digest-Geheimnis
+    parser.add_argument("--bucket_schluessel", nargs='+', default=None,
+                        help="Bucket-Schlüsseldateien beider Standorte für den exakten Digest-Vergleich.") # Argument für Bucket-Schlüsseldateien
+    parser.add_argument("--trends", action="store_true",
+                        help="Zeigt die vorberechnete Trendauswertung des Verlaufs (Rollups, größte Änderungen, Auffälligkeiten) für den gewählten DatenManager.") # Flag für Trendauswertung
+    parser.add_argument("--trend_zeitraum", "--trend-zeitraum", dest="trend_zeitraum", choices=VERLAUF_ROLLUP_ZEITRAEUME, default='woche',
+                        help="Zeitraum der Rollups für --trends. Standard: 'woche'") # Argument für Trend-Zeitraum
+    parser.add_argument("--trend_top", "--trend-top", dest="trend_top", type=int, default=VERLAUF_TOP_STANDARD,
+                        help=f"Anzahl der Dateipaare mit den größten Änderungen und der angezeigten Auffälligkeiten. Standard: {VERLAUF_TOP_STANDARD}") # Argument für Top-N
+    parser.add_argument("--benchmark", action="store_true", help="Führt den Benchmark mit synthetischen Datensätzen aus und schreibt die Ergebnisse als JSON.") # Flag für Benchmark-Modus
+    parser.add_argument("--benchmark_groessen", type=_parse_benchmark_groessen, default=list(BENCHMARK_STANDARD_GROESSEN),
+                        help=f"Zeilen je Datei, kommagetrennt, z.B. '10k,1M,50M' ({BENCHMARK_MIN_ZEILEN}-{BENCHMARK_MAX_ZEILEN}).")
+    parser.add_argument("--benchmark_formate", default="csv", help="Dateiformate für den Benchmark, kommagetrennt ('csv', 'xlsx'). Standard: 'csv'")
+    parser.add_argument("--benchmark_ueberlappung", type=float, default=0.5, help="Anteil überlappender Schlüssel (0-1). Standard: 0.5")
+    parser.add_argument("--benchmark_tippfehler", type=float, default=0.01, help="Tippfehlerrate der überlappenden Schlüssel (0-1). Standard: 0.01")
+    parser.add_argument("--benchmark_ausgabe", default=BENCHMARK_AUSGABE_STANDARD, help=f"JSON-Datei für die Benchmark-Ergebnisse. Standard: '{BENCHMARK_AUSGABE_STANDARD}'")
+    parser.add_argument("--benchmark_bezeichnung", default=None, help="Bezeichnung des Benchmark-Laufs, z.B. Version oder Commit (optional).")
 
 
     argumente = parser.parse_args() # Kommandozeilenargumente parsen
+    if argumente.memory_budget is not None and argumente.memory_budget <= 0:
+        parser.error("--memory_budget muss größer als 0 sein.")
+    if argumente.trend_top < 1:
+        parser.error("--trend_top muss mindestens 1 sein.")
+    if argumente.sql_engine == SQL_ENGINE_DUCKDB and duckdb is None:
+        parser.error("--sql_engine duckdb benötigt das Paket 'duckdb' (pip install duckdb) oder --sql_engine sqlite.")
+    if argumente.daten_manager_typ == "parquet" and pa is None:
+        parser.error("--daten_manager_typ parquet benötigt das Paket 'pyarrow' (pip install pyarrow) oder --daten_manager_typ sqlite/file.")
 
     daten_manager_typ = argumente.daten_manager_typ # DatenManager-Typ aus Argumenten holen
     if daten_manager_typ == "sqlite":
@@ -1800,28 +10289,117 @@ if __name__ == "__main__":
     elif daten_manager_typ == "file":
         daten_manager = FileDataManager(DATEN_VERZEICHNIS) # FileDataManager erstellen
         print(f"Verwende FileDataManager für Datenpersistenz. Datenverzeichnis: '{DATEN_VERZEICHNIS}'")
+    elif daten_manager_typ == "parquet":
+        daten_manager = ParquetDataManager(PARQUET_VERZEICHNIS) # ParquetDataManager erstellen
+        print(f"Verwende ParquetDataManager für Datenpersistenz. Verzeichnis: '{PARQUET_VERZEICHNIS}'")
     else:
         daten_manager = FileDataManager(DATEN_VERZEICHNIS) # FileDataManager als Standard erstellen
         print(f"Ungültiger DatenManager-Typ gewählt oder nicht angegeben. Verwende standardmäßig FileDataManager.")
 
 
-    if argumente.cli or (argumente.datei_pfad1 and argumente.datei_pfad2): # CLI-Modus starten, wenn --cli Flag oder beide Dateipfade gegeben sind
+    if argumente.trends: # Trendauswertung aus den Zusammenfassungstabellen
+        print(formatiere_trend_bericht(daten_manager.verlaufs_auswertung(), argumente.trend_zeitraum, argumente.trend_top))
+
+    elif argumente.benchmark: # Benchmark-Modus
+        print("Starte Benchmark...")
+        formate = ['.' + f.strip().lower().lstrip('.') for f in argumente.benchmark_formate.split(',') if f.strip()]
+        benchmark_ergebnisse = BenchmarkRunner().fuehre_aus(argumente.benchmark_groessen, formate, argumente.benchmark_ueberlappung,
+                                                            argumente.benchmark_tippfehler, argumente.benchmark_bezeichnung)
+        with open(argumente.benchmark_ausgabe, 'w', encoding='utf-8') as benchmark_datei:
+            json.dump(benchmark_ergebnisse, benchmark_datei, indent=4, ensure_ascii=False)
+        for eintrag in benchmark_ergebnisse["ergebnisse"]:
+            if "uebersprungen" in eintrag:
+                print(f"  {eintrag['zeilen']:>10} Zeilen {eintrag['format']}: übersprungen ({eintrag['uebersprungen']})")
+            else:
+                print(f"  {eintrag['zeilen']:>10} Zeilen {eintrag['format']}: {eintrag['gesamt_sekunden']:.3f}s")
+        print(f"Benchmark-Ergebnisse gespeichert: {argumente.benchmark_ausgabe}")
+
+    elif argumente.mehrfach: # N-Wege-Vergleich
+        pdf_pfad, mehrfach_ergebnis = dateien_mehrfach_vergleichen_und_bericht_erstellen(
+            argumente.mehrfach, logo_pfad=argumente.logo_pfad, ausgabe_pfad=argumente.ausgabe_pfad, spalte=argumente.mehrfach_spalte)
+        if mehrfach_ergebnis is None:
+            print(pdf_pfad)
+        else:
+            for anzahl_k, anzahl in enumerate(mehrfach_ergebnis.in_genau_k_dateien(), start=1):
+                print(f"  In genau {anzahl_k} Dateien: {anzahl}")
+            print(f"PDF-Bericht erfolgreich erstellt: {pdf_pfad}")
+
+    elif argumente.digest_erstellen: # Digest je Datei erstellen, optional Bucket-Schlüssel exportieren
+        try:
+            anforderung = None
+            if argumente.bucket_anforderung:
+                with open(argumente.bucket_anforderung, encoding='utf-8') as anforderungs_datei:
+                    anforderung = json.load(anforderungs_datei)
+            if argumente.digest_schluessel_datei:
+                with open(argumente.digest_schluessel_datei, encoding='utf-8') as geheimnis_datei:
+                    geheimnis = geheimnis_datei.read().strip()
+            else:
+                geheimnis = os.environ.get(DIGEST_SCHLUESSEL_UMGEBUNG, '')
+            daten_lader = DatenLader(BASIS_VERZEICHNIS)
+            for datei_pfad, spalte, blatt in ((argumente.datei_pfad1, argumente.spalte_datei1, argumente.blatt_datei1),
+                                              (argumente.datei_pfad2, argumente.spalte_datei2, argumente.blatt_datei2)):
+                if not datei_pfad:
+                    continue
+                digest, hashes = MerkleDigest.aus_datei(datei_pfad, daten_lader, geheimnis, spalte, blatt, argumente.digest_buckets)
+                digest.speichere(datei_pfad + DIGEST_DATEI_ENDUNG)
+                print(f"Digest gespeichert: {datei_pfad + DIGEST_DATEI_ENDUNG} ({digest.anzahl_buckets} Buckets, Wurzel {digest.wurzel})")
+                if anforderung is not None:
+                    if digest.wurzel not in anforderung["wurzeln"]:
+                        raise CipherCoreDatenValidierungsFehler(f"'{os.path.basename(datei_pfad)}' passt nicht zur Bucket-Anforderung (Datei seit dem Digest geändert?).")
+                    MerkleDigest.speichere_bucket_schluessel(datei_pfad + BUCKET_SCHLUESSEL_DATEI_ENDUNG, digest.wurzel,
+                                                             digest.bucket_schluessel(hashes, anforderung["buckets"]))
+                    print(f"Bucket-Schlüssel für {len(anforderung['buckets'])} Buckets gespeichert: {datei_pfad + BUCKET_SCHLUESSEL_DATEI_ENDUNG}")
+        except (CipherCoreDatenFehler, ValueError, KeyError, OSError) as e:
+            print(f"Fehler beim Erstellen des Digests: {e}")
+
+    elif argumente.digest_vergleichen: # Zwei Digests vergleichen, exakt mit den Bucket-Schlüsseln beider Standorte
+        try:
+            digest1, digest2 = MerkleDigest.lade(argumente.datei_pfad1), MerkleDigest.lade(argumente.datei_pfad2)
+            vergleichs_ergebnisse, unterschiedliche = vergleiche_digests(
+                digest1, digest2, [MerkleDigest.lade_bucket_schluessel(pfad) for pfad in argumente.bucket_schluessel or []])
+            print(f"{len(unterschiedliche)} von {digest1.anzahl_buckets} Buckets abweichend.")
+            if vergleichs_ergebnisse.gleiche_werte is None:
+                anforderung_pfad = argumente.bucket_anforderung or DIGEST_ANFORDERUNG_STANDARD
+                with open(anforderung_pfad, 'w', encoding='utf-8') as anforderungs_datei:
+                    json.dump({"wurzeln": [digest1.wurzel, digest2.wurzel], "buckets": unterschiedliche}, anforderungs_datei)
+                print(f"Bucket-Anforderung gespeichert: {anforderung_pfad} (an beide Standorte senden, dort mit --digest_erstellen --bucket_anforderung exportieren)")
+            for metrik, wert in vergleichs_ergebnisse.formatiert().items():
+                print(f"  {metrik}: {wert}")
+            ist_pro = ist_pro_version(LIZENZSCHLUESSEL)
+            diagramm_bild_daten = DiagrammGenerator().erstelle_diagramm(vergleichs_ergebnisse, argumente.diagramm_typ, ist_pro)
+            pdf_pfad = BerichtsGenerator(argumente.logo_pfad, argumente.ausgabe_pfad, daten_manager).erstelle_pdf_bericht(
+                vergleichs_ergebnisse, diagramm_bild_daten, digest1.dateiname, digest2.dateiname, ist_pro)
+            daten_manager.speichere_ergebnisse(vergleichs_ergebnisse, digest1.dateiname, digest2.dateiname, ist_pro)
+            print(f"PDF-Bericht erfolgreich erstellt: {pdf_pfad}")
+        except (CipherCoreDatenFehler, OSError) as e:
+            print(f"Fehler beim Digest-Vergleich: {e}")
+
+    elif argumente.cli or (argumente.datei_pfad1 and argumente.datei_pfad2): # CLI-Modus starten, wenn --cli Flag oder beide Dateipfade gegeben sind
         if not argumente.datei_pfad1 or not argumente.datei_pfad2: # Fehler, wenn im CLI-Modus Dateipfade fehlen
             print("Fehler: Für den Kommandozeilenmodus müssen beide Dateipfade angegeben werden.")
             parser.print_help() # Hilfe ausgeben
         else:
             print("Starte im Kommandozeilenmodus...")
+            profiler = StufenProfiler(argumente.profile, argumente.trace_stages) if argumente.profile or argumente.trace_stages else None # Ohne Flags kein Profiler
             pdf_pfad, vergleichs_ergebnisse = dateien_vergleichen_und_bericht_erstellen( # Vergleichsfunktion aufrufen
                 argumente.datei_pfad1, argumente.datei_pfad2,
                 logo_pfad=argumente.logo_pfad, ausgabe_pfad=argumente.ausgabe_pfad,
                 diagramm_typ=argumente.diagramm_typ, daten_manager=daten_manager,
                 spalte_datei1=argumente.spalte_datei1, spalte_datei2=argumente.spalte_datei2, # Spalten für Vergleich übergeben
-                lizenzschluessel=LIZENZSCHLUESSEL # Lizenzschlüssel übergeben
+                lizenzschluessel=LIZENZSCHLUESSEL, # Lizenzschlüssel übergeben
+                profiler=profiler, blatt_datei1=argumente.blatt_datei1, blatt_datei2=argumente.blatt_datei2,
+                inkrementell=argumente.inkrementell, shards=argumente.shards,
+                approximativ=argumente.approximativ, schaetz_fehler=argumente.schaetz_fehler,
+                spalten_statistik=argumente.spalten_statistik, lauf_cache=not argumente.no_cache,
+                duplikat_bericht=argumente.duplikat_bericht, extern_sortieren=argumente.extern_sortieren,
+                speicher_budget_mb=argumente.memory_budget, sql_engine=argumente.sql_engine if argumente.sql else None, diff_bericht=argumente.diff_bericht
             )
             if isinstance(pdf_pfad, str) and pdf_pfad.endswith('.pdf'): # Erfolgsmeldung im CLI-Modus
                 print(f"PDF-Bericht erfolgreich erstellt: {pdf_pfad}")
             else: # Fehlermeldung im CLI-Modus
                 print(f"Fehler beim Erstellen des Berichts: {pdf_pfad}")
+            if profiler and profiler.bericht_pfad:
+                print(f"Stufenprofil gespeichert: {profiler.bericht_pfad}")
 
 
     else: # GUI-Modus starten, wenn keine Dateipfade und kein --cli Flag gegeben sind
@@ -1837,6 +10415,30 @@ if __name__ == "__main__":
             if ausfuehren_unit_tests:
                 suite = unittest.TestSuite()
                 suite.addTest(unittest.makeSuite(TestDataManager)) # Test-Suite erstellen
+                suite.addTest(unittest.makeSuite(TestKonfiguration))
+                suite.addTest(unittest.makeSuite(TestVerlaufsAuswertung))
+                suite.addTest(unittest.makeSuite(TestVergleichsAbbruch))
+                suite.addTest(unittest.makeSuite(TestSynthetischerDatensatzGenerator))
+                suite.addTest(unittest.makeSuite(TestDatenValidierer))
+                suite.addTest(unittest.makeSuite(TestCsvFormatErkennung))
+                suite.addTest(unittest.makeSuite(TestKomprimierteEingaben))
+                suite.addTest(unittest.makeSuite(TestArrowCsvLeser))
+                suite.addTest(unittest.makeSuite(TestExcelLeser))
+                suite.addTest(unittest.makeSuite(TestSpaltenFormate))
+                suite.addTest(unittest.makeSuite(TestInkrementellerVergleich))
+                suite.addTest(unittest.makeSuite(TestShardVergleicher))
+                suite.addTest(unittest.makeSuite(TestExternerSortierVergleicher))
+                suite.addTest(unittest.makeSuite(TestSqlVergleicher))
+                suite.addTest(unittest.makeSuite(TestVerfahrenswahl))
+                suite.addTest(unittest.makeSuite(TestMerkleDigest))
+                suite.addTest(unittest.makeSuite(TestMehrfachVergleich))
+                suite.addTest(unittest.makeSuite(TestDuplikatStatistik))
+                suite.addTest(unittest.makeSuite(TestDatenSkizze))
+                suite.addTest(unittest.makeSuite(TestVergleichsErgebnis))
+                suite.addTest(unittest.makeSuite(TestSchnellpfade))
+                suite.addTest(unittest.makeSuite(TestLaufCache))
+                suite.addTest(unittest.makeSuite(TestStatistikEngine))
+                suite.addTest(unittest.makeSuite(TestStufenProfiler))
                 runner = unittest.TextTestRunner() # Test-Runner erstellen
                 runner.run(suite) # Unit-Tests ausführen
             else: